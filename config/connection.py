@@ -1,6 +1,11 @@
-from psycopg2 import OperationalError, connect
+from psycopg2 import OperationalError, connect, extensions
+from psycopg2.pool import PoolError
 from contextlib import contextmanager
+from collections import deque
 from config import ProjectLogger, project_settings
+import threading
+import time
+import os
 
 
 # Configuramos el logger para este módulo
@@ -8,6 +13,293 @@ logger = ProjectLogger()
 module_logger = logger.get_logger(__name__)
 
 
+class PooledConnection:
+    """
+    Envoltorio de una conexión obtenida del pool.
+
+    Se comporta como una conexión psycopg2 normal, pero close() la devuelve
+    al pool en lugar de cerrar el socket, de modo que el código existente
+    que hace connection.close() sigue funcionando sin cambios.
+    """
+
+    def __init__(self, pool, raw_connection):
+        self._pool = pool
+        self._raw = raw_connection
+        self._released = False
+
+    @property
+    def raw(self):
+        """Conexión psycopg2 subyacente."""
+        return self._raw
+
+    @property
+    def closed(self):
+        """Indica si la conexión ya fue devuelta al pool o está cerrada."""
+        return self._released or bool(self._raw.closed)
+
+    def close(self):
+        """Devuelve la conexión al pool."""
+        if not self._released:
+            self._released = True
+            self._pool.release(self._raw)
+
+    def __enter__(self):
+        self._raw.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return self._raw.__exit__(exc_type, exc_value, traceback)
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+
+class ConnectionPool:
+    """
+    Pool de conexiones por proceso con verificación de salud y reciclaje.
+
+    Las conexiones se crean bajo demanda hasta max_size, se verifican al
+    entregarse y se cierran tras max_uses entregas. Si el proceso se bifurca
+    (multiprocessing), el hijo descarta las conexiones heredadas y crea las suyas.
+    """
+
+    def __init__(
+        self,
+        connect_func,
+        min_size=1,
+        max_size=5,
+        max_uses=1000,
+        timeout=30,
+        health_check=True,
+    ):
+        """
+        Inicializa el pool.
+
+        Args:
+            connect_func (callable): Función que crea una conexión psycopg2 nueva.
+            min_size (int, optional): Conexiones a mantener abiertas. Por defecto 1.
+            max_size (int, optional): Máximo de conexiones simultáneas. Por defecto 5.
+            max_uses (int, optional): Entregas antes de reciclar una conexión. Por defecto 1000.
+            timeout (int, optional): Segundos a esperar por una conexión libre. Por defecto 30.
+            health_check (bool, optional): Ejecutar SELECT 1 al entregar. Por defecto True.
+        """
+        self._connect = connect_func
+        self.min_size = max(0, min_size)
+        self.max_size = max(1, max_size, self.min_size)
+        self.max_uses = max_uses
+        self.timeout = timeout
+        self.health_check = health_check
+
+        self._condition = threading.Condition()
+        self._inherited = []
+        self._reset_state()
+
+    def _reset_state(self):
+        """Reinicia el estado interno del pool para el proceso actual."""
+        self._pid = os.getpid()
+        self._idle = deque()
+        self._uses = {}
+        self._in_use = 0
+        self._stats = {
+            "created": 0,
+            "closed": 0,
+            "recycled": 0,
+            "checkouts": 0,
+            "reused": 0,
+            "health_check_failures": 0,
+            "waits": 0,
+            "wait_time": 0.0,
+        }
+
+    def _check_pid(self):
+        """Descarta las conexiones heredadas de un proceso padre."""
+        if self._pid != os.getpid():
+            # No se cierran: el socket pertenece al proceso padre y cerrarlo
+            # desde el hijo terminaría también su sesión.
+            self._inherited = list(self._idle)
+            self._reset_state()
+
+    def _total(self):
+        return len(self._idle) + self._in_use
+
+    def _create(self):
+        connection = self._connect()
+        self._uses[id(connection)] = 0
+        self._stats["created"] += 1
+        return connection
+
+    def _discard(self, connection, recycled=False):
+        self._uses.pop(id(connection), None)
+        self._stats["closed"] += 1
+        if recycled:
+            self._stats["recycled"] += 1
+        try:
+            if not connection.closed:
+                connection.close()
+        except Exception as e:
+            module_logger.debug(f"Error cerrando conexión del pool: {str(e)}")
+
+    def _is_healthy(self, connection):
+        """Verifica que una conexión inactiva siga siendo utilizable."""
+        if connection.closed:
+            return False
+        status = connection.get_transaction_status()
+        if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+            return False
+        if not self.health_check:
+            return True
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            connection.rollback()
+            return True
+        except Exception:
+            return False
+
+    def _fill_min_size(self):
+        while self._total() < self.min_size:
+            self._idle.append(self._create())
+
+    def acquire(self):
+        """
+        Obtiene una conexión del pool.
+
+        Returns:
+            PooledConnection: Conexión envuelta que se devuelve al pool con close().
+
+        Raises:
+            PoolError: Si no hay conexiones libres dentro del tiempo de espera.
+            OperationalError: Si no se puede crear una conexión nueva.
+        """
+        with self._condition:
+            self._check_pid()
+            self._fill_min_size()
+            deadline = None
+
+            while True:
+                while self._idle:
+                    connection = self._idle.popleft()
+                    if self._is_healthy(connection):
+                        self._in_use += 1
+                        self._stats["checkouts"] += 1
+                        self._stats["reused"] += 1
+                        return PooledConnection(self, connection)
+                    self._stats["health_check_failures"] += 1
+                    self._discard(connection)
+
+                if self._total() < self.max_size:
+                    connection = self._create()
+                    self._in_use += 1
+                    self._stats["checkouts"] += 1
+                    return PooledConnection(self, connection)
+
+                if deadline is None:
+                    deadline = time.monotonic() + self.timeout
+                    self._stats["waits"] += 1
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolError(
+                        f"No hay conexiones disponibles en el pool (max_size={self.max_size})"
+                    )
+                started = time.monotonic()
+                self._condition.wait(remaining)
+                self._stats["wait_time"] += time.monotonic() - started
+
+    def release(self, connection):
+        """
+        Devuelve una conexión al pool.
+
+        Args:
+            connection: Conexión psycopg2 obtenida con acquire().
+        """
+        with self._condition:
+            if self._pid != os.getpid():
+                return
+
+            self._in_use = max(0, self._in_use - 1)
+            uses = self._uses.get(id(connection), 0) + 1
+            self._uses[id(connection)] = uses
+
+            try:
+                if not connection.closed:
+                    status = connection.get_transaction_status()
+                    if status != extensions.TRANSACTION_STATUS_IDLE:
+                        connection.rollback()
+            except Exception:
+                self._discard(connection)
+                self._condition.notify()
+                return
+
+            if connection.closed:
+                self._discard(connection)
+            elif self.max_uses and uses >= self.max_uses:
+                self._discard(connection, recycled=True)
+            else:
+                self._idle.append(connection)
+
+            self._condition.notify()
+
+    def ensure_capacity(self, size, open_count=0):
+        """
+        Amplía el pool para que admita al menos size conexiones simultáneas.
+
+        Args:
+            size (int): Conexiones simultáneas que debe admitir el pool.
+            open_count (int, optional): Conexiones (en uso o inactivas) que deben
+                                        quedar abiertas. Se crean de inmediato,
+                                        de modo que si el servidor no las admite
+                                        el error ocurre aquí y no a mitad de la
+                                        ejecución.
+
+        Returns:
+            int: Tamaño máximo del pool.
+
+        Raises:
+            OperationalError: Si no se pueden abrir las conexiones pedidas.
+        """
+        with self._condition:
+            self._check_pid()
+            if size > self.max_size:
+                module_logger.info(
+                    f"Pool de conexiones ampliado de {self.max_size} a {size}"
+                )
+                self.max_size = size
+                self._condition.notify_all()
+            while self._total() < min(open_count, self.max_size):
+                self._idle.append(self._create())
+            return self.max_size
+
+    def close_all(self):
+        """Cierra todas las conexiones inactivas del pool."""
+        with self._condition:
+            self._check_pid()
+            while self._idle:
+                self._discard(self._idle.popleft())
+
+    def stats(self):
+        """
+        Retorna las estadísticas del pool para monitoreo.
+
+        Returns:
+            dict: Contadores de creación, reutilización, reciclaje y ocupación.
+        """
+        with self._condition:
+            self._check_pid()
+            stats = dict(self._stats)
+            stats.update(
+                {
+                    "pid": self._pid,
+                    "in_use": self._in_use,
+                    "idle": len(self._idle),
+                    "min_size": self.min_size,
+                    "max_size": self.max_size,
+                    "max_uses": self.max_uses,
+                }
+            )
+            stats["wait_time"] = round(stats["wait_time"], 3)
+            return stats
+
+
 class DatabaseConnection:
     """
     Clase para manejar las conexiones a la base de datos PostgreSQL.
@@ -20,6 +312,7 @@ class DatabaseConnection:
         if cls._instance is None:
             cls._instance = super(DatabaseConnection, cls).__new__(cls)
             cls._instance._init_connection_params()
+            cls._instance._init_pool()
         return cls._instance
 
     def _init_connection_params(self):
@@ -39,6 +332,18 @@ class DatabaseConnection:
             masked_params["password"] = "***"
         module_logger.debug(f"Connection parameters initialized: {masked_params}")
 
+    def _init_pool(self):
+        """Inicializa el pool de conexiones desde la configuración"""
+        db_config = project_settings.db
+        self.pool = ConnectionPool(
+            self._connect,
+            min_size=db_config.get("pool_min_size", 1),
+            max_size=db_config.get("pool_max_size", 5),
+            max_uses=db_config.get("pool_max_uses", 1000),
+            timeout=db_config.get("pool_timeout", 30),
+            health_check=db_config.get("pool_health_check", True),
+        )
+
     def test_connection(self):
         """
         Prueba la conexión a la base de datos.
@@ -47,7 +352,7 @@ class DatabaseConnection:
             bool: True si la conexión es exitosa, False en caso contrario.
         """
         try:
-            with self.get_connection() as conn:
+            with self.get_connection_context() as conn:
                 with conn.cursor() as cursor:
                     cursor.execute("SELECT 1")
                     module_logger.info("Database connection test successful")
@@ -56,12 +361,12 @@ class DatabaseConnection:
             module_logger.error(f"Database connection test failed: {str(e)}")
             return False
 
-    def get_connection(self):
+    def _connect(self):
         """
-        Obtiene una conexión a la base de datos.
+        Abre una conexión nueva a la base de datos (usada por el pool).
 
         Returns:
-            connection: Conexión a la base de datos.
+            connection: Conexión psycopg2 nueva.
 
         Raises:
             OperationalError: Si no se puede establecer la conexión.
@@ -90,11 +395,26 @@ class DatabaseConnection:
                     module_logger.error(f"Retry connection failed: {str(e2)}")
             raise
 
+    def get_connection(self):
+        """
+        Obtiene una conexión del pool de la base de datos.
+
+        La conexión retornada se devuelve al pool al llamar a close().
+
+        Returns:
+            PooledConnection: Conexión a la base de datos.
+
+        Raises:
+            OperationalError: Si no se puede establecer la conexión.
+            PoolError: Si el pool está agotado durante más de pool_timeout segundos.
+        """
+        return self.pool.acquire()
+
     @contextmanager
     def get_connection_context(self):
         """
         Proporciona un contexto para usar una conexión a la base de datos,
-        manejando automáticamente el cierre de la conexión.
+        devolviéndola automáticamente al pool.
 
         Yields:
             connection: Conexión a la base de datos.
@@ -116,6 +436,32 @@ class DatabaseConnection:
             if connection:
                 connection.close()
 
+    def pool_stats(self):
+        """
+        Obtiene las estadísticas del pool de conexiones del proceso actual.
+
+        Returns:
+            dict: Estadísticas del pool.
+        """
+        return self.pool.stats()
+
+    def ensure_pool_capacity(self, size, open_count=0):
+        """
+        Amplía el pool del proceso actual (ver ConnectionPool.ensure_capacity).
+
+        Args:
+            size (int): Conexiones simultáneas que debe admitir el pool.
+            open_count (int, optional): Conexiones que deben quedar abiertas.
+
+        Returns:
+            int: Tamaño máximo del pool.
+        """
+        return self.pool.ensure_capacity(size, open_count)
+
+    def close_pool(self):
+        """Cierra las conexiones inactivas del pool del proceso actual."""
+        self.pool.close_all()
+
     def execute_query(self, query, params=None, commit=True):
         """
         Ejecuta una consulta en la base de datos.
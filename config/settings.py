@@ -18,6 +18,12 @@ DEFAULT_CONFIG = {
         "host": os.getenv("DB_HOST", "localhost"),
         "port": os.getenv("DB_PORT", "5432"),
         "database": os.getenv("DB_NAME", "cvlac_db"),
+        "pool_min_size": int(os.getenv("DB_POOL_MIN_SIZE", "1")),
+        "pool_max_size": int(os.getenv("DB_POOL_MAX_SIZE", "5")),
+        "pool_max_uses": int(os.getenv("DB_POOL_MAX_USES", "1000")),
+        "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+        "pool_health_check": os.getenv("DB_POOL_HEALTH_CHECK", "True").lower()
+        in ("true", "1", "yes"),
     },
     "logging": {
         "level": os.getenv("LOG_LEVEL", "INFO"),
@@ -26,6 +32,7 @@ DEFAULT_CONFIG = {
         "date_format": "%Y-%m-%d %H:%M:%S",
     },
     "scraper": {
+        "base_url": os.getenv("CVLAC_BASE_URL", "https://scienti.minciencias.gov.co"),
         "user_agent": os.getenv(
             "USER_AGENT",
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
@@ -34,10 +41,54 @@ DEFAULT_CONFIG = {
         "max_retries": int(os.getenv("MAX_RETRIES", "3")),
         "retry_delay": int(os.getenv("RETRY_DELAY", "5")),
         "verify_ssl": os.getenv("VERIFY_SSL", "False").lower() in ("true", "1", "yes"),
+        "probe_bytes": int(os.getenv("PROBE_BYTES", "32768")),
+        "parser": os.getenv("HTML_PARSER", "bs4"),
         "remove_existing_data": os.getenv("REMOVE_EXISTING_DATA", "True").lower()
         in ("true", "1", "yes"),
         "update_if_exists": os.getenv("UPDATE_IF_EXISTS", "True").lower()
         in ("true", "1", "yes"),
+        "upsert": os.getenv("UPSERT_MODE", "False").lower() in ("true", "1", "yes"),
+        "skip_unchanged": os.getenv("SKIP_UNCHANGED", "True").lower()
+        in ("true", "1", "yes"),
+        "async_fetch": os.getenv("ASYNC_FETCH", "False").lower()
+        in ("true", "1", "yes"),
+        "max_concurrency": int(os.getenv("MAX_CONCURRENCY", "200")),
+        "initial_concurrency": int(os.getenv("INITIAL_CONCURRENCY", "10")),
+        "min_concurrency": int(os.getenv("MIN_CONCURRENCY", "1")),
+        "latency_target": float(os.getenv("LATENCY_TARGET", "5.0")),
+        "retry_max_delay": int(os.getenv("RETRY_MAX_DELAY", "60")),
+        "fetch_processes": 1,
+        "state_dir": os.getenv("STATE_DIR", "temp/state"),
+        "frontier_path": os.getenv("FRONTIER_DB", "temp/state/frontier.db"),
+        "frontier_batch_size": int(os.getenv("FRONTIER_BATCH_SIZE", "500")),
+        "frontier_commit_interval": int(os.getenv("FRONTIER_COMMIT_INTERVAL", "5")),
+        "frontier_max_attempts": int(os.getenv("FRONTIER_MAX_ATTEMPTS", "5")),
+        "chunk_min_size": int(os.getenv("CHUNK_MIN_SIZE", "250")),
+        "chunk_initial_size": int(os.getenv("CHUNK_INITIAL_SIZE", "1000")),
+        "chunk_target_seconds": float(os.getenv("CHUNK_TARGET_SECONDS", "120")),
+        "lease_seconds": int(os.getenv("LEASE_SECONDS", "300")),
+        "chunk_retry_delay": int(os.getenv("CHUNK_RETRY_DELAY", "60")),
+        "density_block_size": int(os.getenv("DENSITY_BLOCK_SIZE", "10000")),
+        "density_min_yield": float(os.getenv("DENSITY_MIN_YIELD", "0.01")),
+        "density_exploration": float(os.getenv("DENSITY_EXPLORATION", "0.1")),
+        "recrawl_budget": int(os.getenv("RECRAWL_BUDGET", "10000")),
+        "ids_batch_size": int(os.getenv("IDS_BATCH_SIZE", "250")),
+        "max_duration": int(os.getenv("MAX_DURATION", "0")),
+        "max_cvs": int(os.getenv("MAX_CVS", "0")),
+        "checkpoint_interval": int(os.getenv("CHECKPOINT_INTERVAL", "60")),
+        "pipeline": os.getenv("PIPELINE", "False").lower() in ("true", "1", "yes"),
+        "fetch_workers": int(os.getenv("FETCH_WORKERS", "16")),
+        "parse_workers": int(os.getenv("PARSE_WORKERS", "0")),
+        "write_workers": int(os.getenv("WRITE_WORKERS", "2")),
+        "queue_size": int(os.getenv("PIPELINE_QUEUE_SIZE", "64")),
+        "pipeline_report_interval": int(os.getenv("PIPELINE_REPORT_INTERVAL", "30")),
+        "http_pool_connections": int(os.getenv("HTTP_POOL_CONNECTIONS", "4")),
+        "http_pool_maxsize": int(os.getenv("HTTP_POOL_MAXSIZE", "10")),
+        "cache_enabled": os.getenv("HTML_CACHE", "False").lower()
+        in ("true", "1", "yes"),
+        "cache_dir": os.getenv("HTML_CACHE_DIR", "temp/html_cache"),
+        "cache_ttl": int(os.getenv("HTML_CACHE_TTL", str(30 * 24 * 3600))),
+        "cache_max_size_mb": int(os.getenv("HTML_CACHE_MAX_SIZE_MB", "2048")),
     },
 }
 
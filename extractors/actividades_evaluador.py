@@ -1,5 +1,6 @@
 from config import ProjectLogger
-from extractors.utils import insert_data
+from extractors.utils import insert_data, get_section
+from extractors.textkit import NUMBERS, clean_text
 from datetime import datetime
 import re
 
@@ -20,18 +21,19 @@ class ActividadesEvaluador:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(f"No se encontró tabla para jurados en {cod_rh}")
                 return
 
-            lis = table.find_all("li")
-            blockquotes = table.find_all("blockquote")
+            lis = section.lis
+            blockquotes = section.blockquotes
 
             if len(lis) != len(blockquotes):
                 module_logger.warning(
@@ -45,9 +47,7 @@ class ActividadesEvaluador:
                     # Extraer información del elemento li
                     li_split = lis[i].text.split("-")
                     data["chulo"] = "SI" if lis[i].find("img") else "NO"
-                    data["nivel_programa_academico"] = ActividadesEvaluador._clean_text(
-                        li_split[2]
-                    )
+                    data["nivel_programa_academico"] = clean_text(li_split[2])
 
                     # Extraer información del blockquote
                     if i < len(blockquotes):
@@ -87,38 +87,22 @@ class ActividadesEvaluador:
         for j in range(len(blockquote_split)):
             try:
                 if blockquote_split[j] == "Titulo:":
-                    data["coautores"] = ActividadesEvaluador._clean_text(
-                        blockquote_split[j - 1]
-                    )
-                    data["titulo"] = ActividadesEvaluador._clean_text(
-                        blockquote_split[j + 8]
-                    )
+                    data["coautores"] = clean_text(blockquote_split[j - 1])
+                    data["titulo"] = clean_text(blockquote_split[j + 8])
                 elif blockquote_split[j] == "Tipo de trabajo presentado:":
-                    data["tipo_trabajo"] = ActividadesEvaluador._clean_text(
-                        blockquote_split[j + 7]
-                    )
+                    data["tipo_trabajo"] = clean_text(blockquote_split[j + 7])
                 elif blockquote_split[j] == "en:":
-                    data["institucion"] = ActividadesEvaluador._clean_text(
-                        blockquote_split[j + 6]
-                    )
+                    data["institucion"] = clean_text(blockquote_split[j + 6])
                 elif blockquote_split[j] == "programa académico":
-                    data["programa_academico"] = ActividadesEvaluador._clean_text(
-                        blockquote_split[j + 5]
-                    )
+                    data["programa_academico"] = clean_text(blockquote_split[j + 5])
                 elif blockquote_split[j] == "Nombre del orientado:":
-                    data["nombre_orientado"] = ActividadesEvaluador._clean_text(
-                        blockquote_split[j + 4]
-                    )
+                    data["nombre_orientado"] = clean_text(blockquote_split[j + 4])
                 elif blockquote_split[j] == "Palabras:":
                     data["palabras"] = blockquote_split[j + 3].rstrip()
                 elif blockquote_split[j] == "Areas:":
-                    data["areas"] = ActividadesEvaluador._clean_text(
-                        blockquote_split[j + 2]
-                    )
+                    data["areas"] = clean_text(blockquote_split[j + 2])
                 elif blockquote_split[j] == "Sectores:":
-                    data["sectores"] = ActividadesEvaluador._clean_text(
-                        blockquote_split[j + 1]
-                    )
+                    data["sectores"] = clean_text(blockquote_split[j + 1])
             except Exception as ex:
                 module_logger.error(
                     f"Error extrayendo datos del blockquote jurados: {str(ex)}",
@@ -132,11 +116,12 @@ class ActividadesEvaluador:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -144,7 +129,7 @@ class ActividadesEvaluador:
                 )
                 return
 
-            blockquotes = table.find_all("blockquote")
+            blockquotes = section.blockquotes
 
             if not blockquotes:
                 module_logger.warning(
@@ -191,30 +176,24 @@ class ActividadesEvaluador:
         for j in range(len(blockquote_split)):
             try:
                 if blockquote_split[j] == "Ámbito:":
-                    data["ambito"] = ActividadesEvaluador._clean_text(
-                        blockquote_split[j + 5]
-                    )
+                    data["ambito"] = clean_text(blockquote_split[j + 5])
                 if blockquote_split[j] == "Par evaluador de:":
-                    data["par_evaluador_de"] = ActividadesEvaluador._clean_text(
-                        blockquote_split[j + 4]
-                    )
+                    data["par_evaluador_de"] = clean_text(blockquote_split[j + 4])
                 if blockquote_split[j] == "Institución:":
                     temp = blockquote_split[j + 3].split("\xa0")
                     if len(temp) == 4:
-                        data["entidad_convocadora"] = ActividadesEvaluador._clean_text(
-                            temp[0]
-                        )[:-1]
+                        data["entidad_convocadora"] = clean_text(temp[0])[:-1]
                 if blockquote_split[j] in ["Revista:", "Editorial:"]:
-                    data["tipo_material"] = ActividadesEvaluador._clean_text(
+                    data["tipo_material"] = clean_text(
                         "".join(filter(None, blockquote_split[j:]))
                     ).split("\xa0")[0][:-1]
                 if j == len(blockquote_split) - 1:
                     temp = blockquote_split[j].split(",")
-                    anos = re.findall(r"[0-9]+", blockquote_split[j])
+                    anos = NUMBERS.findall(blockquote_split[j])
                     if anos:
                         data["ano"] = anos[0]
                     if len(temp) > 2:
-                        data["mes"] = ActividadesEvaluador._clean_text(temp[2])
+                        data["mes"] = clean_text(temp[2])
             except Exception as ex:
                 module_logger.error(
                     f"Error extrayendo datos del blockquote par evaluador: {str(ex)}",
@@ -228,11 +207,12 @@ class ActividadesEvaluador:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -240,8 +220,8 @@ class ActividadesEvaluador:
                 )
                 return
 
-            lis = table.find_all("li")
-            blockquotes = table.find_all("blockquote")
+            lis = section.lis
+            blockquotes = section.blockquotes
 
             if len(lis) != len(blockquotes):
                 module_logger.warning(
@@ -256,7 +236,7 @@ class ActividadesEvaluador:
                     data["chulo"] = "SI" if lis[i].find("img") else "NO"
                     li_split = lis[i].text.split("-")
                     if len(li_split) > 2:
-                        data["tipo"] = ActividadesEvaluador._clean_text(li_split[2])
+                        data["tipo"] = clean_text(li_split[2])
 
                     # Extraer información del blockquote
                     if i < len(blockquotes):
@@ -297,15 +277,11 @@ class ActividadesEvaluador:
         for j in range(len(blockquote_split)):
             try:
                 if blockquote_split[j] == "en:":
-                    data["institucion"] = ActividadesEvaluador._clean_text(
-                        blockquote_split[j + 4]
-                    )
+                    data["institucion"] = clean_text(blockquote_split[j + 4])
                     if j > 0:
                         parts = blockquote_split[j - 1].split(",")
                         if len(parts) > 1:
-                            data["nombre_producto"] = ActividadesEvaluador._clean_text(
-                                "".join(parts[1:])
-                            )
+                            data["nombre_producto"] = clean_text("".join(parts[1:]))
                             # Buscar año en el formato ####=
                             anos = re.findall(r"[0-9]{4}=", data["nombre_producto"])
                             if anos:
@@ -318,29 +294,6 @@ class ActividadesEvaluador:
                     exc_info=True,
                 )
 
-    @staticmethod
-    def _clean_text(text):
-        """
-        Limpia el texto de caracteres no deseados.
-
-        Args:
-            text (str): Texto a limpiar.
-
-        Returns:
-            str: Texto limpio.
-        """
-        if not text:
-            return ""
-
-        return (
-            text.strip()
-            .replace("'", '"')
-            .replace("\t'", '"')
-            .replace("  ", "")
-            .replace("\n", "")
-            .replace("\r", "")
-        )
-
 
 # Funciones de compatibilidad para el código existente
 def extract_jurados(cod_rh, h3, connection):
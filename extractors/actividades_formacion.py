@@ -1,5 +1,6 @@
 from config import ProjectLogger
-from extractors.utils import insert_data
+from extractors.utils import insert_data, get_section
+from extractors.textkit import AUTHORS, AUTHORS_END, clean_text
 from datetime import datetime
 import re
 
@@ -20,11 +21,12 @@ class ActividadesFormacion:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -32,8 +34,8 @@ class ActividadesFormacion:
                 )
                 return
 
-            lis = table.find_all("li")
-            blockquotes = table.find_all("blockquote")
+            lis = section.lis
+            blockquotes = section.blockquotes
 
             if len(lis) != len(blockquotes):
                 module_logger.warning(
@@ -48,9 +50,7 @@ class ActividadesFormacion:
                     data["chulo"] = "SI" if lis[i].find("img") else "NO"
                     li_split = lis[i].text.split("-")
                     if len(li_split) > 2:
-                        data["nivel_programa_academico"] = (
-                            ActividadesFormacion._clean_text(li_split[2])
-                        )
+                        data["nivel_programa_academico"] = clean_text(li_split[2])
 
                     # Extraer información del blockquote
                     if i < len(blockquotes):
@@ -90,16 +90,12 @@ class ActividadesFormacion:
             try:
                 if blockquote_split[j] == "Finalidad:":
                     data["coautores"] = ", ".join(
-                        re.findall("[A-Z]{2,}[ [A-Z]{2,}]*", blockquote_split[:j][0])
+                        AUTHORS.findall(blockquote_split[:j][0])
                     )
-                    nombre_producto = re.split("[A-Z]{2,},", blockquote_split[j - 1])
+                    nombre_producto = AUTHORS_END.split(blockquote_split[j - 1])
                     if len(nombre_producto) > 1:
-                        data["nombre_producto"] = ActividadesFormacion._clean_text(
-                            nombre_producto[1]
-                        )
-                    finalidad = ActividadesFormacion._clean_text(
-                        blockquote_split[j + 6]
-                    )
+                        data["nombre_producto"] = clean_text(nombre_producto[1])
+                    finalidad = clean_text(blockquote_split[j + 6])
                     if finalidad != ".":
                         data["finalidad"] = finalidad
                 elif blockquote_split[j] == "En:":
@@ -112,31 +108,21 @@ class ActividadesFormacion:
                                 f"No se pudo convertir el año a entero: {temp[1]}"
                             )
                     if len(temp) > 0:
-                        data["pais"] = ActividadesFormacion._clean_text(temp[0])
+                        data["pais"] = clean_text(temp[0])
                     if len(temp) > 3:
-                        data["institucion_financiadora"] = (
-                            ActividadesFormacion._clean_text(temp[3])[:-1]
-                        )
+                        data["institucion_financiadora"] = clean_text(temp[3])[:-1]
                 elif blockquote_split[j] == "participación:":
                     temp = blockquote_split[j + 4].split(",")
                     if len(temp) > 0:
-                        data["participacion"] = ActividadesFormacion._clean_text(
-                            temp[0]
-                        )
+                        data["participacion"] = clean_text(temp[0])
                     if len(temp) > 1:
-                        data["duracion"] = ActividadesFormacion._clean_text(temp[1])
+                        data["duracion"] = clean_text(temp[1])
                 elif blockquote_split[j] == "Palabras:":
-                    data["palabras"] = ActividadesFormacion._clean_text(
-                        blockquote_split[j + 3]
-                    )
+                    data["palabras"] = clean_text(blockquote_split[j + 3])
                 elif blockquote_split[j] == "Areas:":
-                    data["areas"] = ActividadesFormacion._clean_text(
-                        blockquote_split[j + 2]
-                    )
+                    data["areas"] = clean_text(blockquote_split[j + 2])
                 elif blockquote_split[j] == "Sectores:":
-                    data["sectores"] = ActividadesFormacion._clean_text(
-                        blockquote_split[j + 1]
-                    )
+                    data["sectores"] = clean_text(blockquote_split[j + 1])
             except Exception as ex:
                 module_logger.error(
                     f"Error extrayendo datos del blockquote cursos cortos: {str(ex)}",
@@ -150,11 +136,12 @@ class ActividadesFormacion:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -162,8 +149,8 @@ class ActividadesFormacion:
                 )
                 return
 
-            lis = table.find_all("li")
-            blockquotes = table.find_all("blockquote")
+            lis = section.lis
+            blockquotes = section.blockquotes
 
             if len(lis) != len(blockquotes):
                 module_logger.warning(
@@ -179,9 +166,7 @@ class ActividadesFormacion:
                     data["chulo"] = "SI" if lis[i].find("img") else "NO"
                     li_split = lis[i].text.split("-")
                     if len(li_split) > 1:
-                        data["tipo_producto"] = ActividadesFormacion._clean_text(
-                            li_split[1]
-                        )
+                        data["tipo_producto"] = clean_text(li_split[1])
 
                     # Extraer información del blockquote
                     if i < len(blockquotes):
@@ -220,24 +205,20 @@ class ActividadesFormacion:
         for j in range(len(blockquote_split)):
             try:
                 if blockquote_split[j] == "Estado:":
-                    split1 = re.split("[A-Z]{2,},", blockquote_split[j - 1])
+                    split1 = AUTHORS_END.split(blockquote_split[j - 1])
                     if len(split1) > 1:
                         split2 = re.split("([A-Z]{2,}[ A-Z]*)", split1[1])
 
                         if len(split2) > 0:
-                            data["nombre"] = ActividadesFormacion._clean_text(split2[0])
+                            data["nombre"] = clean_text(split2[0])
                         if len(split2) > 1:
-                            data["institucion"] = ActividadesFormacion._clean_text(
-                                split2[1]
-                            )
+                            data["institucion"] = clean_text(split2[1])
 
                     temp = blockquote_split[j + 6].split("\xa0")
                     if len(temp) > 0:
-                        data["estado"] = ActividadesFormacion._clean_text(temp[0])
+                        data["estado"] = clean_text(temp[0])
                     if len(temp) > 1:
-                        data["programa_academico"] = ActividadesFormacion._clean_text(
-                            temp[1]
-                        )
+                        data["programa_academico"] = clean_text(temp[1])
                     if len(temp) > 2:
                         try:
                             year_str = temp[2].replace(",", "").replace(".", "").strip()
@@ -248,36 +229,23 @@ class ActividadesFormacion:
                             )
 
                     data["coautores"] = ", ".join(
-                        re.findall(
-                            "[A-Z]{2,}[ [A-Z]{2,}]*",
-                            blockquote_split[:j][0].split(".")[0],
-                        )
+                        AUTHORS.findall(blockquote_split[:j][0].split(".")[0])
                     )
 
                 elif blockquote_split[j] == "Dirigió como:":
                     tipo_split = blockquote_split[j + 4].split(",")
                     if tipo_split:
-                        data["tipo_orientacion"] = ActividadesFormacion._clean_text(
-                            tipo_split[0]
-                        )
+                        data["tipo_orientacion"] = clean_text(tipo_split[0])
                 elif blockquote_split[j] == "Persona orientada:":
                     persona_split = blockquote_split[j + 5].split("\xa0")
                     if len(persona_split) > 1:
-                        data["persona_orientada"] = ActividadesFormacion._clean_text(
-                            persona_split[1]
-                        )
+                        data["persona_orientada"] = clean_text(persona_split[1])
                 elif blockquote_split[j] == "Palabras:":
-                    data["palabras"] = ActividadesFormacion._clean_text(
-                        blockquote_split[j + 3]
-                    )
+                    data["palabras"] = clean_text(blockquote_split[j + 3])
                 elif blockquote_split[j] == "Areas:":
-                    data["areas"] = ActividadesFormacion._clean_text(
-                        blockquote_split[j + 2]
-                    )
+                    data["areas"] = clean_text(blockquote_split[j + 2])
                 elif blockquote_split[j] == "Sectores:":
-                    data["sectores"] = ActividadesFormacion._clean_text(
-                        blockquote_split[j + 1]
-                    )
+                    data["sectores"] = clean_text(blockquote_split[j + 1])
             except Exception as ex:
                 module_logger.error(
                     f"Error extrayendo datos del blockquote trabajos dirigidos: {str(ex)}",
@@ -291,11 +259,12 @@ class ActividadesFormacion:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -303,8 +272,8 @@ class ActividadesFormacion:
                 )
                 return
 
-            lis = table.find_all("li")
-            blockquotes = table.find_all("blockquote")
+            lis = section.lis
+            blockquotes = section.blockquotes
 
             if len(lis) != len(blockquotes):
                 module_logger.warning(
@@ -317,9 +286,7 @@ class ActividadesFormacion:
 
                     # Extraer información del elemento li
                     data["chulo"] = "SI" if lis[i].find("img") else "NO"
-                    data["nombre_proyecto_ondas"] = ActividadesFormacion._clean_text(
-                        lis[i].text
-                    )
+                    data["nombre_proyecto_ondas"] = clean_text(lis[i].text)
 
                     # Extraer información del blockquote
                     if i < len(blockquotes):
@@ -360,38 +327,13 @@ class ActividadesFormacion:
                     if j + 2 < len(blockquote_split):
                         data["institucion"] = blockquote_split[j + 2][:-1]
                 elif blockquote_split[j] == "Ciudad:":
-                    data["ciudad"] = ActividadesFormacion._clean_text(
-                        blockquote_split[j + 1]
-                    )
+                    data["ciudad"] = clean_text(blockquote_split[j + 1])
             except Exception as ex:
                 module_logger.error(
                     f"Error extrayendo datos del blockquote asesorías: {str(ex)}",
                     exc_info=True,
                 )
 
-    @staticmethod
-    def _clean_text(text):
-        """
-        Limpia el texto de caracteres no deseados.
-
-        Args:
-            text (str): Texto a limpiar.
-
-        Returns:
-            str: Texto limpio.
-        """
-        if not text:
-            return ""
-
-        return (
-            text.strip()
-            .replace("'", '"')
-            .replace("\t'", '"')
-            .replace("  ", "")
-            .replace("\n", "")
-            .replace("\r", "")
-        )
-
 
 # Funciones de compatibilidad para el código existente
 def extract_cursos_cortos(cod_rh, h3, connection):
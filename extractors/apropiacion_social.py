@@ -1,5 +1,15 @@
 from config import ProjectLogger
-from extractors.utils import insert_data
+from extractors.utils import insert_data, get_section
+from extractors.textkit import AUTHORS, AUTHORS_END, YEAR, clean_text
+from extractors.field_spec import (
+    FieldSpec,
+    KEYWORD_FIELDS,
+    SKIP,
+    cleaned_after,
+    first_int,
+    to_int,
+    set_field,
+)
 from datetime import datetime
 import re
 import locale
@@ -17,6 +27,372 @@ except Exception as ex:
     module_logger.warning(f"No se pudo configurar el locale: {str(ex)}")
 
 
+def _nombre_tras_autores(token):
+    """Texto entre la lista de autores y la etiqueta, limpio."""
+    return clean_text(AUTHORS_END.split(token.before)[-1])
+
+
+def _consultoria_pais_ano(token, data):
+    temp = token.after.split(",")
+    data["pais"] = clean_text(temp[0])
+    if len(temp) > 2:
+        set_field(data, "ano", to_int(clean_text(temp[2])))
+    if len(temp) > 3:
+        split_duracion = temp[3].split("\xa0")
+        if len(split_duracion) > 1:
+            data["duracion"] = clean_text(split_duracion[1])
+
+
+def _edicion_pais_ano(token, data):
+    temp = token.after.split("\xa0")
+    data["pais"] = clean_text(temp[0].replace(",", ""))
+    if len(temp) > 1:
+        anos = YEAR.findall(temp[1])
+        if anos:
+            set_field(data, "ano", to_int(anos[0]))
+    if len(temp) > 2:
+        data["editorial"] = clean_text(temp[2])
+    if len(temp) > 3:
+        paginas = PAGES.findall(temp[3])
+        if paginas:
+            set_field(
+                data, "paginas", to_int(paginas[0].replace("p.", ""), "las páginas")
+            )
+
+
+# Páginas ("p.123")
+PAGES = re.compile(r"p\.[0-9]+")
+
+# Campos de los blockquote de cada sección (ver extractors.field_spec)
+CONSULTORIAS = FieldSpec(
+    (
+        "Nombre comercial:",
+        "contrato/registro:",
+        "En:",
+        "Palabras:",
+        "Areas:",
+        "Sectores:",
+    ),
+    [
+        ("Nombre comercial:", "nombre", _nombre_tras_autores),
+        (
+            "contrato/registro:",
+            "numero_contrato",
+            lambda token: clean_text(token.after.replace(",", "").replace(".", "")),
+        ),
+        ("En:", None, _consultoria_pais_ano),
+    ]
+    + KEYWORD_FIELDS,
+    "consultoría",
+)
+
+EDICIONES_REVISIONES = FieldSpec(
+    ("Nombre comercial:", "contrato/registro:", "En:"),
+    [
+        ("En:", None, _edicion_pais_ano),
+        ("Nombre comercial:", "revista", _nombre_tras_autores),
+    ],
+    "edición/revisión",
+)
+
+
+def _evento_realizado(token, data):
+    temp = EVENT_DATES.split(token.after)
+    if temp[0].strip():
+        data["fecha_inicio"] = clean_text(temp[0])
+    if len(temp) > 2 and temp[2].strip():
+        data["fecha_fin"] = clean_text(temp[2])
+    if len(temp) > 4:
+        temp2 = temp[4].split("-")
+        data["ciudad"] = clean_text(temp2[0])
+        if len(temp2) > 1:
+            data["lugar"] = clean_text(temp2[1])
+
+
+def _informe_coautores_ano(token, data):
+    """Autores y año alrededor del primer 'En:' del informe."""
+    if not token.first:
+        return
+    data["coautores"] = ", ".join(AUTHORS.findall(token.before))
+    anos = YEAR.findall(token.after)
+    if anos:
+        set_field(data, "ano", to_int(anos[0]))
+
+
+def _red_creada(token, data):
+    temp = token.after.split("\xa0")
+    data["fecha_inicio"] = clean_text(temp[0].replace(",", ""))
+    if len(temp) > 2:
+        lugar_split = temp[2].split("en ")
+        if len(lugar_split) > 1:
+            data["lugar"] = clean_text(lugar_split[1])
+    if len(temp) > 3:
+        participantes = NETWORK_PARTICIPANTS.findall(temp[3])
+        if participantes and participantes[0] != "":
+            set_field(
+                data, "participantes", to_int(participantes[0], "los participantes")
+            )
+
+
+def _coautores_nombre(token, data, field="nombre"):
+    """Coautores y nombre del producto en el texto anterior a la etiqueta."""
+    data["coautores"] = ", ".join(AUTHORS.findall(token.before))
+    data[field] = clean_text(AUTHORS.sub("", token.before).replace(", ", ""))
+
+
+def _compact(token):
+    """Texto posterior a la etiqueta sin espacios ni puntos (fechas)."""
+    return "".join(token.after.split()).replace(".", "")
+
+
+def _audio_en(token, data):
+    if token.first:
+        _coautores_nombre(token, data, "titulo")
+        data["fecha"] = _compact(token)
+    else:
+        data["lugar"] = clean_text(token.after)
+
+
+def _impreso_tipo(token):
+    tipo_split = token.after.split("-")
+    if len(tipo_split) > 2:
+        return clean_text(tipo_split[2])[:-1]
+    return SKIP
+
+
+def _multimedia_en(token, data):
+    _coautores_nombre(token, data)
+    temp = token.after.split(",")
+    if len(temp) > 2:
+        set_field(data, "ano", to_int(temp[2]))
+    data["pais"] = clean_text(temp[0])
+
+
+def _multimedia_emisora(token, data):
+    temp = token.after.split("\xa0")
+    data["emisora"] = temp[0]
+    if len(temp) > 1:
+        set_field(data, "duracion", first_int(temp[1], "la duración"))
+
+
+def _secuencia_en(token, data):
+    if token.first:
+        _coautores_nombre(token, data)
+        data["fecha"] = _compact(token)
+    else:
+        data["ciudad"] = clean_text(token.after)[:-1]
+
+
+def _contenido_virtual_tipo(token, data):
+    tipo_split = token.after.split("-")
+    if len(tipo_split) > 2:
+        data["tipo"] = clean_text(tipo_split[2].split(",")[0])
+    fecha = DATE_REST.findall(token.after)
+    if fecha:
+        data["fecha"] = clean_text(fecha[0])
+
+
+def _espacio_realizado(token, data):
+    fechas = DATES.findall(token.after)
+    if len(fechas) > 0:
+        data["fecha_inicio"] = fechas[0]
+    if len(fechas) > 1:
+        data["fecha_fin"] = fechas[1]
+
+    temp = PLACE_PARTICIPANTS.split(token.after)
+    if len(temp) > 1:
+        data["ciudad"] = clean_text(temp[1].replace("-", ""))
+    if len(temp) > 2:
+        set_field(data, "participantes", first_int(temp[2], "los participantes"))
+
+
+def _fecha_sin_comas(token):
+    return clean_text(token.after.replace(",", ""))
+
+
+# Separadores de "Realizado el:" de los eventos, fechas, "con N participantes"
+# de las redes y lugar y participantes de los espacios de participación
+EVENT_DATES = re.compile(",|(en)")
+DATES = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+DATE_REST = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}.*")
+NETWORK_PARTICIPANTS = re.compile(r"con\s*([0-9]*)\s*participantes")
+PLACE_PARTICIPANTS = re.compile("en|Con")
+
+DATOS_EVENTO = FieldSpec(
+    ("Nombre del evento:", "Tipo de evento:", "Ámbito:", "Realizado el:"),
+    [
+        ("Nombre del evento:", "nombre_evento", cleaned_after),
+        ("Tipo de evento:", "tipo_evento", cleaned_after),
+        ("Ámbito:", "ambito", cleaned_after),
+        ("Realizado el:", None, _evento_realizado),
+    ],
+    "evento científico",
+)
+
+# Participantes, productos e instituciones de un evento: el primer campo es
+# el texto tras la primera etiqueta y el segundo, el texto tras la segunda
+PARTICIPANTE_EVENTO = FieldSpec(
+    ("Nombre:", "Rol en el evento:"), [], "participante del evento"
+)
+PRODUCTO_EVENTO = FieldSpec(
+    ("Nombre del producto:", "Tipo de producto:"), [], "producto del evento"
+)
+INSTITUCION_EVENTO = FieldSpec(
+    ("Nombre de la institución:", "Tipo de vinculación"),
+    [],
+    "institución del evento",
+)
+
+# Solo "En:" para obtener los autores y el año con la misma división que
+# blockquote.text.split("En:")
+INFORME_EN = FieldSpec(("En:",), [("En:", None, _informe_coautores_ano)], "informe")
+
+INFORMES = FieldSpec(
+    ("Informe de investigación:", "En:"),
+    [
+        (
+            "Informe de investigación:",
+            "titulo",
+            lambda token: clean_text(token.after.replace("\n", "").replace(".", "")),
+        ),
+    ],
+    "informe",
+)
+
+REDES_CONOCIMIENTO = FieldSpec(
+    ("Nombre de la red", "Tipo de red", "Creada el:"),
+    [
+        ("Nombre de la red", "nombre", cleaned_after),
+        ("Tipo de red", "tipo", lambda token: clean_text(token.after)[:-1]),
+        ("Creada el:", None, _red_creada),
+    ],
+    "red de conocimiento",
+)
+
+AUDIO = FieldSpec(
+    ("En:", "Formato:", "Descripción:", "Palabras:", "Areas:", "Sectores:"),
+    [
+        ("En:", None, _audio_en),
+        ("Formato:", "formato", cleaned_after),
+        ("Descripción:", "descripcion", cleaned_after),
+    ]
+    + KEYWORD_FIELDS,
+    "contenido de audio",
+)
+
+IMPRESO = FieldSpec(
+    (
+        "Nombre",
+        "Tipo",
+        "Medio de circulación:",
+        "disponible en",
+        "en la fecha",
+        "en el ámbito",
+    ),
+    [
+        ("Nombre", "nombre", cleaned_after),
+        ("Tipo", "tipo", _impreso_tipo),
+        (
+            "Medio de circulación:",
+            "medio_circulacion",
+            lambda token: clean_text(token.after)[:-1],
+        ),
+        ("disponible en", "sitio_web", cleaned_after),
+        ("en la fecha", "fecha", cleaned_after),
+        ("en el ámbito", "ambito", cleaned_after),
+    ],
+    "contenido impreso",
+)
+
+MULTIMEDIA = FieldSpec(
+    ("En:", "Emisora:", "Palabras:", "Areas:", "Sectores:"),
+    [
+        ("En:", None, _multimedia_en),
+        ("Emisora:", None, _multimedia_emisora),
+    ]
+    + KEYWORD_FIELDS,
+    "contenido multimedia",
+)
+
+SECUENCIA = FieldSpec(
+    (
+        "En:",
+        "Emisora:",
+        "Base de datos donde está incluido el registro:",
+        "disponible en",
+        "Institución:",
+        "Palabras:",
+        "Areas:",
+        "Sectores:",
+    ),
+    [
+        ("En:", None, _secuencia_en),
+        (
+            "Base de datos donde está incluido el registro:",
+            "base_datos",
+            cleaned_after,
+        ),
+        ("disponible en", "disponible_en", cleaned_after),
+        ("Institución:", "institucion", cleaned_after),
+    ]
+    + KEYWORD_FIELDS,
+    "secuencia genética",
+)
+
+CONTENIDO_VIRTUAL = FieldSpec(
+    ("Nombre", "Tipo", "disponible en", "Descripción:"),
+    [
+        ("Nombre", "titulo", cleaned_after),
+        ("Tipo", None, _contenido_virtual_tipo),
+        ("disponible en", "disponible_en", cleaned_after),
+        ("Descripción:", "descripcion", lambda token: token.after),
+    ],
+    "contenido virtual",
+)
+
+
+def _nombre_inicio_fin(label, description):
+    """
+    Crea la especificación de nombre, "Inicio en" y "Finalizó en :".
+
+    Args:
+        label (str): Etiqueta del nombre.
+        description (str): Nombre del producto para los mensajes de error.
+
+    Returns:
+        FieldSpec: Especificación de la sección.
+    """
+    return FieldSpec(
+        (label, "Inicio en", "Finalizó en :"),
+        [
+            (label, "nombre", cleaned_after),
+            ("Inicio en", "fecha_inicio", _fecha_sin_comas),
+            ("Finalizó en :", "fecha_fin", _fecha_sin_comas),
+        ],
+        description,
+    )
+
+
+ESTRATEGIAS_COMUNICACION = _nombre_inicio_fin(
+    "Nombre de la estrategia", "estrategia de comunicación"
+)
+ESTRATEGIAS_PEDAGOGICAS = _nombre_inicio_fin(
+    "Nombre de la estrategia", "estrategia pedagógica"
+)
+PARTICIPACION_PROYECTOS = _nombre_inicio_fin(
+    "Nombre del proyecto", "participación en proyecto"
+)
+
+ESPACIOS_PARTICIPACION = FieldSpec(
+    ("Nombre del espacio", "Realizado el:", "Finalizó en :"),
+    [
+        ("Nombre del espacio", "nombre", cleaned_after),
+        ("Realizado el:", None, _espacio_realizado),
+    ],
+    "espacio de participación",
+)
+
+
 class ApropiacionSocial:
     """
     Clase para extraer información relacionada con la apropiación social del conocimiento.
@@ -29,11 +405,12 @@ class ApropiacionSocial:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -41,8 +418,8 @@ class ApropiacionSocial:
                 )
                 return
 
-            lis = table.find_all("li")
-            blockquotes = table.find_all("blockquote")
+            lis = section.lis
+            blockquotes = section.blockquotes
 
             if len(lis) != len(blockquotes):
                 module_logger.warning(
@@ -61,13 +438,8 @@ class ApropiacionSocial:
 
                     # Extraer información del blockquote
                     if i < len(blockquotes):
-                        blockquote_split = re.split(
-                            "(Nombre comercial:)|(contrato/registro:)|(En:)|(Palabras:)|(Areas:)|(Sectores:)",
-                            blockquotes[i].text,
-                        )
-
                         ApropiacionSocial._extract_blockquote_consultorias(
-                            blockquote_split, data
+                            blockquotes[i].text, data
                         )
 
                     # Insertar en la base de datos
@@ -85,63 +457,15 @@ class ApropiacionSocial:
             )
 
     @staticmethod
-    def _extract_blockquote_consultorias(blockquote_split, data):
+    def _extract_blockquote_consultorias(text, data):
         """
         Extrae información del blockquote para consultorías.
 
         Args:
-            blockquote_split (list): Lista con las partes del blockquote.
+            text (str): Texto del blockquote.
             data (dict): Diccionario donde se almacenará la información.
         """
-        for j in range(len(blockquote_split)):
-            try:
-                if blockquote_split[j] == "Nombre comercial:":
-                    split_nombre = re.split("[A-Z]{2,},", blockquote_split[j - 1])
-                    if len(split_nombre) > 0:
-                        data["nombre"] = ApropiacionSocial._clean_text(split_nombre[-1])
-                elif blockquote_split[j] == "contrato/registro:":
-                    if j + 5 < len(blockquote_split):
-                        temp = blockquote_split[j + 5]
-                        data["numero_contrato"] = ApropiacionSocial._clean_text(
-                            temp.replace(",", "").replace(".", "")
-                        )
-                elif blockquote_split[j] == "En:":
-                    if j + 4 < len(blockquote_split):
-                        temp = blockquote_split[j + 4].split(",")
-                        if len(temp) > 0:
-                            data["pais"] = ApropiacionSocial._clean_text(temp[0])
-                        if len(temp) > 2:
-                            try:
-                                data["ano"] = int(
-                                    ApropiacionSocial._clean_text(temp[2])
-                                )
-                            except (ValueError, TypeError):
-                                module_logger.warning(
-                                    f"No se pudo convertir el año a entero: {temp[2]}"
-                                )
-                        if len(temp) > 3:
-                            split_duracion = temp[3].split("\xa0")
-                            if len(split_duracion) > 1:
-                                data["duracion"] = ApropiacionSocial._clean_text(
-                                    split_duracion[1]
-                                )
-                elif blockquote_split[j] == "Palabras:":
-                    data["palabras"] = ApropiacionSocial._clean_text(
-                        blockquote_split[j + 3]
-                    )
-                elif blockquote_split[j] == "Areas:":
-                    data["areas"] = ApropiacionSocial._clean_text(
-                        blockquote_split[j + 2]
-                    )
-                elif blockquote_split[j] == "Sectores:":
-                    data["sectores"] = ApropiacionSocial._clean_text(
-                        blockquote_split[j + 1]
-                    )
-            except Exception as ex:
-                module_logger.error(
-                    f"Error extrayendo datos del blockquote consultorías: {str(ex)}",
-                    exc_info=True,
-                )
+        CONSULTORIAS.apply(text, data)
 
     @staticmethod
     def extract_ediciones_revisiones(cod_rh, h3, connection):
@@ -150,11 +474,12 @@ class ApropiacionSocial:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -162,8 +487,8 @@ class ApropiacionSocial:
                 )
                 return
 
-            lis = table.find_all("li")
-            blockquotes = table.find_all("blockquote")
+            lis = section.lis
+            blockquotes = section.blockquotes
 
             if len(lis) != len(blockquotes):
                 module_logger.warning(
@@ -178,19 +503,12 @@ class ApropiacionSocial:
                     data["chulo"] = "SI" if lis[i].find("img") else "NO"
                     li_split = lis[i].text.split("-")
                     if len(li_split) > 2:
-                        data["tipo_producto"] = ApropiacionSocial._clean_text(
-                            li_split[2]
-                        )
+                        data["tipo_producto"] = clean_text(li_split[2])
 
                     # Extraer información del blockquote
                     if i < len(blockquotes):
-                        blockquote_split = re.split(
-                            "(Nombre comercial:)|(contrato/registro:)|(En:)",
-                            blockquotes[i].text,
-                        )
-
                         ApropiacionSocial._extract_blockquote_ediciones_revisiones(
-                            blockquote_split, data
+                            blockquotes[i].text, data
                         )
 
                     # Insertar en la base de datos
@@ -208,61 +526,22 @@ class ApropiacionSocial:
             )
 
     @staticmethod
-    def _extract_blockquote_ediciones_revisiones(blockquote_split, data):
+    def _extract_blockquote_ediciones_revisiones(text, data):
         """
         Extrae información del blockquote para ediciones/revisiones.
 
         Args:
-            blockquote_split (list): Lista con las partes del blockquote.
+            text (str): Texto del blockquote.
             data (dict): Diccionario donde se almacenará la información.
         """
-        for j in range(len(blockquote_split)):
-            try:
-                if blockquote_split[j] == "En:":
-                    if j + 1 < len(blockquote_split):
-                        temp = blockquote_split[j + 1].split("\xa0")
-                        if len(temp) > 0:
-                            data["pais"] = ApropiacionSocial._clean_text(
-                                temp[0].replace(",", "")
-                            )
-                        if len(temp) > 1:
-                            anos = re.findall(r"[0-9]{4}", temp[1])
-                            if anos:
-                                try:
-                                    data["ano"] = int(anos[0])
-                                except (ValueError, TypeError):
-                                    module_logger.warning(
-                                        f"No se pudo convertir el año a entero: {anos[0]}"
-                                    )
-                        if len(temp) > 2:
-                            data["editorial"] = ApropiacionSocial._clean_text(temp[2])
-                        if len(temp) > 3:
-                            paginas = re.findall(r"p\.[0-9]+", temp[3])
-                            if paginas:
-                                try:
-                                    data["paginas"] = int(paginas[0].replace("p.", ""))
-                                except (ValueError, TypeError):
-                                    module_logger.warning(
-                                        f"No se pudo convertir las páginas a entero: {paginas[0]}"
-                                    )
-                elif blockquote_split[j] == "Nombre comercial:":
-                    if j - 1 >= 0:
-                        nombre_split = re.split("[A-Z]{2,},", blockquote_split[j - 1])
-                        if len(nombre_split) > 0:
-                            data["revista"] = ApropiacionSocial._clean_text(
-                                nombre_split[-1]
-                            )
-            except Exception as ex:
-                module_logger.error(
-                    f"Error extrayendo datos del blockquote ediciones/revisiones: {str(ex)}",
-                    exc_info=True,
-                )
+        EDICIONES_REVISIONES.apply(text, data)
 
     @staticmethod
     def extract_eventos_cientificos(cod_rh, h3, nombre_completo, connection):
         """Extrae información sobre eventos científicos."""
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -301,7 +580,7 @@ class ApropiacionSocial:
                     result = insert_data("eventos_cientificos", data, connection)
 
                     # Solo proceder con los datos relacionados si el evento principal se insertó correctamente
-                    if result in ["insert", "update"]:
+                    if result in ["insert", "update", "buffered"]:
                         # Extraer participantes
                         ApropiacionSocial._extract_participantes_evento(
                             trs[3], data, nombre_completo, connection
@@ -344,47 +623,7 @@ class ApropiacionSocial:
             tr (BeautifulSoup): Elemento HTML que contiene la información.
             data (dict): Diccionario donde se almacenará la información.
         """
-        try:
-            datos_evento = re.split(
-                "(Nombre del evento:)|(Tipo de evento:)|(Ámbito:)|(Realizado el:)",
-                tr.text,
-            )
-            for i in range(len(datos_evento)):
-                try:
-                    if datos_evento[i] == "Nombre del evento:":
-                        data["nombre_evento"] = ApropiacionSocial._clean_text(
-                            datos_evento[i + 4]
-                        )
-                    elif datos_evento[i] == "Tipo de evento:":
-                        data["tipo_evento"] = ApropiacionSocial._clean_text(
-                            datos_evento[i + 3]
-                        )
-                    elif datos_evento[i] == "Ámbito:":
-                        data["ambito"] = ApropiacionSocial._clean_text(
-                            datos_evento[i + 2]
-                        )
-                    elif datos_evento[i] == "Realizado el:":
-                        temp = re.split(",|(en)", datos_evento[i + 1])
-                        if len(temp) > 0 and temp[0].strip():
-                            data["fecha_inicio"] = ApropiacionSocial._clean_text(
-                                temp[0]
-                            )
-                        if len(temp) > 2 and temp[2].strip():
-                            data["fecha_fin"] = ApropiacionSocial._clean_text(temp[2])
-                        if len(temp) > 4:
-                            temp2 = temp[4].split("-")
-                            if len(temp2) > 0:
-                                data["ciudad"] = ApropiacionSocial._clean_text(temp2[0])
-                            if len(temp2) > 1:
-                                data["lugar"] = ApropiacionSocial._clean_text(temp2[1])
-                except Exception as ex:
-                    module_logger.error(
-                        f"Error extrayendo datos del evento: {str(ex)}", exc_info=True
-                    )
-        except Exception as ex:
-            module_logger.error(
-                f"Error general en _extract_datos_evento: {str(ex)}", exc_info=True
-            )
+        DATOS_EVENTO.apply(tr.text, data)
 
     @staticmethod
     def _extract_participantes_evento(tr, data, nombre_completo, connection):
@@ -405,23 +644,18 @@ class ApropiacionSocial:
                 if unidecode.unidecode(nombre_completo.upper()) in li.text:
                     rol_split = li.text.split("Rol en el evento:")
                     if len(rol_split) > 1:
-                        data["rol"] = ApropiacionSocial._clean_text(rol_split[1])
+                        data["rol"] = clean_text(rol_split[1])
                     break
 
             # Extraer todos los participantes
             for li in lis:
                 try:
                     data_participante = {}
-                    participante = re.split("(Nombre:)|(Rol en el evento:)", li.text)
-
-                    if len(participante) > 3:
-                        data_participante["nombre"] = ApropiacionSocial._clean_text(
-                            participante[3]
-                        )
-                    if len(participante) > 6:
-                        data_participante["rol"] = ApropiacionSocial._clean_text(
-                            participante[6]
-                        )
+                    tokens = PARTICIPANTE_EVENTO.tokenize(li.text)
+                    if len(tokens) > 0:
+                        data_participante["nombre"] = clean_text(tokens[0].after)
+                    if len(tokens) > 1:
+                        data_participante["rol"] = clean_text(tokens[1].after)
 
                     data_participante["evento_id"] = data["id"]
 
@@ -453,18 +687,11 @@ class ApropiacionSocial:
             for li in lis:
                 try:
                     data_producto = {}
-                    producto = re.split(
-                        "(Nombre del producto:)|(Tipo de producto:)", li.text
-                    )
-
-                    if len(producto) > 3:
-                        data_producto["nombre"] = ApropiacionSocial._clean_text(
-                            producto[3]
-                        )
-                    if len(producto) > 6:
-                        data_producto["tipo_producto"] = ApropiacionSocial._clean_text(
-                            producto[6]
-                        )
+                    tokens = PRODUCTO_EVENTO.tokenize(li.text)
+                    if len(tokens) > 0:
+                        data_producto["nombre"] = clean_text(tokens[0].after)
+                    if len(tokens) > 1:
+                        data_producto["tipo_producto"] = clean_text(tokens[1].after)
 
                     data_producto["evento_id"] = data["id"]
 
@@ -495,17 +722,12 @@ class ApropiacionSocial:
             for li in lis:
                 try:
                     data_institucion = {}
-                    institucion = re.split(
-                        "(Nombre de la institución:)|(Tipo de vinculación)", li.text
-                    )
-
-                    if len(institucion) > 3:
-                        data_institucion["nombre"] = ApropiacionSocial._clean_text(
-                            institucion[3]
-                        )
-                    if len(institucion) > 6:
-                        data_institucion["tipo_vinculacion"] = (
-                            ApropiacionSocial._clean_text(institucion[6])
+                    tokens = INSTITUCION_EVENTO.tokenize(li.text)
+                    if len(tokens) > 0:
+                        data_institucion["nombre"] = clean_text(tokens[0].after)
+                    if len(tokens) > 1:
+                        data_institucion["tipo_vinculacion"] = clean_text(
+                            tokens[1].after
                         )
 
                     data_institucion["evento_id"] = data["id"]
@@ -529,49 +751,27 @@ class ApropiacionSocial:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(f"No se encontró tabla para informes en {cod_rh}")
                 return
 
-            blockquotes = table.find_all("blockquote")
+            blockquotes = section.blockquotes
 
             for blockquote in blockquotes:
                 try:
                     data = {"cvlac_id": cod_rh}
 
-                    temp = blockquote.text.split("En:")
-                    if len(temp) > 0:
-                        data["coautores"] = ", ".join(
-                            re.findall(r"([A-Z]{2,}[ [A-Z]{2,}]*)", temp[0])
-                        )
-
-                    if len(temp) > 1:
-                        anos = re.findall(r"[0-9]{4}", temp[1])
-                        if anos:
-                            try:
-                                data["ano"] = int(anos[0])
-                            except (ValueError, TypeError):
-                                module_logger.warning(
-                                    f"No se pudo convertir el año a entero: {anos[0]}"
-                                )
-
-                    blockquote_split = re.split(
-                        "(Informe de investigación:)|(En:)", blockquote.text
-                    )
-                    for j in range(len(blockquote_split)):
-                        if blockquote_split[j] == "Informe de investigación:":
-                            if j + 2 < len(blockquote_split):
-                                data["titulo"] = ApropiacionSocial._clean_text(
-                                    blockquote_split[j + 2]
-                                    .replace("\n", "")
-                                    .replace(".", "")
-                                )
+                    # Sin "En:", los coautores se buscan en todo el texto
+                    data["coautores"] = ", ".join(AUTHORS.findall(blockquote.text))
+                    INFORME_EN.apply(blockquote.text, data)
+                    INFORMES.apply(blockquote.text, data)
 
                     insert_data("informes_investigacion", data, connection)
                     module_logger.debug(
@@ -595,11 +795,12 @@ class ApropiacionSocial:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -607,63 +808,13 @@ class ApropiacionSocial:
                 )
                 return
 
-            blockquotes = table.find_all("blockquote")
+            blockquotes = section.blockquotes
 
             for blockquote in blockquotes:
                 try:
                     data = {"cvlac_id": cod_rh}
 
-                    blockquote_split = re.split(
-                        "(Nombre de la red)|(Tipo de red)|(Creada el:)", blockquote.text
-                    )
-
-                    for i in range(len(blockquote_split)):
-                        try:
-                            if blockquote_split[i] == "Nombre de la red":
-                                if i + 3 < len(blockquote_split):
-                                    data["nombre"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 3]
-                                    )
-                            elif blockquote_split[i] == "Tipo de red":
-                                if i + 2 < len(blockquote_split):
-                                    data["tipo"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 2]
-                                    )[:-1]
-                            elif blockquote_split[i] == "Creada el:":
-                                if i + 1 < len(blockquote_split):
-                                    temp = blockquote_split[i + 1].split("\xa0")
-                                    if len(temp) > 0:
-                                        data["fecha_inicio"] = (
-                                            ApropiacionSocial._clean_text(
-                                                temp[0].replace(",", "")
-                                            )
-                                        )
-                                    if len(temp) > 2:
-                                        lugar_split = temp[2].split("en ")
-                                        if len(lugar_split) > 1:
-                                            data["lugar"] = (
-                                                ApropiacionSocial._clean_text(
-                                                    lugar_split[1]
-                                                )
-                                            )
-                                    if len(temp) > 3:
-                                        participantes = re.findall(
-                                            r"con\s*([0-9]*)\s*participantes", temp[3]
-                                        )
-                                        if participantes and participantes[0] != "":
-                                            try:
-                                                data["participantes"] = int(
-                                                    participantes[0]
-                                                )
-                                            except (ValueError, TypeError):
-                                                module_logger.warning(
-                                                    f"No se pudo convertir los participantes a entero: {participantes[0]}"
-                                                )
-                        except Exception as ex:
-                            module_logger.error(
-                                f"Error extrayendo datos de red de conocimiento: {str(ex)}",
-                                exc_info=True,
-                            )
+                    REDES_CONOCIMIENTO.apply(blockquote.text, data)
 
                     insert_data("redes_conocimiento", data, connection)
                     module_logger.debug(f"Red de conocimiento insertada para {cod_rh}")
@@ -685,11 +836,12 @@ class ApropiacionSocial:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -697,76 +849,13 @@ class ApropiacionSocial:
                 )
                 return
 
-            blockquotes = table.find_all("blockquote")
+            blockquotes = section.blockquotes
 
             for blockquote in blockquotes:
                 try:
                     data = {"cvlac_id": cod_rh}
 
-                    blockquote_split = re.split(
-                        "(En:)|(Formato:)|(Descripción:)|(Palabras:)|(Areas:)|(Sectores:)",
-                        blockquote.text,
-                    )
-
-                    for i in range(len(blockquote_split)):
-                        try:
-                            if blockquote_split[i] == "En:":
-                                if i == 1 and i - 1 >= 0:
-                                    data["coautores"] = ", ".join(
-                                        re.findall(
-                                            r"([A-Z]{2,}[ [A-Z]{2,}]*)",
-                                            blockquote_split[i - 1],
-                                        )
-                                    )
-                                    data["titulo"] = ApropiacionSocial._clean_text(
-                                        re.sub(
-                                            r"([A-Z]{2,}[ [A-Z]{2,}]*)",
-                                            "",
-                                            blockquote_split[i - 1],
-                                        ).replace(", ", "")
-                                    )
-                                    try:
-                                        if i + 6 < len(blockquote_split):
-                                            data["fecha"] = "".join(
-                                                blockquote_split[i + 6].split()
-                                            ).replace(".", "")
-                                    except Exception:
-                                        pass
-                                else:
-                                    if i + 6 < len(blockquote_split):
-                                        data["lugar"] = ApropiacionSocial._clean_text(
-                                            blockquote_split[i + 6]
-                                        )
-                            elif blockquote_split[i] == "Formato:":
-                                if i + 5 < len(blockquote_split):
-                                    data["formato"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 5]
-                                    )
-                            elif blockquote_split[i] == "Descripción:":
-                                if i + 4 < len(blockquote_split):
-                                    data["descripcion"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 4]
-                                    )
-                            elif blockquote_split[i] == "Palabras:":
-                                if i + 3 < len(blockquote_split):
-                                    data["palabras"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 3]
-                                    )
-                            elif blockquote_split[i] == "Areas:":
-                                if i + 2 < len(blockquote_split):
-                                    data["areas"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 2]
-                                    )
-                            elif blockquote_split[i] == "Sectores:":
-                                if i + 1 < len(blockquote_split):
-                                    data["sectores"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 1]
-                                    )
-                        except Exception as ex:
-                            module_logger.error(
-                                f"Error extrayendo datos de contenido de audio: {str(ex)}",
-                                exc_info=True,
-                            )
+                    AUDIO.apply(blockquote.text, data)
 
                     insert_data("audio", data, connection)
                     module_logger.debug(f"Contenido de audio insertado para {cod_rh}")
@@ -788,11 +877,12 @@ class ApropiacionSocial:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -800,59 +890,14 @@ class ApropiacionSocial:
                 )
                 return
 
-            blockquotes = table.find_all("blockquote")
+            blockquotes = section.blockquotes
 
             for blockquote in blockquotes:
                 try:
                     data = {"cvlac_id": cod_rh}
                     data["chulo"] = "SI" if blockquote.find("img") else "NO"
 
-                    blockquote_split = re.split(
-                        "(Nombre)|(Tipo)|(Medio de circulación:)|(disponible en)|(en la fecha)|(en el ámbito)",
-                        blockquote.text,
-                    )
-
-                    for i in range(len(blockquote_split)):
-                        try:
-                            if blockquote_split[i] == "Nombre":
-                                if i + 6 < len(blockquote_split):
-                                    data["nombre"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 6]
-                                    )
-                            elif blockquote_split[i] == "Tipo":
-                                if i + 5 < len(blockquote_split):
-                                    tipo_split = blockquote_split[i + 5].split("-")
-                                    if len(tipo_split) > 2:
-                                        data["tipo"] = ApropiacionSocial._clean_text(
-                                            tipo_split[2]
-                                        )[:-1]
-                            elif blockquote_split[i] == "Medio de circulación:":
-                                if i + 4 < len(blockquote_split):
-                                    data["medio_circulacion"] = (
-                                        ApropiacionSocial._clean_text(
-                                            blockquote_split[i + 4]
-                                        )[:-1]
-                                    )
-                            elif blockquote_split[i] == "disponible en":
-                                if i + 3 < len(blockquote_split):
-                                    data["sitio_web"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 3]
-                                    )
-                            elif blockquote_split[i] == "en la fecha":
-                                if i + 2 < len(blockquote_split):
-                                    data["fecha"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 2]
-                                    )
-                            elif blockquote_split[i] == "en el ámbito":
-                                if i + 1 < len(blockquote_split):
-                                    data["ambito"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 1]
-                                    )
-                        except Exception as ex:
-                            module_logger.error(
-                                f"Error extrayendo datos de contenido impreso: {str(ex)}",
-                                exc_info=True,
-                            )
+                    IMPRESO.apply(blockquote.text, data)
 
                     insert_data("impresa", data, connection)
                     module_logger.debug(f"Contenido impreso insertado para {cod_rh}")
@@ -874,11 +919,12 @@ class ApropiacionSocial:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -886,8 +932,8 @@ class ApropiacionSocial:
                 )
                 return
 
-            lis = table.find_all("li")
-            blockquotes = table.find_all("blockquote")
+            lis = section.lis
+            blockquotes = section.blockquotes
 
             if len(lis) != len(blockquotes):
                 module_logger.warning(
@@ -902,84 +948,11 @@ class ApropiacionSocial:
                     data["chulo"] = "SI" if lis[i].find("img") else "NO"
                     li_split = lis[i].text.split("-")
                     if len(li_split) > 2:
-                        data["tipo"] = ApropiacionSocial._clean_text(li_split[2])
+                        data["tipo"] = clean_text(li_split[2])
 
                     # Extraer información del blockquote
                     if i < len(blockquotes):
-                        blockquote_split = re.split(
-                            "(En:)|(Emisora:)|(Palabras:)|(Areas:)|(Sectores:)",
-                            blockquotes[i].text,
-                        )
-
-                        for j in range(len(blockquote_split)):
-                            try:
-                                if blockquote_split[j] == "En:":
-                                    if j - 1 >= 0:
-                                        data["coautores"] = ", ".join(
-                                            re.findall(
-                                                r"([A-Z]{2,}[ [A-Z]{2,}]*)",
-                                                blockquote_split[j - 1],
-                                            )
-                                        )
-                                        data["nombre"] = ApropiacionSocial._clean_text(
-                                            re.sub(
-                                                r"([A-Z]{2,}[ [A-Z]{2,}]*)",
-                                                "",
-                                                blockquote_split[j - 1],
-                                            ).replace(", ", "")
-                                        )
-
-                                    if j + 5 < len(blockquote_split):
-                                        temp = blockquote_split[j + 5].split(",")
-                                        if len(temp) > 2:
-                                            try:
-                                                data["ano"] = int(temp[2])
-                                            except (ValueError, TypeError):
-                                                module_logger.warning(
-                                                    f"No se pudo convertir el año a entero: {temp[2]}"
-                                                )
-                                        if len(temp) > 0:
-                                            data["pais"] = (
-                                                ApropiacionSocial._clean_text(temp[0])
-                                            )
-                                elif blockquote_split[j] == "Emisora:":
-                                    if j + 4 < len(blockquote_split):
-                                        temp = blockquote_split[j + 4].split("\xa0")
-                                        if len(temp) > 0:
-                                            data["emisora"] = temp[0]
-                                        if len(temp) > 1:
-                                            minutos = re.findall(r"[0-9]+", temp[1])
-                                            if minutos:
-                                                try:
-                                                    data["duracion"] = int(minutos[0])
-                                                except (ValueError, TypeError):
-                                                    module_logger.warning(
-                                                        f"No se pudo convertir la duración a entero: {minutos[0]}"
-                                                    )
-                                elif blockquote_split[j] == "Palabras:":
-                                    if j + 3 < len(blockquote_split):
-                                        data["palabras"] = (
-                                            ApropiacionSocial._clean_text(
-                                                blockquote_split[j + 3]
-                                            )
-                                        )
-                                elif blockquote_split[j] == "Areas:":
-                                    if j + 2 < len(blockquote_split):
-                                        data["areas"] = ApropiacionSocial._clean_text(
-                                            blockquote_split[j + 2]
-                                        )
-                                elif blockquote_split[j] == "Sectores:":
-                                    if j + 1 < len(blockquote_split):
-                                        data["sectores"] = (
-                                            ApropiacionSocial._clean_text(
-                                                blockquote_split[j + 1]
-                                            )
-                                        )
-                            except Exception as ex:
-                                module_logger.error(
-                                    f"Error extrayendo datos de contenido multimedia: {str(ex)}",
-                                    exc_info=True,
-                                )
+                        MULTIMEDIA.apply(blockquotes[i].text, data)
 
                     insert_data("multimedia", data, connection)
                     module_logger.debug(f"Contenido multimedia insertado para {cod_rh}")
@@ -1001,11 +974,12 @@ class ApropiacionSocial:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -1013,7 +987,7 @@ class ApropiacionSocial:
                 )
                 return
 
-            blockquotes = table.find_all("blockquote")
+            blockquotes = section.blockquotes
 
             for blockquote in blockquotes:
                 try:
@@ -1026,82 +1000,7 @@ class ApropiacionSocial:
                         else "NO"
                     )
 
-                    blockquote_split = re.split(
-                        "(En:)|(Emisora:)|(Base de datos donde está incluido el registro:)|(disponible en)|"
-                        "(Institución:)|(Palabras:)|(Areas:)|(Sectores:)",
-                        blockquote.text,
-                    )
-
-                    for i in range(len(blockquote_split)):
-                        try:
-                            if blockquote_split[i] == "En:":
-                                if i == 1:
-                                    if i - 1 >= 0:
-                                        data["coautores"] = ", ".join(
-                                            re.findall(
-                                                r"([A-Z]{2,}[ [A-Z]{2,}]*)",
-                                                blockquote_split[i - 1],
-                                            )
-                                        )
-                                        data["nombre"] = ApropiacionSocial._clean_text(
-                                            re.sub(
-                                                r"([A-Z]{2,}[ [A-Z]{2,}]*)",
-                                                "",
-                                                blockquote_split[i - 1],
-                                            ).replace(", ", "")
-                                        )
-                                    try:
-                                        if i + 8 < len(blockquote_split):
-                                            data["fecha"] = "".join(
-                                                blockquote_split[i + 8].split()
-                                            ).replace(".", "")
-                                    except Exception:
-                                        pass
-                                else:
-                                    if i + 8 < len(blockquote_split):
-                                        data["ciudad"] = ApropiacionSocial._clean_text(
-                                            blockquote_split[i + 8]
-                                        )[:-1]
-                            elif (
-                                blockquote_split[i]
-                                == "Base de datos donde está incluido el registro:"
-                            ):
-                                if i + 6 < len(blockquote_split):
-                                    data["base_datos"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 6]
-                                    )
-                            elif blockquote_split[i] == "disponible en":
-                                if i + 5 < len(blockquote_split):
-                                    data["disponible_en"] = (
-                                        ApropiacionSocial._clean_text(
-                                            blockquote_split[i + 5]
-                                        )
-                                    )
-                            elif blockquote_split[i] == "Institución:":
-                                if i + 4 < len(blockquote_split):
-                                    data["institucion"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 4]
-                                    )
-                            elif blockquote_split[i] == "Palabras:":
-                                if i + 3 < len(blockquote_split):
-                                    data["palabras"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 3]
-                                    )
-                            elif blockquote_split[i] == "Areas:":
-                                if i + 2 < len(blockquote_split):
-                                    data["areas"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 2]
-                                    )
-                            elif blockquote_split[i] == "Sectores:":
-                                if i + 1 < len(blockquote_split):
-                                    data["sectores"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 1]
-                                    )
-                        except Exception as ex:
-                            module_logger.error(
-                                f"Error extrayendo datos de secuencia genética: {str(ex)}",
-                                exc_info=True,
-                            )
+                    SECUENCIA.apply(blockquote.text, data)
 
                     insert_data("secuencias_geneticas", data, connection)
                     module_logger.debug(f"Secuencia genética insertada para {cod_rh}")
@@ -1123,11 +1022,12 @@ class ApropiacionSocial:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -1135,59 +1035,13 @@ class ApropiacionSocial:
                 )
                 return
 
-            blockquotes = table.find_all("blockquote")
+            blockquotes = section.blockquotes
 
             for blockquote in blockquotes:
                 try:
                     data = {"cvlac_id": cod_rh}
 
-                    blockquote_split = re.split(
-                        "(Nombre)|(Tipo)|(disponible en)|(Descripción:)",
-                        blockquote.text,
-                    )
-
-                    for i in range(len(blockquote_split)):
-                        try:
-                            if blockquote_split[i] == "Nombre":
-                                if i + 4 < len(blockquote_split):
-                                    data["titulo"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 4]
-                                    )
-                            elif blockquote_split[i] == "Tipo":
-                                if i + 3 < len(blockquote_split):
-                                    tipo_split = blockquote_split[i + 3].split("-")
-                                    if len(tipo_split) > 2:
-                                        tipo_comma_split = tipo_split[2].split(",")
-                                        if len(tipo_comma_split) > 0:
-                                            data["tipo"] = (
-                                                ApropiacionSocial._clean_text(
-                                                    tipo_comma_split[0]
-                                                )
-                                            )
-
-                                    fecha = re.findall(
-                                        r"[0-9]{4}-[0-9]{2}-[0-9]{2}.*",
-                                        blockquote_split[i + 3],
-                                    )
-                                    if fecha:
-                                        data["fecha"] = ApropiacionSocial._clean_text(
-                                            fecha[0]
-                                        )
-                            elif blockquote_split[i] == "disponible en":
-                                if i + 2 < len(blockquote_split):
-                                    data["disponible_en"] = (
-                                        ApropiacionSocial._clean_text(
-                                            blockquote_split[i + 2]
-                                        )
-                                    )
-                            elif blockquote_split[i] == "Descripción:":
-                                if i + 1 < len(blockquote_split):
-                                    data["descripcion"] = blockquote_split[i + 1]
-                        except Exception as ex:
-                            module_logger.error(
-                                f"Error extrayendo datos de contenido virtual: {str(ex)}",
-                                exc_info=True,
-                            )
+                    CONTENIDO_VIRTUAL.apply(blockquote.text, data)
 
                     insert_data("contenido_virtual", data, connection)
                     module_logger.debug(f"Contenido virtual insertado para {cod_rh}")
@@ -1209,11 +1063,12 @@ class ApropiacionSocial:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -1221,41 +1076,13 @@ class ApropiacionSocial:
                 )
                 return
 
-            blockquotes = table.find_all("blockquote")
+            blockquotes = section.blockquotes
 
             for blockquote in blockquotes:
                 try:
                     data = {"cvlac_id": cod_rh}
 
-                    blockquote_split = re.split(
-                        "(Nombre de la estrategia)|(Inicio en)|(Finalizó en :)",
-                        blockquote.text,
-                    )
-
-                    for i in range(len(blockquote_split)):
-                        try:
-                            if blockquote_split[i] == "Nombre de la estrategia":
-                                if i + 3 < len(blockquote_split):
-                                    data["nombre"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 3]
-                                    )
-                            elif blockquote_split[i] == "Inicio en":
-                                if i + 2 < len(blockquote_split):
-                                    data["fecha_inicio"] = (
-                                        ApropiacionSocial._clean_text(
-                                            blockquote_split[i + 2].replace(",", "")
-                                        )
-                                    )
-                            elif blockquote_split[i] == "Finalizó en :":
-                                if i + 1 < len(blockquote_split):
-                                    data["fecha_fin"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 1].replace(",", "")
-                                    )
-                        except Exception as ex:
-                            module_logger.error(
-                                f"Error extrayendo datos de estrategia de comunicación: {str(ex)}",
-                                exc_info=True,
-                            )
+                    ESTRATEGIAS_COMUNICACION.apply(blockquote.text, data)
 
                     insert_data("estrategias_comunicacion", data, connection)
                     module_logger.debug(
@@ -1279,11 +1106,12 @@ class ApropiacionSocial:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -1291,41 +1119,13 @@ class ApropiacionSocial:
                 )
                 return
 
-            blockquotes = table.find_all("blockquote")
+            blockquotes = section.blockquotes
 
             for blockquote in blockquotes:
                 try:
                     data = {"cvlac_id": cod_rh}
 
-                    blockquote_split = re.split(
-                        "(Nombre de la estrategia)|(Inicio en)|(Finalizó en :)",
-                        blockquote.text,
-                    )
-
-                    for i in range(len(blockquote_split)):
-                        try:
-                            if blockquote_split[i] == "Nombre de la estrategia":
-                                if i + 3 < len(blockquote_split):
-                                    data["nombre"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 3]
-                                    )
-                            elif blockquote_split[i] == "Inicio en":
-                                if i + 2 < len(blockquote_split):
-                                    data["fecha_inicio"] = (
-                                        ApropiacionSocial._clean_text(
-                                            blockquote_split[i + 2].replace(",", "")
-                                        )
-                                    )
-                            elif blockquote_split[i] == "Finalizó en :":
-                                if i + 1 < len(blockquote_split):
-                                    data["fecha_fin"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 1].replace(",", "")
-                                    )
-                        except Exception as ex:
-                            module_logger.error(
-                                f"Error extrayendo datos de estrategia pedagógica: {str(ex)}",
-                                exc_info=True,
-                            )
+                    ESTRATEGIAS_PEDAGOGICAS.apply(blockquote.text, data)
 
                     insert_data("estrategias_pedagogicas", data, connection)
                     module_logger.debug(
@@ -1349,11 +1149,12 @@ class ApropiacionSocial:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -1361,7 +1162,7 @@ class ApropiacionSocial:
                 )
                 return
 
-            tds = table.find_all("td")
+            tds = section.tds
 
             # Eliminar el primer elemento (encabezado) si existe
             if len(tds) > 1:
@@ -1376,48 +1177,7 @@ class ApropiacionSocial:
                 try:
                     data = {"cvlac_id": cod_rh}
 
-                    td_split = re.split(
-                        "(Nombre del espacio)|(Realizado el:)|(Finalizó en :)", td.text
-                    )
-
-                    for i in range(len(td_split)):
-                        try:
-                            if td_split[i] == "Nombre del espacio":
-                                if i + 3 < len(td_split):
-                                    data["nombre"] = ApropiacionSocial._clean_text(
-                                        td_split[i + 3]
-                                    )
-                            elif td_split[i] == "Realizado el:":
-                                if i + 2 < len(td_split):
-                                    fechas = re.findall(
-                                        r"[0-9]{4}-[0-9]{2}-[0-9]{2}", td_split[i + 2]
-                                    )
-                                    if len(fechas) > 0:
-                                        data["fecha_inicio"] = fechas[0]
-                                    if len(fechas) > 1:
-                                        data["fecha_fin"] = fechas[1]
-
-                                    temp = re.split("en|Con", td_split[i + 2])
-                                    if len(temp) > 1:
-                                        data["ciudad"] = ApropiacionSocial._clean_text(
-                                            temp[1].replace("-", "")
-                                        )
-                                    if len(temp) > 2:
-                                        participantes = re.findall(r"[0-9]+", temp[2])
-                                        if participantes and participantes[0] != "":
-                                            try:
-                                                data["participantes"] = int(
-                                                    participantes[0]
-                                                )
-                                            except (ValueError, TypeError):
-                                                module_logger.warning(
-                                                    f"No se pudo convertir los participantes a entero: {participantes[0]}"
-                                                )
-                        except Exception as ex:
-                            module_logger.error(
-                                f"Error extrayendo datos de espacio de participación: {str(ex)}",
-                                exc_info=True,
-                            )
+                    ESPACIOS_PARTICIPACION.apply(td.text, data)
 
                     insert_data("espacios_participacion", data, connection)
                     module_logger.debug(
@@ -1441,11 +1201,12 @@ class ApropiacionSocial:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -1453,41 +1214,13 @@ class ApropiacionSocial:
                 )
                 return
 
-            blockquotes = table.find_all("blockquote")
+            blockquotes = section.blockquotes
 
             for blockquote in blockquotes:
                 try:
                     data = {"cvlac_id": cod_rh}
 
-                    blockquote_split = re.split(
-                        "(Nombre del proyecto)|(Inicio en)|(Finalizó en :)",
-                        blockquote.text,
-                    )
-
-                    for i in range(len(blockquote_split)):
-                        try:
-                            if blockquote_split[i] == "Nombre del proyecto":
-                                if i + 3 < len(blockquote_split):
-                                    data["nombre"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 3]
-                                    )
-                            elif blockquote_split[i] == "Inicio en":
-                                if i + 2 < len(blockquote_split):
-                                    data["fecha_inicio"] = (
-                                        ApropiacionSocial._clean_text(
-                                            blockquote_split[i + 2].replace(",", "")
-                                        )
-                                    )
-                            elif blockquote_split[i] == "Finalizó en :":
-                                if i + 1 < len(blockquote_split):
-                                    data["fecha_fin"] = ApropiacionSocial._clean_text(
-                                        blockquote_split[i + 1].replace(",", "")
-                                    )
-                        except Exception as ex:
-                            module_logger.error(
-                                f"Error extrayendo datos de participación en proyecto: {str(ex)}",
-                                exc_info=True,
-                            )
+                    PARTICIPACION_PROYECTOS.apply(blockquote.text, data)
 
                     insert_data("participacion_proyectos", data, connection)
                     module_logger.debug(
@@ -1504,29 +1237,6 @@ class ApropiacionSocial:
                 exc_info=True,
             )
 
-    @staticmethod
-    def _clean_text(text):
-        """
-        Limpia el texto de caracteres no deseados.
-
-        Args:
-            text (str): Texto a limpiar.
-
-        Returns:
-            str: Texto limpio.
-        """
-        if not text:
-            return ""
-
-        return (
-            text.strip()
-            .replace("'", '"')
-            .replace("\t'", '"')
-            .replace("  ", "")
-            .replace("\n", "")
-            .replace("\r", "")
-        )
-
 
 # Funciones de compatibilidad para el código existente
 def extract_consultorias(cod_rh, h3, connection):
@@ -1,5 +1,6 @@
 from config import ProjectLogger
-from extractors.utils import insert_data
+from extractors.utils import insert_data, get_section
+from extractors.textkit import clean_text
 from datetime import datetime
 
 # Configuramos el logger para este módulo
@@ -19,11 +20,12 @@ class AreasActuacion:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -31,7 +33,7 @@ class AreasActuacion:
                 )
                 return
 
-            lis = table.find_all("li")
+            lis = section.lis
 
             for li in lis:
                 try:
@@ -39,11 +41,11 @@ class AreasActuacion:
 
                     text = li.text.split("--")
                     if len(text) > 0:
-                        data["gran_area"] = AreasActuacion._clean_text(text[0])
+                        data["gran_area"] = clean_text(text[0])
                     if len(text) > 1:
-                        data["area"] = AreasActuacion._clean_text(text[1])
+                        data["area"] = clean_text(text[1])
                     if len(text) > 2:
-                        data["especialidad"] = AreasActuacion._clean_text(text[2])
+                        data["especialidad"] = clean_text(text[2])
 
                     insert_data("areas_actuacion", data, connection)
                     module_logger.debug(f"Área de actuación insertada para {cod_rh}")
@@ -57,29 +59,6 @@ class AreasActuacion:
                 f"Error general en extract para {cod_rh}: {str(ex)}", exc_info=True
             )
 
-    @staticmethod
-    def _clean_text(text):
-        """
-        Limpia el texto de caracteres no deseados.
-
-        Args:
-            text (str): Texto a limpiar.
-
-        Returns:
-            str: Texto limpio.
-        """
-        if not text:
-            return ""
-
-        return (
-            text.strip()
-            .replace("'", '"')
-            .replace("\t'", '"')
-            .replace("  ", "")
-            .replace("\n", "")
-            .replace("\r", "")
-        )
-
 
 # Función de compatibilidad para el código existente
 def extract(cod_rh, h3, connection):
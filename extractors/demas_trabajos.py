@@ -1,5 +1,6 @@
 from config import ProjectLogger
-from extractors.utils import insert_data
+from extractors.utils import insert_data, get_section
+from extractors.textkit import AUTHORS, AUTHORS_END, DIGITS, EMPTY_COUNTRY, clean_text
 from datetime import datetime
 import re
 
@@ -20,11 +21,12 @@ class DemasTrabajosExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -32,7 +34,7 @@ class DemasTrabajosExtractor:
                 )
                 return
 
-            blockquotes = table.find_all("blockquote")
+            blockquotes = section.blockquotes
 
             for blockquote in blockquotes:
                 try:
@@ -73,22 +75,18 @@ class DemasTrabajosExtractor:
                 if blockquote_split[j] == "En:":
                     if j > 0:
                         data["coautores"] = ", ".join(
-                            re.findall(
-                                r"[A-Z]{2,}[ [A-Z]{2,}]*", blockquote_split[:j][0]
-                            )
+                            AUTHORS.findall(blockquote_split[:j][0])
                         )
-                        nombre_split = re.split("[A-Z]{2,},", blockquote_split[j - 1])
+                        nombre_split = AUTHORS_END.split(blockquote_split[j - 1])
                         if len(nombre_split) > 0:
-                            data["nombre"] = DemasTrabajosExtractor._clean_text(
-                                nombre_split[-1][:-2]
-                            )
+                            data["nombre"] = clean_text(nombre_split[-1][:-2])
 
                     if j + 5 < len(blockquote_split):
-                        temp = re.split(r"([0-9]+)", blockquote_split[j + 5])
+                        temp = DIGITS.split(blockquote_split[j + 5])
                         if len(temp) > 0:
-                            data["pais"] = DemasTrabajosExtractor._clean_text(
-                                re.sub(r",\xa0\n\s+,", "", temp[0])
-                            )[:-1]
+                            data["pais"] = clean_text(EMPTY_COUNTRY.sub("", temp[0]))[
+                                :-1
+                            ]
                         if len(temp) > 1:
                             try:
                                 data["ano"] = int(temp[1])
@@ -98,53 +96,22 @@ class DemasTrabajosExtractor:
                                 )
                 elif blockquote_split[j] == "finalidad:":
                     if j + 4 < len(blockquote_split):
-                        data["finalidad"] = DemasTrabajosExtractor._clean_text(
-                            blockquote_split[j + 4]
-                        )
+                        data["finalidad"] = clean_text(blockquote_split[j + 4])
                 elif blockquote_split[j] == "Palabras:":
                     if j + 3 < len(blockquote_split):
-                        data["palabras"] = DemasTrabajosExtractor._clean_text(
-                            blockquote_split[j + 3]
-                        )
+                        data["palabras"] = clean_text(blockquote_split[j + 3])
                 elif blockquote_split[j] == "Areas:":
                     if j + 2 < len(blockquote_split):
-                        data["areas"] = DemasTrabajosExtractor._clean_text(
-                            blockquote_split[j + 2]
-                        )
+                        data["areas"] = clean_text(blockquote_split[j + 2])
                 elif blockquote_split[j] == "Sectores:":
                     if j + 1 < len(blockquote_split):
-                        data["sectores"] = DemasTrabajosExtractor._clean_text(
-                            blockquote_split[j + 1]
-                        )
+                        data["sectores"] = clean_text(blockquote_split[j + 1])
             except Exception as ex:
                 module_logger.error(
                     f"Error extrayendo datos del blockquote demás trabajos: {str(ex)}",
                     exc_info=True,
                 )
 
-    @staticmethod
-    def _clean_text(text):
-        """
-        Limpia el texto de caracteres no deseados.
-
-        Args:
-            text (str): Texto a limpiar.
-
-        Returns:
-            str: Texto limpio.
-        """
-        if not text:
-            return ""
-
-        return (
-            text.strip()
-            .replace("'", '"')
-            .replace("\t'", '"')
-            .replace("  ", "")
-            .replace("\n", "")
-            .replace("\r", "")
-        )
-
 
 # Función de compatibilidad para el código existente
 def extract(cod_rh, h3, connection):
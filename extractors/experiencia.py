@@ -1,7 +1,7 @@
 from config import ProjectLogger
-from extractors.utils import insert_data
+from extractors.utils import insert_data, get_section
+from extractors.textkit import YEAR
 from datetime import datetime
-import re
 
 # Configuramos el logger para este módulo
 logger = ProjectLogger()
@@ -20,11 +20,12 @@ class ExperienciaExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -34,7 +35,7 @@ class ExperienciaExtractor:
 
             institucion_actual = ""
 
-            for b in table.find_all("b"):
+            for b in section.bs:
                 try:
                     data = {"cvlac_id": cod_rh}
 
@@ -56,7 +57,7 @@ class ExperienciaExtractor:
                                 data["dedicacion"] = temp_dates[0].replace("\xa0", " ")
 
                                 # Extraer año de inicio
-                                ano_inicio = re.findall(r"[0-9]{4}", temp_dates[1])
+                                ano_inicio = YEAR.findall(temp_dates[1])
                                 if ano_inicio:
                                     try:
                                         data["ano_inicio"] = int(ano_inicio[0])
@@ -67,7 +68,7 @@ class ExperienciaExtractor:
 
                                 # Extraer año de fin
                                 if len(temp_dates) > 2:
-                                    ano_fin = re.findall(r"[0-9]{4}", temp_dates[2])
+                                    ano_fin = YEAR.findall(temp_dates[2])
                                     if ano_fin:
                                         try:
                                             data["ano_fin"] = int(ano_fin[0])
@@ -1,5 +1,6 @@
 from config import ProjectLogger
-from extractors.utils import insert_data
+from extractors.utils import insert_data, get_section
+from extractors.textkit import clean_text, clean_texts
 from datetime import datetime
 
 # Configuramos el logger para este módulo
@@ -19,11 +20,12 @@ class FormacionExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -31,47 +33,24 @@ class FormacionExtractor:
                 )
                 return
 
-            for b in table.find_all("b"):
+            for b in section.bs:
                 try:
                     data = {"cvlac_id": cod_rh}
 
                     # Extraer cadenas de texto del elemento padre de b y limpiarlas
-                    strs = [
-                        str_.strip()
-                        .replace("'", '"')
-                        .replace("\t'", '"')
-                        .replace("  ", "")
-                        .replace("\n", "")
-                        .replace("\r", "")
-                        or None
-                        for str_ in b.parent.strings
-                    ]
+                    strs = clean_texts(b.parent.strings, empty=None)
 
                     # Extraer fechas
                     if len(strs) > 3 and strs[3]:
                         fechas = strs[3].split("-")
                         try:
                             if len(fechas) > 0:
-                                data["fecha_inicio"] = (
-                                    fechas[0]
-                                    .strip()
-                                    .replace("'", '"')
-                                    .replace("\t'", '"')
-                                    .replace("  ", "")
-                                    .replace("\n", "")
-                                    .replace("\r", "")
-                                    .replace("de", "")
+                                data["fecha_inicio"] = clean_text(fechas[0]).replace(
+                                    "de", ""
                                 )
                             if len(fechas) > 1:
-                                data["fecha_fin"] = (
-                                    fechas[1]
-                                    .strip()
-                                    .replace("'", '"')
-                                    .replace("\t'", '"')
-                                    .replace("  ", "")
-                                    .replace("\n", "")
-                                    .replace("\r", "")
-                                    .replace("de", "")
+                                data["fecha_fin"] = clean_text(fechas[1]).replace(
+                                    "de", ""
                                 )
                         except Exception as ex:
                             module_logger.warning(
@@ -111,11 +90,12 @@ class FormacionExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -123,47 +103,24 @@ class FormacionExtractor:
                 )
                 return
 
-            for b in table.find_all("b"):
+            for b in section.bs:
                 try:
                     data = {"cvlac_id": cod_rh}
 
                     # Extraer cadenas de texto del elemento padre de b y limpiarlas
-                    strs = [
-                        str_.strip()
-                        .replace("'", '"')
-                        .replace("\t'", '"')
-                        .replace("  ", "")
-                        .replace("\n", "")
-                        .replace("\r", "")
-                        or None
-                        for str_ in b.parent.strings
-                    ]
+                    strs = clean_texts(b.parent.strings, empty=None)
 
                     # Extraer fechas
                     if len(strs) > 3 and strs[3]:
                         fechas = strs[3].split("-")
                         try:
                             if len(fechas) > 0:
-                                data["fecha_inicio"] = (
-                                    fechas[0]
-                                    .strip()
-                                    .replace("'", '"')
-                                    .replace("\t'", '"')
-                                    .replace("  ", "")
-                                    .replace("\n", "")
-                                    .replace("\r", "")
-                                    .replace("de", "")
+                                data["fecha_inicio"] = clean_text(fechas[0]).replace(
+                                    "de", ""
                                 )
                             if len(fechas) > 1:
-                                data["fecha_fin"] = (
-                                    fechas[1]
-                                    .strip()
-                                    .replace("'", '"')
-                                    .replace("\t'", '"')
-                                    .replace("  ", "")
-                                    .replace("\n", "")
-                                    .replace("\r", "")
-                                    .replace("de", "")
+                                data["fecha_fin"] = clean_text(fechas[1]).replace(
+                                    "de", ""
                                 )
                         except Exception as ex:
                             module_logger.warning(
@@ -198,29 +155,6 @@ class FormacionExtractor:
                 exc_info=True,
             )
 
-    @staticmethod
-    def _clean_text(text):
-        """
-        Limpia el texto de caracteres no deseados.
-
-        Args:
-            text (str): Texto a limpiar.
-
-        Returns:
-            str: Texto limpio.
-        """
-        if not text:
-            return ""
-
-        return (
-            text.strip()
-            .replace("'", '"')
-            .replace("\t'", '"')
-            .replace("  ", "")
-            .replace("\n", "")
-            .replace("\r", "")
-        )
-
 
 # Funciones de compatibilidad para el código existente
 def extract_academic_formation(cod_rh, h3, connection):
@@ -1,5 +1,6 @@
 from config import ProjectLogger
 from extractors.utils import get_table, get_text_next_tag, get_href, insert_data
+from extractors.textkit import clean_text
 
 # Configuramos el logger para este módulo
 logger = ProjectLogger()
@@ -18,7 +19,8 @@ class IdentificacionExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            html (BeautifulSoup): Documento HTML completo.
+            html (BeautifulSoup | SectionIndex): Documento HTML completo o su índice
+                                                 de secciones.
             connection: Conexión a la base de datos.
 
         Returns:
@@ -44,9 +46,9 @@ class IdentificacionExtractor:
             # Extraer nombre completo
             nombre_completo = get_text_next_tag(table, "Nombre", "td")
             if nombre_completo:
-                data["nombre_completo"] = IdentificacionExtractor._clean_text(
-                    nombre_completo
-                ).replace("\xa0", " ")
+                data["nombre_completo"] = clean_text(nombre_completo).replace(
+                    "\xa0", " "
+                )
             else:
                 module_logger.warning(f"No se encontró nombre completo para {cod_rh}")
                 return None
@@ -95,29 +97,6 @@ class IdentificacionExtractor:
             )
             return None
 
-    @staticmethod
-    def _clean_text(text):
-        """
-        Limpia el texto de caracteres no deseados.
-
-        Args:
-            text (str): Texto a limpiar.
-
-        Returns:
-            str: Texto limpio.
-        """
-        if not text:
-            return ""
-
-        return (
-            text.strip()
-            .replace("'", '"')
-            .replace("\t'", '"')
-            .replace("  ", "")
-            .replace("\n", "")
-            .replace("\r", "")
-        )
-
 
 # Función de compatibilidad para el código existente
 def extract(cod_rh, html, connection):
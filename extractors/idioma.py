@@ -1,5 +1,5 @@
 from config import ProjectLogger
-from extractors.utils import insert_data
+from extractors.utils import insert_data, get_section
 from datetime import datetime
 
 # Configuramos el logger para este módulo
@@ -19,17 +19,18 @@ class IdiomaExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(f"No se encontró tabla para idiomas en {cod_rh}")
                 return
 
-            for tr in table.find_all("tr"):
+            for tr in section.trs:
                 try:
                     data = {"cvlac_id": cod_rh}
 
@@ -1,5 +1,6 @@
 from config import ProjectLogger
-from extractors.utils import insert_data
+from extractors.utils import insert_data, get_section
+from extractors.textkit import clean_text
 from datetime import datetime
 
 # Configuramos el logger para este módulo
@@ -19,11 +20,12 @@ class LineasInvestigacionExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -31,7 +33,7 @@ class LineasInvestigacionExtractor:
                 )
                 return
 
-            for li in table.find_all("li"):
+            for li in section.lis:
                 try:
                     data = {"cvlac_id": cod_rh}
 
@@ -44,9 +46,7 @@ class LineasInvestigacionExtractor:
                         linea = strs[0].strip()
                         if linea.endswith(","):
                             linea = linea[:-1]  # Eliminar la coma al final
-                        data["linea_investigacion"] = (
-                            LineasInvestigacionExtractor._clean_text(linea)
-                        )
+                        data["linea_investigacion"] = clean_text(linea)
 
                     # Verificar si la línea está activa
                     if len(strs) > 2:
@@ -67,29 +67,6 @@ class LineasInvestigacionExtractor:
                 f"Error general en extract para {cod_rh}: {str(ex)}", exc_info=True
             )
 
-    @staticmethod
-    def _clean_text(text):
-        """
-        Limpia el texto de caracteres no deseados.
-
-        Args:
-            text (str): Texto a limpiar.
-
-        Returns:
-            str: Texto limpio.
-        """
-        if not text:
-            return ""
-
-        return (
-            text.strip()
-            .replace("'", '"')
-            .replace("\t'", '"')
-            .replace("  ", "")
-            .replace("\n", "")
-            .replace("\r", "")
-        )
-
 
 # Función de compatibilidad para el código existente
 def extract(cod_rh, h3, connection):
@@ -0,0 +1,427 @@
+from bs4.dammit import EncodingDetector
+from lxml import etree
+from lxml import html as lxml_html
+
+
+# Espacios que BeautifulSoup colapsa en las cadenas que solo tienen espacios
+ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+
+# Etiquetas que conservan los espacios (no se colapsan)
+PRESERVE_WHITESPACE_TAGS = ("pre", "textarea")
+
+# Etiquetas cuyo texto BeautifulSoup excluye de .text y .strings del contenedor
+STRING_CONTAINERS = ("rp", "rt", "script", "style", "template")
+
+_TEXTS = etree.XPath("descendant::text()")
+_VISIBLE_TEXTS = etree.XPath(
+    "descendant::text()[not("
+    + " or ".join(f"parent::{name}" for name in STRING_CONTAINERS)
+    + ")]"
+)
+_NEXT_AFTER_TEXT = etree.XPath(
+    "(descendant::*[name()=$name] | following::*[name()=$name])[1]"
+)
+_NEXT_AFTER_TAIL = etree.XPath("following::*[name()=$name][1]")
+
+
+def _collapse(value, owner):
+    """
+    Colapsa una cadena de solo espacios a '\\n' o ' ', como BeautifulSoup.
+
+    Args:
+        value (str): Texto de un nodo.
+        owner (etree._Element): Elemento que contiene el texto.
+
+    Returns:
+        str: El texto, colapsado si solo tiene espacios fuera de pre/textarea.
+    """
+    if value.strip(ASCII_SPACES):
+        return value
+    if owner is not None and (
+        owner.tag in PRESERVE_WHITESPACE_TAGS
+        or next(owner.iterancestors(*PRESERVE_WHITESPACE_TAGS), None) is not None
+    ):
+        return value
+    return "\n" if "\n" in value else " "
+
+
+class LxmlDocument:
+    """
+    Documento HTML construido con lxml.html y presentado con la interfaz de
+    BeautifulSoup que usan los extractores.
+
+    lxml construye el árbol en C y las búsquedas (find_all, find_next, .text)
+    se resuelven con iteradores y XPath de lxml; solo se crean objetos de
+    Python para los elementos que los extractores visitan. Los elementos se
+    envuelven en LxmlTag (uno por elemento, de modo que la identidad se
+    conserva) y los textos en LxmlString, que como NavigableString es un str
+    con sus hermanos y su padre.
+    """
+
+    name = "[document]"
+
+    def __init__(self, content):
+        """
+        Construye el árbol del documento.
+
+        La codificación se elige como lo hace BeautifulSoup con el parser
+        "lxml" (declarada en el documento, BOM o detección), para que los
+        textos extraídos coincidan.
+
+        Args:
+            content (bytes | str): Cuerpo de la respuesta.
+        """
+        self._tags = {}
+        self.root = None
+        self.original_encoding = None
+
+        if isinstance(content, str):
+            candidates = [None]
+        else:
+            candidates = list(EncodingDetector(content, is_html=True).encodings) or [
+                None
+            ]
+
+        for encoding in candidates:
+            try:
+                parser = lxml_html.HTMLParser(encoding=encoding, recover=True)
+                self.root = etree.fromstring(content, parser) if content else None
+                self.original_encoding = encoding
+                break
+            except (UnicodeDecodeError, LookupError, etree.ParserError):
+                continue
+
+    def wrap(self, element):
+        """
+        Retorna el nodo que representa un elemento de lxml.
+
+        Args:
+            element (etree._Element): Elemento del árbol.
+
+        Returns:
+            LxmlTag | LxmlComment: Nodo del elemento (siempre el mismo objeto).
+        """
+        node = self._tags.get(element)
+        if node is None:
+            if isinstance(element.tag, str):
+                node = LxmlTag(element, self)
+            else:
+                node = LxmlComment(element, self)
+            self._tags[element] = node
+        return node
+
+    def string(self, value, owner, is_tail):
+        """Crea el nodo de texto .text (o .tail si is_tail) de owner."""
+        parent = owner.getparent() if is_tail else owner
+        return LxmlString(_collapse(value, parent), owner, is_tail, self)
+
+    @property
+    def contents(self):
+        return [] if self.root is None else [self.wrap(self.root)]
+
+    @property
+    def text(self):
+        return "" if self.root is None else self.wrap(self.root).text
+
+    def find_all(self, name=None, attrs=None, recursive=True, string=None, text=None):
+        if self.root is None:
+            return []
+        root = self.wrap(self.root)
+        found = [root] if root._matches(name, attrs, string or text) else []
+        if recursive:
+            found.extend(root.find_all(name, attrs, True, string, text))
+        return found
+
+    def find(self, name=None, attrs=None, recursive=True, string=None, text=None):
+        if self.root is None:
+            return None
+        root = self.wrap(self.root)
+        if root._matches(name, attrs, string or text):
+            return root
+        return root.find(name, attrs, recursive, string, text) if recursive else None
+
+
+class LxmlTag:
+    """
+    Elemento de lxml con la interfaz de bs4.Tag que usan los extractores:
+    name, text, strings, get_text, contents, parent, hermanos, find,
+    find_all, find_next, find_next_sibling y atributos.
+    """
+
+    __slots__ = ("element", "document")
+
+    def __init__(self, element, document):
+        self.element = element
+        self.document = document
+
+    @property
+    def name(self):
+        return self.element.tag
+
+    @property
+    def attrs(self):
+        return dict(self.element.attrib)
+
+    def get(self, key, default=None):
+        return self.element.get(key, default)
+
+    def __getitem__(self, key):
+        return self.element.attrib[key]
+
+    def __bool__(self):
+        return True
+
+    def __len__(self):
+        return len(self.contents)
+
+    def __iter__(self):
+        return iter(self.contents)
+
+    def __str__(self):
+        return etree.tostring(
+            self.element, encoding=str, method="html", with_tail=False
+        )
+
+    __repr__ = __str__
+
+    # Texto
+
+    def _strings(self):
+        """Textos del subárbol, sin comentarios ni scripts, como en bs4."""
+        element = self.element
+        texts = (
+            _TEXTS(element)
+            if element.tag in STRING_CONTAINERS
+            else _VISIBLE_TEXTS(element)
+        )
+        for value in texts:
+            if value.strip(ASCII_SPACES):
+                yield str(value)
+            else:
+                owner = value.getparent()
+                yield _collapse(value, owner.getparent() if value.is_tail else owner)
+
+    @property
+    def strings(self):
+        return self._strings()
+
+    @property
+    def text(self):
+        return "".join(self._strings())
+
+    def get_text(self, separator="", strip=False):
+        strings = self._strings()
+        if strip:
+            strings = (value.strip() for value in strings)
+            strings = (value for value in strings if value)
+        return separator.join(strings)
+
+    @property
+    def string(self):
+        """El único texto del elemento (como Tag.string), o None."""
+        contents = self.contents
+        if len(contents) != 1:
+            return None
+        child = contents[0]
+        return child.string if isinstance(child, LxmlTag) else child
+
+    # Navegación
+
+    @property
+    def contents(self):
+        element = self.element
+        document = self.document
+        nodes = []
+        if element.text:
+            nodes.append(document.string(element.text, element, False))
+        for child in element:
+            nodes.append(document.wrap(child))
+            if child.tail:
+                nodes.append(document.string(child.tail, child, True))
+        return nodes
+
+    @property
+    def parent(self):
+        parent = self.element.getparent()
+        return None if parent is None else self.document.wrap(parent)
+
+    @property
+    def previous_sibling(self):
+        element = self.element
+        previous = element.getprevious()
+        if previous is not None:
+            if previous.tail:
+                return self.document.string(previous.tail, previous, True)
+            return self.document.wrap(previous)
+        parent = element.getparent()
+        if parent is not None and parent.text:
+            return self.document.string(parent.text, parent, False)
+        return None
+
+    @property
+    def next_sibling(self):
+        element = self.element
+        if element.tail:
+            return self.document.string(element.tail, element, True)
+        following = element.getnext()
+        return None if following is None else self.document.wrap(following)
+
+    # Búsquedas
+
+    def _matches(self, name, attrs, string):
+        element = self.element
+        if name is not None and element.tag != name:
+            return False
+        if attrs:
+            for key, value in attrs.items():
+                if element.get(key) != value:
+                    return False
+        if string is not None and self.string != string:
+            return False
+        return True
+
+    def find_all(self, name=None, attrs=None, recursive=True, string=None, text=None):
+        string = string if string is not None else text
+        if name is None and not attrs and string is not None:
+            return [node for node in self._iter_strings() if node == string]
+
+        element = self.element
+        candidates = (
+            element.iterdescendants(name) if recursive else element.iterchildren(name)
+        )
+        wrap = self.document.wrap
+        found = []
+        for candidate in candidates:
+            if not isinstance(candidate.tag, str):
+                continue
+            node = wrap(candidate)
+            if (attrs or string is not None) and not node._matches(None, attrs, string):
+                continue
+            found.append(node)
+        return found
+
+    def find(self, name=None, attrs=None, recursive=True, string=None, text=None):
+        string = string if string is not None else text
+        if name is None and not attrs and string is not None:
+            return next((node for node in self._iter_strings() if node == string), None)
+
+        element = self.element
+        candidates = (
+            element.iterdescendants(name) if recursive else element.iterchildren(name)
+        )
+        wrap = self.document.wrap
+        for candidate in candidates:
+            if not isinstance(candidate.tag, str):
+                continue
+            node = wrap(candidate)
+            if (attrs or string is not None) and not node._matches(None, attrs, string):
+                continue
+            return node
+        return None
+
+    def _iter_strings(self):
+        """Nodos de texto del subárbol (incluidos los de scripts)."""
+        document = self.document
+        for value in _TEXTS(self.element):
+            owner = value.getparent()
+            yield document.string(value, owner, value.is_tail)
+
+    def find_next(self, name):
+        found = _NEXT_AFTER_TEXT(self.element, name=name)
+        return self.document.wrap(found[0]) if found else None
+
+    def find_next_sibling(self, name=None):
+        following = next(self.element.itersiblings(name), None)
+        return None if following is None else self.document.wrap(following)
+
+
+class LxmlString(str):
+    """
+    Texto del árbol de lxml (el .text o el .tail de un elemento) con la
+    interfaz de bs4.NavigableString: es un str con padre y hermanos.
+    """
+
+    name = None
+
+    def __new__(cls, value, owner, is_tail, document):
+        node = super().__new__(cls, value)
+        node.owner = owner
+        node.is_tail = is_tail
+        node.document = document
+        return node
+
+    def __reduce__(self):
+        # Al enviarse a otro proceso viaja como un str (sin el árbol)
+        return (str, (str(self),))
+
+    @property
+    def text(self):
+        return str(self)
+
+    @property
+    def strings(self):
+        return iter((str(self),))
+
+    def get_text(self, separator="", strip=False):
+        return self.strip() if strip else str(self)
+
+    @property
+    def parent(self):
+        parent = self.owner.getparent() if self.is_tail else self.owner
+        return None if parent is None else self.document.wrap(parent)
+
+    @property
+    def previous_sibling(self):
+        return self.document.wrap(self.owner) if self.is_tail else None
+
+    @property
+    def next_sibling(self):
+        if self.is_tail:
+            following = self.owner.getnext()
+        else:
+            following = self.owner[0] if len(self.owner) else None
+        return None if following is None else self.document.wrap(following)
+
+    def find_next(self, name):
+        query = _NEXT_AFTER_TAIL if self.is_tail else _NEXT_AFTER_TEXT
+        found = query(self.owner, name=name)
+        return self.document.wrap(found[0]) if found else None
+
+    def find_next_sibling(self, name=None):
+        if self.is_tail:
+            following = next(self.owner.itersiblings(name), None)
+        else:
+            following = next(self.owner.iterchildren(name), None)
+        return None if following is None else self.document.wrap(following)
+
+
+class LxmlComment(str):
+    """Comentario HTML (como bs4.Comment: un str sin texto visible)."""
+
+    name = None
+
+    def __new__(cls, element, document):
+        node = super().__new__(cls, element.text or "")
+        node.element = element
+        node.document = document
+        return node
+
+    def __reduce__(self):
+        return (str, (str(self),))
+
+    @property
+    def parent(self):
+        parent = self.element.getparent()
+        return None if parent is None else self.document.wrap(parent)
+
+    @property
+    def previous_sibling(self):
+        return LxmlTag.previous_sibling.fget(self)
+
+    @property
+    def next_sibling(self):
+        return LxmlTag.next_sibling.fget(self)
+
+    def find_next(self, name):
+        found = _NEXT_AFTER_TAIL(self.element, name=name)
+        return self.document.wrap(found[0]) if found else None
@@ -1,13 +1,150 @@
 from config import ProjectLogger
-from extractors.utils import insert_data
-from datetime import datetime
-import re
+from extractors.utils import insert_data, get_section
+from extractors.textkit import clean_text
+from extractors.field_spec import FieldSpec, SectionSpec, SKIP, cleaned_after
 
 # Configuramos el logger para este módulo
 logger = ProjectLogger()
 module_logger = logger.get_logger(__name__)
 
 
+def _chulo_blockquote(item, blockquote):
+    """Chulo dentro del blockquote."""
+    return blockquote.find("img")
+
+
+def _sin_comas(token):
+    """Texto posterior a la etiqueta, limpio y sin comas."""
+    return clean_text(token.after).replace(",", "")
+
+
+def _sin_comas_crudo(token):
+    """Texto posterior a la etiqueta sin comas, sin limpiar."""
+    return token.after.replace(",", "")
+
+
+def _fecha_fin(token):
+    fecha_fin = _sin_comas(token)
+    return fecha_fin if fecha_fin else SKIP
+
+
+def _participacion(token):
+    participacion = clean_text(token.after)
+    return participacion if participacion != "null" else SKIP
+
+
+# Campos de los blockquote de cada sección (ver extractors.field_spec)
+OBRAS_PRODUCTOS = SectionSpec(
+    "obras_productos",
+    FieldSpec(
+        (
+            "Disciplina:",
+            "Nombre del producto:",
+            "Fecha de creación:",
+            "INSTANCIAS DE VALORACIÓN DE LA OBRA",
+        ),
+        [
+            ("Disciplina:", "disciplina", cleaned_after),
+            (
+                "Nombre del producto:",
+                "nombre",
+                lambda token: clean_text(token.after)[:-1],
+            ),
+            ("Fecha de creación:", "fecha_creacion", cleaned_after),
+        ],
+        "obra/producto",
+    ),
+    chulo=_chulo_blockquote,
+)
+
+# El registro de licencia no tiene blockquote: los campos están en el li
+REGISTRO_LICENCIA = FieldSpec(
+    (
+        "Institución u organización que tiene la licencia:",
+        "Fecha de otorgamiento de la licencia:",
+        "Número de registro de la Dirección",
+        "Nacional de Derechos de Autor:",
+    ),
+    [
+        (
+            "Institución u organización que tiene la licencia:",
+            "institucion",
+            cleaned_after,
+        ),
+        ("Fecha de otorgamiento de la licencia:", "fecha_otorgamiento", _sin_comas),
+        ("Número de registro de la Dirección", "numero_registro", cleaned_after),
+        ("Nacional de Derechos de Autor:", "nacional_derechos", cleaned_after),
+    ],
+    "registro de licencia",
+)
+
+INDUSTRIAS_CREATIVAS = SectionSpec(
+    "industrias_creativas_culturales",
+    FieldSpec(
+        (
+            "Nombre de la empresa creativa:",
+            "Nit o codigo de registro:",
+            "Fecha de registro ante la camara de comercio:",
+            "Tiene productos en el mercado",
+        ),
+        [
+            ("Nombre de la empresa creativa:", "nombre", cleaned_after),
+            ("Nit o codigo de registro:", "nit_registro", cleaned_after),
+            (
+                "Fecha de registro ante la camara de comercio:",
+                "fecha_registro",
+                _sin_comas,
+            ),
+            ("Tiene productos en el mercado", "tiene_productos", cleaned_after),
+        ],
+        "industria creativa",
+    ),
+)
+
+EVENTOS_ARTISTICOS = SectionSpec(
+    "eventos_artisticos",
+    FieldSpec(
+        ("Nombre del evento:", "Fecha de inicio:", "Tipo del evento:"),
+        [
+            ("Nombre del evento:", "nombre", cleaned_after),
+            ("Fecha de inicio:", "fecha_inicio", cleaned_after),
+        ],
+        "evento artístico",
+    ),
+    chulo=_chulo_blockquote,
+)
+
+TALLERES_CREATIVOS = SectionSpec(
+    "talleres_creativos",
+    FieldSpec(
+        (
+            "Nombre del taller:",
+            "Tipo de taller:",
+            "Participación:",
+            "Fecha de inicio:",
+            "Fecha de finalización:",
+            "Lugar de realización:",
+            "Ámbito:",
+            "Distinción obtenida:",
+            "Mecanismo de selección:",
+        ),
+        [
+            ("Nombre del taller:", "nombre", _sin_comas),
+            ("Tipo de taller:", "tipo", _sin_comas),
+            ("Fecha de inicio:", "fecha_inicio", _sin_comas),
+            ("Fecha de finalización:", "fecha_fin", _fecha_fin),
+            ("Participación:", "participacion", _participacion),
+            ("Ámbito:", "ambito", _sin_comas_crudo),
+            ("Distinción obtenida:", "distincion_obtenida", _sin_comas_crudo),
+            ("Mecanismo de selección:", "mecanismo_seleccion", cleaned_after),
+            ("Lugar de realización:", "lugar_realizacion", cleaned_after),
+        ],
+        "taller creativo",
+    ),
+    chulo=_chulo_blockquote,
+)
+
+
 class ProduccionArtesExtractor:
     """
     Clase para extraer información relacionada con producción en artes del investigador.
@@ -20,71 +157,10 @@ class ProduccionArtesExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
-        try:
-            table = h3.parent.parent.parent
-
-            if not table:
-                module_logger.warning(
-                    f"No se encontró tabla para obras/productos en {cod_rh}"
-                )
-                return
-
-            blockquotes = table.find_all("blockquote")
-
-            for blockquote in blockquotes:
-                try:
-                    data = {"cvlac_id": cod_rh}
-                    data["chulo"] = "SI" if blockquote.find("img") else "NO"
-
-                    blockquote_split = re.split(
-                        "(Disciplina:)|(Nombre del producto:)|(Fecha de creación:)|(INSTANCIAS DE VALORACIÓN DE LA OBRA)",
-                        blockquote.text,
-                    )
-
-                    for i in range(len(blockquote_split)):
-                        try:
-                            if blockquote_split[i] == "Disciplina:":
-                                if i + 4 < len(blockquote_split):
-                                    data["disciplina"] = (
-                                        ProduccionArtesExtractor._clean_text(
-                                            blockquote_split[i + 4]
-                                        )
-                                    )
-                            elif blockquote_split[i] == "Nombre del producto:":
-                                if i + 3 < len(blockquote_split):
-                                    data["nombre"] = (
-                                        ProduccionArtesExtractor._clean_text(
-                                            blockquote_split[i + 3]
-                                        )[:-1]
-                                    )
-                            elif blockquote_split[i] == "Fecha de creación:":
-                                if i + 2 < len(blockquote_split):
-                                    data["fecha_creacion"] = (
-                                        ProduccionArtesExtractor._clean_text(
-                                            blockquote_split[i + 2]
-                                        )
-                                    )
-                        except Exception as ex:
-                            module_logger.error(
-                                f"Error extrayendo datos de obra/producto para {cod_rh}: {str(ex)}",
-                                exc_info=True,
-                            )
-
-                    insert_data("obras_productos", data, connection)
-                    module_logger.debug(f"Obra/producto insertado para {cod_rh}")
-                except Exception as ex:
-                    module_logger.error(
-                        f"Error procesando obra/producto para {cod_rh}: {str(ex)}",
-                        exc_info=True,
-                    )
-        except Exception as ex:
-            module_logger.error(
-                f"Error general en extract_obras_productos para {cod_rh}: {str(ex)}",
-                exc_info=True,
-            )
+        OBRAS_PRODUCTOS.extract(cod_rh, h3, connection)
 
     @staticmethod
     def extract_registro_licencia(cod_rh, h3, connection):
@@ -93,11 +169,12 @@ class ProduccionArtesExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -105,57 +182,14 @@ class ProduccionArtesExtractor:
                 )
                 return
 
-            lis = table.find_all("li")
+            lis = section.lis
 
             for li in lis:
                 try:
                     data = {"cvlac_id": cod_rh}
                     data["chulo"] = "SI" if li.find("img") else "NO"
 
-                    li_split = re.split(
-                        "(Institución u organización que tiene la licencia:)|(Fecha de otorgamiento de la licencia:)|"
-                        "(Número de registro de la Dirección)|(Nacional de Derechos de Autor:)",
-                        li.text,
-                    )
-
-                    for i in range(len(li_split)):
-                        try:
-                            if (
-                                li_split[i]
-                                == "Institución u organización que tiene la licencia:"
-                            ):
-                                if i + 4 < len(li_split):
-                                    data["institucion"] = (
-                                        ProduccionArtesExtractor._clean_text(
-                                            li_split[i + 4]
-                                        )
-                                    )
-                            elif li_split[i] == "Fecha de otorgamiento de la licencia:":
-                                if i + 3 < len(li_split):
-                                    data["fecha_otorgamiento"] = (
-                                        ProduccionArtesExtractor._clean_text(
-                                            li_split[i + 3]
-                                        ).replace(",", "")
-                                    )
-                            elif li_split[i] == "Número de registro de la Dirección":
-                                if i + 2 < len(li_split):
-                                    data["numero_registro"] = (
-                                        ProduccionArtesExtractor._clean_text(
-                                            li_split[i + 2]
-                                        )
-                                    )
-                            elif li_split[i] == "Nacional de Derechos de Autor:":
-                                if i + 1 < len(li_split):
-                                    data["nacional_derechos"] = (
-                                        ProduccionArtesExtractor._clean_text(
-                                            li_split[i + 1]
-                                        )
-                                    )
-                        except Exception as ex:
-                            module_logger.error(
-                                f"Error extrayendo datos de registro de licencia para {cod_rh}: {str(ex)}",
-                                exc_info=True,
-                            )
+                    REGISTRO_LICENCIA.apply(li.text, data)
 
                     insert_data("registro_licencia", data, connection)
                     module_logger.debug(f"Registro de licencia insertado para {cod_rh}")
@@ -177,81 +211,10 @@ class ProduccionArtesExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
-        try:
-            table = h3.parent.parent.parent
-
-            if not table:
-                module_logger.warning(
-                    f"No se encontró tabla para industrias creativas en {cod_rh}"
-                )
-                return
-
-            blockquotes = table.find_all("blockquote")
-
-            for blockquote in blockquotes:
-                try:
-                    data = {"cvlac_id": cod_rh}
-
-                    blockquote_split = re.split(
-                        "(Nombre de la empresa creativa:)|(Nit o codigo de registro:)|"
-                        "(Fecha de registro ante la camara de comercio:)|(Tiene productos en el mercado)",
-                        blockquote.text,
-                    )
-
-                    for i in range(len(blockquote_split)):
-                        try:
-                            if blockquote_split[i] == "Nombre de la empresa creativa:":
-                                if i + 4 < len(blockquote_split):
-                                    data["nombre"] = (
-                                        ProduccionArtesExtractor._clean_text(
-                                            blockquote_split[i + 4]
-                                        )
-                                    )
-                            elif blockquote_split[i] == "Nit o codigo de registro:":
-                                if i + 3 < len(blockquote_split):
-                                    data["nit_registro"] = (
-                                        ProduccionArtesExtractor._clean_text(
-                                            blockquote_split[i + 3]
-                                        )
-                                    )
-                            elif (
-                                blockquote_split[i]
-                                == "Fecha de registro ante la camara de comercio:"
-                            ):
-                                if i + 2 < len(blockquote_split):
-                                    data["fecha_registro"] = (
-                                        ProduccionArtesExtractor._clean_text(
-                                            blockquote_split[i + 2]
-                                        ).replace(",", "")
-                                    )
-                            elif blockquote_split[i] == "Tiene productos en el mercado":
-                                if i + 1 < len(blockquote_split):
-                                    data["tiene_productos"] = (
-                                        ProduccionArtesExtractor._clean_text(
-                                            blockquote_split[i + 1]
-                                        )
-                                    )
-                        except Exception as ex:
-                            module_logger.error(
-                                f"Error extrayendo datos de industria creativa para {cod_rh}: {str(ex)}",
-                                exc_info=True,
-                            )
-
-                    insert_data("industrias_creativas_culturales", data, connection)
-                    module_logger.debug(f"Industria creativa insertada para {cod_rh}")
-                except Exception as ex:
-                    module_logger.error(
-                        f"Error procesando industria creativa para {cod_rh}: {str(ex)}",
-                        exc_info=True,
-                    )
-        except Exception as ex:
-            module_logger.error(
-                f"Error general en extract_industrias_creativas para {cod_rh}: {str(ex)}",
-                exc_info=True,
-            )
+        INDUSTRIAS_CREATIVAS.extract(cod_rh, h3, connection)
 
     @staticmethod
     def extract_eventos_artisticos(cod_rh, h3, connection):
@@ -260,64 +223,10 @@ class ProduccionArtesExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
-        try:
-            table = h3.parent.parent.parent
-
-            if not table:
-                module_logger.warning(
-                    f"No se encontró tabla para eventos artísticos en {cod_rh}"
-                )
-                return
-
-            blockquotes = table.find_all("blockquote")
-
-            for blockquote in blockquotes:
-                try:
-                    data = {"cvlac_id": cod_rh}
-                    data["chulo"] = "SI" if blockquote.find("img") else "NO"
-
-                    blockquote_split = re.split(
-                        "(Nombre del evento:)|(Fecha de inicio:)|(Tipo del evento:)",
-                        blockquote.text,
-                    )
-
-                    for i in range(len(blockquote_split)):
-                        try:
-                            if blockquote_split[i] == "Nombre del evento:":
-                                if i + 3 < len(blockquote_split):
-                                    data["nombre"] = (
-                                        ProduccionArtesExtractor._clean_text(
-                                            blockquote_split[i + 3]
-                                        )
-                                    )
-                            elif blockquote_split[i] == "Fecha de inicio:":
-                                if i + 2 < len(blockquote_split):
-                                    data["fecha_inicio"] = (
-                                        ProduccionArtesExtractor._clean_text(
-                                            blockquote_split[i + 2]
-                                        )
-                                    )
-                        except Exception as ex:
-                            module_logger.error(
-                                f"Error extrayendo datos de evento artístico para {cod_rh}: {str(ex)}",
-                                exc_info=True,
-                            )
-
-                    insert_data("eventos_artisticos", data, connection)
-                    module_logger.debug(f"Evento artístico insertado para {cod_rh}")
-                except Exception as ex:
-                    module_logger.error(
-                        f"Error procesando evento artístico para {cod_rh}: {str(ex)}",
-                        exc_info=True,
-                    )
-        except Exception as ex:
-            module_logger.error(
-                f"Error general en extract_eventos_artisticos para {cod_rh}: {str(ex)}",
-                exc_info=True,
-            )
+        EVENTOS_ARTISTICOS.extract(cod_rh, h3, connection)
 
     @staticmethod
     def extract_talleres_creativos(cod_rh, h3, connection):
@@ -326,134 +235,10 @@ class ProduccionArtesExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
-        try:
-            table = h3.parent.parent.parent
-
-            if not table:
-                module_logger.warning(
-                    f"No se encontró tabla para talleres creativos en {cod_rh}"
-                )
-                return
-
-            blockquotes = table.find_all("blockquote")
-
-            for blockquote in blockquotes:
-                try:
-                    data = {"cvlac_id": cod_rh}
-                    data["chulo"] = "SI" if blockquote.find("img") else "NO"
-
-                    blockquote_split = re.split(
-                        "(Nombre del taller:)|(Tipo de taller:)|(Participación:)|(Fecha de inicio:)|"
-                        "(Fecha de finalización:)|(Lugar de realización:)|(Ámbito:)|(Distinción obtenida:)|"
-                        "(Mecanismo de selección:)",
-                        blockquote.text,
-                    )
-
-                    for i in range(len(blockquote_split)):
-                        try:
-                            if blockquote_split[i] == "Nombre del taller:":
-                                if i + 9 < len(blockquote_split):
-                                    data["nombre"] = (
-                                        ProduccionArtesExtractor._clean_text(
-                                            blockquote_split[i + 9]
-                                        ).replace(",", "")
-                                    )
-                            elif blockquote_split[i] == "Tipo de taller:":
-                                if i + 8 < len(blockquote_split):
-                                    data["tipo"] = ProduccionArtesExtractor._clean_text(
-                                        blockquote_split[i + 8]
-                                    ).replace(",", "")
-                            elif blockquote_split[i] == "Fecha de inicio:":
-                                if i + 6 < len(blockquote_split):
-                                    data["fecha_inicio"] = (
-                                        ProduccionArtesExtractor._clean_text(
-                                            blockquote_split[i + 6]
-                                        ).replace(",", "")
-                                    )
-                            elif blockquote_split[i] == "Fecha de finalización:":
-                                if i + 5 < len(blockquote_split):
-                                    fecha_fin = ProduccionArtesExtractor._clean_text(
-                                        blockquote_split[i + 5]
-                                    ).replace(",", "")
-                                    if fecha_fin:
-                                        data["fecha_fin"] = fecha_fin
-                            elif blockquote_split[i] == "Participación:":
-                                if i + 7 < len(blockquote_split):
-                                    participacion = (
-                                        ProduccionArtesExtractor._clean_text(
-                                            blockquote_split[i + 7]
-                                        )
-                                    )
-                                    if participacion != "null":
-                                        data["participacion"] = participacion
-                            elif blockquote_split[i] == "Ámbito:":
-                                if i + 3 < len(blockquote_split):
-                                    data["ambito"] = blockquote_split[i + 3].replace(
-                                        ",", ""
-                                    )
-                            elif blockquote_split[i] == "Distinción obtenida:":
-                                if i + 2 < len(blockquote_split):
-                                    data["distincion_obtenida"] = blockquote_split[
-                                        i + 2
-                                    ].replace(",", "")
-                            elif blockquote_split[i] == "Mecanismo de selección:":
-                                if i + 1 < len(blockquote_split):
-                                    data["mecanismo_seleccion"] = (
-                                        ProduccionArtesExtractor._clean_text(
-                                            blockquote_split[i + 1]
-                                        )
-                                    )
-                            elif blockquote_split[i] == "Lugar de realización:":
-                                if i + 4 < len(blockquote_split):
-                                    data["lugar_realizacion"] = (
-                                        ProduccionArtesExtractor._clean_text(
-                                            blockquote_split[i + 4]
-                                        )
-                                    )
-                        except Exception as ex:
-                            module_logger.error(
-                                f"Error extrayendo datos de taller creativo para {cod_rh}: {str(ex)}",
-                                exc_info=True,
-                            )
-
-                    insert_data("talleres_creativos", data, connection)
-                    module_logger.debug(f"Taller creativo insertado para {cod_rh}")
-                except Exception as ex:
-                    module_logger.error(
-                        f"Error procesando taller creativo para {cod_rh}: {str(ex)}",
-                        exc_info=True,
-                    )
-        except Exception as ex:
-            module_logger.error(
-                f"Error general en extract_talleres_creativos para {cod_rh}: {str(ex)}",
-                exc_info=True,
-            )
-
-    @staticmethod
-    def _clean_text(text):
-        """
-        Limpia el texto de caracteres no deseados.
-
-        Args:
-            text (str): Texto a limpiar.
-
-        Returns:
-            str: Texto limpio.
-        """
-        if not text:
-            return ""
-
-        return (
-            text.strip()
-            .replace("'", '"')
-            .replace("\t'", '"')
-            .replace("  ", "")
-            .replace("\n", "")
-            .replace("\r", "")
-        )
+        TALLERES_CREATIVOS.extract(cod_rh, h3, connection)
 
 
 # Funciones de compatibilidad para el código existente
@@ -1,5 +1,19 @@
 from config import ProjectLogger
-from extractors.utils import insert_data
+from extractors.utils import insert_data, get_section
+from extractors.textkit import AUTHORS, NUMBERS, QUOTED, clean_text
+from extractors.field_spec import (
+    FieldSpec,
+    SKIP,
+    KEYWORD_FIELDS,
+    cleaned_after,
+    authors,
+    authors_before,
+    title_after_authors,
+    quoted_before,
+    first_int,
+    to_int,
+    set_field,
+)
 from datetime import datetime
 import re
 
@@ -8,6 +22,260 @@ logger = ProjectLogger()
 module_logger = logger.get_logger(__name__)
 
 
+def _titulo_entre_comillas(token):
+    """Título entre comillas antes de la etiqueta, sin saltos de línea."""
+    titulo = quoted_before(token)
+    if titulo is SKIP:
+        return SKIP
+    return (
+        titulo.replace("\t'", '"').replace("  ", "").replace("\n", "").replace("\r", "")
+    )
+
+
+def _paginas_ano(temp, data, inicial, final, ano=None):
+    """Asigna página inicial, página final y año (primer número de cada línea)."""
+    if len(temp) > inicial:
+        pagina_inicial = first_int(temp[inicial], "la página inicial")
+        set_field(data, "pagina_inicial", pagina_inicial)
+    if len(temp) > final:
+        set_field(data, "pagina_final", first_int(temp[final], "la página final"))
+    if ano is not None and len(temp) > ano:
+        set_field(data, "ano", first_int(temp[ano]))
+
+
+def _articulo_pais_revista(token, data):
+    temp = token.after.split("\xa0\n")
+    data["pais"] = clean_text(temp[0])
+    if len(temp) > 1:
+        data["revista"] = clean_text(temp[1])
+
+
+def _articulo_editorial(token, data):
+    temp = token.after.split("\n")
+    data["editorial"] = clean_text(temp[0])
+    if len(temp) > 1:
+        data["volumen"] = temp[1]
+
+
+def _articulo_fasciculo(token, data):
+    temp = token.after.split("\n")
+    data["fasciculo"] = temp[0]
+    _paginas_ano(temp, data, 1, 2, 3)
+
+
+def _capitulo_coautores(token, data):
+    """Los capítulos acumulan el primer autor antes de cada 'Tipo:' y 'En:'."""
+    coautores = AUTHORS.findall(token.before)
+    if coautores:
+        data["coautores"] += coautores[0] + ", "
+
+
+def _capitulo_libro(token):
+    libro_split = token.before.split("\n")
+    if len(libro_split) > 1:
+        return clean_text(libro_split[-2])
+    return SKIP
+
+
+def _capitulo_editorial(token, data):
+    temp = token.after.split("\n")
+    data["editorial"] = clean_text(temp[0])
+    if len(temp) > 1:
+        volumen = NUMBERS.findall(temp[1])
+        if volumen:
+            data["volumen"] = volumen[0]
+    _paginas_ano(temp, data, 2, 3, 5)
+
+
+def _libro_lugar_ano(token, data):
+    lugar = NUMBERS.sub("", token.after).replace(".", "")
+    data["lugar_publicacion"] = clean_text(lugar)
+    set_field(data, "ano", first_int(token.after))
+
+
+def _libro_isbn(token, data):
+    temp = token.after.split("\n")
+    data["isbn"] = clean_text(temp[0])
+    if len(temp) > 1:
+        data["volumen"] = "".join(NUMBERS.findall(temp[1]))
+    if len(temp) > 2:
+        data["paginas"] = "".join(NUMBERS.findall(temp[2]))
+
+
+def _otra_produccion_ano(token, data):
+    temp = token.after.split("\n")
+    if len(temp) > 1:
+        set_field(data, "ano", to_int(clean_text(temp[1])[:-1]))
+
+
+def _pais_ano(token, data):
+    """País y año en las dos primeras líneas (sin el separador final)."""
+    temp = token.after.split("\n")
+    data["pais"] = clean_text(temp[0])[:-1]
+    if len(temp) > 1:
+        set_field(data, "ano", to_int(clean_text(temp[1])[:-1]))
+    return temp
+
+
+def _texto_pais_ano_revista(token, data):
+    temp = _pais_ano(token, data)
+    if len(temp) > 2:
+        data["revista"] = clean_text(temp[2])[:-1]
+
+
+def _texto_issn(token, data):
+    temp = token.after.split("\n")
+    data["issn"] = clean_text(temp[0])
+    _paginas_ano(temp, data, 1, 2)
+    if len(temp) > 3:
+        data["volumen"] = clean_text(temp[3])
+
+
+def _traduccion_volumen(token):
+    volumen = VOLUME.findall(token.after)
+    return volumen[0] if volumen else SKIP
+
+
+def _nota_titulo_revista(token, data):
+    temp = QUOTED_GROUP.split(token.before)
+    data["coautores"] = ", ".join(AUTHORS.findall(temp[0]))
+    if len(temp) > 1:
+        data["titulo_nota"] = clean_text(temp[1])
+    if len(temp) > 2:
+        data["revista"] = clean_text(temp[2][1:])
+
+
+def _nota_editorial(token, data):
+    temp = token.after.split("\n")
+    data["editorial"] = clean_text(temp[0])
+    if len(temp) > 1:
+        data["volumen"] = clean_text(temp[1])
+    if len(temp) > 2:
+        data["fasc"] = clean_text(temp[2])
+    _paginas_ano(temp, data, 3, 4, 5)
+
+
+# Volumen de una traducción ("v.3") y título entre comillas (con grupo)
+VOLUME = re.compile(r"v.[0-9]*")
+QUOTED_GROUP = re.compile(r'(".*")')
+
+# Campos de los blockquote de cada sección (ver extractors.field_spec)
+ARTICULOS = FieldSpec(
+    ("En:", "ISSN:", "ed:", "fasc.", "DOI:", "Palabras:", "Areas:", "Sectores:"),
+    [
+        ("En:", "coautores", authors),
+        ("En:", "titulo", title_after_authors),
+        ("En:", None, _articulo_pais_revista),
+        ("ISSN:", "issn", cleaned_after),
+        ("ed:", None, _articulo_editorial),
+        ("fasc.", None, _articulo_fasciculo),
+        ("DOI:", "doi", cleaned_after),
+    ]
+    + KEYWORD_FIELDS,
+    "artículo",
+)
+
+CAPITULOS = FieldSpec(
+    ("Tipo:", "En:", "ISBN:", "ed:", "Palabras:", "Areas:", "Sectores:"),
+    [
+        ("Tipo:", None, _capitulo_coautores),
+        ("En:", None, _capitulo_coautores),
+        ("En:", "titulo_capitulo", quoted_before),
+        ("En:", "libro", _capitulo_libro),
+        ("En:", "lugar_publicacion", cleaned_after),
+        ("ISBN:", "isbn", cleaned_after),
+        ("ed:", None, _capitulo_editorial),
+    ]
+    + KEYWORD_FIELDS,
+    "capítulo de libro",
+)
+
+LIBROS = FieldSpec(
+    ("En:", "ed:", "ISBN:", "Palabras:", "Areas:", "Sectores:"),
+    [
+        ("En:", "coautores", authors_before),
+        ("En:", "titulo", _titulo_entre_comillas),
+        ("En:", None, _libro_lugar_ano),
+        ("ed:", "editorial", cleaned_after),
+        ("ISBN:", None, _libro_isbn),
+    ]
+    + KEYWORD_FIELDS,
+    "libro",
+)
+
+OTRA_PRODUCCION = FieldSpec(
+    ("En:", "Palabras:", "Areas:", "Sectores:"),
+    [
+        ("En:", "coautores", authors_before),
+        ("En:", "titulo", _titulo_entre_comillas),
+        ("En:", None, _otra_produccion_ano),
+    ]
+    + KEYWORD_FIELDS,
+    "otra producción",
+)
+
+TEXTOS_NO_CIENTIFICOS = FieldSpec(
+    ("En:", "ISSN:", "Palabras:", "Areas:", "Sectores:"),
+    [
+        ("En:", "coautores", authors_before),
+        ("En:", "titulo", _titulo_entre_comillas),
+        ("En:", None, _texto_pais_ano_revista),
+        ("ISSN:", None, _texto_issn),
+    ]
+    + KEYWORD_FIELDS,
+    "texto no científico",
+)
+
+TRADUCCIONES = FieldSpec(
+    (
+        "En:",
+        "Idioma original:",
+        "Idioma traducción:",
+        "Autor:",
+        "Nombre original:",
+        "Palabras:",
+        "Areas:",
+        "Sectores:",
+    ),
+    [
+        ("En:", "coautores", authors_before),
+        ("En:", "nombre", quoted_before),
+        ("En:", None, _pais_ano),
+        ("Idioma original:", "idioma_original", cleaned_after),
+        ("Idioma traducción:", "idioma_traduccion", cleaned_after),
+        ("Autor:", "autor", cleaned_after),
+        ("Nombre original:", "volumen", _traduccion_volumen),
+    ]
+    + KEYWORD_FIELDS,
+    "traducción",
+)
+
+NOTAS_CIENTIFICAS = FieldSpec(
+    (
+        "medio de divulgación:",
+        "Idioma original:",
+        "ISSN:",
+        "ed:",
+        "Sitio web:",
+        "DOI:",
+        "Palabras:",
+        "Areas:",
+        "Sectores:",
+    ),
+    [
+        ("medio de divulgación:", None, _nota_titulo_revista),
+        ("medio de divulgación:", "medio_divulgacion", cleaned_after),
+        ("Idioma original:", "idioma_original", cleaned_after),
+        ("ISSN:", "issn", cleaned_after),
+        ("ed:", None, _nota_editorial),
+        ("Sitio web:", "sitio_web", cleaned_after),
+        ("DOI:", "doi", cleaned_after),
+    ]
+    + KEYWORD_FIELDS,
+    "nota científica",
+)
+
+
 class ProduccionBibliograficaExtractor:
     """
     Clase para extraer información relacionada con producción bibliográfica del investigador.
@@ -20,11 +288,12 @@ class ProduccionBibliograficaExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -32,8 +301,8 @@ class ProduccionBibliograficaExtractor:
                 )
                 return
 
-            lis = table.find_all("li")
-            blockquotes = table.find_all("blockquote")
+            lis = section.lis
+            blockquotes = section.blockquotes
 
             if len(lis) != len(blockquotes):
                 module_logger.warning(
@@ -48,19 +317,12 @@ class ProduccionBibliograficaExtractor:
                     data["chulo"] = "SI" if lis[i].find("img") else "NO"
                     li_split = lis[i].text.split("-")
                     if len(li_split) > 2:
-                        data["tipo"] = ProduccionBibliograficaExtractor._clean_text(
-                            li_split[2]
-                        )
+                        data["tipo"] = clean_text(li_split[2])
 
                     # Extraer información del blockquote
                     if i < len(blockquotes):
-                        blockquote_split = re.split(
-                            "(En:)|(ISSN:)|(ed:)|(fasc.)|(DOI:)|(Palabras:)|(Areas:)|(Sectores:)",
-                            blockquotes[i].text,
-                        )
-
                         ProduccionBibliograficaExtractor._extract_blockquote_articulos(
-                            blockquote_split, data
+                            blockquotes[i].text, data
                         )
 
                     # Insertar en la base de datos
@@ -78,118 +340,15 @@ class ProduccionBibliograficaExtractor:
             )
 
     @staticmethod
-    def _extract_blockquote_articulos(blockquote_split, data):
+    def _extract_blockquote_articulos(text, data):
         """
         Extrae información del blockquote para artículos.
 
         Args:
-            blockquote_split (list): Lista con las partes del blockquote.
+            text (str): Texto del blockquote.
             data (dict): Diccionario donde se almacenará la información.
         """
-        for j in range(len(blockquote_split)):
-            try:
-                if blockquote_split[j] == "En:":
-                    if j > 0:
-                        data["coautores"] = ", ".join(
-                            re.findall(
-                                "[A-Z]{2,}[ [A-Z]{2,}]*", blockquote_split[:j][0]
-                            )
-                        )
-                        titulo_split = re.split("[A-Z]{2,},", blockquote_split[j - 1])
-                        if len(titulo_split) > 0:
-                            data["titulo"] = (
-                                ProduccionBibliograficaExtractor._clean_text(
-                                    titulo_split[-1][:-1]
-                                )
-                            )
-
-                    if j + 8 < len(blockquote_split):
-                        temp = blockquote_split[j + 8].split("\xa0\n")
-                        if len(temp) > 0:
-                            data["pais"] = ProduccionBibliograficaExtractor._clean_text(
-                                temp[0]
-                            )
-                        if len(temp) > 1:
-                            data["revista"] = (
-                                ProduccionBibliograficaExtractor._clean_text(temp[1])
-                            )
-                elif blockquote_split[j] == "ISSN:":
-                    if j + 7 < len(blockquote_split):
-                        data["issn"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 7]
-                        )
-                elif blockquote_split[j] == "ed:":
-                    if j + 6 < len(blockquote_split):
-                        temp = blockquote_split[j + 6].split("\n")
-                        if len(temp) > 0:
-                            data["editorial"] = (
-                                ProduccionBibliograficaExtractor._clean_text(temp[0])
-                            )
-                        if len(temp) > 1:
-                            data["volumen"] = temp[1]
-                elif blockquote_split[j] == "fasc.":
-                    if j + 5 < len(blockquote_split):
-                        temp = blockquote_split[j + 5].split("\n")
-                        if len(temp) > 0:
-                            data["fasciculo"] = temp[0]
-
-                        # Extraer página inicial
-                        if len(temp) > 1:
-                            pagina_inicial = re.findall(r"[0-9]+", temp[1])
-                            if pagina_inicial:
-                                try:
-                                    data["pagina_inicial"] = int(pagina_inicial[0])
-                                except (ValueError, TypeError):
-                                    module_logger.warning(
-                                        f"No se pudo convertir la página inicial a entero: {pagina_inicial[0]}"
-                                    )
-
-                        # Extraer página final
-                        if len(temp) > 2:
-                            pagina_final = re.findall(r"[0-9]+", temp[2])
-                            if pagina_final:
-                                try:
-                                    data["pagina_final"] = int(pagina_final[0])
-                                except (ValueError, TypeError):
-                                    module_logger.warning(
-                                        f"No se pudo convertir la página final a entero: {pagina_final[0]}"
-                                    )
-
-                        # Extraer año
-                        if len(temp) > 3:
-                            ano = re.findall(r"[0-9]+", temp[3])
-                            if ano:
-                                try:
-                                    data["ano"] = int(ano[0])
-                                except (ValueError, TypeError):
-                                    module_logger.warning(
-                                        f"No se pudo convertir el año a entero: {ano[0]}"
-                                    )
-                elif blockquote_split[j] == "DOI:":
-                    if j + 4 < len(blockquote_split):
-                        data["doi"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 4]
-                        )
-                elif blockquote_split[j] == "Palabras:":
-                    if j + 3 < len(blockquote_split):
-                        data["palabras"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 3]
-                        )
-                elif blockquote_split[j] == "Areas:":
-                    if j + 2 < len(blockquote_split):
-                        data["areas"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 2]
-                        )
-                elif blockquote_split[j] == "Sectores:":
-                    if j + 1 < len(blockquote_split):
-                        data["sectores"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 1]
-                        )
-            except Exception as ex:
-                module_logger.error(
-                    f"Error extrayendo datos del blockquote artículos: {str(ex)}",
-                    exc_info=True,
-                )
+        ARTICULOS.apply(text, data)
 
     @staticmethod
     def extract_capitulos(cod_rh, h3, connection):
@@ -198,11 +357,12 @@ class ProduccionBibliograficaExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -210,7 +370,7 @@ class ProduccionBibliograficaExtractor:
                 )
                 return
 
-            blockquotes = table.find_all("blockquote")
+            blockquotes = section.blockquotes
 
             for blockquote in blockquotes:
                 try:
@@ -218,10 +378,7 @@ class ProduccionBibliograficaExtractor:
                     data["chulo"] = "SI" if blockquote.find("img") else "NO"
                     data["coautores"] = ""
 
-                    blockquote_split = re.split(
-                        "(Tipo:)|(En:)|(ISBN:)|(ed:)|(Palabras:)|(Areas:)|(Sectores:)",
-                        blockquote.text,
-                    )
+                    blockquote_split = CAPITULOS.pattern.split(blockquote.text)
 
                     # Verificar que haya suficientes elementos
                     if len(blockquote_split) > 6 and blockquote_split[6] is not None:
@@ -234,7 +391,7 @@ class ProduccionBibliograficaExtractor:
                         )
 
                     ProduccionBibliograficaExtractor._extract_blockquote_capitulos(
-                        blockquote_split, data
+                        blockquote.text, data
                     )
 
                     # Insertar en la base de datos
@@ -252,120 +409,15 @@ class ProduccionBibliograficaExtractor:
             )
 
     @staticmethod
-    def _extract_blockquote_capitulos(blockquote_split, data):
+    def _extract_blockquote_capitulos(text, data):
         """
         Extrae información del blockquote para capítulos de libro.
 
         Args:
-            blockquote_split (list): Lista con las partes del blockquote.
+            text (str): Texto del blockquote.
             data (dict): Diccionario donde se almacenará la información.
         """
-        for i in range(len(blockquote_split)):
-            try:
-                if blockquote_split[i] == "Tipo:":
-                    if i - 1 >= 0:
-                        coautores = re.findall(
-                            "[A-Z]{2,}[ [A-Z]{2,}]*", blockquote_split[i - 1]
-                        )
-                        if coautores:
-                            data["coautores"] += coautores[0] + ", "
-                elif blockquote_split[i] == "En:":
-                    if i - 2 >= 0:
-                        coautores = re.findall(
-                            "[A-Z]{2,}[ [A-Z]{2,}]*", blockquote_split[i - 2]
-                        )
-                        if coautores:
-                            data["coautores"] += coautores[0] + ", "
-
-                        titulo = re.findall(r'".*"', blockquote_split[i - 2])
-                        if titulo:
-                            data["titulo_capitulo"] = titulo[0]
-
-                        libro_split = blockquote_split[i - 2].split("\n")
-                        if len(libro_split) > 1:
-                            data["libro"] = (
-                                ProduccionBibliograficaExtractor._clean_text(
-                                    libro_split[-2]
-                                )
-                            )
-
-                    if i + 6 < len(blockquote_split):
-                        data["lugar_publicacion"] = (
-                            ProduccionBibliograficaExtractor._clean_text(
-                                blockquote_split[i + 6]
-                            )
-                        )
-                elif blockquote_split[i] == "ISBN:":
-                    if i + 5 < len(blockquote_split):
-                        data["isbn"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[i + 5]
-                        )
-                elif blockquote_split[i] == "ed:":
-                    if i + 4 < len(blockquote_split):
-                        temp = blockquote_split[i + 4].split("\n")
-                        if len(temp) > 0:
-                            data["editorial"] = (
-                                ProduccionBibliograficaExtractor._clean_text(temp[0])
-                            )
-
-                        # Extraer volumen
-                        if len(temp) > 1:
-                            volumen = re.findall(r"[0-9]+", temp[1])
-                            if volumen:
-                                data["volumen"] = volumen[0]
-
-                        # Extraer página inicial
-                        if len(temp) > 2:
-                            pagina_inicial = re.findall(r"[0-9]+", temp[2])
-                            if pagina_inicial:
-                                try:
-                                    data["pagina_inicial"] = int(pagina_inicial[0])
-                                except (ValueError, TypeError):
-                                    module_logger.warning(
-                                        f"No se pudo convertir la página inicial a entero: {pagina_inicial[0]}"
-                                    )
-
-                        # Extraer página final
-                        if len(temp) > 3:
-                            pagina_final = re.findall(r"[0-9]+", temp[3])
-                            if pagina_final:
-                                try:
-                                    data["pagina_final"] = int(pagina_final[0])
-                                except (ValueError, TypeError):
-                                    module_logger.warning(
-                                        f"No se pudo convertir la página final a entero: {pagina_final[0]}"
-                                    )
-
-                        # Extraer año
-                        if len(temp) > 5:
-                            ano = re.findall(r"[0-9]+", temp[5])
-                            if ano:
-                                try:
-                                    data["ano"] = int(ano[0])
-                                except (ValueError, TypeError):
-                                    module_logger.warning(
-                                        f"No se pudo convertir el año a entero: {ano[0]}"
-                                    )
-                elif blockquote_split[i] == "Palabras:":
-                    if i + 3 < len(blockquote_split):
-                        data["palabras"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[i + 3]
-                        )
-                elif blockquote_split[i] == "Areas:":
-                    if i + 2 < len(blockquote_split):
-                        data["areas"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[i + 2]
-                        )
-                elif blockquote_split[i] == "Sectores:":
-                    if i + 1 < len(blockquote_split):
-                        data["sectores"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[i + 1]
-                        )
-            except Exception as ex:
-                module_logger.error(
-                    f"Error extrayendo datos del blockquote capítulos: {str(ex)}",
-                    exc_info=True,
-                )
+        CAPITULOS.apply(text, data)
 
     @staticmethod
     def extract_libros(cod_rh, h3, connection):
@@ -374,18 +426,19 @@ class ProduccionBibliograficaExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(f"No se encontró tabla para libros en {cod_rh}")
                 return
 
-            lis = table.find_all("li")
-            blockquotes = table.find_all("blockquote")
+            lis = section.lis
+            blockquotes = section.blockquotes
 
             if len(lis) != len(blockquotes):
                 module_logger.warning(
@@ -400,19 +453,12 @@ class ProduccionBibliograficaExtractor:
                     data["chulo"] = "SI" if lis[i].find("img") else "NO"
                     li_split = lis[i].text.split("-")
                     if len(li_split) > 2:
-                        data["tipo"] = ProduccionBibliograficaExtractor._clean_text(
-                            li_split[2]
-                        )
+                        data["tipo"] = clean_text(li_split[2])
 
                     # Extraer información del blockquote
                     if i < len(blockquotes):
-                        blockquote_split = re.split(
-                            "(En:)|(ed:)|(ISBN:)|(Palabras:)|(Areas:)|(Sectores:)",
-                            blockquotes[i].text,
-                        )
-
                         ProduccionBibliograficaExtractor._extract_blockquote_libros(
-                            blockquote_split, data
+                            blockquotes[i].text, data
                         )
 
                     # Insertar en la base de datos
@@ -430,91 +476,15 @@ class ProduccionBibliograficaExtractor:
             )
 
     @staticmethod
-    def _extract_blockquote_libros(blockquote_split, data):
+    def _extract_blockquote_libros(text, data):
         """
         Extrae información del blockquote para libros.
 
         Args:
-            blockquote_split (list): Lista con las partes del blockquote.
+            text (str): Texto del blockquote.
             data (dict): Diccionario donde se almacenará la información.
         """
-        for j in range(len(blockquote_split)):
-            try:
-                if blockquote_split[j] == "En:":
-                    if j - 1 >= 0:
-                        data["coautores"] = ", ".join(
-                            re.findall(
-                                "[A-Z]{2,}[ [A-Z]{2,}]*", blockquote_split[j - 1]
-                            )
-                        )
-                        titulo = re.findall(r'".*"', blockquote_split[j - 1])
-                        if titulo:
-                            data["titulo"] = (
-                                titulo[0]
-                                .replace("\t'", '"')
-                                .replace("  ", "")
-                                .replace("\n", "")
-                                .replace("\r", "")
-                            )
-
-                    if j + 6 < len(blockquote_split):
-                        lugar = re.sub(r"[0-9]+", "", blockquote_split[j + 6]).replace(
-                            ".", ""
-                        )
-                        data["lugar_publicacion"] = (
-                            ProduccionBibliograficaExtractor._clean_text(lugar)
-                        )
-
-                        anos = re.findall(r"[0-9]+", blockquote_split[j + 6])
-                        if anos:
-                            try:
-                                data["ano"] = int(anos[0])
-                            except (ValueError, TypeError):
-                                module_logger.warning(
-                                    f"No se pudo convertir el año a entero: {anos[0]}"
-                                )
-                elif blockquote_split[j] == "ed:":
-                    if j + 5 < len(blockquote_split):
-                        data["editorial"] = (
-                            ProduccionBibliograficaExtractor._clean_text(
-                                blockquote_split[j + 5]
-                            )
-                        )
-                elif blockquote_split[j] == "ISBN:":
-                    if j + 4 < len(blockquote_split):
-                        temp = blockquote_split[j + 4].split("\n")
-                        if len(temp) > 0:
-                            data["isbn"] = ProduccionBibliograficaExtractor._clean_text(
-                                temp[0]
-                            )
-
-                        # Extraer volumen
-                        if len(temp) > 1:
-                            data["volumen"] = "".join(re.findall(r"[0-9]+", temp[1]))
-
-                        # Extraer páginas
-                        if len(temp) > 2:
-                            data["paginas"] = "".join(re.findall(r"[0-9]+", temp[2]))
-                elif blockquote_split[j] == "Palabras:":
-                    if j + 3 < len(blockquote_split):
-                        data["palabras"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 3]
-                        )
-                elif blockquote_split[j] == "Areas:":
-                    if j + 2 < len(blockquote_split):
-                        data["areas"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 2]
-                        )
-                elif blockquote_split[j] == "Sectores:":
-                    if j + 1 < len(blockquote_split):
-                        data["sectores"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 1]
-                        )
-            except Exception as ex:
-                module_logger.error(
-                    f"Error extrayendo datos del blockquote libros: {str(ex)}",
-                    exc_info=True,
-                )
+        LIBROS.apply(text, data)
 
     @staticmethod
     def extract_working_papers(cod_rh, h3, connection):
@@ -523,11 +493,12 @@ class ProduccionBibliograficaExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -535,7 +506,7 @@ class ProduccionBibliograficaExtractor:
                 )
                 return
 
-            blockquotes = table.find_all("blockquote")
+            blockquotes = section.blockquotes
 
             for blockquote in blockquotes:
                 try:
@@ -547,20 +518,14 @@ class ProduccionBibliograficaExtractor:
                         try:
                             if blockquote_split[i] == "En:":
                                 if i - 1 >= 0:
-                                    nombre = re.findall(
-                                        r'".*"', blockquote_split[i - 1]
-                                    )
+                                    nombre = QUOTED.findall(blockquote_split[i - 1])
                                     if nombre:
                                         data["nombre"] = nombre[0]
 
                                 if i + 1 < len(blockquote_split):
                                     temp_split = blockquote_split[i + 1].split("\n")
                                     if len(temp_split) > 1:
-                                        ano_text = ProduccionBibliograficaExtractor._clean_text(
-                                            temp_split[1]
-                                        )[
-                                            :-1
-                                        ]
+                                        ano_text = clean_text(temp_split[1])[:-1]
                                         try:
                                             data["ano"] = int(ano_text)
                                         except (ValueError, TypeError):
@@ -569,9 +534,7 @@ class ProduccionBibliograficaExtractor:
                                             )
 
                                 if len(blockquote_split) > (i + 1):
-                                    paginas = re.findall(
-                                        r"[0-9]+", blockquote_split[-2]
-                                    )
+                                    paginas = NUMBERS.findall(blockquote_split[-2])
                                     if paginas:
                                         data["paginas"] = paginas
                         except Exception as ex:
@@ -600,11 +563,12 @@ class ProduccionBibliograficaExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -612,8 +576,8 @@ class ProduccionBibliograficaExtractor:
                 )
                 return
 
-            lis = table.find_all("li")
-            blockquotes = table.find_all("blockquote")
+            lis = section.lis
+            blockquotes = section.blockquotes
 
             if len(lis) != len(blockquotes):
                 module_logger.warning(
@@ -628,19 +592,12 @@ class ProduccionBibliograficaExtractor:
                     data["chulo"] = "SI" if lis[i].find("img") else "NO"
                     li_split = lis[i].text.split("-")
                     if len(li_split) > 2:
-                        data["tipo"] = ProduccionBibliograficaExtractor._clean_text(
-                            li_split[2]
-                        )
+                        data["tipo"] = clean_text(li_split[2])
 
                     # Extraer información del blockquote
                     if i < len(blockquotes):
-                        blockquote_split = re.split(
-                            "(En:)|(Palabras:)|(Areas:)|(Sectores:)",
-                            blockquotes[i].text,
-                        )
-
                         ProduccionBibliograficaExtractor._extract_blockquote_otra_produccion(
-                            blockquote_split, data
+                            blockquotes[i].text, data
                         )
 
                     # Insertar en la base de datos
@@ -660,65 +617,15 @@ class ProduccionBibliograficaExtractor:
             )
 
     @staticmethod
-    def _extract_blockquote_otra_produccion(blockquote_split, data):
+    def _extract_blockquote_otra_produccion(text, data):
         """
         Extrae información del blockquote para otra producción bibliográfica.
 
         Args:
-            blockquote_split (list): Lista con las partes del blockquote.
+            text (str): Texto del blockquote.
             data (dict): Diccionario donde se almacenará la información.
         """
-        for j in range(len(blockquote_split)):
-            try:
-                if blockquote_split[j] == "En:":
-                    if j - 1 >= 0:
-                        data["coautores"] = ", ".join(
-                            re.findall(
-                                "[A-Z]{2,}[ [A-Z]{2,}]*", blockquote_split[j - 1]
-                            )
-                        )
-                        titulo = re.findall(r'".*"', blockquote_split[j - 1])
-                        if titulo:
-                            data["titulo"] = (
-                                titulo[0]
-                                .replace("\t'", '"')
-                                .replace("  ", "")
-                                .replace("\n", "")
-                                .replace("\r", "")
-                            )
-
-                    if j + 4 < len(blockquote_split):
-                        temp = blockquote_split[j + 4].split("\n")
-                        if len(temp) > 1:
-                            ano_text = ProduccionBibliograficaExtractor._clean_text(
-                                temp[1]
-                            )[:-1]
-                            try:
-                                data["ano"] = int(ano_text)
-                            except (ValueError, TypeError):
-                                module_logger.warning(
-                                    f"No se pudo convertir el año a entero: {ano_text}"
-                                )
-                elif blockquote_split[j] == "Palabras:":
-                    if j + 3 < len(blockquote_split):
-                        data["palabras"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 3]
-                        )
-                elif blockquote_split[j] == "Areas:":
-                    if j + 2 < len(blockquote_split):
-                        data["areas"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 2]
-                        )
-                elif blockquote_split[j] == "Sectores:":
-                    if j + 1 < len(blockquote_split):
-                        data["sectores"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 1]
-                        )
-            except Exception as ex:
-                module_logger.error(
-                    f"Error extrayendo datos del blockquote otra producción: {str(ex)}",
-                    exc_info=True,
-                )
+        OTRA_PRODUCCION.apply(text, data)
 
     @staticmethod
     def extract_textos_no_cientificas(cod_rh, h3, connection):
@@ -727,11 +634,12 @@ class ProduccionBibliograficaExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -739,8 +647,8 @@ class ProduccionBibliograficaExtractor:
                 )
                 return
 
-            lis = table.find_all("li")
-            blockquotes = table.find_all("blockquote")
+            lis = section.lis
+            blockquotes = section.blockquotes
 
             if len(lis) != len(blockquotes):
                 module_logger.warning(
@@ -755,19 +663,12 @@ class ProduccionBibliograficaExtractor:
                     data["chulo"] = "SI" if lis[i].find("img") else "NO"
                     li_split = lis[i].text.split("-")
                     if len(li_split) > 2:
-                        data["tipo"] = ProduccionBibliograficaExtractor._clean_text(
-                            li_split[2]
-                        )
+                        data["tipo"] = clean_text(li_split[2])
 
                     # Extraer información del blockquote
                     if i < len(blockquotes):
-                        blockquote_split = re.split(
-                            "(En:)|(ISSN:)|(Palabras:)|(Areas:)|(Sectores:)",
-                            blockquotes[i].text,
-                        )
-
                         ProduccionBibliograficaExtractor._extract_blockquote_textos_no_cientificas(
-                            blockquote_split, data
+                            blockquotes[i].text, data
                         )
 
                     # Insertar en la base de datos
@@ -785,109 +686,15 @@ class ProduccionBibliograficaExtractor:
             )
 
     @staticmethod
-    def _extract_blockquote_textos_no_cientificas(blockquote_split, data):
+    def _extract_blockquote_textos_no_cientificas(text, data):
         """
         Extrae información del blockquote para textos en publicaciones no científicas.
 
         Args:
-            blockquote_split (list): Lista con las partes del blockquote.
+            text (str): Texto del blockquote.
             data (dict): Diccionario donde se almacenará la información.
         """
-        for j in range(len(blockquote_split)):
-            try:
-                if blockquote_split[j] == "En:":
-                    if j - 1 >= 0:
-                        data["coautores"] = ", ".join(
-                            re.findall(
-                                "[A-Z]{2,}[ [A-Z]{2,}]*", blockquote_split[j - 1]
-                            )
-                        )
-                        titulo = re.findall(r'".*"', blockquote_split[j - 1])
-                        if titulo:
-                            data["titulo"] = (
-                                titulo[0]
-                                .replace("\t'", '"')
-                                .replace("  ", "")
-                                .replace("\n", "")
-                                .replace("\r", "")
-                            )
-
-                    if j + 5 < len(blockquote_split):
-                        temp = blockquote_split[j + 5].split("\n")
-                        if len(temp) > 0:
-                            data["pais"] = ProduccionBibliograficaExtractor._clean_text(
-                                temp[0]
-                            )[:-1]
-                        if len(temp) > 1:
-                            ano_text = ProduccionBibliograficaExtractor._clean_text(
-                                temp[1]
-                            )[:-1]
-                            try:
-                                data["ano"] = int(ano_text)
-                            except (ValueError, TypeError):
-                                module_logger.warning(
-                                    f"No se pudo convertir el año a entero: {ano_text}"
-                                )
-                        if len(temp) > 2:
-                            data["revista"] = (
-                                ProduccionBibliograficaExtractor._clean_text(temp[2])[
-                                    :-1
-                                ]
-                            )
-                elif blockquote_split[j] == "ISSN:":
-                    if j + 4 < len(blockquote_split):
-                        temp = blockquote_split[j + 4].split("\n")
-                        if len(temp) > 0:
-                            data["issn"] = ProduccionBibliograficaExtractor._clean_text(
-                                temp[0]
-                            )
-
-                        # Extraer página inicial
-                        if len(temp) > 1:
-                            pagina_inicial = re.findall(r"[0-9]+", temp[1])
-                            if pagina_inicial:
-                                try:
-                                    data["pagina_inicial"] = int(pagina_inicial[0])
-                                except (ValueError, TypeError):
-                                    module_logger.warning(
-                                        f"No se pudo convertir la página inicial a entero: {pagina_inicial[0]}"
-                                    )
-
-                        # Extraer página final
-                        if len(temp) > 2:
-                            pagina_final = re.findall(r"[0-9]+", temp[2])
-                            if pagina_final:
-                                try:
-                                    data["pagina_final"] = int(pagina_final[0])
-                                except (ValueError, TypeError):
-                                    module_logger.warning(
-                                        f"No se pudo convertir la página final a entero: {pagina_final[0]}"
-                                    )
-
-                        if len(temp) > 3:
-                            data["volumen"] = (
-                                ProduccionBibliograficaExtractor._clean_text(temp[3])
-                            )
-                elif blockquote_split[j] == "Palabras:":
-                    if j + 3 < len(blockquote_split):
-                        data["palabras"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 3]
-                        )
-                elif blockquote_split[j] == "Areas:":
-                    if j + 2 < len(blockquote_split):
-                        data["areas"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 2]
-                        )
-                elif blockquote_split[j] == "Sectores:":
-                    if j + 1 < len(blockquote_split):
-                        data["sectores"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 1]
-                        )
-            except Exception as ex:
-                module_logger.error(
-                    f"Error extrayendo datos del blockquote textos no científicos: {str(ex)}",
-                    exc_info=True,
-                )
+        TEXTOS_NO_CIENTIFICOS.apply(text, data)
 
     @staticmethod
     def extract_traducciones(cod_rh, h3, connection):
@@ -896,11 +703,12 @@ class ProduccionBibliograficaExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -908,8 +716,8 @@ class ProduccionBibliograficaExtractor:
                 )
                 return
 
-            lis = table.find_all("li")
-            blockquotes = table.find_all("blockquote")
+            lis = section.lis
+            blockquotes = section.blockquotes
 
             if len(lis) != len(blockquotes):
                 module_logger.warning(
@@ -924,20 +732,12 @@ class ProduccionBibliograficaExtractor:
                     data["chulo"] = "SI" if lis[i].find("img") else "NO"
                     li_split = lis[i].text.split("-")
                     if len(li_split) > 2:
-                        data["tipo"] = ProduccionBibliograficaExtractor._clean_text(
-                            li_split[2]
-                        )
+                        data["tipo"] = clean_text(li_split[2])
 
                     # Extraer información del blockquote
                     if i < len(blockquotes):
-                        blockquote_split = re.split(
-                            "(En:)|(Idioma original:)|(Idioma traducción:)|(Autor:)|(Nombre original:)|"
-                            "(Palabras:)|(Areas:)|(Sectores:)",
-                            blockquotes[i].text,
-                        )
-
                         ProduccionBibliograficaExtractor._extract_blockquote_traducciones(
-                            blockquote_split, data
+                            blockquotes[i].text, data
                         )
 
                     # Insertar en la base de datos
@@ -955,87 +755,15 @@ class ProduccionBibliograficaExtractor:
             )
 
     @staticmethod
-    def _extract_blockquote_traducciones(blockquote_split, data):
+    def _extract_blockquote_traducciones(text, data):
         """
         Extrae información del blockquote para traducciones.
 
         Args:
-            blockquote_split (list): Lista con las partes del blockquote.
+            text (str): Texto del blockquote.
             data (dict): Diccionario donde se almacenará la información.
         """
-        for j in range(len(blockquote_split)):
-            try:
-                if blockquote_split[j] == "En:":
-                    if j - 1 >= 0:
-                        data["coautores"] = ", ".join(
-                            re.findall(
-                                "[A-Z]{2,}[ [A-Z]{2,}]*", blockquote_split[j - 1]
-                            )
-                        )
-                        nombre = re.findall(r'".*"', blockquote_split[j - 1])
-                        if nombre:
-                            data["nombre"] = nombre[0]
-
-                    if j + 8 < len(blockquote_split):
-                        temp = blockquote_split[j + 8].split("\n")
-                        if len(temp) > 0:
-                            data["pais"] = ProduccionBibliograficaExtractor._clean_text(
-                                temp[0]
-                            )[:-1]
-                        if len(temp) > 1:
-                            ano_text = ProduccionBibliograficaExtractor._clean_text(
-                                temp[1]
-                            )[:-1]
-                            try:
-                                data["ano"] = int(ano_text)
-                            except (ValueError, TypeError):
-                                module_logger.warning(
-                                    f"No se pudo convertir el año a entero: {ano_text}"
-                                )
-                elif blockquote_split[j] == "Idioma original:":
-                    if j + 7 < len(blockquote_split):
-                        data["idioma_original"] = (
-                            ProduccionBibliograficaExtractor._clean_text(
-                                blockquote_split[j + 7]
-                            )
-                        )
-                elif blockquote_split[j] == "Idioma traducción:":
-                    if j + 6 < len(blockquote_split):
-                        data["idioma_traduccion"] = (
-                            ProduccionBibliograficaExtractor._clean_text(
-                                blockquote_split[j + 6]
-                            )
-                        )
-                elif blockquote_split[j] == "Autor:":
-                    if j + 5 < len(blockquote_split):
-                        data["autor"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 5]
-                        )
-                elif blockquote_split[j] == "Nombre original:":
-                    if j + 4 < len(blockquote_split):
-                        volumen = re.findall(r"v.[0-9]*", blockquote_split[j + 4])
-                        if volumen:
-                            data["volumen"] = volumen[0]
-                elif blockquote_split[j] == "Palabras:":
-                    if j + 3 < len(blockquote_split):
-                        data["palabras"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 3]
-                        )
-                elif blockquote_split[j] == "Areas:":
-                    if j + 2 < len(blockquote_split):
-                        data["areas"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 2]
-                        )
-                elif blockquote_split[j] == "Sectores:":
-                    if j + 1 < len(blockquote_split):
-                        data["sectores"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 1]
-                        )
-            except Exception as ex:
-                module_logger.error(
-                    f"Error extrayendo datos del blockquote traducciones: {str(ex)}",
-                    exc_info=True,
-                )
+        TRADUCCIONES.apply(text, data)
 
     @staticmethod
     def extract_notas_cientificas(cod_rh, h3, connection):
@@ -1044,11 +772,12 @@ class ProduccionBibliograficaExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -1056,7 +785,7 @@ class ProduccionBibliograficaExtractor:
                 )
                 return
 
-            blockquotes = table.find_all("blockquote")
+            blockquotes = section.blockquotes
 
             for blockquote in blockquotes:
                 try:
@@ -1069,14 +798,8 @@ class ProduccionBibliograficaExtractor:
                         else "NO"
                     )
 
-                    blockquote_split = re.split(
-                        "(medio de divulgación:)|(Idioma original:)|(ISSN:)|(ed:)|(Sitio web:)|"
-                        "(DOI:)|(Palabras:)|(Areas:)|(Sectores:)",
-                        blockquote.text,
-                    )
-
                     ProduccionBibliograficaExtractor._extract_blockquote_notas_cientificas(
-                        blockquote_split, data
+                        blockquote.text, data
                     )
 
                     # Insertar en la base de datos
@@ -1094,155 +817,15 @@ class ProduccionBibliograficaExtractor:
             )
 
     @staticmethod
-    def _extract_blockquote_notas_cientificas(blockquote_split, data):
+    def _extract_blockquote_notas_cientificas(text, data):
         """
         Extrae información del blockquote para notas científicas.
 
         Args:
-            blockquote_split (list): Lista con las partes del blockquote.
+            text (str): Texto del blockquote.
             data (dict): Diccionario donde se almacenará la información.
         """
-        for j in range(len(blockquote_split)):
-            try:
-                if blockquote_split[j] == "medio de divulgación:":
-                    if j - 1 >= 0:
-                        temp = re.split(r'(".*")', blockquote_split[j - 1])
-                        if len(temp) > 0:
-                            data["coautores"] = ", ".join(
-                                re.findall("[A-Z]{2,}[ [A-Z]{2,}]*", temp[0])
-                            )
-                        if len(temp) > 1:
-                            data["titulo_nota"] = (
-                                ProduccionBibliograficaExtractor._clean_text(temp[1])
-                            )
-                        if len(temp) > 2:
-                            data["revista"] = (
-                                ProduccionBibliograficaExtractor._clean_text(
-                                    temp[2][1:]
-                                )
-                            )
-
-                    if j + 9 < len(blockquote_split):
-                        data["medio_divulgacion"] = (
-                            ProduccionBibliograficaExtractor._clean_text(
-                                blockquote_split[j + 9]
-                            )
-                        )
-                elif blockquote_split[j] == "Idioma original:":
-                    if j + 8 < len(blockquote_split):
-                        data["idioma_original"] = (
-                            ProduccionBibliograficaExtractor._clean_text(
-                                blockquote_split[j + 8]
-                            )
-                        )
-                elif blockquote_split[j] == "ISSN:":
-                    if j + 7 < len(blockquote_split):
-                        data["issn"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 7]
-                        )
-                elif blockquote_split[j] == "ed:":
-                    if j + 6 < len(blockquote_split):
-                        temp = blockquote_split[j + 6].split("\n")
-                        if len(temp) > 0:
-                            data["editorial"] = (
-                                ProduccionBibliograficaExtractor._clean_text(temp[0])
-                            )
-                        if len(temp) > 1:
-                            data["volumen"] = (
-                                ProduccionBibliograficaExtractor._clean_text(temp[1])
-                            )
-                        if len(temp) > 2:
-                            data["fasc"] = ProduccionBibliograficaExtractor._clean_text(
-                                temp[2]
-                            )
-
-                        # Extraer página inicial
-                        if len(temp) > 3:
-                            pagina_inicial = re.findall(r"[0-9]+", temp[3])
-                            if pagina_inicial:
-                                try:
-                                    data["pagina_inicial"] = int(pagina_inicial[0])
-                                except (ValueError, TypeError):
-                                    module_logger.warning(
-                                        f"No se pudo convertir la página inicial a entero: {pagina_inicial[0]}"
-                                    )
-
-                        # Extraer página final
-                        if len(temp) > 4:
-                            pagina_final = re.findall(r"[0-9]+", temp[4])
-                            if pagina_final:
-                                try:
-                                    data["pagina_final"] = int(pagina_final[0])
-                                except (ValueError, TypeError):
-                                    module_logger.warning(
-                                        f"No se pudo convertir la página final a entero: {pagina_final[0]}"
-                                    )
-
-                        # Extraer año
-                        if len(temp) > 5:
-                            ano = re.findall(r"[0-9]+", temp[5])
-                            if ano:
-                                try:
-                                    data["ano"] = int(ano[0])
-                                except (ValueError, TypeError):
-                                    module_logger.warning(
-                                        f"No se pudo convertir el año a entero: {ano[0]}"
-                                    )
-                elif blockquote_split[j] == "Sitio web:":
-                    if j + 5 < len(blockquote_split):
-                        data["sitio_web"] = (
-                            ProduccionBibliograficaExtractor._clean_text(
-                                blockquote_split[j + 5]
-                            )
-                        )
-                elif blockquote_split[j] == "DOI:":
-                    if j + 4 < len(blockquote_split):
-                        data["doi"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 4]
-                        )
-                elif blockquote_split[j] == "Palabras:":
-                    if j + 3 < len(blockquote_split):
-                        data["palabras"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 3]
-                        )
-                elif blockquote_split[j] == "Areas:":
-                    if j + 2 < len(blockquote_split):
-                        data["areas"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 2]
-                        )
-                elif blockquote_split[j] == "Sectores:":
-                    if j + 1 < len(blockquote_split):
-                        data["sectores"] = ProduccionBibliograficaExtractor._clean_text(
-                            blockquote_split[j + 1]
-                        )
-            except Exception as ex:
-                module_logger.error(
-                    f"Error extrayendo datos del blockquote notas científicas: {str(ex)}",
-                    exc_info=True,
-                )
-
-    @staticmethod
-    def _clean_text(text):
-        """
-        Limpia el texto de caracteres no deseados.
-
-        Args:
-            text (str): Texto a limpiar.
-
-        Returns:
-            str: Texto limpio.
-        """
-        if not text:
-            return ""
-
-        return (
-            text.strip()
-            .replace("'", '"')
-            .replace("\t'", '"')
-            .replace("  ", "")
-            .replace("\n", "")
-            .replace("\r", "")
-        )
+        NOTAS_CIENTIFICAS.apply(text, data)
 
 
 # Funciones de compatibilidad para el código existente
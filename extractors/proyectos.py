@@ -1,5 +1,6 @@
 from config import ProjectLogger
-from extractors.utils import insert_data
+from extractors.utils import insert_data, get_section
+from extractors.textkit import clean_text
 from datetime import datetime
 import re
 
@@ -20,11 +21,12 @@ class ProyectosExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -32,7 +34,7 @@ class ProyectosExtractor:
                 )
                 return
 
-            blockquotes = table.find_all("blockquote")
+            blockquotes = section.blockquotes
 
             for blockquote in blockquotes:
                 try:
@@ -50,13 +52,9 @@ class ProyectosExtractor:
                                 if j + 5 < len(blockquote_split):
                                     temp = blockquote_split[j + 5].split("\n")
                                     if len(temp) > 0:
-                                        data["tipo"] = ProyectosExtractor._clean_text(
-                                            temp[0]
-                                        )
+                                        data["tipo"] = clean_text(temp[0])
                                     if len(temp) > 1:
-                                        data["nombre"] = ProyectosExtractor._clean_text(
-                                            temp[1]
-                                        )
+                                        data["nombre"] = clean_text(temp[1])
                             elif blockquote_split[j] == "Inicio:":
                                 if j + 4 < len(blockquote_split):
                                     try:
@@ -79,12 +77,12 @@ class ProyectosExtractor:
                                         )
                             elif blockquote_split[j] == "Duración":
                                 if j + 2 < len(blockquote_split):
-                                    data["duracion"] = ProyectosExtractor._clean_text(
+                                    data["duracion"] = clean_text(
                                         blockquote_split[j + 2]
                                     )
                             elif blockquote_split[j] == "Resumen":
                                 if j + 1 < len(blockquote_split):
-                                    data["resumen"] = ProyectosExtractor._clean_text(
+                                    data["resumen"] = clean_text(
                                         blockquote_split[j + 1]
                                     )
                         except Exception as ex:
@@ -105,29 +103,6 @@ class ProyectosExtractor:
                 f"Error general en extract para {cod_rh}: {str(ex)}", exc_info=True
             )
 
-    @staticmethod
-    def _clean_text(text):
-        """
-        Limpia el texto de caracteres no deseados.
-
-        Args:
-            text (str): Texto a limpiar.
-
-        Returns:
-            str: Texto limpio.
-        """
-        if not text:
-            return ""
-
-        return (
-            text.strip()
-            .replace("'", '"')
-            .replace("\t'", '"')
-            .replace("  ", "")
-            .replace("\n", "")
-            .replace("\r", "")
-        )
-
 
 # Función de compatibilidad para el código existente
 def extract(cod_rh, h3, connection):
@@ -1,7 +1,7 @@
 from config import ProjectLogger
-from extractors.utils import insert_data
+from extractors.utils import insert_data, get_section
+from extractors.textkit import LIST_SEPARATORS, clean_text
 from datetime import datetime
-import re
 
 # Configuramos el logger para este módulo
 logger = ProjectLogger()
@@ -20,11 +20,12 @@ class ReconocimientosExtractor:
 
         Args:
             cod_rh (str): Código del investigador.
-            h3 (BeautifulSoup): Elemento HTML que contiene la información.
+            h3 (Section): Sección del CvLAC (también se acepta el h3 de la sección).
             connection: Conexión a la base de datos.
         """
         try:
-            table = h3.parent.parent.parent
+            section = get_section(h3)
+            table = section.table
 
             if not table:
                 module_logger.warning(
@@ -32,7 +33,7 @@ class ReconocimientosExtractor:
                 )
                 return
 
-            lis = table.find_all("li")
+            lis = section.lis
 
             if not lis:
                 module_logger.warning(
@@ -45,7 +46,7 @@ class ReconocimientosExtractor:
                     data = {"cvlac_id": cod_rh}
 
                     # Separar el texto por comas o por guiones
-                    li_split = re.split(",| - ", li.text)
+                    li_split = LIST_SEPARATORS.split(li.text)
 
                     if len(li_split) > 0:
                         data["nombre"] = li_split[0]
@@ -56,9 +57,7 @@ class ReconocimientosExtractor:
 
                     # El último elemento es la fecha
                     if len(li_split) > 0:
-                        fecha = ReconocimientosExtractor._clean_text(
-                            li_split[-1]
-                        ).replace("de", "")
+                        fecha = clean_text(li_split[-1]).replace("de", "")
                         if fecha:
                             try:
                                 data["fecha"] = fecha
@@ -79,29 +78,6 @@ class ReconocimientosExtractor:
                 f"Error general en extract para {cod_rh}: {str(ex)}", exc_info=True
             )
 
-    @staticmethod
-    def _clean_text(text):
-        """
-        Limpia el texto de caracteres no deseados.
-
-        Args:
-            text (str): Texto a limpiar.
-
-        Returns:
-            str: Texto limpio.
-        """
-        if not text:
-            return ""
-
-        return (
-            text.strip()
-            .replace("'", '"')
-            .replace("\t'", '"')
-            .replace("  ", "")
-            .replace("\n", "")
-            .replace("\r", "")
-        )
-
 
 # Función de compatibilidad para el código existente
 def extract(cod_rh, h3, connection):
@@ -0,0 +1,207 @@
+from bisect import bisect_right
+from bs4 import Tag
+from lxml import etree
+from extractors.lxml_backend import LxmlDocument
+
+
+class Section:
+    """
+    Sección de un CvLAC: el título h3 y la tabla que lo contiene, con sus
+    elementos li, blockquote, b, tr y td ya recolectados.
+
+    Los extractores reciben una Section en el lugar del h3; también se puede
+    crear a partir de un h3 suelto (sin índice), en cuyo caso los elementos
+    se buscan en la tabla con find_all.
+    """
+
+    def __init__(self, h3, index=None):
+        """
+        Inicializa la sección.
+
+        Args:
+            h3 (Tag): Título de la sección.
+            index (SectionIndex, optional): Índice del documento.
+        """
+        self.h3 = h3
+        self.title = SectionIndex.normalize(h3.text)
+        self.index = index
+        self._items = {}
+        try:
+            self.table = h3.parent.parent.parent
+        except AttributeError:
+            self.table = None
+
+    def find_all(self, name):
+        """
+        Retorna los descendientes de la tabla de la sección con una etiqueta.
+
+        Args:
+            name (str): Nombre de la etiqueta.
+
+        Returns:
+            list: Elementos en orden de documento.
+        """
+        if name not in self._items:
+            if self.table is None:
+                self._items[name] = []
+            elif self.index is not None and name in self.index.TAGS:
+                self._items[name] = self.index.find_all(self.table, name)
+            else:
+                self._items[name] = self.table.find_all(name)
+        return self._items[name]
+
+    @property
+    def lis(self):
+        return self.find_all("li")
+
+    @property
+    def blockquotes(self):
+        return self.find_all("blockquote")
+
+    @property
+    def bs(self):
+        return self.find_all("b")
+
+    @property
+    def trs(self):
+        return self.find_all("tr")
+
+    @property
+    def tds(self):
+        return self.find_all("td")
+
+
+class SectionIndex:
+    """
+    Índice de las secciones de un CvLAC construido con un solo recorrido del
+    árbol HTML.
+
+    El recorrido numera las etiquetas en orden de documento y guarda, para
+    cada etiqueta de TAGS, la lista de elementos y sus posiciones, y para
+    cada elemento el rango de posiciones de sus descendientes. Así, los
+    descendientes de una tabla con una etiqueta se obtienen con una
+    búsqueda binaria en lugar de recorrer de nuevo su subárbol, y el conteo
+    de tablas, los títulos h3 y las anclas (p. ej. datos_generales) salen
+    del mismo recorrido.
+    """
+
+    # Etiquetas que se recolectan durante el recorrido
+    TAGS = ("a", "b", "blockquote", "h3", "li", "table", "td", "tr")
+
+    def __init__(self, html):
+        """
+        Recorre el documento y construye el índice.
+
+        Args:
+            html (BeautifulSoup | LxmlDocument): Documento HTML completo.
+        """
+        self.html = html
+        self._nodes = {name: [] for name in self.TAGS}
+        self._positions = {name: [] for name in self.TAGS}
+        self._ranges = {}
+        if isinstance(html, LxmlDocument):
+            self._walk_lxml(html)
+        else:
+            self._walk(html)
+
+        # Anclas <a name="..."> (la primera de cada nombre)
+        self.anchors = {}
+        for a in self._nodes["a"]:
+            name = a.get("name")
+            if name and name not in self.anchors:
+                self.anchors[name] = a
+
+        # Secciones en orden de documento y por título normalizado
+        self.sections = [Section(h3, self) for h3 in self._nodes["h3"]]
+        self.by_title = {}
+        for section in self.sections:
+            self.by_title.setdefault(section.title, section)
+
+    def _walk(self, root):
+        """Numera las etiquetas del documento en un recorrido en profundidad."""
+        counter = 0
+        self._ranges[id(root)] = [0, 0]
+        open_tags = [root]
+        stack = [iter(root.contents)]
+
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                self._ranges[id(open_tags.pop())][1] = counter
+                continue
+            if not isinstance(child, Tag):
+                continue
+
+            counter += 1
+            self._ranges[id(child)] = [counter, counter]
+            if child.name in self._nodes:
+                self._nodes[child.name].append(child)
+                self._positions[child.name].append(counter)
+            open_tags.append(child)
+            stack.append(iter(child.contents))
+
+    def _walk_lxml(self, document):
+        """
+        Numera las etiquetas de un documento de lxml con iterwalk (en C) y
+        envuelve solo las de TAGS.
+        """
+        if document.root is None:
+            return
+        counter = 0
+        wrap = document.wrap
+
+        for event, element in etree.iterwalk(document.root, events=("start", "end")):
+            name = element.tag
+            if event == "start":
+                counter += 1
+                if name in self._nodes:
+                    node = wrap(element)
+                    self._ranges[id(node)] = [counter, counter]
+                    self._nodes[name].append(node)
+                    self._positions[name].append(counter)
+            elif name in self._nodes:
+                self._ranges[id(wrap(element))][1] = counter
+
+    @staticmethod
+    def normalize(title):
+        """Normaliza un título de sección (espacios colapsados)."""
+        return " ".join(title.split())
+
+    @property
+    def table_count(self):
+        """Número de tablas del documento."""
+        return len(self._nodes["table"])
+
+    def get(self, title):
+        """
+        Retorna la sección con un título.
+
+        Args:
+            title (str): Título de la sección.
+
+        Returns:
+            Section: La primera sección con ese título, o None.
+        """
+        return self.by_title.get(self.normalize(title))
+
+    def find_all(self, container, name):
+        """
+        Retorna los descendientes de un elemento con una etiqueta de TAGS.
+
+        Args:
+            container (Tag): Elemento del documento indexado.
+            name (str): Nombre de la etiqueta.
+
+        Returns:
+            list: Elementos en orden de documento.
+        """
+        bounds = self._ranges.get(id(container))
+        if bounds is None:
+            # Elemento sin rango en el índice (etiqueta fuera de TAGS en lxml)
+            return container.find_all(name)
+        start, end = bounds
+        positions = self._positions[name]
+        return self._nodes[name][
+            bisect_right(positions, start) : bisect_right(positions, end)
+        ]
@@ -0,0 +1,82 @@
+"""
+Limpieza de texto y patrones compartidos por los extractores.
+
+Todos los extractores limpian los textos del CvLAC de la misma forma
+(strip, comillas simples a dobles, sin espacios dobles ni saltos de línea)
+y varios buscan los mismos fragmentos (autores en mayúsculas, años,
+números). Este módulo reúne esa limpieza y compila los patrones una sola
+vez al importarse.
+
+La limpieza produce exactamente el mismo resultado que la cadena original
+
+    text.strip().replace("'", '"').replace("\\t'", '"').replace("  ", "")
+        .replace("\\n", "").replace("\\r", "")
+
+pero solo recorre el texto por cada reemplazo que realmente aplica: la
+mayoría de los textos cortos (nombres, fechas, instituciones) no tienen
+comillas, saltos de línea ni espacios dobles. El reemplazo de "\\t'" se
+omite porque, después de cambiar las comillas simples, nunca encuentra
+nada.
+"""
+
+import re
+
+# Autores en mayúsculas ("PEREZ GOMEZ, JUAN" -> "PEREZ GOMEZ", "JUAN")
+AUTHORS = re.compile(r"[A-Z]{2,}[ [A-Z]{2,}]*")
+# Separador entre la lista de autores y el nombre del producto
+AUTHORS_END = re.compile("[A-Z]{2,},")
+# Números (con grupo, para conservarlos al dividir)
+DIGITS = re.compile(r"([0-9]+)")
+NUMBERS = re.compile(r"[0-9]+")
+# Años de cuatro cifras
+YEAR = re.compile(r"[0-9]{4}")
+# Texto entre comillas
+QUOTED = re.compile(r'".*"')
+# País vacío (",\xa0\n   ,")
+EMPTY_COUNTRY = re.compile(r",\xa0\n\s+,")
+# Separadores de las listas de los li (reconocimientos, redes sociales)
+LIST_SEPARATORS = re.compile(",| - ")
+
+
+def clean_text(text):
+    """
+    Limpia el texto de caracteres no deseados.
+
+    Args:
+        text (str): Texto a limpiar.
+
+    Returns:
+        str: Texto limpio.
+    """
+    if not text:
+        return ""
+
+    text = text.strip()
+    # El orden importa: los espacios dobles se quitan antes que los saltos
+    # de línea (" \n " conserva sus dos espacios)
+    if "  " in text:
+        text = text.replace("  ", "")
+    if "\n" in text:
+        text = text.replace("\n", "")
+    if "\r" in text:
+        text = text.replace("\r", "")
+    if "'" in text:
+        text = text.replace("'", '"')
+    return text
+
+
+def clean_texts(texts, empty=""):
+    """
+    Limpia una secuencia de textos (p. ej. los strings de un elemento).
+
+    Args:
+        texts (iterable): Textos a limpiar.
+        empty (optional): Valor para los textos que quedan vacíos.
+
+    Returns:
+        list: Textos limpios en el mismo orden.
+    """
+    clean = clean_text
+    if empty == "":
+        return [clean(text) for text in texts]
+    return [clean(text) or empty for text in texts]
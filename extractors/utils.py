@@ -1,6 +1,11 @@
 from config import ProjectLogger
-from validators import DataValidator
-from config import db
+from validators import DataValidator, WriteBuffer
+from config import db, project_settings
+from contextlib import contextmanager
+from bs4 import BeautifulSoup
+from extractors.lxml_backend import LxmlDocument
+from extractors.section_index import SectionIndex, Section
+import threading
 
 # Configuramos el logger para este módulo
 logger = ProjectLogger()
@@ -9,31 +14,84 @@ module_logger = logger.get_logger(__name__)
 # Inicializar el validador como una variable global
 data_validator = DataValidator(db)
 
+# Buffer de escritura activo (por hilo) mientras se extrae un CvLAC
+_buffer_state = threading.local()
+
 
 class ExtractorUtils:
     """
     Clase de utilidades para los extractores de CvLAC.
     """
 
+    # Backends para construir el árbol HTML
+    PARSERS = ("bs4", "lxml")
+
+    @staticmethod
+    def parse_html(content, parser=None):
+        """
+        Construye el árbol HTML de un CvLAC.
+
+        Con "bs4" se usa BeautifulSoup sobre lxml; con "lxml" el árbol de
+        lxml.html con un adaptador (LxmlDocument) que expone a los
+        extractores la misma interfaz, sin construir el árbol de objetos de
+        Python de BeautifulSoup.
+
+        Args:
+            content (bytes): Cuerpo de la respuesta.
+            parser (str, optional): "bs4" o "lxml". Por defecto el de la
+                                    configuración (scraper.parser).
+
+        Returns:
+            BeautifulSoup | LxmlDocument: Documento HTML.
+        """
+        parser = parser or project_settings.scraper.get("parser", "bs4")
+        if parser == "lxml":
+            return LxmlDocument(content)
+        if parser != "bs4":
+            raise ValueError(f"Parser HTML desconocido: {parser}")
+        return BeautifulSoup(content, "lxml")
+
     @staticmethod
     def get_table(html, name_tag):
         """
         Obtiene una tabla a partir de una etiqueta de nombre.
 
         Args:
-            html (BeautifulSoup): Documento HTML.
+            html (BeautifulSoup | SectionIndex): Documento HTML o su índice de secciones.
             name_tag (dict): Diccionario con los atributos de la etiqueta de nombre.
 
         Returns:
             BeautifulSoup: Elemento de tabla encontrado o None.
         """
         try:
-            tag = html.find("a", name_tag)
+            if isinstance(html, SectionIndex):
+                # Las anclas <a name="..."> ya están en el índice
+                if set(name_tag) == {"name"}:
+                    tag = html.anchors.get(name_tag["name"])
+                else:
+                    tag = html.html.find("a", name_tag)
+            else:
+                tag = html.find("a", name_tag)
             return tag and tag.find_next_sibling("table")
         except Exception as ex:
             module_logger.error(f"Error en get_table: {str(ex)}", exc_info=True)
             return None
 
+    @staticmethod
+    def get_section(h3):
+        """
+        Obtiene la sección que recibe un extractor.
+
+        Args:
+            h3 (Section | Tag): Sección del índice o título h3 de la sección.
+
+        Returns:
+            Section: Sección con su tabla y sus elementos.
+        """
+        if isinstance(h3, Section):
+            return h3
+        return Section(h3)
+
     @staticmethod
     def get_text_next_tag(table, string, tag):
         """
@@ -74,14 +132,25 @@ class ExtractorUtils:
             return None
 
     @staticmethod
-    def delete_data(cod_rh, connection):
+    def delete_data(cod_rh, connection, commit=True):
         """
         Elimina los datos de un investigador de la base de datos.
 
         Args:
             cod_rh (str): Código del investigador.
             connection: Conexión a la base de datos.
+            commit (bool, optional): Si es False, no confirma ni captura los errores:
+                                     la eliminación queda en la transacción del
+                                     llamador (p. ej. el flush de batched_writes).
+                                     Por defecto es True.
         """
+        if not commit:
+            cursor = connection.cursor()
+            cursor.execute(
+                "delete from identificacion where cvlac_id = '{}'".format(cod_rh)
+            )
+            return
+
         try:
             cursor = connection.cursor()
             cursor.execute(
@@ -108,13 +177,24 @@ class ExtractorUtils:
                                               existentes. Por defecto es True.
 
         Returns:
-            str: Operación realizada ('insert', 'update', 'skip', 'error')
+            str: Operación realizada ('insert', 'update', 'skip', 'error'), o
+                 'buffered' si hay un buffer de escritura activo.
         """
         try:
+            # Si hay un buffer activo, diferir la escritura hasta el flush
+            buffer = getattr(_buffer_state, "buffer", None)
+            if buffer is not None:
+                return buffer.add(table, dictionary)
+
             # Usar el validador para insertar o actualizar evitando duplicados
-            operation, error = data_validator.insert_or_update(
-                table, dictionary, connection, update_if_exists
-            )
+            if project_settings.scraper.get("upsert", False):
+                operation, error = data_validator.upsert(
+                    table, dictionary, connection, update_if_exists
+                )
+            else:
+                operation, error = data_validator.insert_or_update(
+                    table, dictionary, connection, update_if_exists
+                )
 
             if operation == "insert":
                 module_logger.debug(f"Insertado nuevo registro en tabla {table}")
@@ -140,6 +220,36 @@ class ExtractorUtils:
             data_validator.record_operation(table, "error", dictionary, error=str(ex))
             return "error"
 
+    @staticmethod
+    @contextmanager
+    def batched_writes(connection, flush=True, before=None):
+        """
+        Acumula en un WriteBuffer todas las inserciones hechas con insert_data
+        dentro del contexto y las escribe en una sola transacción al salir.
+
+        Args:
+            connection: Conexión a la base de datos usada para el flush.
+            flush (bool, optional): Si es False, no escribe al salir y el llamador
+                                    decide qué hacer con el buffer. Por defecto True.
+            before (callable, optional): Se ejecuta en la transacción del flush antes
+                                         de los registros (ver WriteBuffer.flush).
+
+        Yields:
+            WriteBuffer: Buffer activo.
+        """
+        buffer = WriteBuffer(
+            data_validator, upsert=project_settings.scraper.get("upsert", False)
+        )
+        previous = getattr(_buffer_state, "buffer", None)
+        _buffer_state.buffer = buffer
+        try:
+            yield buffer
+        finally:
+            _buffer_state.buffer = previous
+
+        if flush and connection is not None:
+            buffer.flush(connection, before=before)
+
     @staticmethod
     def start_extraction():
         """
@@ -165,11 +275,21 @@ class ExtractorUtils:
 
 
 # Funciones de compatibilidad para el código existente
+def parse_html(content, parser=None):
+    """Función de compatibilidad para parse_html"""
+    return ExtractorUtils.parse_html(content, parser)
+
+
 def get_table(html, name_tag):
     """Función de compatibilidad para get_table"""
     return ExtractorUtils.get_table(html, name_tag)
 
 
+def get_section(h3):
+    """Función de compatibilidad para get_section"""
+    return ExtractorUtils.get_section(h3)
+
+
 def get_text_next_tag(table, string, tag):
     """Función de compatibilidad para get_text_next_tag"""
     return ExtractorUtils.get_text_next_tag(table, string, tag)
@@ -180,9 +300,9 @@ def get_href(table, string):
     return ExtractorUtils.get_href(table, string)
 
 
-def delete_data(cod_rh, connection):
+def delete_data(cod_rh, connection, commit=True):
     """Función de compatibilidad para delete_data"""
-    return ExtractorUtils.delete_data(cod_rh, connection)
+    return ExtractorUtils.delete_data(cod_rh, connection, commit)
 
 
 def insert_data(table, dictionary, connection):
@@ -190,6 +310,11 @@ def insert_data(table, dictionary, connection):
     return ExtractorUtils.insert_data(table, dictionary, connection)
 
 
+def batched_writes(connection, flush=True, before=None):
+    """Función de compatibilidad para batched_writes"""
+    return ExtractorUtils.batched_writes(connection, flush, before)
+
+
 def start_extraction():
     """Función de compatibilidad para start_extraction"""
     return ExtractorUtils.start_extraction()
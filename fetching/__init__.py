@@ -0,0 +1,18 @@
+from .async_fetcher import AsyncFetcher, FetchResult
+from .cache import CachedPage, PageCache
+from .probe import StreamProbe
+from .rate_controller import RateController
+from .session import HttpSession
+from .stored_pages import StoredPage, StoredPages
+
+__all__ = [
+    "AsyncFetcher",
+    "CachedPage",
+    "FetchResult",
+    "HttpSession",
+    "PageCache",
+    "RateController",
+    "StoredPage",
+    "StoredPages",
+    "StreamProbe",
+]
@@ -0,0 +1,219 @@
+"""
+Motor de descarga asíncrona de páginas CvLAC.
+"""
+
+from collections import namedtuple
+from config import ProjectLogger, project_settings
+from fetching.probe import StreamProbe
+from fetching.rate_controller import RateController
+import asyncio
+import aiohttp
+import math
+import queue
+import threading
+import time
+
+
+# Configuramos el logger para este módulo
+logger = ProjectLogger()
+module_logger = logger.get_logger(__name__)
+
+
+# Resultado de una descarga. content es None si hubo error de red.
+FetchResult = namedtuple(
+    "FetchResult", ["cod_rh", "status_code", "content", "error", "elapsed"]
+)
+
+# Marca de fin de la cola de resultados
+_DONE = object()
+
+
+class AsyncFetcher:
+    """
+    Descarga páginas CvLAC con asyncio/aiohttp manteniendo muchas peticiones
+    en vuelo desde un solo proceso.
+
+    La descarga corre en un hilo propio con su event loop y entrega los
+    resultados por una cola acotada, de modo que el hilo llamador puede
+    parsear y escribir en la base de datos mientras siguen llegando páginas.
+
+    El número de peticiones en vuelo lo decide el RateController del proceso
+    (AIMD) entre min_concurrency y el máximo asignado a este proceso.
+    """
+
+    def __init__(self, url_builder, scraper_config=None, concurrency=None):
+        """
+        Inicializa el motor de descarga.
+
+        Args:
+            url_builder (callable): Función que recibe un cod_rh y retorna la URL.
+            scraper_config (dict, optional): Configuración del scraper. Por defecto
+                                             project_settings.scraper.
+            concurrency (int, optional): Máximo de peticiones simultáneas. Por defecto
+                                         max_concurrency dividido entre fetch_processes.
+        """
+        config = scraper_config or project_settings.scraper
+        self.url_builder = url_builder
+        self.headers = {}
+        if config.get("user_agent"):
+            self.headers["User-Agent"] = config["user_agent"]
+        self.timeout = config.get("timeout", 30)
+        self.verify_ssl = config.get("verify_ssl", False)
+        self.probe_bytes = config.get("probe_bytes", 32768)
+
+        if concurrency is None:
+            # El límite global se reparte entre los procesos que descargan
+            processes = max(1, config.get("fetch_processes", 1))
+            concurrency = math.ceil(config.get("max_concurrency", 200) / processes)
+        self.concurrency = max(1, concurrency)
+        self.queue_size = max(1, config.get("fetch_queue_size", self.concurrency))
+
+        self.controller = RateController(config)
+        self.controller.configure(self.concurrency)
+
+        self._stop = threading.Event()
+        self._slots = None
+        self._in_flight = 0
+
+    async def _acquire_slot(self):
+        """Espera hasta que el controlador permita otra petición en vuelo."""
+        async with self._slots:
+            while self._in_flight >= self.controller.concurrency:
+                await self._slots.wait()
+            self._in_flight += 1
+
+    async def _release_slot(self):
+        """Libera un lugar y despierta a los workers en espera."""
+        async with self._slots:
+            self._in_flight -= 1
+            self._slots.notify_all()
+
+    async def _request(self, session, cod_rh):
+        """
+        Realiza un intento de descarga y lo registra en el controlador.
+
+        Returns:
+            tuple: (status_code, content, error, retry_after)
+        """
+        started = time.monotonic()
+        status_code, content, error, retry_after = None, None, None, None
+        try:
+            async with session.get(
+                self.url_builder(cod_rh), ssl=None if self.verify_ssl else False
+            ) as response:
+                status_code = response.status
+                # Leer de forma incremental y cortar si la página está vacía
+                probe = StreamProbe(self.probe_bytes)
+                async for chunk in response.content.iter_chunked(8192):
+                    if probe.feed(chunk) == StreamProbe.EMPTY:
+                        response.close()
+                        break
+                content = probe.content
+                retry_after = self.controller.parse_retry_after(
+                    response.headers.get("Retry-After")
+                )
+        except asyncio.TimeoutError:
+            error = f"Timeout después de {self.timeout} segundos"
+        except aiohttp.ClientError as e:
+            error = f"Error de red: {str(e)}"
+        except Exception as e:
+            # Un error inesperado en una petición no debe detener el motor
+            module_logger.error(f"Error descargando CvLAC {cod_rh}: {str(e)}")
+            error = str(e)
+
+        self.controller.record(time.monotonic() - started, status_code, error)
+        return status_code, content, error, retry_after
+
+    async def _fetch_one(self, session, cod_rh):
+        """Descarga una página, con reintentos, y retorna un FetchResult."""
+        started = time.monotonic()
+
+        for attempt in range(self.controller.max_retries + 1):
+            await self._acquire_slot()
+            try:
+                status_code, content, error, retry_after = await self._request(
+                    session, cod_rh
+                )
+            finally:
+                await self._release_slot()
+
+            if (
+                attempt == self.controller.max_retries
+                or not self.controller.is_retryable(status_code, error)
+            ):
+                break
+
+            # Esperar fuera del límite de concurrencia antes de reintentar
+            await asyncio.sleep(self.controller.backoff(attempt, retry_after))
+
+        return FetchResult(
+            cod_rh, status_code, content, error, time.monotonic() - started
+        )
+
+    async def _run(self, ids, results):
+        """Ejecuta los workers de descarga hasta agotar los IDs."""
+        loop = asyncio.get_running_loop()
+        self._slots = asyncio.Condition()
+        self._in_flight = 0
+        connector = aiohttp.TCPConnector(limit=self.concurrency, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        id_iterator = iter(ids)
+
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout, headers=self.headers
+        ) as session:
+
+            async def worker():
+                for cod_rh in id_iterator:
+                    if self._stop.is_set():
+                        return
+                    result = await self._fetch_one(session, cod_rh)
+                    # La cola acotada frena la descarga si el consumidor se atrasa
+                    await loop.run_in_executor(None, results.put, result)
+
+            await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+
+    def iter_results(self, ids):
+        """
+        Descarga los IDs y entrega los resultados a medida que se completan.
+
+        El orden de salida no es el de entrada. Si el llamador deja de iterar,
+        la descarga se detiene.
+
+        Args:
+            ids (iterable): IDs a descargar. Se consume de forma perezosa.
+
+        Yields:
+            FetchResult: Resultado de cada descarga.
+        """
+        results = queue.Queue(maxsize=self.queue_size)
+        self._stop.clear()
+
+        def runner():
+            try:
+                asyncio.run(self._run(ids, results))
+            except Exception as e:
+                module_logger.error(
+                    f"Error en el motor de descarga asíncrona: {str(e)}", exc_info=True
+                )
+            finally:
+                results.put(_DONE)
+
+        thread = threading.Thread(target=runner, name="async-fetcher", daemon=True)
+        thread.start()
+
+        try:
+            while True:
+                item = results.get()
+                if item is _DONE:
+                    break
+                yield item
+        finally:
+            self._stop.set()
+            # Vaciar la cola para liberar a los workers bloqueados en put()
+            while thread.is_alive():
+                try:
+                    results.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            thread.join()
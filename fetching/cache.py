@@ -0,0 +1,364 @@
+"""
+Caché en disco de las páginas CvLAC descargadas.
+"""
+
+from collections import namedtuple
+from pathlib import Path
+from config import ProjectLogger, project_settings
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+# Configuramos el logger para este módulo
+logger = ProjectLogger()
+module_logger = logger.get_logger(__name__)
+
+
+# Página leída de la caché
+CachedPage = namedtuple(
+    "CachedPage", ["cod_rh", "status_code", "content", "fetched_at", "content_hash"]
+)
+
+
+class PageCache:
+    """
+    Caché de respuestas crudas de CvLAC direccionada por contenido.
+
+    Los cuerpos se guardan comprimidos con gzip en objects/<hash[:2]>/<hash>.gz,
+    de modo que las páginas idénticas (p. ej. los IDs sin CvLAC) ocupan un
+    solo archivo. Cada cod_rh tiene una entrada en entries/<cod_rh[-3:]>/ con
+    la fecha de descarga, el código HTTP y el hash del cuerpo.
+
+    Las escrituras son atómicas (archivo temporal + os.replace) para que varios
+    procesos puedan compartir el mismo directorio.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, scraper_config=None):
+        """Implementa el patrón Singleton para compartir la caché en el proceso."""
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(PageCache, cls).__new__(cls)
+                cls._instance._initialized = False
+            return cls._instance
+
+    def __init__(self, scraper_config=None):
+        """
+        Inicializa la caché.
+
+        Args:
+            scraper_config (dict, optional): Configuración del scraper. Por defecto
+                                             project_settings.scraper.
+        """
+        if self._initialized:
+            return
+
+        self.config = scraper_config or project_settings.scraper
+        self.base_dir = Path(self.config.get("cache_dir", "temp/html_cache"))
+        self.objects_dir = self.base_dir / "objects"
+        self.entries_dir = self.base_dir / "entries"
+        self._counters = {"hits": 0, "misses": 0, "expired": 0, "writes": 0}
+        self._last_taken = dict(self._counters)
+        self._pid = os.getpid()
+        self._initialized = True
+
+    @property
+    def enabled(self):
+        """Indica si la caché está activada en la configuración."""
+        return self.config.get("cache_enabled", False)
+
+    @property
+    def ttl(self):
+        """Tiempo de vida de una entrada en segundos (0 = sin vencimiento)."""
+        return self.config.get("cache_ttl", 0)
+
+    @staticmethod
+    def content_hash(content):
+        """
+        Calcula el hash SHA-256 de un cuerpo.
+
+        Args:
+            content (bytes): Cuerpo de la respuesta.
+
+        Returns:
+            str: Hash hexadecimal.
+        """
+        return hashlib.sha256(content or b"").hexdigest()
+
+    def _entry_path(self, cod_rh):
+        return self.entries_dir / str(cod_rh)[-3:] / f"{cod_rh}.json"
+
+    def _object_path(self, content_hash):
+        return self.objects_dir / content_hash[:2] / f"{content_hash}.gz"
+
+    @staticmethod
+    def _write_atomic(path, data):
+        """
+        Escribe un archivo de forma atómica. El temporal es propio de cada
+        hilo: los hilos de descarga del pipeline comparten la caché y pueden
+        escribir el mismo objeto a la vez.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(
+            f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _count(self, counter):
+        with self._lock:
+            if self._pid != os.getpid():
+                # Contadores propios para cada worker
+                self._counters = {key: 0 for key in self._counters}
+                self._last_taken = dict(self._counters)
+                self._pid = os.getpid()
+            self._counters[counter] += 1
+
+    def _read_entry(self, cod_rh):
+        """Lee la entrada de un cod_rh. Retorna None si no existe o está dañada."""
+        try:
+            with open(self._entry_path(cod_rh), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get(self, cod_rh):
+        """
+        Obtiene la página de un CvLAC desde la caché.
+
+        Args:
+            cod_rh (str): Código del investigador.
+
+        Returns:
+            CachedPage: Página cacheada, o None si no existe o venció.
+        """
+        if not self.enabled:
+            return None
+
+        entry = self._read_entry(cod_rh)
+        if entry is None:
+            self._count("misses")
+            return None
+
+        if self.ttl and time.time() - entry["fetched_at"] > self.ttl:
+            self._count("expired")
+            return None
+
+        page = self._load(cod_rh, entry)
+        if page is None:
+            # El objeto fue eliminado por la evicción de otro proceso
+            self._count("misses")
+            return None
+
+        self._count("hits")
+        return page
+
+    def _load(self, cod_rh, entry):
+        """Lee el cuerpo de una entrada. Retorna None si el objeto no existe."""
+        try:
+            with gzip.open(self._object_path(entry["content_hash"]), "rb") as f:
+                content = f.read()
+        except OSError:
+            return None
+
+        return CachedPage(
+            cod_rh,
+            entry["status_code"],
+            content,
+            entry["fetched_at"],
+            entry["content_hash"],
+        )
+
+    def read(self, cod_rh):
+        """
+        Lee la página guardada de un CvLAC aunque la caché esté desactivada o
+        la entrada haya vencido (p. ej. para volver a parsearla con --reparse).
+
+        Args:
+            cod_rh (str): Código del investigador.
+
+        Returns:
+            CachedPage: Página guardada, o None si no existe.
+        """
+        entry = self._read_entry(cod_rh)
+        if entry is None:
+            return None
+        return self._load(cod_rh, entry)
+
+    def stored_ids(self):
+        """
+        Recorre los cod_rh que tienen una entrada en la caché.
+
+        Yields:
+            str: Códigos de investigador, ordenados dentro de cada directorio.
+        """
+        if not self.entries_dir.exists():
+            return
+        for entry_dir in sorted(self.entries_dir.iterdir()):
+            for entry_path in sorted(entry_dir.glob("*.json")):
+                yield entry_path.stem
+
+    def put(self, cod_rh, status_code, content):
+        """
+        Guarda la respuesta de un CvLAC.
+
+        Los errores de servidor (5xx) no se guardan para que se reintenten.
+
+        Args:
+            cod_rh (str): Código del investigador.
+            status_code (int): Código HTTP de la respuesta.
+            content (bytes): Cuerpo de la respuesta.
+
+        Returns:
+            str: Hash del contenido, o None si no se guardó.
+        """
+        if not self.enabled or status_code is None or status_code >= 500:
+            return None
+
+        content_hash = self.content_hash(content)
+        try:
+            object_path = self._object_path(content_hash)
+            if not object_path.exists():
+                self._write_atomic(object_path, gzip.compress(content or b""))
+
+            entry = {
+                "cod_rh": str(cod_rh),
+                "status_code": status_code,
+                "fetched_at": time.time(),
+                "content_hash": content_hash,
+                "size": len(content or b""),
+            }
+            self._write_atomic(
+                self._entry_path(cod_rh), json.dumps(entry).encode("utf-8")
+            )
+            self._count("writes")
+            return content_hash
+        except OSError as e:
+            module_logger.warning(
+                f"No se pudo guardar CvLAC {cod_rh} en la caché: {str(e)}"
+            )
+            return None
+
+    def evict(self, max_size_mb=None):
+        """
+        Elimina las entradas vencidas y, si la caché supera el tamaño máximo,
+        las entradas más antiguas. Luego borra los objetos sin referencias.
+
+        Args:
+            max_size_mb (int, optional): Tamaño máximo en MB. Por defecto cache_max_size_mb.
+
+        Returns:
+            dict: Entradas y objetos eliminados y tamaño final en bytes.
+        """
+        result = {"entries_removed": 0, "objects_removed": 0, "size_bytes": 0}
+        if not self.base_dir.exists():
+            return result
+
+        if max_size_mb is None:
+            max_size_mb = self.config.get("cache_max_size_mb", 0)
+        now = time.time()
+
+        # Leer todas las entradas vigentes
+        entries = []
+        for entry_path in self.entries_dir.glob("*/*.json"):
+            try:
+                with open(entry_path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                entry = None
+
+            if entry is None or (self.ttl and now - entry["fetched_at"] > self.ttl):
+                entry_path.unlink(missing_ok=True)
+                result["entries_removed"] += 1
+                continue
+            entries.append((entry["fetched_at"], entry["content_hash"], entry_path))
+
+        # Tamaño de los objetos referenciados
+        object_sizes = {}
+        for object_path in self.objects_dir.glob("*/*.gz"):
+            object_sizes[object_path.stem] = object_path.stat().st_size
+
+        references = {}
+        for _, content_hash, _ in entries:
+            references[content_hash] = references.get(content_hash, 0) + 1
+
+        total = sum(object_sizes.get(h, 0) for h in references)
+
+        # Eliminar las entradas más antiguas hasta quedar bajo el límite
+        if max_size_mb and total > max_size_mb * 1024 * 1024:
+            limit = max_size_mb * 1024 * 1024
+            for _, content_hash, entry_path in sorted(entries):
+                if total <= limit:
+                    break
+                entry_path.unlink(missing_ok=True)
+                result["entries_removed"] += 1
+                references[content_hash] -= 1
+                if references[content_hash] == 0:
+                    del references[content_hash]
+                    total -= object_sizes.get(content_hash, 0)
+
+        # Borrar los objetos que ya no referencia ninguna entrada
+        for content_hash in object_sizes:
+            if content_hash not in references:
+                self._object_path(content_hash).unlink(missing_ok=True)
+                result["objects_removed"] += 1
+
+        result["size_bytes"] = total
+        module_logger.info(f"Evicción de la caché de páginas: {result}")
+        return result
+
+    def stats(self):
+        """
+        Retorna los contadores de uso de la caché en el proceso.
+
+        Returns:
+            dict: Aciertos, fallos, entradas vencidas, escrituras y tasa de aciertos.
+        """
+        with self._lock:
+            return self._format_stats(dict(self._counters))
+
+    def take_stats(self):
+        """
+        Retorna los contadores acumulados desde la última llamada.
+
+        Returns:
+            dict: Mismo formato que stats().
+        """
+        with self._lock:
+            current = dict(self._counters)
+            delta = {
+                key: current[key] - self._last_taken.get(key, 0) for key in current
+            }
+            self._last_taken = current
+        return self._format_stats(delta)
+
+    @staticmethod
+    def _format_stats(counters):
+        """Agrega la tasa de aciertos a los contadores."""
+        lookups = counters["hits"] + counters["misses"] + counters["expired"]
+        counters["hit_ratio"] = round(counters["hits"] / lookups, 4) if lookups else 0.0
+        return counters
+
+    @staticmethod
+    def merge_stats(stats_list):
+        """
+        Combina los contadores de varios workers.
+
+        Args:
+            stats_list (list): Lista de diccionarios retornados por take_stats().
+
+        Returns:
+            dict: Contadores sumados.
+        """
+        counters = {"hits": 0, "misses": 0, "expired": 0, "writes": 0}
+        for stats in stats_list:
+            for key in counters:
+                counters[key] += (stats or {}).get(key, 0)
+        return PageCache._format_stats(counters)
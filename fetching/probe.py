@@ -0,0 +1,101 @@
+"""
+Detección temprana de páginas CvLAC vacías durante la descarga.
+"""
+
+from config import project_settings
+import re
+
+
+# Ancla de la sección de datos generales, presente en todo CvLAC real
+DATOS_GENERALES_MARKER = re.compile(
+    rb"""name\s*=\s*["']?datos_generales""", re.IGNORECASE
+)
+TABLE_TAG = re.compile(rb"<table\b", re.IGNORECASE)
+
+# Bytes del final del buffer que se vuelven a revisar para no perder un
+# marcador partido entre dos fragmentos
+_OVERLAP = 64
+
+
+class StreamProbe:
+    """
+    Clasifica una respuesta como CvLAC real o página vacía mientras se lee.
+
+    Un CvLAC real contiene el ancla 'datos_generales'; en cuanto aparece, se
+    lee el resto del cuerpo. Si se leen probe_bytes sin encontrarla y el
+    prefijo tiene dos tablas o menos (el mismo criterio que se aplicaba con
+    BeautifulSoup), la página se considera vacía y se deja de leer para
+    cerrar la conexión.
+    """
+
+    CV = "cv"
+    EMPTY = "empty"
+
+    def __init__(self, probe_bytes=None):
+        """
+        Inicializa el clasificador.
+
+        Args:
+            probe_bytes (int, optional): Bytes a leer antes de decidir. Por defecto
+                                         probe_bytes de la configuración; 0 desactiva
+                                         el corte anticipado.
+        """
+        if probe_bytes is None:
+            probe_bytes = project_settings.scraper.get("probe_bytes", 32768)
+        self.probe_bytes = probe_bytes
+        self.verdict = None
+        self._chunks = []
+        self._size = 0
+        self._tail = b""
+
+    @property
+    def content(self):
+        """Cuerpo leído hasta el momento."""
+        return b"".join(self._chunks)
+
+    @property
+    def truncated(self):
+        """Indica si se dejó de leer antes del final de la respuesta."""
+        return self.verdict == self.EMPTY
+
+    def feed(self, chunk):
+        """
+        Agrega un fragmento de la respuesta.
+
+        Args:
+            chunk (bytes): Fragmento leído.
+
+        Returns:
+            str: StreamProbe.CV, StreamProbe.EMPTY, o None si aún no se puede decidir.
+        """
+        if not chunk:
+            return self.verdict
+
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+
+        if self.verdict is None:
+            window = self._tail + chunk
+            if DATOS_GENERALES_MARKER.search(window):
+                self.verdict = self.CV
+            elif self.probe_bytes and self._size >= self.probe_bytes:
+                self.verdict = self.EMPTY if self.looks_empty(self.content) else self.CV
+            self._tail = window[-_OVERLAP:]
+
+        return self.verdict
+
+    @staticmethod
+    def looks_empty(content):
+        """
+        Clasifica un cuerpo sin construir el árbol HTML.
+
+        Args:
+            content (bytes): Cuerpo completo o prefijo de la respuesta.
+
+        Returns:
+            bool: True si no tiene el ancla de datos generales y tiene dos tablas o menos.
+        """
+        content = content or b""
+        if DATOS_GENERALES_MARKER.search(content):
+            return False
+        return len(TABLE_TAG.findall(content)) <= 2
@@ -0,0 +1,298 @@
+"""
+Control adaptativo de la concurrencia y de los reintentos de descarga.
+"""
+
+from collections import deque
+from config import ProjectLogger, project_settings
+import os
+import random
+import threading
+
+
+# Configuramos el logger para este módulo
+logger = ProjectLogger()
+module_logger = logger.get_logger(__name__)
+
+
+# Códigos HTTP que indican que el servidor está saturado
+THROTTLE_STATUS = {429, 502, 503, 504}
+
+
+def percentile(values, fraction):
+    """
+    Calcula un percentil por el método del rango más cercano.
+
+    Args:
+        values (list): Valores numéricos.
+        fraction (float): Percentil entre 0 y 1.
+
+    Returns:
+        float: Valor del percentil, o 0.0 si no hay valores.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+class RateController:
+    """
+    Controlador AIMD (incremento aditivo, reducción multiplicativa) de las
+    peticiones en vuelo contra el servidor de CvLAC.
+
+    Cada respuesta sana con latencia bajo el objetivo suma crédito; cuando se
+    acumulan tantas respuestas como el límite actual (una "ventana"), el
+    límite sube en uno. Un timeout, un error de red, un 429 o un 5xx reducen
+    el límite a la mitad, como máximo una vez por ventana para no colapsar
+    ante una ráfaga de errores de peticiones que ya estaban en vuelo.
+
+    También calcula las esperas de los reintentos con backoff exponencial
+    con jitter acotado por max_retries, retry_delay y retry_max_delay.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    # Muestras de latencia conservadas para los percentiles
+    LATENCY_WINDOW = 2000
+
+    def __new__(cls, scraper_config=None):
+        """Implementa el patrón Singleton para compartir el controlador en el proceso."""
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(RateController, cls).__new__(cls)
+                cls._instance._initialized = False
+            return cls._instance
+
+    def __init__(self, scraper_config=None):
+        """
+        Inicializa el controlador.
+
+        Args:
+            scraper_config (dict, optional): Configuración del scraper. Por defecto
+                                             project_settings.scraper.
+        """
+        if self._initialized:
+            return
+
+        self.config = scraper_config or project_settings.scraper
+        self.max_retries = self.config.get("max_retries", 3)
+        self.retry_delay = self.config.get("retry_delay", 5)
+        self.retry_max_delay = self.config.get("retry_max_delay", 60)
+        self.latency_target = self.config.get("latency_target", 5.0)
+        self._reset()
+        self._initialized = True
+
+    def _reset(self):
+        """Reinicia el estado del controlador (también tras un fork)."""
+        self.maximum = max(1, self.config.get("max_concurrency", 200))
+        self.minimum = max(1, min(self.config.get("min_concurrency", 1), self.maximum))
+        initial = self.config.get("initial_concurrency", 10)
+        self.limit = float(max(self.minimum, min(initial, self.maximum)))
+        self._credit = 0
+        self._since_decrease = 0
+        self._latencies = deque(maxlen=self.LATENCY_WINDOW)
+        self._counters = {"requests": 0, "retries": 0, "throttled": 0, "errors": 0}
+        self._last_taken = dict(self._counters)
+        self._peak = self.limit
+        self._pid = os.getpid()
+
+    def configure(self, maximum):
+        """
+        Ajusta el límite máximo de concurrencia (p. ej. repartido entre workers).
+
+        Args:
+            maximum (int): Nuevo máximo de peticiones en vuelo.
+        """
+        with self._lock:
+            self._check_pid()
+            self.maximum = max(1, maximum)
+            self.minimum = min(self.minimum, self.maximum)
+            self.limit = min(self.limit, float(self.maximum))
+
+    def _check_pid(self):
+        if self._pid != os.getpid():
+            self._reset()
+
+    @property
+    def concurrency(self):
+        """Número actual de peticiones permitidas en vuelo."""
+        return int(self.limit)
+
+    @staticmethod
+    def is_retryable(status_code=None, error=None):
+        """
+        Indica si un resultado merece un reintento.
+
+        Args:
+            status_code (int, optional): Código HTTP de la respuesta.
+            error (str, optional): Error de red o timeout.
+
+        Returns:
+            bool: True para errores de red, timeouts, 429 y 5xx.
+        """
+        if error is not None:
+            return True
+        return status_code is not None and (
+            status_code in THROTTLE_STATUS or status_code >= 500
+        )
+
+    def record(self, latency, status_code=None, error=None):
+        """
+        Registra el resultado de una petición y ajusta el límite.
+
+        Args:
+            latency (float): Duración de la petición en segundos.
+            status_code (int, optional): Código HTTP de la respuesta.
+            error (str, optional): Error de red o timeout.
+        """
+        with self._lock:
+            self._check_pid()
+            self._counters["requests"] += 1
+            self._since_decrease += 1
+
+            if self.is_retryable(status_code, error):
+                if error is not None:
+                    self._counters["errors"] += 1
+                else:
+                    self._counters["throttled"] += 1
+
+                # Reducir como máximo una vez por ventana
+                if self._since_decrease >= self.limit:
+                    previous = self.concurrency
+                    self.limit = max(float(self.minimum), self.limit / 2)
+                    self._credit = 0
+                    self._since_decrease = 0
+                    if self.concurrency != previous:
+                        module_logger.info(
+                            f"Reduciendo concurrencia de descarga a {self.concurrency} "
+                            f"({error or f'HTTP {status_code}'})"
+                        )
+                return
+
+            self._latencies.append(latency)
+            if latency > self.latency_target:
+                return
+
+            self._credit += 1
+            if self._credit >= self.limit and self.limit < self.maximum:
+                self.limit = min(float(self.maximum), self.limit + 1)
+                self._credit = 0
+                self._peak = max(self._peak, self.limit)
+                module_logger.debug(
+                    f"Aumentando concurrencia de descarga a {self.concurrency}"
+                )
+
+    def backoff(self, attempt, retry_after=None):
+        """
+        Calcula la espera antes de un reintento (backoff exponencial con jitter).
+
+        Args:
+            attempt (int): Número de reintento, empezando en 0.
+            retry_after (float, optional): Espera sugerida por el servidor (Retry-After).
+
+        Returns:
+            float: Segundos de espera.
+        """
+        with self._lock:
+            self._check_pid()
+            self._counters["retries"] += 1
+
+        ceiling = min(self.retry_max_delay, self.retry_delay * (2**attempt))
+        delay = random.uniform(ceiling / 2, ceiling)
+        if retry_after is not None:
+            delay = max(delay, min(float(retry_after), self.retry_max_delay))
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value):
+        """
+        Interpreta la cabecera Retry-After cuando viene en segundos.
+
+        Args:
+            value (str): Valor de la cabecera.
+
+        Returns:
+            float: Segundos de espera, o None si no es un número.
+        """
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            return None
+
+    def stats(self):
+        """
+        Retorna el estado del controlador en el proceso.
+
+        Returns:
+            dict: Concurrencia actual y máxima alcanzada, latencias p50/p95 y contadores.
+        """
+        with self._lock:
+            self._check_pid()
+            latencies = list(self._latencies)
+            return self._format_stats(dict(self._counters), latencies)
+
+    def take_stats(self):
+        """
+        Retorna los contadores acumulados desde la última llamada y las
+        muestras de latencia para combinarlas entre workers.
+
+        Returns:
+            dict: Mismo formato que stats() más la lista 'latency_samples' y el
+                  'pid' del worker.
+        """
+        with self._lock:
+            self._check_pid()
+            current = dict(self._counters)
+            delta = {key: current[key] - self._last_taken[key] for key in current}
+            self._last_taken = current
+            latencies = list(self._latencies)
+            self._latencies.clear()
+        stats = self._format_stats(delta, latencies)
+        stats["latency_samples"] = latencies
+        stats["pid"] = os.getpid()
+        return stats
+
+    def _format_stats(self, counters, latencies):
+        counters.update(
+            {
+                "concurrency": self.concurrency,
+                "peak_concurrency": int(self._peak),
+                "latency_p50": round(percentile(latencies, 0.50), 3),
+                "latency_p95": round(percentile(latencies, 0.95), 3),
+            }
+        )
+        return counters
+
+    @staticmethod
+    def merge_stats(stats_list):
+        """
+        Combina los contadores de varios workers.
+
+        Args:
+            stats_list (list): Lista de diccionarios retornados por take_stats().
+
+        Returns:
+            dict: Contadores sumados, concurrencia total y percentiles globales.
+        """
+        stats_list = [s for s in stats_list if s]
+        merged = {
+            key: sum(s.get(key, 0) for s in stats_list)
+            for key in ("requests", "retries", "throttled", "errors")
+        }
+        latencies = [
+            value for s in stats_list for value in s.get("latency_samples", [])
+        ]
+        # Un worker reporta una vez por bloque: se suma el último límite de
+        # cada proceso, no el de cada reporte
+        concurrency = {}
+        for index, s in enumerate(stats_list):
+            concurrency[s.get("pid", index)] = s.get("concurrency", 0)
+        merged["concurrency"] = sum(concurrency.values())
+        merged["peak_concurrency"] = max(
+            (s.get("peak_concurrency", 0) for s in stats_list), default=0
+        )
+        merged["latency_p50"] = round(percentile(latencies, 0.50), 3)
+        merged["latency_p95"] = round(percentile(latencies, 0.95), 3)
+        return merged
@@ -0,0 +1,237 @@
+"""
+Sesión HTTP persistente por proceso para las descargas síncronas.
+"""
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from config import ProjectLogger, project_settings
+import os
+import requests
+import threading
+
+
+# Configuramos el logger para este módulo
+logger = ProjectLogger()
+module_logger = logger.get_logger(__name__)
+
+
+class _CountingHTTPConnection(HTTPConnection):
+    """Conexión HTTP que registra cada conexión TCP abierta."""
+
+    def connect(self):
+        super().connect()
+        HttpSession().count_handshake()
+
+
+class _CountingHTTPSConnection(HTTPSConnection):
+    """Conexión HTTPS que registra cada handshake TCP+TLS."""
+
+    def connect(self):
+        super().connect()
+        HttpSession().count_handshake()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CountingHTTPConnection
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CountingHTTPSConnection
+
+
+class _CountingAdapter(HTTPAdapter):
+    """HTTPAdapter cuyos pools cuentan las conexiones nuevas."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+class HttpSession:
+    """
+    Sesión requests compartida por todas las descargas de un proceso.
+
+    Mantiene las conexiones abiertas (keep-alive) contra el servidor de CvLAC
+    para que cada ID no pague un handshake TCP y TLS nuevo. Al igual que el
+    pool de base de datos, detecta el fork y crea una sesión nueva en cada
+    worker sin cerrar los sockets heredados del proceso padre.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, scraper_config=None):
+        """Implementa el patrón Singleton para compartir la sesión en el proceso."""
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(HttpSession, cls).__new__(cls)
+                cls._instance._initialized = False
+            return cls._instance
+
+    def __init__(self, scraper_config=None):
+        """
+        Inicializa la sesión.
+
+        Args:
+            scraper_config (dict, optional): Configuración del scraper. Por defecto
+                                             project_settings.scraper.
+        """
+        if self._initialized:
+            return
+
+        self.config = scraper_config or project_settings.scraper
+        self._session = None
+        self._pid = os.getpid()
+        # Sesiones heredadas de otro proceso: no se cierran para no cortar
+        # las conexiones TLS que sigue usando el padre
+        self._inherited = []
+        self._counters = {"requests": 0, "handshakes": 0}
+        self._last_taken = {"requests": 0, "handshakes": 0}
+        self._pool_maxsize = self.config.get("http_pool_maxsize", 10)
+        self._initialized = True
+
+    def _build_session(self):
+        """Crea una sesión con un pool de conexiones ajustado."""
+        session = requests.Session()
+        adapter = _CountingAdapter(
+            pool_connections=self.config.get("http_pool_connections", 4),
+            pool_maxsize=self._pool_maxsize,
+            pool_block=False,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if self.config.get("user_agent"):
+            session.headers["User-Agent"] = self.config["user_agent"]
+        session.verify = self.config.get("verify_ssl", False)
+        return session
+
+    def _check_pid(self):
+        """Descarta la sesión y los contadores heredados tras un fork."""
+        if self._pid != os.getpid():
+            if self._session is not None:
+                self._inherited.append(self._session)
+                self._session = None
+            self._counters = {"requests": 0, "handshakes": 0}
+            self._last_taken = {"requests": 0, "handshakes": 0}
+            self._pid = os.getpid()
+
+    @property
+    def session(self):
+        """Retorna la sesión del proceso actual, creándola si es necesario."""
+        with self._lock:
+            self._check_pid()
+            if self._session is None:
+                self._session = self._build_session()
+            return self._session
+
+    def ensure_pool_maxsize(self, size):
+        """
+        Amplía el pool de conexiones por host para size hilos concurrentes.
+
+        Con menos conexiones que hilos, requests descarta en cada petición
+        las conexiones keep-alive que no caben en el pool. Si la sesión ya
+        existe se reemplaza por una con el pool ampliado; debe llamarse antes
+        de iniciar los hilos que la usan.
+
+        Args:
+            size (int): Hilos que descargan en paralelo con la sesión.
+        """
+        with self._lock:
+            self._check_pid()
+            if size <= self._pool_maxsize:
+                return
+            self._pool_maxsize = size
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def count_handshake(self):
+        """Registra una conexión nueva (handshake TCP y, en HTTPS, TLS)."""
+        with self._lock:
+            self._check_pid()
+            self._counters["handshakes"] += 1
+
+    def get(self, url, **kwargs):
+        """
+        Realiza una petición GET reutilizando las conexiones abiertas.
+
+        Args:
+            url (str): URL a descargar.
+            **kwargs: Argumentos adicionales para requests.Session.get.
+
+        Returns:
+            requests.Response: Respuesta HTTP.
+        """
+        kwargs.setdefault("timeout", self.config.get("timeout", 30))
+        session = self.session
+        with self._lock:
+            self._counters["requests"] += 1
+        return session.get(url, **kwargs)
+
+    def stats(self):
+        """
+        Retorna los contadores de uso de conexiones del proceso.
+
+        Returns:
+            dict: Peticiones, handshakes (conexiones nuevas), peticiones servidas
+                  con una conexión reutilizada y tasa de reutilización.
+        """
+        with self._lock:
+            self._check_pid()
+            return self._format_stats(
+                self._counters["requests"], self._counters["handshakes"]
+            )
+
+    def take_stats(self):
+        """
+        Retorna los contadores acumulados desde la última llamada.
+
+        Permite que cada worker reporte su parte sin contar dos veces.
+
+        Returns:
+            dict: Mismo formato que stats().
+        """
+        with self._lock:
+            self._check_pid()
+            current = dict(self._counters)
+            delta = {key: current[key] - self._last_taken[key] for key in current}
+            self._last_taken = current
+        return self._format_stats(delta["requests"], delta["handshakes"])
+
+    @staticmethod
+    def _format_stats(requests_count, handshakes):
+        """Calcula las conexiones reutilizadas a partir de los contadores."""
+        reused = max(0, requests_count - handshakes)
+        return {
+            "requests": requests_count,
+            "handshakes": handshakes,
+            "reused": reused,
+            "reuse_ratio": round(reused / requests_count, 4) if requests_count else 0.0,
+        }
+
+    @staticmethod
+    def merge_stats(stats_list):
+        """
+        Combina los contadores de varios workers.
+
+        Args:
+            stats_list (list): Lista de diccionarios retornados por take_stats().
+
+        Returns:
+            dict: Contadores sumados.
+        """
+        requests_count = sum(s.get("requests", 0) for s in stats_list if s)
+        handshakes = sum(s.get("handshakes", 0) for s in stats_list if s)
+        return HttpSession._format_stats(requests_count, handshakes)
+
+    def close(self):
+        """Cierra la sesión del proceso actual."""
+        with self._lock:
+            self._check_pid()
+            if self._session is not None:
+                self._session.close()
+                self._session = None
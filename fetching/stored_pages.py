@@ -0,0 +1,180 @@
+"""
+Lectura de páginas CvLAC guardadas para volver a parsearlas sin descargarlas.
+"""
+
+from collections import namedtuple
+from pathlib import Path
+from config import ProjectLogger
+from fetching.cache import PageCache
+import gzip
+import tarfile
+import zipfile
+
+
+# Configuramos el logger para este módulo
+logger = ProjectLogger()
+module_logger = logger.get_logger(__name__)
+
+
+# Página guardada: código del investigador y cuerpo HTML
+StoredPage = namedtuple("StoredPage", ["cod_rh", "content"])
+
+
+class StoredPages:
+    """
+    Recorre páginas CvLAC guardadas en disco, en cualquiera de estas formas:
+
+    - la caché de páginas (PageCache), con sus entradas y objetos gzip;
+    - un directorio con archivos <cod_rh>.html o <cod_rh>.html.gz (se
+      recorren también los subdirectorios);
+    - un archivo .tar, .tar.gz, .tgz o .zip con esos mismos archivos.
+
+    Las páginas de la caché con un código HTTP distinto de 200 se omiten.
+    Los nombres numéricos se normalizan a 10 dígitos, como los de --ids-file.
+    Las páginas se leen de a una, a medida que se recorren, para no cargar
+    el corpus completo en memoria.
+    """
+
+    SUFFIXES = (".html", ".html.gz")
+    ARCHIVE_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".zip")
+
+    def __init__(self, path=None, cod_rhs=None):
+        """
+        Inicializa el recorrido.
+
+        Args:
+            path (str, optional): Directorio o archivo con las páginas. Por
+                                  defecto, la caché de páginas configurada.
+            cod_rhs (set, optional): Solo recorrer estos códigos (con ceros a
+                                     la izquierda).
+        """
+        self.path = Path(path) if path else None
+        self.cod_rhs = set(cod_rhs) if cod_rhs else None
+        self.counts = {"pages": 0, "filtered": 0, "missing": 0, "skipped": 0}
+
+    @staticmethod
+    def is_cache_dir(path):
+        """
+        Indica si una ruta es un directorio de la caché de páginas.
+
+        Args:
+            path (str): Ruta a revisar.
+
+        Returns:
+            bool: True si contiene el directorio entries/ de PageCache.
+        """
+        return bool(path) and (Path(path) / "entries").is_dir()
+
+    @classmethod
+    def cod_rh_from_name(cls, name):
+        """
+        Obtiene el cod_rh del nombre de un archivo guardado.
+
+        Args:
+            name (str): Nombre o ruta del archivo ('0001468382.html.gz').
+
+        Returns:
+            str: Código del investigador (con ceros a la izquierda si es
+                 numérico), o None si no es una página.
+        """
+        name = name.replace("\\", "/").rsplit("/", 1)[-1]
+        for suffix in cls.SUFFIXES:
+            if name.endswith(suffix):
+                cod_rh = name[: -len(suffix)]
+                if cod_rh.isdigit():
+                    return "{:010d}".format(int(cod_rh))
+                return cod_rh or None
+        return None
+
+    @staticmethod
+    def _decode(name, data):
+        """Descomprime el cuerpo si el archivo es .gz."""
+        return gzip.decompress(data) if name.endswith(".gz") else data
+
+    def _accept(self, cod_rh):
+        """Aplica el filtro de cod_rh y cuenta las páginas descartadas."""
+        if self.cod_rhs is not None and cod_rh not in self.cod_rhs:
+            self.counts["filtered"] += 1
+            return False
+        return True
+
+    def __iter__(self):
+        if self.path is None or self.is_cache_dir(self.path):
+            pages = self._iter_cache()
+        elif self.path.is_dir():
+            pages = self._iter_directory()
+        elif self.path.name.endswith(self.ARCHIVE_SUFFIXES):
+            pages = self._iter_archive()
+        else:
+            pages = self._iter_files([self.path])
+
+        for page in pages:
+            self.counts["pages"] += 1
+            yield page
+
+        module_logger.info(
+            f"Páginas guardadas en {self.path or 'la caché'}: "
+            f"{self.counts['pages']} leídas, {self.counts['filtered']} filtradas, "
+            f"{self.counts['missing']} no encontradas, {self.counts['skipped']} omitidas"
+        )
+
+    def _iter_cache(self):
+        """Páginas de la caché (la ruta, si se indicó, ya es su cache_dir)."""
+        cache = PageCache()
+        if self.cod_rhs is not None:
+            ids = sorted(self.cod_rhs)
+        else:
+            ids = cache.stored_ids()
+
+        for cod_rh in ids:
+            page = cache.read(cod_rh)
+            if page is None:
+                self.counts["missing"] += 1
+                continue
+            if page.status_code != 200:
+                self.counts["skipped"] += 1
+                continue
+            yield StoredPage(cod_rh, page.content)
+
+    def _iter_directory(self):
+        """Páginas de un directorio y sus subdirectorios."""
+        paths = sorted(
+            path
+            for suffix in self.SUFFIXES
+            for path in self.path.rglob(f"*{suffix}")
+            if path.is_file()
+        )
+        yield from self._iter_files(paths)
+
+    def _iter_files(self, paths):
+        for path in paths:
+            cod_rh = self.cod_rh_from_name(path.name)
+            if cod_rh is None or not self._accept(cod_rh):
+                continue
+            try:
+                yield StoredPage(cod_rh, self._decode(path.name, path.read_bytes()))
+            except OSError as e:
+                self.counts["skipped"] += 1
+                module_logger.warning(f"No se pudo leer {path}: {str(e)}")
+
+    def _iter_archive(self):
+        """Páginas de un archivo tar (con o sin compresión) o zip."""
+        if self.path.name.endswith(".zip"):
+            with zipfile.ZipFile(self.path) as archive:
+                for name in archive.namelist():
+                    cod_rh = self.cod_rh_from_name(name)
+                    if cod_rh is None or not self._accept(cod_rh):
+                        continue
+                    yield StoredPage(cod_rh, self._decode(name, archive.read(name)))
+            return
+
+        # Modo de flujo: los miembros se leen en orden sin buscar en el archivo
+        with tarfile.open(self.path, "r|*") as archive:
+            for member in archive:
+                if not member.isfile():
+                    continue
+                cod_rh = self.cod_rh_from_name(member.name)
+                if cod_rh is None or not self._accept(cod_rh):
+                    continue
+                data = archive.extractfile(member).read()
+                yield StoredPage(cod_rh, self._decode(member.name, data))
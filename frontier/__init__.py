@@ -0,0 +1,22 @@
+from .bitmap import IdBitmap
+from .density import DensityBlock, DensityIndex
+from .id_list import iter_id_batches, normalize_cod_rh
+from .leases import ChunkLease, ChunkLeases
+from .recrawl import RecrawlPlanner
+from .run_control import RunControl
+from .scheduler import ChunkScheduler
+from .store import FrontierStore
+
+__all__ = [
+    "ChunkLease",
+    "ChunkLeases",
+    "ChunkScheduler",
+    "DensityBlock",
+    "DensityIndex",
+    "FrontierStore",
+    "IdBitmap",
+    "RecrawlPlanner",
+    "RunControl",
+    "iter_id_batches",
+    "normalize_cod_rh",
+]
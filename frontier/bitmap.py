@@ -0,0 +1,230 @@
+"""
+Mapa de bits en disco de los IDs de CvLAC intentados y procesados.
+"""
+
+from pathlib import Path
+from config import ProjectLogger
+import mmap
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows: solo se protege entre hilos del mismo proceso
+    fcntl = None
+
+
+# Configuramos el logger para este módulo
+logger = ProjectLogger()
+module_logger = logger.get_logger(__name__)
+
+
+class IdBitmap:
+    """
+    Conjunto de IDs numéricos de CvLAC guardado como un mapa de bits en un
+    archivo mapeado en memoria (un bit por ID: 2 millones de IDs ocupan unos
+    250 KB).
+
+    Todos los procesos que abren el mismo archivo comparten el mapa
+    (MAP_SHARED), de modo que un ID marcado por un worker es visible de
+    inmediato para los demás sin releer archivos. Cada actualización bloquea
+    el byte afectado con fcntl.lockf, ya que dos workers pueden compartir el
+    byte en el borde de sus rangos. El archivo crece al marcar un ID fuera
+    del espacio actual.
+
+    Se usa como un set de cod_rh: 'cod_rh in bitmap', bitmap.add(cod_rh) y
+    len(bitmap).
+    """
+
+    # Capacidad inicial en IDs (2^21 bits = 256 KB)
+    INITIAL_CAPACITY = 1 << 21
+
+    # Instancias abiertas en el proceso, por ruta
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def open(cls, path, legacy_path=None):
+        """
+        Retorna el mapa de bits de una ruta, abriéndolo una sola vez por proceso.
+
+        Args:
+            path (str): Ruta del archivo del mapa de bits.
+            legacy_path (str, optional): Archivo de texto heredado a migrar.
+
+        Returns:
+            IdBitmap: Mapa de bits compartido en el proceso.
+        """
+        key = (os.getpid(), str(Path(path).resolve()))
+        with cls._instances_lock:
+            bitmap = cls._instances.get(key)
+            if bitmap is None:
+                bitmap = cls(path, legacy_path)
+                cls._instances[key] = bitmap
+            return bitmap
+
+    def __init__(self, path, legacy_path=None):
+        """
+        Abre (o crea) el mapa de bits.
+
+        Args:
+            path (str): Ruta del archivo del mapa de bits.
+            legacy_path (str, optional): Archivo de texto con un cod_rh por línea
+                                         que se importa la primera vez que se crea
+                                         el mapa (p. ej. procesados.txt).
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._mmap = None
+        self._size = 0
+
+        if not self.path.exists():
+            self._create(legacy_path)
+
+        self._fd = os.open(self.path, os.O_RDWR)
+        self._remap()
+
+    def _create(self, legacy_path):
+        """Crea el archivo, importando una sola vez el archivo de texto heredado."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_path = self.path.with_name(self.path.name + ".lock")
+
+        with open(lock_path, "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+            # Otro proceso pudo crearlo mientras esperábamos el bloqueo
+            if self.path.exists():
+                return
+
+            ids = []
+            if legacy_path and os.path.exists(legacy_path):
+                with open(legacy_path, "r") as f:
+                    for line in f:
+                        line = line.strip()
+                        if line.isdigit():
+                            ids.append(int(line))
+
+            capacity = self.INITIAL_CAPACITY
+            while ids and max(ids) >= capacity:
+                capacity *= 2
+
+            data = bytearray(capacity // 8)
+            for value in ids:
+                data[value >> 3] |= 1 << (value & 7)
+
+            tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+
+            if ids:
+                module_logger.info(
+                    f"{len(set(ids))} IDs migrados de {legacy_path} a {self.path}"
+                )
+
+    def _remap(self):
+        """Mapea el archivo completo (también después de que otro proceso lo amplió)."""
+        size = os.fstat(self._fd).st_size
+        if size == self._size and self._mmap is not None:
+            return
+        if self._mmap is not None:
+            self._mmap.close()
+        self._mmap = mmap.mmap(self._fd, size)
+        self._size = size
+
+    def _grow(self, value):
+        """Amplía el archivo para que incluya el ID indicado."""
+        if fcntl is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            size = max(os.fstat(self._fd).st_size, self.INITIAL_CAPACITY // 8)
+            while value >> 3 >= size:
+                size *= 2
+            if size > os.fstat(self._fd).st_size:
+                os.ftruncate(self._fd, size)
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._remap()
+
+    @staticmethod
+    def _to_int(cod_rh):
+        """Convierte un cod_rh ('0001468382' o 1468382) a entero."""
+        return int(cod_rh)
+
+    def __contains__(self, cod_rh):
+        try:
+            value = self._to_int(cod_rh)
+        except (TypeError, ValueError):
+            return False
+
+        with self._lock:
+            if value >> 3 >= self._size:
+                self._remap()
+                if value >> 3 >= self._size:
+                    return False
+            return bool(self._mmap[value >> 3] & (1 << (value & 7)))
+
+    def add(self, cod_rh):
+        """
+        Marca un ID.
+
+        Args:
+            cod_rh (str): Código del investigador.
+        """
+        value = self._to_int(cod_rh)
+        offset = value >> 3
+
+        with self._lock:
+            if offset >= self._size:
+                self._remap()
+                if offset >= self._size:
+                    self._grow(value)
+
+            if fcntl is not None:
+                fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, offset)
+            try:
+                self._mmap[offset] |= 1 << (value & 7)
+            finally:
+                if fcntl is not None:
+                    fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, offset)
+
+    def update(self, ids):
+        """
+        Marca varios IDs.
+
+        Args:
+            ids (iterable): Códigos de investigador.
+        """
+        for cod_rh in ids:
+            self.add(cod_rh)
+
+    def __iter__(self):
+        """Recorre los IDs marcados en orden ascendente (como enteros)."""
+        with self._lock:
+            self._remap()
+            data = self._mmap[:]
+        for offset, byte in enumerate(data):
+            if byte:
+                for bit in range(8):
+                    if byte & (1 << bit):
+                        yield (offset << 3) | bit
+
+    def __len__(self):
+        with self._lock:
+            self._remap()
+            return int.from_bytes(self._mmap[:], "little").bit_count()
+
+    def flush(self):
+        """Fuerza la escritura del mapa a disco."""
+        with self._lock:
+            self._mmap.flush()
+
+    def close(self):
+        """Cierra el mapa y el archivo."""
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            os.close(self._fd)
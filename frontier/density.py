@@ -0,0 +1,232 @@
+"""
+Modelo de densidad de CvLAC por bloques del espacio de IDs.
+"""
+
+from collections import namedtuple
+from config import ProjectLogger, project_settings
+import math
+
+
+# Configuramos el logger para este módulo
+logger = ProjectLogger()
+module_logger = logger.get_logger(__name__)
+
+
+# Bloque del plan de recorrido (size IDs desde start)
+DensityBlock = namedtuple(
+    "DensityBlock", ["start", "size", "expected_yield", "sample_rate", "tried", "hits"]
+)
+
+
+class DensityIndex:
+    """
+    Estima la fracción de IDs con CvLAC en cada bloque a partir de los
+    recorridos anteriores (la frontera y los IDs de identificacion) y arma
+    un plan que visita primero los bloques más densos.
+
+    La tasa de cada bloque se suaviza hacia la tasa global con PRIOR_WEIGHT
+    observaciones ficticias, de modo que un bloque con pocos IDs intentados
+    no queda descartado por azar. Los bloques nunca recorridos se recorren
+    completos; los que quedan por debajo de density_min_yield se muestrean
+    con la fracción density_exploration (el presupuesto de exploración),
+    para seguir encontrando registros nuevos en zonas poco pobladas. Los IDs
+    no muestreados siguen pendientes en la frontera, así que cada ejecución
+    muestrea otros.
+    """
+
+    # Observaciones ficticias con la tasa global que se suman a cada bloque
+    PRIOR_WEIGHT = 50
+
+    KNOWN_IDS_QUERY = "SELECT cvlac_id FROM public.identificacion"
+
+    def __init__(self, db_connection, frontier, processed_ids, scraper_config=None):
+        """
+        Inicializa el índice.
+
+        Args:
+            db_connection: Instancia de la clase DatabaseConnection.
+            frontier (FrontierStore): Frontera con el historial de cada ID.
+            processed_ids (IdBitmap): IDs procesados (para no contar dos veces
+                                      los de identificacion).
+            scraper_config (dict, optional): Configuración del scraper. Por defecto
+                                             project_settings.scraper.
+        """
+        config = scraper_config or project_settings.scraper
+        self.db = db_connection
+        self.frontier = frontier
+        self.processed_ids = processed_ids
+        self.block_size = max(1, config.get("density_block_size", 10000))
+        self.min_yield = config.get("density_min_yield", 0.01)
+        self.exploration = min(1.0, max(0.0, config.get("density_exploration", 0.1)))
+        self.blocks = None
+        self.global_yield = 0.0
+
+    def _known_ids(self):
+        """IDs de identificacion que no están entre los procesados de la frontera."""
+        connection = None
+        try:
+            connection = self.db.get_connection()
+            cursor = connection.cursor()
+            cursor.execute(self.KNOWN_IDS_QUERY)
+            known = []
+            for (cvlac_id,) in cursor.fetchall():
+                try:
+                    value = int(cvlac_id)
+                except (TypeError, ValueError):
+                    continue
+                if value not in self.processed_ids:
+                    known.append(value)
+            return known
+        except Exception as e:
+            module_logger.warning(
+                f"No se pudieron leer los IDs de identificacion: {str(e)}"
+            )
+            return []
+        finally:
+            if connection:
+                connection.close()
+
+    def build(self):
+        """
+        Calcula los CvLAC encontrados e IDs intentados de cada bloque.
+
+        Returns:
+            dict: {índice del bloque: (encontrados, intentados)}
+        """
+        blocks = {
+            block: [hits, tried]
+            for block, (hits, tried) in self.frontier.block_outcomes(
+                self.block_size
+            ).items()
+        }
+
+        # Los CvLAC conocidos que no pasaron por la frontera (p. ej. extraídos
+        # antes de que existiera) cuentan como encontrados e intentados
+        for value in self._known_ids():
+            counts = blocks.setdefault(value // self.block_size, [0, 0])
+            counts[0] += 1
+            counts[1] += 1
+
+        self.blocks = {block: tuple(counts) for block, counts in blocks.items()}
+        total_hits = sum(hits for hits, _ in self.blocks.values())
+        total_tried = sum(tried for _, tried in self.blocks.values())
+        self.global_yield = total_hits / total_tried if total_tried else 0.0
+
+        module_logger.info(
+            f"Índice de densidad: {len(self.blocks)} bloques de {self.block_size} IDs "
+            f"con historial, tasa global {self.global_yield:.4f}"
+        )
+        return self.blocks
+
+    def expected_yield(self, block):
+        """
+        Fracción esperada de IDs con CvLAC en un bloque.
+
+        Args:
+            block (int): Índice del bloque.
+
+        Returns:
+            float: Tasa suavizada hacia la tasa global.
+        """
+        hits, tried = self.blocks.get(block, (0, 0))
+        return (hits + self.PRIOR_WEIGHT * self.global_yield) / (
+            tried + self.PRIOR_WEIGHT
+        )
+
+    def plan(self, range_start, range_end):
+        """
+        Divide un rango en bloques ordenados por densidad esperada.
+
+        Args:
+            range_start (int): Primer ID.
+            range_end (int): ID final (excluido).
+
+        Returns:
+            list: DensityBlock de mayor a menor densidad esperada.
+        """
+        if self.blocks is None:
+            self.build()
+
+        plan = []
+        start = range_start
+        while start < range_end:
+            block = start // self.block_size
+            end = min((block + 1) * self.block_size, range_end)
+            hits, tried = self.blocks.get(block, (0, 0))
+            expected = self.expected_yield(block)
+
+            # Sin historial no hay con qué descartar el bloque
+            if tried and expected < self.min_yield:
+                sample_rate = self.exploration
+            else:
+                sample_rate = 1.0
+
+            if sample_rate > 0:
+                plan.append(
+                    DensityBlock(start, end - start, expected, sample_rate, tried, hits)
+                )
+            start = end
+
+        plan.sort(key=lambda item: (-item.expected_yield, item.start))
+        sparse = sum(1 for item in plan if item.sample_rate < 1)
+        module_logger.info(
+            f"Plan de densidad: {len(plan)} bloques, {sparse} muestreados al "
+            f"{self.exploration:.0%}, "
+            f"{sum(math.ceil(item.size * item.sample_rate) for item in plan)} IDs a visitar"
+        )
+        return plan
+
+    def report(self, plan, since):
+        """
+        Compara la densidad esperada con la observada en esta ejecución.
+
+        Args:
+            plan (list): DensityBlock recorridos.
+            since (float): Inicio de la ejecución (time.time()).
+
+        Returns:
+            dict: Totales y detalle por bloque con la tasa esperada y la observada.
+        """
+        if not plan:
+            return {}
+
+        first_id = min(item.start for item in plan)
+        last_id = max(item.start + item.size for item in plan) - 1
+        observed = self.frontier.block_outcomes(
+            self.block_size, first_id, last_id, since=since
+        )
+
+        blocks = []
+        expected_hits = 0.0
+        actual_hits = 0
+        probed = 0
+        for item in sorted(plan, key=lambda item: item.start):
+            hits, tried = observed.get(item.start // self.block_size, (0, 0))
+            if not tried:
+                continue
+            expected_hits += item.expected_yield * tried
+            actual_hits += hits
+            probed += tried
+            blocks.append(
+                {
+                    "block": f"{item.start}-{item.start + item.size - 1}",
+                    "sample_rate": item.sample_rate,
+                    "probed": tried,
+                    "expected_yield": round(item.expected_yield, 4),
+                    "actual_yield": round(hits / tried, 4),
+                    "hits": hits,
+                }
+            )
+
+        summary = {
+            "block_size": self.block_size,
+            "probed": probed,
+            "expected_hits": round(expected_hits, 1),
+            "actual_hits": actual_hits,
+            "blocks": blocks,
+        }
+        module_logger.info(
+            f"Densidad: {probed} IDs visitados, {summary['expected_hits']} CvLAC "
+            f"esperados y {actual_hits} encontrados en {len(blocks)} bloques"
+        )
+        return summary
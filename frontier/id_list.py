@@ -0,0 +1,94 @@
+"""
+Lectura de listas de IDs de CvLAC desde un archivo o la entrada estándar.
+"""
+
+from config import ProjectLogger
+import sys
+
+
+# Configuramos el logger para este módulo
+logger = ProjectLogger()
+module_logger = logger.get_logger(__name__)
+
+
+def normalize_cod_rh(value):
+    """
+    Normaliza un código de investigador al formato de 10 dígitos.
+
+    Args:
+        value (str): Código leído ('1468382', '0001468382', ...).
+
+    Returns:
+        str: Código con ceros a la izquierda, o None si no es un ID válido.
+    """
+    value = value.strip()
+    if not value.isdigit():
+        return None
+    return "{:010d}".format(int(value))
+
+
+def iter_id_batches(path, batch_size, frontier=None):
+    """
+    Lee IDs de un archivo (o de la entrada estándar con '-') y los entrega en
+    lotes a medida que se leen, sin cargar toda la lista en memoria.
+
+    Se ignoran las líneas vacías y las que empiezan con '#'. Cada ID se
+    entrega una sola vez y, si se indica la frontera, se omiten los que ya
+    tienen un estado terminal.
+
+    Args:
+        path (str): Ruta del archivo, o '-' para la entrada estándar.
+        batch_size (int): IDs por lote.
+        frontier (FrontierStore, optional): Frontera para omitir los IDs terminados.
+
+    Yields:
+        list: Lotes de cod_rh con ceros a la izquierda.
+    """
+    stream = sys.stdin if path == "-" else open(path, "r")
+    seen = set()
+    batch = []
+    counts = {"read": 0, "invalid": 0, "duplicated": 0, "skipped": 0}
+
+    def emit(batch):
+        if frontier is None:
+            return batch
+        pending = frontier.filter_pending(batch)
+        counts["skipped"] += len(batch) - len(pending)
+        return pending
+
+    try:
+        for line in stream:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            counts["read"] += 1
+            cod_rh = normalize_cod_rh(line)
+            if cod_rh is None:
+                counts["invalid"] += 1
+                module_logger.warning(f"ID inválido en {path}: {line!r}")
+                continue
+            if cod_rh in seen:
+                counts["duplicated"] += 1
+                continue
+
+            seen.add(cod_rh)
+            batch.append(cod_rh)
+            if len(batch) >= batch_size:
+                pending = emit(batch)
+                batch = []
+                if pending:
+                    yield pending
+
+        if batch:
+            pending = emit(batch)
+            if pending:
+                yield pending
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        module_logger.info(
+            f"Lista de IDs {path}: {counts['read']} leídos, {len(seen)} únicos, "
+            f"{counts['duplicated']} duplicados, {counts['invalid']} inválidos, "
+            f"{counts['skipped']} ya procesados"
+        )
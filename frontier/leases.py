@@ -0,0 +1,337 @@
+"""
+Coordinación de varios nodos mediante leases sobre bloques de IDs en Postgres.
+"""
+
+from collections import namedtuple
+from config import ProjectLogger, project_settings
+from validators.schema_catalog import SchemaCatalog
+import os
+import socket
+import threading
+
+
+# Configuramos el logger para este módulo
+logger = ProjectLogger()
+module_logger = logger.get_logger(__name__)
+
+
+# Bloque de IDs tomado por un worker (range_end excluido)
+ChunkLease = namedtuple(
+    "ChunkLease", ["chunk_id", "range_start", "range_end", "attempts"]
+)
+
+
+class ChunkLeases:
+    """
+    Reparte bloques de IDs entre workers de uno o varios nodos a través de
+    la tabla crawl_chunk.
+
+    Un worker toma el primer bloque pendiente (o con el lease vencido) con
+    SELECT ... FOR UPDATE SKIP LOCKED, de modo que dos workers nunca toman el
+    mismo bloque ni se bloquean entre sí. Mientras lo procesa renueva el
+    lease con heartbeats; si el nodo muere, el lease vence y otro worker
+    retoma el bloque. Agregar nodos solo agrega consumidores de la misma
+    tabla, sin repartir rangos a mano.
+
+    Cada toma cuenta como un intento. Un bloque devuelto para reintentarlo
+    no se vuelve a tomar hasta pasados chunk_retry_delay segundos, y los
+    bloques que agotaron frontier_max_attempts intentos (incluidos los que
+    tumban al nodo y dejan vencer su lease) ya no se toman.
+    """
+
+    TABLE = "crawl_chunk"
+
+    PENDING = "pending"
+    LEASED = "leased"
+    DONE = "done"
+
+    SEED_QUERY = """
+        INSERT INTO public.crawl_chunk (range_start, range_end)
+        SELECT start_id, LEAST(start_id + %(size)s, %(range_end)s)
+        FROM generate_series(%(range_start)s, %(range_end)s - 1, %(size)s) AS start_id
+        ON CONFLICT (range_start, range_end) DO NOTHING
+    """
+
+    CLAIM_QUERY = """
+        UPDATE public.crawl_chunk
+        SET status = 'leased',
+            lease_owner = %(owner)s,
+            lease_expires_at = now() + make_interval(secs => %(lease_seconds)s),
+            attempts = attempts + 1
+        WHERE chunk_id = (
+            SELECT chunk_id
+            FROM public.crawl_chunk
+            WHERE range_start >= %(range_start)s
+              AND range_end <= %(range_end)s
+              AND attempts < %(max_attempts)s
+              AND (
+                  (status = 'pending' AND (retry_at IS NULL OR retry_at <= now()))
+                  OR (status = 'leased' AND lease_expires_at < now())
+              )
+            ORDER BY range_start
+            LIMIT 1
+            FOR UPDATE SKIP LOCKED
+        )
+        RETURNING chunk_id, range_start, range_end, attempts
+    """
+
+    RENEW_QUERY = """
+        UPDATE public.crawl_chunk
+        SET lease_expires_at = now() + make_interval(secs => %(lease_seconds)s)
+        WHERE chunk_id = %(chunk_id)s AND lease_owner = %(owner)s AND status = 'leased'
+    """
+
+    COMPLETE_QUERY = """
+        UPDATE public.crawl_chunk
+        SET status = 'done', completed_at = now(), lease_expires_at = NULL
+        WHERE chunk_id = %(chunk_id)s AND lease_owner = %(owner)s
+    """
+
+    RELEASE_QUERY = """
+        UPDATE public.crawl_chunk
+        SET status = 'pending',
+            lease_owner = NULL,
+            lease_expires_at = NULL,
+            attempts = attempts - %(refund)s,
+            retry_at = now() + make_interval(secs => %(retry_delay)s)
+        WHERE chunk_id = %(chunk_id)s AND lease_owner = %(owner)s AND status = 'leased'
+    """
+
+    RETRY_WAIT_QUERY = """
+        SELECT EXTRACT(EPOCH FROM MIN(retry_at) - now())
+        FROM public.crawl_chunk
+        WHERE range_start >= %(range_start)s
+          AND range_end <= %(range_end)s
+          AND status = 'pending'
+          AND attempts < %(max_attempts)s
+          AND retry_at > now()
+    """
+
+    PROGRESS_QUERY = """
+        SELECT CASE
+                   WHEN status = 'done' THEN 'done'
+                   WHEN status = 'leased' AND lease_expires_at >= now() THEN 'leased'
+                   WHEN attempts >= %(max_attempts)s THEN 'exhausted'
+                   WHEN status = 'leased' THEN 'expired'
+                   ELSE status
+               END,
+               COUNT(*)
+        FROM public.crawl_chunk
+        WHERE range_start >= %(range_start)s AND range_end <= %(range_end)s
+        GROUP BY 1
+    """
+
+    def __init__(self, db_connection, scraper_config=None):
+        """
+        Inicializa el coordinador.
+
+        Args:
+            db_connection: Instancia de la clase DatabaseConnection.
+            scraper_config (dict, optional): Configuración del scraper. Por defecto
+                                             project_settings.scraper.
+        """
+        self.db = db_connection
+        self.schema = SchemaCatalog(db_connection)
+        self.config = scraper_config or project_settings.scraper
+        self.lease_seconds = self.config.get("lease_seconds", 300)
+        self.retry_delay = self.config.get("chunk_retry_delay", 60)
+        self.max_attempts = self.config.get("frontier_max_attempts", 5)
+
+    @property
+    def available(self):
+        """Indica si la tabla crawl_chunk existe en la base de datos."""
+        return self.schema.table_exists(self.TABLE)
+
+    @staticmethod
+    def owner_id():
+        """Identificador del worker actual: host y pid."""
+        return f"{socket.gethostname()}:{os.getpid()}"
+
+    def _execute(self, query, params, fetch=False):
+        """Ejecuta una sentencia en su propia transacción."""
+        connection = self.db.get_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(query, params)
+            result = cursor.fetchall() if fetch else cursor.rowcount
+            connection.commit()
+            return result
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+
+    def seed(self, range_start, range_end, chunk_size):
+        """
+        Crea los bloques de un rango que aún no existen. Es seguro llamarlo
+        desde todos los nodos.
+
+        Args:
+            range_start (int): Primer ID.
+            range_end (int): ID final (excluido).
+            chunk_size (int): IDs por bloque.
+
+        Returns:
+            int: Bloques creados.
+        """
+        created = self._execute(
+            self.SEED_QUERY,
+            {"range_start": range_start, "range_end": range_end, "size": chunk_size},
+        )
+        if created:
+            module_logger.info(
+                f"{created} bloques de {chunk_size} IDs creados para {range_start}-{range_end - 1}"
+            )
+        return created
+
+    def claim(self, range_start, range_end, owner):
+        """
+        Toma el siguiente bloque libre del rango que no agotó sus intentos.
+
+        Args:
+            range_start (int): Primer ID del rango coordinado.
+            range_end (int): ID final (excluido).
+            owner (str): Identificador del worker.
+
+        Returns:
+            ChunkLease: Bloque tomado, o None si no quedan bloques libres.
+        """
+        rows = self._execute(
+            self.CLAIM_QUERY,
+            {
+                "owner": owner,
+                "lease_seconds": self.lease_seconds,
+                "range_start": range_start,
+                "range_end": range_end,
+                "max_attempts": self.max_attempts,
+            },
+            fetch=True,
+        )
+        if not rows:
+            return None
+
+        chunk_id, start, end, attempts = rows[0]
+        if attempts > 1:
+            module_logger.info(
+                f"Retomando el bloque {start}-{end - 1} (intento {attempts})"
+            )
+        return ChunkLease(chunk_id, start, end, attempts)
+
+    def renew(self, lease, owner):
+        """
+        Extiende el lease de un bloque.
+
+        Returns:
+            bool: False si el lease se perdió (venció y otro worker lo tomó).
+        """
+        return bool(
+            self._execute(
+                self.RENEW_QUERY,
+                {
+                    "chunk_id": lease.chunk_id,
+                    "owner": owner,
+                    "lease_seconds": self.lease_seconds,
+                },
+            )
+        )
+
+    def complete(self, lease, owner):
+        """Marca un bloque como terminado."""
+        self._execute(self.COMPLETE_QUERY, {"chunk_id": lease.chunk_id, "owner": owner})
+
+    def release(self, lease, owner, retry=True):
+        """
+        Devuelve un bloque a pendiente.
+
+        Args:
+            lease (ChunkLease): Bloque tomado.
+            owner (str): Identificador del worker.
+            retry (bool, optional): True si el procesamiento falló o quedó
+                                    incompleto: el intento cuenta y el bloque
+                                    espera chunk_retry_delay segundos. False si
+                                    se interrumpió por la parada: el intento no
+                                    cuenta y el bloque queda libre de inmediato.
+        """
+        self._execute(
+            self.RELEASE_QUERY,
+            {
+                "chunk_id": lease.chunk_id,
+                "owner": owner,
+                "refund": 0 if retry else 1,
+                "retry_delay": self.retry_delay if retry else 0,
+            },
+        )
+
+    def retry_wait(self, range_start, range_end):
+        """
+        Segundos hasta que el próximo bloque devuelto del rango se pueda tomar.
+
+        Args:
+            range_start (int): Primer ID del rango coordinado.
+            range_end (int): ID final (excluido).
+
+        Returns:
+            float: Segundos de espera, o None si no hay bloques esperando reintento.
+        """
+        rows = self._execute(
+            self.RETRY_WAIT_QUERY,
+            {
+                "range_start": range_start,
+                "range_end": range_end,
+                "max_attempts": self.max_attempts,
+            },
+            fetch=True,
+        )
+        if not rows or rows[0][0] is None:
+            return None
+        return max(0.0, float(rows[0][0]))
+
+    def progress(self, range_start, range_end):
+        """
+        Cuenta los bloques del rango por estado.
+
+        Returns:
+            dict: Bloques pending, leased, expired, exhausted (sin intentos
+                  restantes) y done.
+        """
+        rows = self._execute(
+            self.PROGRESS_QUERY,
+            {
+                "range_start": range_start,
+                "range_end": range_end,
+                "max_attempts": self.max_attempts,
+            },
+            fetch=True,
+        )
+        return dict(rows)
+
+    def heartbeat(self, lease, owner):
+        """
+        Inicia un hilo que renueva el lease cada tercio de lease_seconds.
+
+        Args:
+            lease (ChunkLease): Bloque tomado.
+            owner (str): Identificador del worker.
+
+        Returns:
+            threading.Event: Evento que detiene el heartbeat al activarlo.
+        """
+        stop = threading.Event()
+        interval = max(1, self.lease_seconds / 3)
+
+        def beat():
+            while not stop.wait(interval):
+                try:
+                    if not self.renew(lease, owner):
+                        module_logger.warning(
+                            f"Se perdió el lease del bloque {lease.range_start}-{lease.range_end - 1}"
+                        )
+                        return
+                except Exception as e:
+                    module_logger.warning(
+                        f"Error renovando el lease del bloque {lease.chunk_id}: {str(e)}"
+                    )
+
+        threading.Thread(target=beat, daemon=True).start()
+        return stop
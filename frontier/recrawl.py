@@ -0,0 +1,189 @@
+"""
+Priorización de la actualización de los CvLAC conocidos.
+"""
+
+from config import ProjectLogger, project_settings
+from validators.schema_catalog import SchemaCatalog
+import math
+
+
+# Configuramos el logger para este módulo
+logger = ProjectLogger()
+module_logger = logger.get_logger(__name__)
+
+
+class RecrawlPlanner:
+    """
+    Ordena los CvLAC de identificacion según la probabilidad de que hayan
+    cambiado desde la última descarga y elige los primeros dentro de un
+    presupuesto de peticiones.
+
+    Cada descarga de un CvLAC conocido se registra en la tabla cvlac_refresh
+    (fecha de la primera y la última revisión, número de revisiones y de
+    cambios). La tasa de cambios por día de cada CvLAC se suaviza hacia la
+    tasa global con PRIOR_DAYS días ficticios, y la probabilidad de cambio
+    es 1 - exp(-tasa * días desde la última descarga). Los CvLAC sin fecha
+    de descarga (ni en cvlac_refresh ni en cvlac_fingerprint) van primero.
+    """
+
+    TABLE = "cvlac_refresh"
+
+    # Días ficticios con la tasa global que se suman a cada CvLAC
+    PRIOR_DAYS = 90
+
+    # Tasa de cambios por día mientras no haya historial (uno cada 180 días)
+    DEFAULT_RATE = 1 / 180
+
+    RECORD_QUERY = """
+        INSERT INTO public.cvlac_refresh (cvlac_id, first_checked_at, checked_at, checks, changes)
+        VALUES (%(cvlac_id)s, now(), now(), 1, 0)
+        ON CONFLICT (cvlac_id) DO UPDATE
+        SET checked_at = now(),
+            checks = cvlac_refresh.checks + 1,
+            changes = cvlac_refresh.changes + CASE WHEN %(changed)s THEN 1 ELSE 0 END,
+            changed_at = CASE WHEN %(changed)s THEN now() ELSE cvlac_refresh.changed_at END
+    """
+
+    def __init__(self, db_connection, scraper_config=None):
+        """
+        Inicializa el planificador.
+
+        Args:
+            db_connection: Instancia de la clase DatabaseConnection.
+            scraper_config (dict, optional): Configuración del scraper. Por defecto
+                                             project_settings.scraper.
+        """
+        self.db = db_connection
+        self.schema = SchemaCatalog(db_connection)
+        self.config = scraper_config or project_settings.scraper
+        self._stats = {}
+
+    @property
+    def available(self):
+        """Indica si la tabla cvlac_refresh existe en la base de datos."""
+        return self.schema.table_exists(self.TABLE)
+
+    def record(self, cod_rh, changed, connection):
+        """
+        Registra la descarga de un CvLAC conocido.
+
+        Args:
+            cod_rh (str): Código del investigador.
+            changed (bool): True si el contenido cambió respecto de la huella
+                            registrada; None si no se comparó.
+            connection: Conexión a la base de datos.
+        """
+        if not self.available:
+            return
+
+        try:
+            cursor = connection.cursor()
+            cursor.execute(self.RECORD_QUERY, {"cvlac_id": cod_rh, "changed": changed})
+            connection.commit()
+        except Exception as e:
+            connection.rollback()
+            module_logger.warning(
+                f"No se pudo registrar la revisión de {cod_rh}: {str(e)}"
+            )
+
+    def _known_query(self):
+        """Consulta de los CvLAC conocidos con su antigüedad e historial de cambios."""
+        columns = ["i.cvlac_id"]
+        joins = []
+        last_checked = []
+
+        if self.available:
+            joins.append("LEFT JOIN public.cvlac_refresh r ON r.cvlac_id = i.cvlac_id")
+            last_checked.append("r.checked_at")
+            history = (
+                "EXTRACT(EPOCH FROM r.checked_at - r.first_checked_at) / 86400",
+                "COALESCE(r.changes, 0)",
+            )
+        else:
+            history = ("NULL", "0")
+
+        if self.schema.table_exists("cvlac_fingerprint"):
+            joins.append(
+                "LEFT JOIN public.cvlac_fingerprint f ON f.cvlac_id = i.cvlac_id"
+            )
+            last_checked.append("f.updated_at")
+
+        if last_checked:
+            columns.append(
+                f"EXTRACT(EPOCH FROM now() - COALESCE({', '.join(last_checked)})) / 86400"
+            )
+        else:
+            columns.append("NULL")
+        columns.extend(history)
+
+        return f"SELECT {', '.join(columns)} FROM public.identificacion i " + " ".join(
+            joins
+        )
+
+    def plan(self, budget):
+        """
+        Elige los CvLAC a actualizar.
+
+        Args:
+            budget (int): Número máximo de CvLAC (peticiones) de la ejecución.
+
+        Returns:
+            list: cod_rh ordenados del más al menos probable de haber cambiado.
+        """
+        connection = self.db.get_connection()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(self._known_query())
+            rows = cursor.fetchall()
+            connection.commit()
+        finally:
+            connection.close()
+
+        # Tasa global de cambios por día observado
+        total_changes = sum(changes for _, _, _, changes in rows)
+        total_days = sum(float(span or 0) for _, _, span, _ in rows)
+        global_rate = (
+            total_changes / total_days
+            if total_changes and total_days
+            else self.DEFAULT_RATE
+        )
+
+        ranked = []
+        for cvlac_id, age, span, changes in rows:
+            if age is None:
+                score = 1.0
+                age = math.inf
+            else:
+                age = float(age)
+                rate = (changes + self.PRIOR_DAYS * global_rate) / (
+                    float(span or 0) + self.PRIOR_DAYS
+                )
+                score = 1 - math.exp(-rate * max(age, 0.0))
+            ranked.append((score, age, cvlac_id))
+
+        ranked.sort(key=lambda item: (-item[0], -item[1]))
+        selected = ranked[: max(0, budget)]
+
+        self._stats = {
+            "known": len(ranked),
+            "selected": len(selected),
+            "never_checked": sum(1 for _, age, _ in selected if age == math.inf),
+            "global_change_rate": round(global_rate, 5),
+            "expected_changes": round(sum(score for score, _, _ in selected), 1),
+            "min_score": round(selected[-1][0], 4) if selected else 0.0,
+        }
+        module_logger.info(
+            f"Actualización: {len(selected)} de {len(ranked)} CvLAC conocidos, "
+            f"{self._stats['expected_changes']} cambios esperados"
+        )
+        return [cvlac_id for _, _, cvlac_id in selected]
+
+    def stats(self):
+        """
+        Retorna el resumen del último plan.
+
+        Returns:
+            dict: CvLAC conocidos, elegidos, sin fecha de descarga, tasa global y
+                  cambios esperados.
+        """
+        return dict(self._stats)
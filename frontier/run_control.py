@@ -0,0 +1,272 @@
+"""
+Control de la ejecución: parada ordenada, presupuestos y checkpoints.
+"""
+
+from pathlib import Path
+from config import ProjectLogger, project_settings
+import json
+import multiprocessing
+import os
+import signal
+import threading
+import time
+
+
+# Configuramos el logger para este módulo
+logger = ProjectLogger()
+module_logger = logger.get_logger(__name__)
+
+
+class RunControl:
+    """
+    Decide cuándo debe terminar una ejecución y guarda su avance.
+
+    La ejecución se detiene de forma ordenada con SIGINT/SIGTERM, al cumplir
+    max_duration segundos o al procesar max_cvs CvLAC. Al detenerse no se
+    toman IDs nuevos, pero los CvLAC en curso terminan de escribirse; los
+    IDs no procesados quedan pendientes en la frontera y la siguiente
+    ejecución los retoma. Un segundo SIGINT interrumpe de inmediato.
+
+    El evento de parada y el contador de CvLAC se comparten con los workers
+    del Pool mediante attach() como inicializador; los workers ignoran
+    SIGINT y esperan a que el proceso principal pida la parada.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, scraper_config=None):
+        """Implementa el patrón Singleton para compartir el control en el proceso."""
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(RunControl, cls).__new__(cls)
+                cls._instance._initialized = False
+            return cls._instance
+
+    def __init__(self, scraper_config=None):
+        """
+        Inicializa el control.
+
+        Args:
+            scraper_config (dict, optional): Configuración del scraper. Por defecto
+                                             project_settings.scraper.
+        """
+        if self._initialized:
+            return
+
+        self.config = scraper_config or project_settings.scraper
+        self.checkpoint_path = Path(
+            self.config.get(
+                "checkpoint_path",
+                os.path.join(
+                    self.config.get("state_dir", "temp/state"), "checkpoint.json"
+                ),
+            )
+        )
+        self.checkpoint_interval = self.config.get("checkpoint_interval", 60)
+        self.reason = None
+        self._stop_event = threading.Event()
+        self._cvs = None
+        self._local_cvs = 0
+        self._deadline = None
+        self._max_cvs = 0
+        self._started = time.time()
+        self._checkpoint_stop = None
+        self._checkpoint_thread = None
+        self._initialized = True
+
+    def start(self):
+        """
+        Fija los presupuestos de la ejecución y crea los objetos compartidos
+        con los workers. Se llama en el proceso principal antes de crear el Pool.
+        """
+        max_duration = self.config.get("max_duration", 0)
+        self._max_cvs = self.config.get("max_cvs", 0)
+        self._started = time.time()
+        self._deadline = self._started + max_duration if max_duration else None
+        self._stop_event = multiprocessing.Event()
+        self._cvs = multiprocessing.Value("i", 0)
+
+    def shared(self):
+        """
+        Retorna los argumentos de attach() para el inicializador del Pool.
+
+        Returns:
+            tuple: (evento de parada, contador de CvLAC, fecha límite, máximo de CvLAC)
+        """
+        return self._stop_event, self._cvs, self._deadline, self._max_cvs
+
+    @classmethod
+    def attach(cls, stop_event, cvs, deadline, max_cvs):
+        """
+        Inicializador de los workers del Pool: comparte el estado del proceso
+        principal e ignora SIGINT.
+        """
+        control = cls()
+        control._stop_event = stop_event
+        control._cvs = cvs
+        control._deadline = deadline
+        control._max_cvs = max_cvs
+        cls.ignore_interrupts()
+
+    @staticmethod
+    def ignore_interrupts():
+        """
+        Inicializador de los procesos auxiliares: ignora SIGINT (la parada la
+        decide el proceso principal) y restablece SIGTERM heredado para que
+        Pool.terminate() siga funcionando.
+        """
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    def install_signal_handlers(self):
+        """Pide la parada ordenada con SIGINT/SIGTERM; un segundo SIGINT interrumpe."""
+
+        def handler(signum, frame):
+            name = signal.Signals(signum).name
+            if self._stop_event.is_set() and signum == signal.SIGINT:
+                signal.signal(signal.SIGINT, signal.default_int_handler)
+                raise KeyboardInterrupt
+            module_logger.warning(
+                f"{name} recibido: terminando los CvLAC en curso "
+                "(otro Ctrl+C interrumpe de inmediato)"
+            )
+            self.request_stop(name)
+
+        signal.signal(signal.SIGINT, handler)
+        signal.signal(signal.SIGTERM, handler)
+
+    def request_stop(self, reason):
+        """
+        Pide que la ejecución termine de forma ordenada.
+
+        Args:
+            reason (str): Motivo de la parada.
+        """
+        if self.reason is None:
+            self.reason = reason
+        self._stop_event.set()
+
+    def record_cv(self):
+        """Cuenta un CvLAC procesado y pide la parada al llegar a max_cvs."""
+        if self._cvs is None:
+            self._local_cvs += 1
+            count = self._local_cvs
+        else:
+            with self._cvs.get_lock():
+                self._cvs.value += 1
+                count = self._cvs.value
+        if self._max_cvs and count >= self._max_cvs:
+            self.request_stop("max_cvs")
+
+    @property
+    def cvs(self):
+        """CvLAC procesados en la ejecución (todos los procesos)."""
+        return self._cvs.value if self._cvs is not None else self._local_cvs
+
+    def should_stop(self):
+        """
+        Indica si no se deben tomar IDs nuevos.
+
+        Returns:
+            bool: True si se pidió la parada o se agotó algún presupuesto.
+        """
+        if self._stop_event.is_set():
+            return True
+        if self._deadline is not None and time.time() >= self._deadline:
+            self.request_stop("max_duration")
+            return True
+        return False
+
+    def iter_until_stopped(self, iterable):
+        """
+        Recorre un iterable hasta que se pida la parada.
+
+        Args:
+            iterable: Elementos a recorrer.
+
+        Yields:
+            Los elementos del iterable mientras no haya que detenerse.
+        """
+        for item in iterable:
+            if self.should_stop():
+                return
+            yield item
+
+    def stop_reason(self):
+        """
+        Motivo de la parada vista desde el proceso principal.
+
+        Returns:
+            str: Señal, max_duration, max_cvs o None si la ejecución terminó.
+        """
+        # La parada pudo pedirla un worker (presupuesto agotado)
+        if self.reason is None and self._stop_event.is_set():
+            if self._max_cvs and self.cvs >= self._max_cvs:
+                self.reason = "max_cvs"
+            elif self._deadline is not None and time.time() >= self._deadline:
+                self.reason = "max_duration"
+            else:
+                self.reason = "stop"
+        return self.reason
+
+    def checkpoint(self, state):
+        """
+        Escribe el checkpoint de la ejecución de forma atómica.
+
+        Args:
+            state (dict): Avance de la ejecución (modo, rango, contadores...).
+        """
+        data = {
+            "updated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "elapsed_seconds": round(time.time() - self._started, 1),
+            "cvs_processed": self.cvs,
+            "stop_reason": self.stop_reason(),
+        }
+        data.update(state)
+
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_name(
+            f".{self.checkpoint_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def start_checkpoints(self, state_func):
+        """
+        Escribe el checkpoint cada checkpoint_interval segundos en un hilo.
+
+        Args:
+            state_func (callable): Retorna el estado a guardar en cada checkpoint.
+        """
+        if not self.checkpoint_interval:
+            return
+        stop = threading.Event()
+
+        def loop():
+            while not stop.wait(self.checkpoint_interval):
+                try:
+                    self.checkpoint(state_func())
+                except Exception as e:
+                    module_logger.warning(
+                        f"No se pudo escribir el checkpoint: {str(e)}"
+                    )
+
+        thread = threading.Thread(target=loop, name="checkpoint", daemon=True)
+        thread.start()
+        self._checkpoint_stop = stop
+        self._checkpoint_thread = thread
+
+    def stop_checkpoints(self):
+        """
+        Detiene el hilo de checkpoints y espera a que termine el checkpoint
+        en curso, para que el checkpoint final no se escriba a la vez.
+        """
+        if self._checkpoint_stop is not None:
+            self._checkpoint_stop.set()
+            self._checkpoint_stop = None
+        if self._checkpoint_thread is not None:
+            if self._checkpoint_thread is not threading.current_thread():
+                self._checkpoint_thread.join()
+            self._checkpoint_thread = None
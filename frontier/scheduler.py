@@ -0,0 +1,139 @@
+"""
+Reparto dinámico del espacio de IDs en bloques para los workers.
+"""
+
+from config import project_settings
+import math
+import threading
+
+
+class ChunkScheduler:
+    """
+    Entrega bloques de IDs consecutivos cuyo tamaño se adapta al costo
+    observado por ID.
+
+    Cada bloque terminado actualiza un promedio móvil exponencial de los
+    segundos por ID; el siguiente bloque se dimensiona para durar cerca de
+    target_seconds, entre min_size y max_size. Hacia el final del rango los
+    bloques se achican (nunca más que una fracción de lo que queda por
+    worker) para que todos los workers terminen casi al mismo tiempo en
+    lugar de esperar a un bloque grande en una región densa.
+    """
+
+    # Peso de la última observación en el promedio de costo por ID
+    SMOOTHING = 0.3
+
+    def __init__(
+        self,
+        range_start,
+        range_end,
+        workers,
+        max_size=None,
+        min_size=None,
+        initial_size=None,
+        target_seconds=None,
+        scraper_config=None,
+    ):
+        """
+        Inicializa el planificador.
+
+        Args:
+            range_start (int): Primer ID.
+            range_end (int): ID final (excluido).
+            workers (int): Número de workers que consumen bloques.
+            max_size (int, optional): Tamaño máximo de un bloque. Por defecto 31250.
+            min_size (int, optional): Tamaño mínimo. Por defecto chunk_min_size.
+            initial_size (int, optional): Tamaño antes de tener mediciones. Por
+                                          defecto chunk_initial_size.
+            target_seconds (float, optional): Duración buscada de cada bloque. Por
+                                              defecto chunk_target_seconds.
+            scraper_config (dict, optional): Configuración del scraper. Por defecto
+                                             project_settings.scraper.
+        """
+        config = scraper_config or project_settings.scraper
+        self.range_start = range_start
+        self.range_end = range_end
+        self.workers = max(1, workers)
+        self.max_size = max(1, max_size or 31250)
+        self.min_size = max(
+            1, min(min_size or config.get("chunk_min_size", 250), self.max_size)
+        )
+        self.initial_size = initial_size or config.get("chunk_initial_size", 1000)
+        self.target_seconds = target_seconds or config.get("chunk_target_seconds", 120)
+        self.cost_per_id = None
+        self._next_id = range_start
+        self._completed_ids = 0
+        self._chunks = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self):
+        """IDs que aún no se han entregado."""
+        return max(0, self.range_end - self._next_id)
+
+    def _chunk_size(self):
+        """Tamaño del próximo bloque según el costo observado y lo que queda."""
+        if self.cost_per_id:
+            size = self.target_seconds / self.cost_per_id
+        else:
+            size = self.initial_size
+
+        # Autoplanificación guiada: no entregar más de la mitad de lo que le
+        # tocaría a cada worker con lo que queda
+        size = min(size, math.ceil(self.remaining / (2 * self.workers)))
+        return int(max(self.min_size, min(self.max_size, size)))
+
+    def next_chunk(self):
+        """
+        Entrega el siguiente bloque.
+
+        Returns:
+            tuple: (start_id, size), o None si ya se entregó todo el rango.
+        """
+        with self._lock:
+            if self._next_id >= self.range_end:
+                return None
+            size = min(self._chunk_size(), self.remaining)
+            start_id = self._next_id
+            self._next_id += size
+            self._chunks += 1
+            return start_id, size
+
+    def record(self, size, elapsed):
+        """
+        Registra la duración de un bloque terminado.
+
+        Args:
+            size (int): IDs del bloque.
+            elapsed (float): Segundos que tardó el worker.
+        """
+        if size <= 0:
+            return
+        cost = max(elapsed, 0.0) / size
+        with self._lock:
+            self._completed_ids += size
+            if self.cost_per_id is None:
+                self.cost_per_id = cost
+            else:
+                self.cost_per_id = (
+                    self.SMOOTHING * cost + (1 - self.SMOOTHING) * self.cost_per_id
+                )
+
+    def stats(self):
+        """
+        Retorna el avance del planificador.
+
+        Returns:
+            dict: Bloques entregados, IDs completados, avance y costo por ID.
+        """
+        total = self.range_end - self.range_start
+        with self._lock:
+            return {
+                "chunks": self._chunks,
+                "completed_ids": self._completed_ids,
+                "progress": round(self._completed_ids / total, 4) if total else 1.0,
+                "cost_per_id": round(self.cost_per_id or 0.0, 5),
+                "next_chunk_size": (
+                    self._chunk_size() if self._next_id < self.range_end else 0
+                ),
+            }
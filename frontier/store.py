@@ -0,0 +1,399 @@
+"""
+Frontera de recorrido de los IDs de CvLAC con estado por ID.
+"""
+
+from pathlib import Path
+from config import ProjectLogger, project_settings
+import os
+import sqlite3
+import threading
+import time
+
+
+# Configuramos el logger para este módulo
+logger = ProjectLogger()
+module_logger = logger.get_logger(__name__)
+
+
+class FrontierStore:
+    """
+    Registro durable del estado de cada ID de CvLAC en una base SQLite en
+    modo WAL.
+
+    Cada ID pasa por uno de los estados:
+
+    - pending: conocido pero aún no intentado;
+    - in_flight: extracción iniciada (si el proceso muere, queda así);
+    - done: extraído o sin cambios;
+    - empty: la página no tiene un CvLAC;
+    - transient_error: error de red, timeout, 429/5xx o de la base de datos;
+    - permanent_error: 4xx o un CvLAC que no se pudo extraer.
+
+    Un rango se reanuda con los IDs nunca vistos, pendientes, en vuelo
+    (interrumpidos) y con errores transitorios. Cada inicio de extracción
+    cuenta como un intento: los IDs en vuelo o con error transitorio que
+    agotaron max_attempts (p. ej. un CvLAC que mata al worker en cada
+    intento) ya no se vuelven a intentar.
+    Las marcas se acumulan en memoria y se escriben en una sola transacción
+    cada batch_size marcas o cada commit_interval segundos; si el proceso
+    muere, las marcas sin escribir se vuelven a procesar al reanudar.
+    """
+
+    PENDING = "pending"
+    IN_FLIGHT = "in_flight"
+    DONE = "done"
+    EMPTY = "empty"
+    TRANSIENT_ERROR = "transient_error"
+    PERMANENT_ERROR = "permanent_error"
+
+    # Estados que no se vuelven a intentar
+    TERMINAL = (DONE, EMPTY, PERMANENT_ERROR)
+    # Estados que se reintentan hasta agotar max_attempts
+    RETRYABLE = (IN_FLIGHT, TRANSIENT_ERROR)
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS frontier (
+            cvlac_id INTEGER PRIMARY KEY,
+            status TEXT NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT,
+            first_seen REAL NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS frontier_status_idx ON frontier (status);
+        CREATE TABLE IF NOT EXISTS frontier_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+
+    UPSERT_QUERY = """
+        INSERT INTO frontier (cvlac_id, status, attempts, last_error, first_seen, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT (cvlac_id) DO UPDATE
+        SET status = excluded.status,
+            attempts = frontier.attempts + excluded.attempts,
+            last_error = excluded.last_error,
+            updated_at = excluded.updated_at
+    """
+
+    RANGE_QUERY = """
+        SELECT cvlac_id, status, attempts
+        FROM frontier
+        WHERE cvlac_id BETWEEN ? AND ?
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, scraper_config=None):
+        """Implementa el patrón Singleton para compartir la frontera en el proceso."""
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(FrontierStore, cls).__new__(cls)
+                cls._instance._initialized = False
+            return cls._instance
+
+    def __init__(self, scraper_config=None):
+        """
+        Inicializa la frontera.
+
+        Args:
+            scraper_config (dict, optional): Configuración del scraper. Por defecto
+                                             project_settings.scraper.
+        """
+        if self._initialized:
+            return
+
+        self.config = scraper_config or project_settings.scraper
+        self.path = Path(
+            self.config.get(
+                "frontier_path",
+                os.path.join(self.config.get("state_dir", "temp/state"), "frontier.db"),
+            )
+        )
+        self.batch_size = self.config.get("frontier_batch_size", 500)
+        self.commit_interval = self.config.get("frontier_commit_interval", 5)
+        self.max_attempts = self.config.get("frontier_max_attempts", 5)
+        self._connection = None
+        self._pid = None
+        self._batch = []
+        self._last_commit = time.monotonic()
+        self._initialized = True
+
+    def _connect(self):
+        """Retorna la conexión del proceso, abriéndola si es necesario (también tras un fork)."""
+        if self._connection is not None and self._pid == os.getpid():
+            return self._connection
+
+        # La conexión y las marcas heredadas pertenecen al proceso padre
+        self._batch = []
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(
+            self.path, timeout=60, isolation_level=None, check_same_thread=False
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(self.SCHEMA)
+        self._connection = connection
+        self._pid = os.getpid()
+        return connection
+
+    def migrate(self, tried_ids=None, processed_ids=None):
+        """
+        Importa una sola vez los IDs de los registros anteriores a la frontera.
+
+        Los procesados quedan como done y el resto de los intentados como
+        empty, que era el efecto de marcarlos como intentados: no se volvían
+        a descargar.
+
+        Args:
+            tried_ids (iterable, optional): IDs intentados (p. ej. un IdBitmap).
+            processed_ids (iterable, optional): IDs procesados.
+        """
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute(
+                    "SELECT value FROM frontier_meta WHERE key = 'legacy_migrated'"
+                ).fetchone()
+                if row is not None:
+                    connection.execute("COMMIT")
+                    return
+
+                now = time.time()
+                done = set(int(cod_rh) for cod_rh in (processed_ids or ()))
+                empty = set(int(cod_rh) for cod_rh in (tried_ids or ())) - done
+                connection.executemany(
+                    "INSERT OR IGNORE INTO frontier VALUES (?, ?, 1, NULL, ?, ?)",
+                    [(value, self.DONE, now, now) for value in sorted(done)]
+                    + [(value, self.EMPTY, now, now) for value in sorted(empty)],
+                )
+                connection.execute(
+                    "INSERT INTO frontier_meta VALUES ('legacy_migrated', ?)",
+                    (str(now),),
+                )
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+
+        if done or empty:
+            module_logger.info(
+                f"Frontera inicializada con {len(done)} IDs procesados y "
+                f"{len(empty)} intentados de los registros anteriores"
+            )
+
+    def mark(self, cod_rh, status, error=None):
+        """
+        Registra el estado de un ID. La escritura se difiere hasta el próximo lote.
+
+        Args:
+            cod_rh (str): Código del investigador.
+            status (str): Uno de los estados de FrontierStore.
+            error (str, optional): Último error del ID.
+        """
+        now = time.time()
+        attempts = 1 if status == self.IN_FLIGHT else 0
+        with self._lock:
+            self._connect()
+            self._batch.append((int(cod_rh), status, attempts, error, now, now))
+            if (
+                len(self._batch) >= self.batch_size
+                or time.monotonic() - self._last_commit >= self.commit_interval
+            ):
+                self._flush()
+
+    def flush(self):
+        """Escribe las marcas pendientes."""
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._flush()
+
+    def _flush(self):
+        """Escribe el lote actual en una transacción (con el bloqueo tomado)."""
+        self._last_commit = time.monotonic()
+        if not self._batch:
+            return
+
+        batch, self._batch = self._batch, []
+        try:
+            self._connection.execute("BEGIN IMMEDIATE")
+            self._connection.executemany(self.UPSERT_QUERY, batch)
+            self._connection.execute("COMMIT")
+        except sqlite3.Error as e:
+            try:
+                self._connection.execute("ROLLBACK")
+            except sqlite3.Error:
+                pass
+            module_logger.error(
+                f"Error escribiendo {len(batch)} marcas en la frontera: {str(e)}"
+            )
+
+    def pending_ids(self, first_id, last_id):
+        """
+        Retorna los IDs de un rango que hay que procesar.
+
+        Args:
+            first_id (int): Primer ID del rango.
+            last_id (int): Último ID del rango (incluido).
+
+        Returns:
+            list: cod_rh con ceros a la izquierda de los IDs nunca vistos o
+                  pendientes, y de los interrumpidos o con errores transitorios
+                  que no agotaron max_attempts.
+        """
+        self.flush()
+        with self._lock:
+            rows = self._connect().execute(self.RANGE_QUERY, (first_id, last_id))
+            known = {
+                cvlac_id: (status, attempts) for cvlac_id, status, attempts in rows
+            }
+
+        return [
+            "{:010d}".format(value)
+            for value in range(first_id, last_id + 1)
+            if self._is_pending(*known.get(value, (self.PENDING, 0)))
+        ]
+
+    def filter_pending(self, cod_rhs):
+        """
+        Filtra una lista de IDs dejando solo los que hay que procesar.
+
+        Args:
+            cod_rhs (list): Códigos de investigador con ceros a la izquierda.
+
+        Returns:
+            list: Los cod_rh pendientes, en el mismo orden.
+        """
+        if not cod_rhs:
+            return []
+
+        self.flush()
+        known = {}
+        values = [int(cod_rh) for cod_rh in cod_rhs]
+        with self._lock:
+            connection = self._connect()
+            # SQLite limita el número de parámetros por consulta
+            for i in range(0, len(values), 500):
+                chunk = values[i : i + 500]
+                rows = connection.execute(
+                    "SELECT cvlac_id, status, attempts FROM frontier "
+                    f"WHERE cvlac_id IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                )
+                known.update(
+                    (cvlac_id, (status, attempts))
+                    for cvlac_id, status, attempts in rows
+                )
+
+        return [
+            cod_rh
+            for cod_rh, value in zip(cod_rhs, values)
+            if self._is_pending(*known.get(value, (self.PENDING, 0)))
+        ]
+
+    def _is_pending(self, status, attempts):
+        """Indica si un ID con el estado e intentos dados se debe procesar."""
+        if status in self.TERMINAL:
+            return False
+        return not (status in self.RETRYABLE and attempts >= self.max_attempts)
+
+    def ids_with_status(self, first_id, last_id, status):
+        """
+        Retorna los IDs de un rango con un estado.
+
+        Args:
+            first_id (int): Primer ID del rango.
+            last_id (int): Último ID del rango (incluido).
+            status (str): Uno de los estados de FrontierStore.
+
+        Returns:
+            list: cod_rh con ceros a la izquierda.
+        """
+        self.flush()
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT cvlac_id FROM frontier WHERE cvlac_id BETWEEN ? AND ? AND status = ?",
+                (first_id, last_id, status),
+            )
+            return ["{:010d}".format(cvlac_id) for (cvlac_id,) in rows.fetchall()]
+
+    def counts(self, first_id=None, last_id=None):
+        """
+        Cuenta los IDs por estado.
+
+        Args:
+            first_id (int, optional): Primer ID del rango. Por defecto todos.
+            last_id (int, optional): Último ID del rango (incluido).
+
+        Returns:
+            dict: Número de IDs por estado.
+        """
+        self.flush()
+        query = "SELECT status, COUNT(*) FROM frontier"
+        params = ()
+        if first_id is not None and last_id is not None:
+            query += " WHERE cvlac_id BETWEEN ? AND ?"
+            params = (first_id, last_id)
+        with self._lock:
+            rows = self._connect().execute(query + " GROUP BY status", params)
+            return dict(rows.fetchall())
+
+    def block_outcomes(self, block_size, first_id=None, last_id=None, since=None):
+        """
+        Cuenta por bloque de IDs los CvLAC encontrados y los IDs con resultado
+        definitivo.
+
+        Args:
+            block_size (int): IDs por bloque.
+            first_id (int, optional): Primer ID del rango. Por defecto todos.
+            last_id (int, optional): Último ID del rango (incluido).
+            since (float, optional): Contar solo los IDs actualizados desde este
+                                     instante (time.time()).
+
+        Returns:
+            dict: {índice del bloque: (IDs done, IDs done/empty/permanent_error)}
+        """
+        self.flush()
+        query = """
+            SELECT cvlac_id / ?,
+                   SUM(status = ?),
+                   SUM(status IN (?, ?, ?))
+            FROM frontier
+            WHERE 1 = 1
+        """
+        params = [block_size, self.DONE, *self.TERMINAL]
+        if first_id is not None and last_id is not None:
+            query += " AND cvlac_id BETWEEN ? AND ?"
+            params += [first_id, last_id]
+        if since is not None:
+            query += " AND updated_at >= ?"
+            params.append(since)
+        with self._lock:
+            rows = self._connect().execute(query + " GROUP BY 1", params)
+            return {block: (hits, tried) for block, hits, tried in rows.fetchall()}
+
+    @classmethod
+    def status_for_http(cls, status_code):
+        """
+        Clasifica un código HTTP distinto de 200.
+
+        Args:
+            status_code (int): Código HTTP de la respuesta.
+
+        Returns:
+            str: TRANSIENT_ERROR para 429 y 5xx, PERMANENT_ERROR en otro caso.
+        """
+        if status_code == 429 or (status_code is not None and status_code >= 500):
+            return cls.TRANSIENT_ERROR
+        return cls.PERMANENT_ERROR
+
+    def close(self):
+        """Escribe las marcas pendientes y cierra la conexión."""
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._flush()
+                self._connection.close()
+            self._connection = None
@@ -3,12 +3,35 @@
 """
 Scraper principal para CvLAC.
 """
-from bs4 import BeautifulSoup
+from collections import namedtuple
 from urllib3.exceptions import InsecureRequestWarning
 from multiprocessing import Pool
+from functools import partial
 from config import ProjectLogger
-from extractors.utils import delete_data
+from extractors.utils import ExtractorUtils, delete_data, batched_writes, parse_html
+from extractors.section_index import SectionIndex
+from validators import FingerprintStore
+from pipeline import ExtractionPipeline, Reparser
+from frontier import (
+    ChunkLeases,
+    ChunkScheduler,
+    DensityIndex,
+    FrontierStore,
+    IdBitmap,
+    RecrawlPlanner,
+    RunControl,
+    iter_id_batches,
+    normalize_cod_rh,
+)
 from config import project_settings, db
+from fetching import (
+    AsyncFetcher,
+    HttpSession,
+    PageCache,
+    RateController,
+    StoredPages,
+    StreamProbe,
+)
 
 # Importar módulos de extracción específicos
 from extractors import (
@@ -34,7 +57,11 @@ import argparse
 import requests
 import datetime
 import urllib3
+import math
 import os
+import queue
+import random
+import time
 
 
 # Configurar el logger
@@ -50,6 +77,9 @@ class CvlacScraper:
     Clase principal para el scraper de CvLAC.
     """
 
+    # Ruta de un CvLAC dentro de base_url
+    CVLAC_URL = "{base_url}/cvlac/visualizador/generarCurriculoCv.do?cod_rh={cod_rh}"
+
     # Diccionario de funciones de extracción por título de sección
     EXTRACTORS = {
         "Formación Académica": formacion.extract_academic_formation,
@@ -122,66 +152,214 @@ class CvlacScraper:
         """
         Inicializa el scraper.
         """
-        # Cargar CVLACs ya procesados e intentados
-        self.processed_ids = self._load_processed_ids()
-        self.tried_ids = self._load_tried_ids()
-
         # Configuración del scraper
         self.scraper_config = project_settings.scraper
 
+        # CVLACs ya procesados (mapa de bits compartido entre procesos)
+        state_dir = self.scraper_config.get("state_dir", "temp/state")
+        self.processed_ids = IdBitmap.open(
+            os.path.join(state_dir, "processed.bitmap"), legacy_path="procesados.txt"
+        )
+
+        # Estado de cada ID para reanudar los rangos; la primera vez importa
+        # los IDs intentados y procesados de los registros anteriores
+        self.frontier = FrontierStore(self.scraper_config)
+        self.frontier.migrate(
+            IdBitmap.open(
+                os.path.join(state_dir, "tried.bitmap"),
+                legacy_path="cvlac_id_tries.txt",
+            ),
+            self.processed_ids,
+        )
+
+        # Caché en disco de las páginas descargadas (opcional)
+        self.cache = PageCache(self.scraper_config)
+
+        # Huellas del contenido para omitir los CvLAC sin cambios
+        self.fingerprints = FingerprintStore(db)
+
+        # Historial de revisiones para priorizar la actualización (--recrawl)
+        self.refresh = RecrawlPlanner(db, self.scraper_config)
+
+        # Pipeline por etapas (se crea en el primer lote y se reutiliza) y
+        # estadísticas de cada una de sus ejecuciones
+        self.pipeline = None
+        self.pipeline_stats = []
+
+        # Parada ordenada y presupuestos de la ejecución
+        self.control = RunControl(self.scraper_config)
+
         # Verificar conexión a BD al inicializar
         if not db.test_connection():
             main_logger.warning(
                 "Database connection failed. Some functionality may be limited."
             )
 
-    def _load_processed_ids(self):
+    def _mark_tried(self, cod_rh):
+        """
+        Registra el inicio de la extracción de un ID.
+
+        Args:
+            cod_rh (str): Código del investigador.
         """
-        Carga los IDs de CVLACs ya procesados.
+        self.frontier.mark(cod_rh, FrontierStore.IN_FLIGHT)
+
+    def _mark_processed(self, cod_rh):
+        """
+        Registra un ID como procesado.
+
+        Args:
+            cod_rh (str): Código del investigador.
+        """
+        self.processed_ids.add(cod_rh)
+        self.frontier.mark(cod_rh, FrontierStore.DONE)
+        self.control.record_cv()
+
+    def _skip_unchanged(self):
+        """Indica si se deben omitir los CvLAC cuyo contenido no cambió."""
+        return (
+            self.scraper_config.get("skip_unchanged", True)
+            and self.fingerprints.available
+        )
+
+    def should_parse(self, cod_rh, status_code, content, error, connection):
+        """
+        Indica si una página descargada debe parsearse.
+
+        Aplica sin construir el árbol HTML los mismos filtros que process_cvlac
+        hace antes de parsear: errores de descarga, códigos HTTP distintos de
+        200, páginas vacías y CvLAC sin cambios.
+
+        Args:
+            cod_rh (str): Código del investigador.
+            status_code (int): Código HTTP de la respuesta.
+            content (bytes): Cuerpo de la respuesta.
+            error (str): Error de red ocurrido durante la descarga.
+            connection: Conexión a la base de datos para consultar las huellas.
 
         Returns:
-            set: Conjunto de IDs procesados.
+            bool: True si la página contiene un CvLAC que hay que extraer.
         """
-        processed = set()
-        try:
-            if os.path.exists("procesados.txt"):
-                with open("procesados.txt", "r") as f:
-                    for line in f:
-                        processed.add(line.strip())
-            return processed
-        except Exception as ex:
-            main_logger.error(
-                f"Error cargando IDs procesados: {str(ex)}", exc_info=True
-            )
-            return processed
+        if error is not None or status_code != 200:
+            return False
+        if StreamProbe.looks_empty(content):
+            return False
+        if self._skip_unchanged():
+            content_hash = FingerprintStore.fingerprint(content)
+            return not self.fingerprints.is_unchanged(cod_rh, content_hash, connection)
+        return True
+
+    def build_url(self, cod_rh):
+        """
+        Construye la URL pública de un CvLAC.
+
+        Args:
+            cod_rh (str): Código del investigador.
 
-    def _load_tried_ids(self):
+        Returns:
+            str: URL del CvLAC.
         """
-        Carga los IDs de CVLACs ya intentados.
+        base_url = self.scraper_config.get(
+            "base_url", "https://scienti.minciencias.gov.co"
+        ).rstrip("/")
+        return self.CVLAC_URL.format(base_url=base_url, cod_rh=cod_rh)
+
+    def fetch_cvlac(self, cod_rh):
+        """
+        Descarga la página de un CvLAC.
+
+        Los timeouts, errores de red, 429 y 5xx se reintentan con backoff
+        exponencial con jitter hasta max_retries veces.
+
+        Args:
+            cod_rh (str): Código del investigador.
 
         Returns:
-            set: Conjunto de IDs intentados.
+            tuple: (status_code, content) de la última respuesta HTTP.
+
+        Raises:
+            requests.RequestException: Si el último intento falla por red o timeout.
         """
-        tried = set()
-        try:
-            if os.path.exists("cvlac_id_tries.txt"):
-                with open("cvlac_id_tries.txt", "r") as f:
-                    for line in f:
-                        tried.add(line.strip())
-            return tried
-        except Exception as ex:
-            main_logger.error(
-                f"Error cargando IDs intentados: {str(ex)}", exc_info=True
+        controller = RateController(self.scraper_config)
+
+        for attempt in range(controller.max_retries + 1):
+            last_attempt = attempt == controller.max_retries
+            status_code, content, error, retry_after = None, None, None, None
+            started = time.monotonic()
+
+            try:
+                # Sesión persistente del proceso: reutiliza las conexiones keep-alive
+                with HttpSession(self.scraper_config).get(
+                    self.build_url(cod_rh), stream=True
+                ) as response:
+                    status_code = response.status_code
+                    retry_after = controller.parse_retry_after(
+                        response.headers.get("Retry-After")
+                    )
+                    # Leer de forma incremental y cortar si la página está vacía
+                    probe = StreamProbe(self.scraper_config.get("probe_bytes", 32768))
+                    for chunk in response.iter_content(chunk_size=8192):
+                        if probe.feed(chunk) == StreamProbe.EMPTY:
+                            main_logger.debug(
+                                f"CvLAC {cod_rh} vacío, descarga interrumpida"
+                            )
+                            break
+                    content = probe.content
+            except requests.RequestException as ex:
+                error = str(ex)
+                controller.record(time.monotonic() - started, error=error)
+                if last_attempt:
+                    raise
+            else:
+                controller.record(time.monotonic() - started, status_code)
+                if last_attempt or not controller.is_retryable(status_code):
+                    return status_code, content
+
+            delay = controller.backoff(attempt, retry_after)
+            main_logger.debug(
+                f"Reintentando CvLAC {cod_rh} en {delay:.1f}s "
+                f"({error or f'HTTP {status_code}'})"
             )
-            return tried
+            time.sleep(delay)
 
     def extract_cvlac(self, cod_rh):
         """
-        Extrae la información de un CvLAC.
+        Descarga y extrae la información de un CvLAC.
 
         Args:
             cod_rh (str): Código del investigador.
 
+        Returns:
+            str: Ruta al reporte de extracción generado.
+        """
+        main_logger.info(f"Iniciando extracción para CvLAC: {cod_rh}")
+
+        # Usar la copia en caché si existe y no ha vencido
+        cached = self.cache.get(cod_rh)
+        if cached is not None:
+            main_logger.debug(f"CvLAC {cod_rh} leído de la caché")
+            return self.process_cvlac(cod_rh, cached.status_code, cached.content)
+
+        try:
+            status_code, content = self.fetch_cvlac(cod_rh)
+        except requests.RequestException as ex:
+            return self.process_cvlac(cod_rh, None, None, error=str(ex))
+
+        self.cache.put(cod_rh, status_code, content)
+        return self.process_cvlac(cod_rh, status_code, content)
+
+    def process_cvlac(self, cod_rh, status_code, content, error=None, parsed=None):
+        """
+        Extrae la información de un CvLAC ya descargado.
+
+        Args:
+            cod_rh (str): Código del investigador.
+            status_code (int): Código HTTP de la respuesta (None si falló la descarga).
+            content (bytes): Cuerpo de la respuesta.
+            error (str, optional): Error de red ocurrido durante la descarga.
+            parsed (ParsedCvlac, optional): Resultado de parse_cvlac si ya se parseó
+                                            en otro proceso.
+
         Returns:
             str: Ruta al reporte de extracción generado.
         """
@@ -189,95 +367,111 @@ class CvlacScraper:
         report_path = None
 
         try:
-            main_logger.info(f"Iniciando extracción para CvLAC: {cod_rh}")
-
             # Iniciar nueva extracción para estadísticas
             from validators import DataValidator
 
             validator = DataValidator(db)
             validator.start_new_extraction()
 
-            # Obtener conexión a la base de datos
-            connection = db.get_connection()
-
-            # Obtener la página CvLAC
-            url = f"https://scienti.minciencias.gov.co/cvlac/visualizador/generarCurriculoCv.do?cod_rh={cod_rh}"
-
-            headers = {"User-Agent": self.scraper_config.get("user_agent")}
-            timeout = self.scraper_config.get("timeout", 30)
-            verify_ssl = self.scraper_config.get("verify_ssl", False)
-
-            with requests.get(
-                url, headers=headers, timeout=timeout, verify=verify_ssl
-            ) as response:
-                if response.status_code != 200:
-                    main_logger.warning(
-                        f"Error al obtener CvLAC {cod_rh}. Status: {response.status_code}"
-                    )
-                    validator.record_extraction_result(
-                        cod_rh,
-                        success=False,
-                        error=f"HTTP Status {response.status_code}",
-                    )
-                    return None
-
-                html = BeautifulSoup(response.content, "lxml")
+            if error is not None:
+                main_logger.warning(f"Error al obtener CvLAC {cod_rh}: {error}")
+                validator.record_extraction_result(cod_rh, success=False, error=error)
+                self.frontier.mark(cod_rh, FrontierStore.TRANSIENT_ERROR, error)
+                return None
 
-                # Verificar si hay suficientes tablas
-                if len(html.find_all("table")) <= 2:  # Use find_all instead of findAll
-                    main_logger.warning(f"CvLAC {cod_rh} no tiene suficientes tablas")
-                    validator.record_extraction_result(
-                        cod_rh,
-                        success=False,
-                        error="No hay suficientes tablas en el CvLAC",
-                    )
-                    return None
+            if status_code != 200:
+                main_logger.warning(
+                    f"Error al obtener CvLAC {cod_rh}. Status: {status_code}"
+                )
+                validator.record_extraction_result(
+                    cod_rh,
+                    success=False,
+                    error=f"HTTP Status {status_code}",
+                )
+                self.frontier.mark(
+                    cod_rh,
+                    FrontierStore.status_for_http(status_code),
+                    f"HTTP Status {status_code}",
+                )
+                return None
+
+            # Descartar las páginas vacías sin construir el árbol HTML
+            if StreamProbe.looks_empty(content):
+                main_logger.warning(f"CvLAC {cod_rh} no tiene suficientes tablas")
+                validator.record_extraction_result(
+                    cod_rh,
+                    success=False,
+                    error=NOT_ENOUGH_TABLES,
+                )
+                self.frontier.mark(cod_rh, FrontierStore.EMPTY)
+                return None
 
-                # Eliminar datos previos si se está realizando una actualización completa
-                if self.scraper_config.get("remove_existing_data", True):
-                    delete_data(cod_rh, connection)
+            # Obtener conexión a la base de datos
+            connection = db.get_connection()
 
-                # Extraer identificación
-                nombre_completo = identificacion.extract(cod_rh, html, connection)
-                if not nombre_completo:
-                    main_logger.warning(
-                        f"No se pudo extraer identificación para CvLAC {cod_rh}"
+            # Omitir el CvLAC si su contenido no cambió desde la última extracción
+            content_hash = None
+            if self._skip_unchanged():
+                content_hash = FingerprintStore.fingerprint(content)
+                if self.fingerprints.is_unchanged(cod_rh, content_hash, connection):
+                    main_logger.info(
+                        f"CvLAC {cod_rh} sin cambios desde la última extracción"
                     )
                     validator.record_extraction_result(
-                        cod_rh, success=False, error="No se pudo extraer identificación"
+                        cod_rh, success=True, unchanged=True
                     )
+                    self.refresh.record(cod_rh, False, connection)
+                    self._mark_processed(cod_rh)
                     return None
 
-                # Extraer el resto de secciones
-                for h3 in html.find_all("h3"):
-                    section_title = h3.text
-                    extractor_func = self.EXTRACTORS.get(section_title)
+            # Parsear el HTML y ejecutar los extractores (el pipeline lo hace en otro proceso)
+            if parsed is None:
+                parsed = parse_cvlac(cod_rh, content)
 
-                    if extractor_func:
-                        try:
-                            main_logger.debug(
-                                f"Extrayendo sección: {section_title} para {cod_rh}"
-                            )
+            if parsed.error:
+                validator.record_extraction_result(
+                    cod_rh, success=False, error=parsed.error
+                )
+                self.frontier.mark(
+                    cod_rh,
+                    (
+                        FrontierStore.EMPTY
+                        if parsed.error == NOT_ENOUGH_TABLES
+                        else FrontierStore.PERMANENT_ERROR
+                    ),
+                    parsed.error,
+                )
+                return None
+
+            # Eliminar datos previos si se está realizando una actualización
+            # completa, en la misma transacción que los registros nuevos
+            delete = None
+            if self.scraper_config.get("remove_existing_data", True):
+                delete = partial(delete_data, cod_rh, commit=False)
+
+            # Escribir todos los registros del CvLAC en una sola transacción
+            with batched_writes(connection, before=delete) as buffer:
+                buffer.extend(parsed.rows)
+
+            # Con errores de escritura el CvLAC se vuelve a intentar al reanudar
+            if buffer.last_summary and buffer.last_summary["errors"]:
+                error = (
+                    f"{buffer.last_summary['errors']} registros con error de escritura"
+                )
+                main_logger.warning(f"CvLAC {cod_rh}: {error}")
+                validator.record_extraction_result(cod_rh, success=False, error=error)
+                self.frontier.mark(cod_rh, FrontierStore.TRANSIENT_ERROR, error)
+                return None
 
-                            # Caso especial para eventos científicos
-                            if section_title == "Eventos científicos":
-                                extractor_func(cod_rh, h3, nombre_completo, connection)
-                            else:
-                                extractor_func(cod_rh, h3, connection)
+            # Registrar la huella solo si todo el CvLAC se escribió sin errores
+            if content_hash and not parsed.section_errors:
+                self.fingerprints.record(cod_rh, content_hash, connection)
 
-                            main_logger.debug(
-                                f"Sección {section_title} extraída correctamente para {cod_rh}"
-                            )
-                        except Exception as ex:
-                            main_logger.error(
-                                f"Error extrayendo sección {section_title} para {cod_rh}: {str(ex)}",
-                                exc_info=True,
-                            )
+            # Sin huella (--force) no se sabe si el contenido cambió
+            self.refresh.record(cod_rh, True if content_hash else None, connection)
 
             # Registrar como procesado
-            with open("procesados.txt", "a") as f:
-                f.write(str(cod_rh) + "\n")
-            self.processed_ids.add(cod_rh)
+            self._mark_processed(cod_rh)
 
             # Generar reporte de extracción
             report_path = validator.finish_extraction(cod_rh)
@@ -289,6 +483,9 @@ class CvlacScraper:
                 f"Error general en extract_cvlac para {cod_rh}: {str(ex)}",
                 exc_info=True,
             )
+            # Se vuelve a intentar al reanudar el rango (p. ej. si la base de datos falló)
+            self.frontier.mark(cod_rh, FrontierStore.TRANSIENT_ERROR, str(ex))
+
             # Intentar registrar el error
             try:
                 if "validator" in locals():
@@ -304,13 +501,82 @@ class CvlacScraper:
 
         return report_path
 
-    def process_range(self, start_id, range_size=31250):
+    def close(self):
+        """Termina el pool de procesos del pipeline, si se creó."""
+        if self.pipeline is not None:
+            self.pipeline.close()
+            self.pipeline = None
+
+    def process_ids(self, ids):
+        """
+        Procesa una lista de IDs de CvLAC con el modo configurado: pipeline por
+        etapas, descarga asíncrona o secuencial. Si se pide la parada, los IDs
+        restantes no se procesan.
+
+        Args:
+            ids (list): Códigos de investigador con ceros a la izquierda.
+
+        Returns:
+            list: Lista de rutas a los reportes generados
+        """
+        reports = []
+
+        if self.scraper_config.get("pipeline", False):
+            # Descarga, parseo y escritura en etapas concurrentes
+            if self.pipeline is None:
+                self.pipeline = ExtractionPipeline(self, parse_cvlac)
+            reports.extend(self.pipeline.run(ids))
+            self.pipeline_stats.append(self.pipeline.stats)
+        elif self.scraper_config.get("async_fetch", False):
+            # Procesar primero las páginas en caché y descargar el resto
+            to_fetch = []
+            for cod_rh in self.control.iter_until_stopped(ids):
+                cached = self.cache.get(cod_rh)
+                if cached is None:
+                    to_fetch.append(cod_rh)
+                    continue
+                self._mark_tried(cod_rh)
+                report_path = self.process_cvlac(
+                    cod_rh, cached.status_code, cached.content
+                )
+                if report_path:
+                    reports.append(report_path)
+
+            # Descargar con el motor asíncrono y procesar a medida que llegan
+            fetcher = AsyncFetcher(self.build_url, self.scraper_config)
+            main_logger.info(
+                f"Descarga asíncrona con hasta {fetcher.concurrency} peticiones simultáneas"
+            )
+            for result in fetcher.iter_results(
+                self.control.iter_until_stopped(to_fetch)
+            ):
+                self._mark_tried(result.cod_rh)
+                self.cache.put(result.cod_rh, result.status_code, result.content)
+                report_path = self.process_cvlac(
+                    result.cod_rh, result.status_code, result.content, result.error
+                )
+                if report_path:
+                    reports.append(report_path)
+        else:
+            for cod_rh_formatted in self.control.iter_until_stopped(ids):
+                self._mark_tried(cod_rh_formatted)
+
+                # Extraer información
+                report_path = self.extract_cvlac(cod_rh_formatted)
+                if report_path:
+                    reports.append(report_path)
+
+        return reports
+
+    def process_range(self, start_id, range_size=31250, sample_rate=1.0):
         """
         Procesa un rango de IDs de CvLAC.
 
         Args:
             start_id (int): ID inicial.
             range_size (int, optional): Tamaño del rango. Por defecto 31250.
+            sample_rate (float, optional): Fracción de los IDs pendientes a visitar,
+                                           elegidos al azar. Por defecto todos.
 
         Returns:
             list: Lista de rutas a los reportes generados
@@ -325,22 +591,26 @@ class CvlacScraper:
         try:
             connection = db.get_connection()
 
-            for i in range(start_id, start_id + range_size):
-                cod_rh_formatted = "{:010d}".format(i)
+            # Reanudar el rango: omitir los IDs terminados y reintentar los
+            # interrumpidos y los que tuvieron errores transitorios
+            pending = self.frontier.pending_ids(start_id, start_id + range_size - 1)
 
-                # Verificar si ya se ha procesado o intentado
-                if cod_rh_formatted in self.tried_ids:
-                    continue
+            # Bloque poco denso: visitar solo una muestra, que incluye IDs ya
+            # vistos sin CvLAC para detectar registros nuevos; el resto de los
+            # pendientes queda para las siguientes ejecuciones
+            if sample_rate < 1:
+                candidates = pending + self.frontier.ids_with_status(
+                    start_id, start_id + range_size - 1, FrontierStore.EMPTY
+                )
+                if candidates:
+                    sample_size = max(1, math.ceil(len(candidates) * sample_rate))
+                    pending = sorted(random.sample(candidates, sample_size))
 
-                # Registrar como intentado
-                with open("cvlac_id_tries.txt", "a") as f:
-                    f.write(cod_rh_formatted + "\n")
-                self.tried_ids.add(cod_rh_formatted)
+            # Precargar las huellas del rango con una sola consulta
+            if pending and self._skip_unchanged():
+                self.fingerprints.preload(pending[0], pending[-1], connection)
 
-                # Extraer información
-                report_path = self.extract_cvlac(cod_rh_formatted)
-                if report_path:
-                    reports.append(report_path)
+            reports.extend(self.process_ids(pending))
 
             # Generar reporte de resumen para todo el rango
             if reports:
@@ -366,32 +636,347 @@ class CvlacScraper:
                 main_logger.info(f"Resumen del rango generado en: {summary_file}")
                 reports.append(summary_file)
 
+            main_logger.info(f"Estadísticas del pool de conexiones: {db.pool_stats()}")
+            main_logger.info(f"Estadísticas de la sesión HTTP: {HttpSession().stats()}")
+            main_logger.info(f"Estadísticas de descarga: {RateController().stats()}")
+            if self.cache.enabled:
+                main_logger.info(f"Estadísticas de la caché: {self.cache.stats()}")
+            main_logger.info(
+                f"Estado de la frontera del rango: "
+                f"{self.frontier.counts(start_id, start_id + range_size - 1)}"
+            )
+
         except Exception as ex:
             main_logger.error(f"Error en process_range: {str(ex)}", exc_info=True)
 
         finally:
+            self.frontier.flush()
             if connection:
                 connection.close()
 
         return reports
 
 
-def process_range_wrapper(start_id):
+# Error de las páginas sin CvLAC (dos tablas o menos)
+NOT_ENOUGH_TABLES = "No hay suficientes tablas en el CvLAC"
+
+# Resultado del parseo de un CvLAC. 'rows' es el contenido del WriteBuffer
+# ({tabla: [registros]}) para poder enviarlo entre procesos.
+ParsedCvlac = namedtuple("ParsedCvlac", ["cod_rh", "rows", "section_errors", "error"])
+
+
+def parse_cvlac(cod_rh, content, sections=None):
+    """
+    Construye el árbol HTML de un CvLAC (con el backend de scraper.parser) y
+    ejecuta los extractores.
+
+    No accede a la base de datos: los registros quedan en un WriteBuffer sin
+    escribir, de modo que la función puede ejecutarse en otro proceso.
+
+    Args:
+        cod_rh (str): Código del investigador.
+        content (bytes): Cuerpo de la respuesta.
+        sections (set, optional): Títulos de las secciones a extraer. Si se
+                                  indica, solo se conservan sus registros (la
+                                  identificación se extrae pero no se incluye).
+
+    Returns:
+        ParsedCvlac: Registros por tabla, secciones con error y el error que
+                     impidió la extracción (None si no hubo).
+    """
+    html = parse_html(content)
+
+    # Un solo recorrido del árbol para las tablas, los h3 y sus elementos
+    index = SectionIndex(html)
+
+    # Verificar si hay suficientes tablas
+    if index.table_count <= 2:
+        main_logger.warning(f"CvLAC {cod_rh} no tiene suficientes tablas")
+        return ParsedCvlac(cod_rh, {}, 0, NOT_ENOUGH_TABLES)
+
+    section_errors = 0
+    with batched_writes(None, flush=False) as buffer:
+        # Extraer identificación
+        nombre_completo = identificacion.extract(cod_rh, index, None)
+        if not nombre_completo:
+            main_logger.warning(f"No se pudo extraer identificación para CvLAC {cod_rh}")
+            return ParsedCvlac(cod_rh, {}, 0, "No se pudo extraer identificación")
+
+        # Con un filtro de secciones solo se conservan los registros de esas secciones
+        if sections is not None:
+            buffer.clear()
+
+        # Extraer el resto de secciones
+        for section in index.sections:
+            section_title = section.h3.text
+            if sections is not None and section_title not in sections:
+                continue
+            extractor_func = CvlacScraper.EXTRACTORS.get(section_title)
+
+            if extractor_func:
+                try:
+                    main_logger.debug(
+                        f"Extrayendo sección: {section_title} para {cod_rh}"
+                    )
+
+                    # Caso especial para eventos científicos
+                    if section_title == "Eventos científicos":
+                        extractor_func(cod_rh, section, nombre_completo, None)
+                    else:
+                        extractor_func(cod_rh, section, None)
+
+                    main_logger.debug(
+                        f"Sección {section_title} extraída correctamente para {cod_rh}"
+                    )
+                except Exception as ex:
+                    section_errors += 1
+                    main_logger.error(
+                        f"Error extrayendo sección {section_title} para {cod_rh}: {str(ex)}",
+                        exc_info=True,
+                    )
+
+    return ParsedCvlac(cod_rh, buffer.rows, section_errors, None)
+
+
+# Componentes por proceso cuyos contadores se agregan en el reporte de sesión
+RUNTIME_METRICS = {
+    "http_session": HttpSession,
+    "html_cache": PageCache,
+    "fetch_rate": RateController,
+}
+
+
+def take_runtime_metrics():
+    """
+    Obtiene los contadores de los componentes del proceso desde la última llamada.
+
+    Returns:
+        dict: Contadores por componente.
+    """
+    return {
+        name: component().take_stats() for name, component in RUNTIME_METRICS.items()
+    }
+
+
+def merge_runtime_metrics(metrics_list):
+    """
+    Combina los contadores reportados por varios procesos.
+
+    Args:
+        metrics_list (list): Lista de diccionarios retornados por take_runtime_metrics().
+
+    Returns:
+        dict: Contadores sumados por componente.
+    """
+    return {
+        name: component.merge_stats([metrics.get(name) for metrics in metrics_list])
+        for name, component in RUNTIME_METRICS.items()
+    }
+
+
+def process_range_wrapper(start_id, range_size=31250, sample_rate=1.0):
     """
     Función wrapper para procesar rangos en multiproceso.
 
     Args:
         start_id (int): ID inicial.
+        range_size (int, optional): Tamaño del rango. Por defecto 31250.
+        sample_rate (float, optional): Fracción de los IDs pendientes a visitar.
 
     Returns:
-        list: Lista de rutas a los reportes generados
+        tuple: (lista de rutas a los reportes generados, contadores del proceso,
+                segundos que tardó el rango)
     """
+    started = time.monotonic()
     try:
         scraper = CvlacScraper()
-        return scraper.process_range(start_id)
+        reports = scraper.process_range(start_id, range_size, sample_rate)
     except Exception as ex:
         main_logger.error(f"Error en process_range_wrapper: {str(ex)}", exc_info=True)
-        return []
+        reports = []
+    return reports, take_runtime_metrics(), time.monotonic() - started
+
+
+def process_ids_wrapper(ids):
+    """
+    Función wrapper para procesar listas de IDs en multiproceso.
+
+    Args:
+        ids (list): Códigos de investigador con ceros a la izquierda.
+
+    Returns:
+        tuple: (lista de rutas a los reportes generados, contadores del proceso)
+    """
+    try:
+        scraper = CvlacScraper()
+        reports = scraper.process_ids(ids)
+        scraper.frontier.flush()
+    except Exception as ex:
+        main_logger.error(f"Error en process_ids_wrapper: {str(ex)}", exc_info=True)
+        reports = []
+    return reports, take_runtime_metrics()
+
+
+def process_density_block(block):
+    """
+    Procesa un bloque del plan de densidad en un worker del Pool.
+
+    Args:
+        block (DensityBlock): Bloque a procesar.
+
+    Returns:
+        tuple: Resultado de process_range_wrapper.
+    """
+    return process_range_wrapper(block.start, block.size, block.sample_rate)
+
+
+def process_leased_chunks(range_start, range_end, worker_index=0):
+    """
+    Toma bloques de la tabla crawl_chunk y los procesa hasta que no queden
+    bloques libres en el rango (modo --coordinator).
+
+    Un bloque con IDs pendientes o con errores transitorios al terminar, o
+    cuyo procesamiento falló, se devuelve a la tabla para reintentarlo tras
+    chunk_retry_delay segundos, hasta frontier_max_attempts intentos.
+
+    Args:
+        range_start (int): Primer ID del rango coordinado.
+        range_end (int): ID final (excluido).
+        worker_index (int, optional): Número del worker en el nodo (solo para el log).
+
+    Returns:
+        tuple: (lista de rutas a los reportes generados, contadores del proceso)
+    """
+    reports = []
+    try:
+        leases = ChunkLeases(db)
+        owner = ChunkLeases.owner_id()
+        scraper = CvlacScraper()
+
+        while not scraper.control.should_stop():
+            lease = leases.claim(range_start, range_end, owner)
+            if lease is None:
+                # Esperar a los bloques devueltos que aún no se pueden reintentar
+                wait = leases.retry_wait(range_start, range_end)
+                if wait is None:
+                    break
+                time.sleep(min(wait, 5) or 0.1)
+                continue
+
+            main_logger.info(
+                f"Worker {worker_index} ({owner}) tomó el bloque "
+                f"{lease.range_start}-{lease.range_end - 1}"
+            )
+            stop_heartbeat = leases.heartbeat(lease, owner)
+            try:
+                reports.extend(
+                    scraper.process_range(
+                        lease.range_start, lease.range_end - lease.range_start
+                    )
+                )
+            except Exception as ex:
+                main_logger.error(
+                    f"Error procesando el bloque {lease.range_start}-"
+                    f"{lease.range_end - 1}, se devuelve para reintentarlo: {str(ex)}",
+                    exc_info=True,
+                )
+                leases.release(lease, owner)
+                continue
+            finally:
+                stop_heartbeat.set()
+
+            remaining = scraper.frontier.pending_ids(
+                lease.range_start, lease.range_end - 1
+            )
+            if remaining and scraper.control.should_stop():
+                # Un bloque interrumpido por la parada se devuelve sin contar el intento
+                leases.release(lease, owner, retry=False)
+            elif remaining and lease.attempts < leases.max_attempts:
+                main_logger.warning(
+                    f"Bloque {lease.range_start}-{lease.range_end - 1} con "
+                    f"{len(remaining)} IDs pendientes, se devuelve para reintentarlo"
+                )
+                leases.release(lease, owner)
+            else:
+                leases.complete(lease, owner)
+    except Exception as ex:
+        main_logger.error(f"Error en process_leased_chunks: {str(ex)}", exc_info=True)
+
+    return reports, take_runtime_metrics()
+
+
+def iter_scheduled_ranges(scheduler, workers):
+    """
+    Procesa los bloques de un ChunkScheduler y entrega los resultados a
+    medida que terminan.
+
+    Cada worker tiene a lo sumo dos bloques asignados; al terminar uno se
+    pide al planificador el siguiente, cuyo tamaño ya refleja el costo
+    observado, de modo que ningún worker queda con una parte fija y grande
+    del rango mientras los demás esperan.
+
+    Args:
+        scheduler (ChunkScheduler): Planificador de bloques.
+        workers (int): Número de procesos (1 = en el proceso actual).
+
+    Yields:
+        tuple: (start_id, range_size, reportes, contadores del proceso)
+    """
+    if workers <= 1:
+        while True:
+            chunk = scheduler.next_chunk()
+            if chunk is None or RunControl().should_stop():
+                return
+            reports, metrics, elapsed = process_range_wrapper(*chunk)
+            scheduler.record(chunk[1], elapsed)
+            yield chunk[0], chunk[1], reports, metrics
+
+    finished = queue.Queue()
+    control = RunControl()
+    with Pool(
+        workers, initializer=RunControl.attach, initargs=control.shared()
+    ) as pool:
+        in_flight = 0
+
+        def submit():
+            # Al pedir la parada solo se esperan los bloques en curso
+            if control.should_stop():
+                return False
+            chunk = scheduler.next_chunk()
+            if chunk is None:
+                return False
+            pool.apply_async(
+                process_range_wrapper,
+                chunk,
+                callback=lambda result, chunk=chunk: finished.put((chunk, result)),
+                error_callback=lambda ex, chunk=chunk: finished.put((chunk, ex)),
+            )
+            return True
+
+        for _ in range(2 * workers):
+            if submit():
+                in_flight += 1
+
+        while in_flight:
+            (start_id, range_size), result = finished.get()
+            in_flight -= 1
+
+            if isinstance(result, Exception):
+                main_logger.error(
+                    f"Error en el bloque {start_id}-{start_id + range_size - 1}: {str(result)}"
+                )
+                reports, metrics = [], {}
+            else:
+                reports, metrics, elapsed = result
+                scheduler.record(range_size, elapsed)
+                main_logger.info(
+                    f"Bloque {start_id}-{start_id + range_size - 1} terminado en "
+                    f"{elapsed:.1f}s; planificador: {scheduler.stats()}"
+                )
+
+            if submit():
+                in_flight += 1
+            yield start_id, range_size, reports, metrics
 
 
 def main():
@@ -445,6 +1030,142 @@ def main():
         action="store_true",
         help="Solo validar sin actualizar ni insertar nuevos registros",
     )
+    parser.add_argument(
+        "--upsert",
+        action="store_true",
+        help="Escribir con INSERT ... ON CONFLICT sobre claves naturales (requiere sql/migrations/001_natural_keys.sql)",
+    )
+    parser.add_argument(
+        "--base-url",
+        help="URL base del sitio CvLAC (p. ej. el servidor simulado de scripts/mock_cvlac_server.py)",
+    )
+    parser.add_argument(
+        "--async-fetch",
+        action="store_true",
+        help="Descargar los CvLAC con el motor asíncrono (aiohttp)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Límite global de peticiones simultáneas con --async-fetch",
+    )
+    parser.add_argument(
+        "--coordinator",
+        action="store_true",
+        help="Tomar bloques de IDs de la tabla crawl_chunk para repartir el rango entre varios nodos",
+    )
+    parser.add_argument(
+        "--lease-seconds",
+        type=int,
+        help="Vigencia del lease de un bloque con --coordinator (se renueva con heartbeats)",
+    )
+    parser.add_argument(
+        "--max-duration",
+        type=int,
+        help="Segundos máximos de la ejecución; al cumplirse termina los CvLAC en curso y se detiene",
+    )
+    parser.add_argument(
+        "--max-cvs",
+        type=int,
+        help="Número máximo de CvLAC a procesar en la ejecución",
+    )
+    parser.add_argument(
+        "--ids-file",
+        help="Archivo con un cod_rh por línea ('-' para leerlos de la entrada estándar)",
+    )
+    parser.add_argument(
+        "--recrawl",
+        action="store_true",
+        help="Actualizar los CvLAC conocidos, primero los más probables de haber cambiado",
+    )
+    parser.add_argument(
+        "--budget",
+        type=int,
+        help="Número máximo de CvLAC a descargar con --recrawl",
+    )
+    parser.add_argument(
+        "--density",
+        action="store_true",
+        help="Recorrer primero los bloques con más CvLAC y muestrear los poco densos",
+    )
+    parser.add_argument(
+        "--exploration",
+        type=float,
+        help="Fracción de IDs a visitar en los bloques poco densos con --density",
+    )
+    parser.add_argument(
+        "--chunk-target",
+        type=float,
+        help="Segundos buscados por bloque con --multiprocess (ajusta el tamaño de los bloques)",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Procesar con el pipeline descarga → parseo → escritura (reemplaza --multiprocess)",
+    )
+    parser.add_argument(
+        "--fetch-workers",
+        type=int,
+        help="Hilos de descarga del pipeline",
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        help="Procesos de parseo del pipeline (por defecto, el número de CPUs)",
+    )
+    parser.add_argument(
+        "--write-workers",
+        type=int,
+        help="Hilos de escritura en la base de datos del pipeline",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        help="Capacidad de las colas entre etapas del pipeline",
+    )
+    parser.add_argument(
+        "--parser",
+        choices=ExtractorUtils.PARSERS,
+        help="Backend para construir el árbol HTML (bs4 o lxml, más rápido)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Guardar y reutilizar las páginas descargadas en la caché en disco",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=int,
+        help="Segundos de vigencia de una página en la caché (0 = sin vencimiento)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Reprocesar también los CvLAC cuyo contenido no cambió",
+    )
+    parser.add_argument(
+        "--reparse",
+        nargs="?",
+        const="",
+        metavar="RUTA",
+        help="Volver a extraer páginas guardadas sin descargarlas: directorio, archivo "
+        ".tar/.tar.gz/.zip o directorio de la caché (sin RUTA, la caché configurada). "
+        "Se filtran con --cod_rh o --ids-file",
+    )
+    parser.add_argument(
+        "--section",
+        action="append",
+        metavar="TITULO",
+        help="Con --reparse, extraer solo esta sección (se puede repetir); "
+        "se reemplazan solo las tablas que produce",
+    )
+    parser.add_argument(
+        "--sink",
+        choices=("db", "null"),
+        default="db",
+        help="Con --reparse, escribir en la base de datos o descartar los registros "
+        "(null, para medir el parseo)",
+    )
     parser.add_argument(
         "--report_dir",
         help="Directorio para almacenar los reportes de extracción",
@@ -456,6 +1177,16 @@ def main():
 
     args = parser.parse_args()
 
+    if args.section:
+        unknown = [
+            title for title in args.section if title not in CvlacScraper.EXTRACTORS
+        ]
+        if unknown:
+            parser.error(
+                f"Secciones desconocidas: {', '.join(unknown)}. Disponibles: "
+                f"{', '.join(CvlacScraper.EXTRACTORS)}"
+            )
+
     # Actualizar configuración basada en argumentos de línea de comandos
     if args.update_only:
         project_settings.scraper["remove_existing_data"] = False
@@ -463,6 +1194,62 @@ def main():
     if args.validate_only:
         project_settings.scraper["update_if_exists"] = False
 
+    if args.upsert:
+        project_settings.scraper["upsert"] = True
+
+    if args.base_url:
+        project_settings.scraper["base_url"] = args.base_url
+
+    if args.async_fetch:
+        project_settings.scraper["async_fetch"] = True
+
+    if args.concurrency:
+        project_settings.scraper["max_concurrency"] = args.concurrency
+
+    if args.force:
+        project_settings.scraper["skip_unchanged"] = False
+
+    if args.pipeline:
+        project_settings.scraper["pipeline"] = True
+
+    if args.max_duration is not None:
+        project_settings.scraper["max_duration"] = args.max_duration
+
+    if args.max_cvs is not None:
+        project_settings.scraper["max_cvs"] = args.max_cvs
+
+    if args.budget is not None:
+        project_settings.scraper["recrawl_budget"] = args.budget
+
+    if args.exploration is not None:
+        project_settings.scraper["density_exploration"] = args.exploration
+
+    if args.lease_seconds:
+        project_settings.scraper["lease_seconds"] = args.lease_seconds
+
+    if args.chunk_target:
+        project_settings.scraper["chunk_target_seconds"] = args.chunk_target
+
+    for option in ("fetch_workers", "parse_workers", "write_workers", "queue_size"):
+        if getattr(args, option):
+            project_settings.scraper[option] = getattr(args, option)
+
+    if args.parser:
+        project_settings.scraper["parser"] = args.parser
+
+    if args.cache:
+        project_settings.scraper["cache_enabled"] = True
+
+    if args.cache_ttl is not None:
+        project_settings.scraper["cache_ttl"] = args.cache_ttl
+
+    if args.reparse and StoredPages.is_cache_dir(args.reparse):
+        project_settings.scraper["cache_dir"] = args.reparse
+
+    if args.multiprocess:
+        # El límite de concurrencia se reparte entre los workers
+        project_settings.scraper["fetch_processes"] = max(1, args.workers)
+
     if args.report_dir:
         # Asegurarse de que el directorio de reportes exista
         os.makedirs(args.report_dir, exist_ok=True)
@@ -494,6 +1281,27 @@ def main():
 
     scraper = CvlacScraper()
     all_reports = []
+    worker_metrics = []
+    density = None
+    density_plan = None
+    recrawl = None
+    started_at = time.time()
+
+    # Presupuestos (--max-duration, --max-cvs), parada ordenada con
+    # SIGINT/SIGTERM y checkpoints periódicos del avance
+    control = scraper.control
+    control.start()
+    control.install_signal_handlers()
+
+    def run_state():
+        return {
+            "session_id": session_id,
+            "args": vars(args),
+            "reports": len(all_reports),
+            "frontier": scraper.frontier.counts(args.range_start, args.range_end - 1),
+        }
+
+    control.start_checkpoints(run_state)
 
     try:
         if args.enhanced_reports:
@@ -520,43 +1328,227 @@ def main():
                         main_logger.info(f"  {format_type}: {path}")
             else:
                 main_logger.warning("Failed to generate enhanced reports")
+        # Modo de ejecución: volver a extraer páginas guardadas sin descargarlas
+        if args.reparse is not None:
+            cod_rhs = None
+            if args.ids_file:
+                cod_rhs = {
+                    cod_rh
+                    for batch in iter_id_batches(args.ids_file, 1000)
+                    for cod_rh in batch
+                }
+            if args.cod_rh:
+                cod_rhs = (cod_rhs or set()) | {
+                    normalize_cod_rh(args.cod_rh) or args.cod_rh
+                }
+
+            pages = StoredPages(args.reparse or None, cod_rhs)
+            reparser = Reparser(parse_cvlac, sink=args.sink, sections=args.section)
+            validator.record_runtime_metrics("reparse", reparser.run(pages))
+            validator.record_runtime_metrics("stored_pages", pages.counts)
+
         # Modo de ejecución: un solo CvLAC
-        if args.cod_rh:
+        elif args.cod_rh:
             main_logger.info(f"Extrayendo información para CvLAC: {args.cod_rh}")
             report_path = scraper.extract_cvlac(args.cod_rh)
             if report_path:
                 all_reports.append(report_path)
                 main_logger.info(f"Reporte generado: {report_path}")
 
-        # Modo de ejecución: multiprocesamiento
-        elif args.multiprocess:
-            main_logger.info(f"Iniciando extracción con {args.workers} workers")
+        # Modo de ejecución: lista de IDs de un archivo o de la entrada estándar
+        elif args.ids_file:
+            # Con --force también se reprocesan los IDs ya terminados
+            batches = iter_id_batches(
+                args.ids_file,
+                project_settings.scraper.get("ids_batch_size", 250),
+                None if args.force else scraper.frontier,
+            )
+
+            if args.multiprocess and not project_settings.scraper.get("pipeline"):
+                main_logger.info(
+                    f"Procesando los IDs de {args.ids_file} con {args.workers} workers"
+                )
+                with Pool(
+                    args.workers,
+                    initializer=RunControl.attach,
+                    initargs=control.shared(),
+                ) as pool:
+                    for reports, metrics in pool.imap_unordered(
+                        process_ids_wrapper, batches
+                    ):
+                        worker_metrics.append(metrics)
+                        all_reports.extend(reports)
+            else:
+                main_logger.info(f"Procesando los IDs de {args.ids_file}")
+                for batch in batches:
+                    all_reports.extend(scraper.process_ids(batch))
+
+        # Modo de ejecución: bloques coordinados entre nodos por la base de datos
+        elif args.coordinator:
+            leases = ChunkLeases(db)
+            if not leases.available:
+                main_logger.error(
+                    "No existe la tabla crawl_chunk; aplique sql/migrations/003_crawl_chunk.sql"
+                )
+            else:
+                leases.seed(args.range_start, args.range_end, args.step)
+
+                # El pipeline no puede crear su pool de procesos dentro de un worker
+                workers = args.workers if args.multiprocess else 1
+                if project_settings.scraper.get("pipeline"):
+                    workers = 1
+                main_logger.info(
+                    f"Iniciando extracción coordinada con {workers} workers en "
+                    f"{ChunkLeases.owner_id()}"
+                )
+
+                if workers > 1:
+                    with Pool(
+                        workers,
+                        initializer=RunControl.attach,
+                        initargs=control.shared(),
+                    ) as pool:
+                        for reports, metrics in pool.imap_unordered(
+                            partial(
+                                process_leased_chunks, args.range_start, args.range_end
+                            ),
+                            range(workers),
+                        ):
+                            worker_metrics.append(metrics)
+                            all_reports.extend(reports)
+                else:
+                    reports, metrics = process_leased_chunks(
+                        args.range_start, args.range_end
+                    )
+                    worker_metrics.append(metrics)
+                    all_reports.extend(reports)
+
+                main_logger.info(
+                    f"Bloques coordinados: "
+                    f"{leases.progress(args.range_start, args.range_end)}"
+                )
 
-            parts = list(range(args.range_start, args.range_end, args.step))
+        # Modo de ejecución: actualizar primero los CvLAC conocidos con más
+        # probabilidad de haber cambiado, dentro del presupuesto de peticiones
+        elif args.recrawl:
+            recrawl = RecrawlPlanner(db)
+            ids = recrawl.plan(project_settings.scraper.get("recrawl_budget", 10000))
 
-            if args.workers > 1:
-                with Pool(args.workers) as pool:
-                    results = pool.map(process_range_wrapper, parts)
-                    # Aplanar la lista de resultados
-                    for reports in results:
+            if args.multiprocess and not project_settings.scraper.get("pipeline"):
+                main_logger.info(
+                    f"Actualizando {len(ids)} CvLAC con {args.workers} workers"
+                )
+                # Lotes pequeños para que los más prioritarios se procesen primero
+                batch_size = max(1, math.ceil(len(ids) / (4 * args.workers)))
+                batches = [
+                    ids[i : i + batch_size] for i in range(0, len(ids), batch_size)
+                ]
+                with Pool(
+                    args.workers,
+                    initializer=RunControl.attach,
+                    initargs=control.shared(),
+                ) as pool:
+                    for reports, metrics in pool.imap(process_ids_wrapper, batches):
+                        worker_metrics.append(metrics)
+                        all_reports.extend(reports)
+            else:
+                main_logger.info(f"Actualizando {len(ids)} CvLAC")
+                all_reports.extend(scraper.process_ids(ids))
+
+        # Modo de ejecución: multiprocesamiento (el pipeline ya usa su propio
+        # pool de procesos, que no puede crearse dentro de un worker del Pool)
+        elif args.multiprocess and not project_settings.scraper.get("pipeline"):
+            main_logger.info(f"Iniciando extracción con {args.workers} workers")
+
+            if args.density:
+                # Bloques del plan de densidad, los más densos primero
+                density = DensityIndex(db, scraper.frontier, scraper.processed_ids)
+                density_plan = density.plan(args.range_start, args.range_end)
+                with Pool(
+                    args.workers,
+                    initializer=RunControl.attach,
+                    initargs=control.shared(),
+                ) as pool:
+                    for reports, metrics, _ in pool.imap_unordered(
+                        process_density_block, density_plan
+                    ):
+                        worker_metrics.append(metrics)
                         if reports:
                             all_reports.extend(reports)
             else:
-                for start_id in parts:
-                    reports = process_range_wrapper(start_id)
+                # Bloques de tamaño adaptativo (--step es el tamaño máximo)
+                scheduler = ChunkScheduler(
+                    args.range_start, args.range_end, args.workers, max_size=args.step
+                )
+                for _, _, reports, metrics in iter_scheduled_ranges(
+                    scheduler, args.workers
+                ):
+                    worker_metrics.append(metrics)
                     if reports:
                         all_reports.extend(reports)
+                main_logger.info(f"Planificación de bloques: {scheduler.stats()}")
 
         # Modo por defecto: un solo proceso, todos los rangos
         else:
-            main_logger.info("Iniciando extracción en modo single-process")
-
-            for start_id in range(args.range_start, args.range_end, args.step):
-                reports = scraper.process_range(start_id, args.step)
+            if project_settings.scraper.get("pipeline"):
+                main_logger.info("Iniciando extracción con el pipeline por etapas")
+            else:
+                main_logger.info("Iniciando extracción en modo single-process")
+
+            if args.density:
+                density = DensityIndex(db, scraper.frontier, scraper.processed_ids)
+                density_plan = density.plan(args.range_start, args.range_end)
+                ranges = [
+                    (block.start, block.size, block.sample_rate)
+                    for block in density_plan
+                ]
+            else:
+                ranges = [
+                    (start_id, args.step, 1.0)
+                    for start_id in range(args.range_start, args.range_end, args.step)
+                ]
+
+            for start_id, range_size, sample_rate in control.iter_until_stopped(
+                ranges
+            ):
+                reports = scraper.process_range(start_id, range_size, sample_rate)
                 if reports:
                     all_reports.extend(reports)
 
         # Finalizar la sesión y generar reportes finales
+        stop_reason = control.stop_reason()
+        if stop_reason:
+            main_logger.warning(
+                f"Ejecución detenida ({stop_reason}) tras {control.cvs} CvLAC; "
+                "los IDs pendientes se retoman en la siguiente ejecución"
+            )
+        validator.record_runtime_metrics(
+            "run",
+            {
+                "stop_reason": stop_reason,
+                "cvs_processed": control.cvs,
+                "elapsed_seconds": round(time.time() - started_at, 1),
+            },
+        )
+        validator.record_runtime_metrics("connection_pool", db.pool_stats())
+        worker_metrics.append(take_runtime_metrics())
+        for name, metrics in merge_runtime_metrics(worker_metrics).items():
+            validator.record_runtime_metrics(name, metrics)
+        if scraper.pipeline_stats:
+            validator.record_runtime_metrics("pipeline", scraper.pipeline_stats)
+        validator.record_runtime_metrics("frontier", scraper.frontier.counts())
+        if recrawl is not None:
+            validator.record_runtime_metrics("recrawl", recrawl.stats())
+        if density is not None:
+            validator.record_runtime_metrics(
+                "density", density.report(density_plan, since=started_at)
+            )
+
+        if project_settings.scraper.get("cache_enabled", False):
+            scraper.cache.evict()
+        scraper.processed_ids.flush()
+        control.stop_checkpoints()
+        control.checkpoint(run_state())
         summary_paths = validator.finish_session()
         if summary_paths:
             main_logger.info(
@@ -567,11 +1559,24 @@ def main():
                 "Extracción completada. No se generaron reportes de sesión."
             )
 
+    except KeyboardInterrupt:
+        main_logger.warning("Ejecución interrumpida; guardando el estado")
+        scraper.frontier.flush()
+        scraper.processed_ids.flush()
+        control.request_stop("SIGINT")
+        control.stop_checkpoints()
+        control.checkpoint(run_state())
+        validator.finish_session()
+
     except Exception as e:
         main_logger.error(f"Error en el proceso principal: {str(e)}")
         # Even on error, finalize the session
         validator.finish_session()
 
+    finally:
+        scraper.close()
+        control.stop_checkpoints()
+
 
 if __name__ == "__main__":
     main()
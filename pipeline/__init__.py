@@ -0,0 +1,10 @@
+from .extraction_pipeline import ExtractionPipeline, FetchedPage, StageStats
+from .reparse import Reparser, ReparseResult
+
+__all__ = [
+    "ExtractionPipeline",
+    "FetchedPage",
+    "ReparseResult",
+    "Reparser",
+    "StageStats",
+]
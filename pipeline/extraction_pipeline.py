@@ -0,0 +1,477 @@
+"""
+Pipeline por etapas para la extracción de CvLAC: descarga → parseo → escritura.
+"""
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from config import ProjectLogger, db
+from fetching import AsyncFetcher, HttpSession
+from frontier import RunControl
+import os
+import queue
+import threading
+import time
+
+
+# Configuramos el logger para este módulo
+logger = ProjectLogger()
+module_logger = logger.get_logger(__name__)
+
+
+# Página descargada que pasa de la etapa de descarga a la de parseo
+FetchedPage = namedtuple("FetchedPage", ["cod_rh", "status_code", "content", "error"])
+
+# Marca de fin de una cola
+_DONE = object()
+
+
+def _timed_parse(parse_func, cod_rh, content):
+    """Ejecuta parse_func en un worker y retorna también la duración."""
+    started = time.monotonic()
+    parsed = parse_func(cod_rh, content)
+    return parsed, time.monotonic() - started
+
+
+class StageStats:
+    """
+    Contadores de una etapa del pipeline: elementos procesados, tiempo
+    ocupado de sus workers y profundidad de su cola de entrada.
+    """
+
+    def __init__(self, name, workers, inbox=None):
+        """
+        Inicializa los contadores.
+
+        Args:
+            name (str): Nombre de la etapa.
+            workers (int): Número de workers de la etapa.
+            inbox (queue.Queue, optional): Cola de entrada de la etapa.
+        """
+        self.name = name
+        self.workers = workers
+        self.inbox = inbox
+        self.items = 0
+        self.busy = 0.0
+        self.depth_max = 0
+        self.depth_total = 0
+        self.samples = 0
+        self._lock = threading.Lock()
+
+    def add(self, elapsed):
+        """
+        Registra un elemento procesado.
+
+        Args:
+            elapsed (float): Segundos que el worker dedicó al elemento.
+        """
+        with self._lock:
+            self.items += 1
+            self.busy += elapsed
+
+    def sample(self):
+        """Registra la profundidad actual de la cola de entrada."""
+        if self.inbox is None:
+            return
+        depth = self.inbox.qsize()
+        with self._lock:
+            self.depth_max = max(self.depth_max, depth)
+            self.depth_total += depth
+            self.samples += 1
+
+    def snapshot(self, elapsed):
+        """
+        Retorna el estado de la etapa.
+
+        Args:
+            elapsed (float): Segundos transcurridos desde el inicio del pipeline.
+
+        Returns:
+            dict: Elementos, throughput, utilización de los workers y profundidad de la cola.
+        """
+        with self._lock:
+            stats = {
+                "workers": self.workers,
+                "items": self.items,
+                "throughput": round(self.items / elapsed, 2) if elapsed else 0.0,
+                "utilization": (
+                    round(self.busy / (elapsed * self.workers), 3)
+                    if elapsed and self.workers
+                    else 0.0
+                ),
+            }
+            if self.inbox is not None:
+                stats["queue_depth"] = self.inbox.qsize()
+                stats["queue_depth_max"] = self.depth_max
+                stats["queue_depth_avg"] = (
+                    round(self.depth_total / self.samples, 1) if self.samples else 0.0
+                )
+        return stats
+
+
+class ExtractionPipeline:
+    """
+    Ejecuta la extracción de un lote de CvLAC en tres etapas desacopladas:
+
+    - descarga: hilos con la sesión HTTP persistente (o el motor asíncrono
+      con async_fetch), que también consultan y llenan la caché de páginas;
+    - parseo: un pool de procesos que construye el árbol HTML y ejecuta los
+      extractores sin tocar la base de datos;
+    - escritura: hilos que eliminan los datos previos, escriben los registros
+      en una transacción y registran huellas, IDs procesados y reportes.
+
+    Las etapas se comunican por colas acotadas a queue_size elementos: si una
+    etapa se atrasa, la anterior se bloquea en lugar de acumular páginas en
+    memoria. Cada etapa reporta su throughput, la utilización de sus workers
+    y la profundidad de su cola de entrada para identificar el cuello de
+    botella.
+
+    El pool de procesos de parseo se crea en la primera llamada a run() y se
+    reutiliza en las siguientes (un lote o rango por llamada) hasta close().
+    """
+
+    def __init__(
+        self,
+        scraper,
+        parse_func,
+        fetch_workers=None,
+        parse_workers=None,
+        write_workers=None,
+        queue_size=None,
+    ):
+        """
+        Inicializa el pipeline.
+
+        Args:
+            scraper (CvlacScraper): Scraper que provee la descarga, los filtros y la escritura.
+            parse_func (callable): Función parse_func(cod_rh, content) a nivel de
+                                   módulo (debe poder enviarse a otro proceso).
+            fetch_workers (int, optional): Hilos de descarga. Por defecto fetch_workers
+                                           de la configuración.
+            parse_workers (int, optional): Procesos de parseo. Por defecto parse_workers
+                                           de la configuración o el número de CPUs.
+            write_workers (int, optional): Hilos de escritura. Por defecto write_workers
+                                           de la configuración.
+            queue_size (int, optional): Capacidad de cada cola. Por defecto queue_size
+                                        de la configuración.
+        """
+        config = scraper.scraper_config
+        self.scraper = scraper
+        self.parse_func = parse_func
+        self.fetch_workers = max(1, fetch_workers or config.get("fetch_workers", 16))
+        self.parse_workers = max(
+            1, parse_workers or config.get("parse_workers") or os.cpu_count() or 1
+        )
+        self.write_workers = max(1, write_workers or config.get("write_workers", 2))
+        self.queue_size = max(1, queue_size or config.get("queue_size", 64))
+        self.report_interval = config.get("pipeline_report_interval", 30)
+        self.async_fetch = config.get("async_fetch", False)
+        self.stats = None
+        self._executor = None
+
+    def run(self, ids):
+        """
+        Procesa una lista de IDs.
+
+        Args:
+            ids (list): Códigos cod_rh a procesar.
+
+        Returns:
+            list: Rutas a los reportes generados.
+        """
+        ids = list(ids)
+        fetched = queue.Queue(maxsize=self.queue_size)
+        parsed = queue.Queue(maxsize=self.queue_size)
+        reports = []
+        reports_lock = threading.Lock()
+
+        fetcher = None
+        if self.async_fetch:
+            fetcher = AsyncFetcher(self.scraper.build_url, self.scraper.scraper_config)
+
+        self._stages = {
+            "fetch": StageStats(
+                "fetch", fetcher.concurrency if fetcher else self.fetch_workers
+            ),
+            "parse": StageStats("parse", self.parse_workers, fetched),
+            "write": StageStats("write", self.write_workers, parsed),
+        }
+        self._started = time.monotonic()
+        finished = threading.Event()
+
+        module_logger.info(
+            f"Pipeline de {len(ids)} CvLAC: descarga={self._stages['fetch'].workers}, "
+            f"parseo={self.parse_workers}, escritura={self.write_workers}, "
+            f"colas={self.queue_size}"
+        )
+
+        self._reserve_connections()
+        if fetcher is None:
+            # Una conexión keep-alive por hilo de descarga
+            HttpSession().ensure_pool_maxsize(self.fetch_workers)
+        executor = self._get_executor()
+
+        monitor = threading.Thread(target=self._monitor, args=(finished,), daemon=True)
+        monitor.start()
+
+        # Etapa de escritura
+        writers = [
+            threading.Thread(
+                target=self._write_stage,
+                args=(parsed, reports, reports_lock),
+                name=f"pipeline-write-{i}",
+            )
+            for i in range(self.write_workers)
+        ]
+        for writer in writers:
+            writer.start()
+
+        # Etapa de parseo: despacha las páginas al pool de procesos
+        dispatcher = threading.Thread(
+            target=self._parse_stage,
+            args=(fetched, parsed, executor),
+            name="pipeline-parse",
+        )
+        dispatcher.start()
+
+        # Etapa de descarga
+        if fetcher is not None:
+            fetchers = [
+                threading.Thread(
+                    target=self._async_fetch_stage,
+                    args=(fetcher, ids, fetched),
+                    name="pipeline-fetch",
+                )
+            ]
+        else:
+            id_iter = iter(ids)
+            id_lock = threading.Lock()
+            fetchers = [
+                threading.Thread(
+                    target=self._fetch_stage,
+                    args=(id_iter, id_lock, fetched),
+                    name=f"pipeline-fetch-{i}",
+                )
+                for i in range(self.fetch_workers)
+            ]
+        for thread in fetchers:
+            thread.start()
+
+        for thread in fetchers:
+            thread.join()
+        fetched.put(_DONE)
+        dispatcher.join()
+        for writer in writers:
+            writer.join()
+
+        finished.set()
+        monitor.join()
+
+        self.stats = self.snapshot()
+        module_logger.info(f"Estadísticas del pipeline: {self.stats}")
+        return reports
+
+    def _get_executor(self):
+        """Retorna el pool de procesos de parseo, creándolo en el primer uso."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                initializer=RunControl.ignore_interrupts,
+            )
+            # Crear los procesos de parseo antes de iniciar los hilos del pipeline
+            self._executor.submit(os.getpid).result()
+        return self._executor
+
+    def close(self):
+        """Termina el pool de procesos de parseo."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _reserve_connections(self):
+        """
+        Amplía el pool de conexiones para las etapas del pipeline.
+
+        process_range y el despachador de parseo mantienen una conexión cada
+        uno y cada escritor una más la de sus consultas auxiliares (catálogo,
+        frontera). Las conexiones que se mantienen durante toda la ejecución
+        se abren antes de empezar: si el servidor no las admite, el pipeline
+        falla de inmediato en lugar de bloquear a los escritores hasta
+        pool_timeout.
+        """
+        db.ensure_pool_capacity(
+            2 + 2 * self.write_workers, open_count=2 + self.write_workers
+        )
+
+    def _fetch_one(self, cod_rh):
+        """Obtiene la página de un CvLAC desde la caché o descargándola."""
+        cached = self.scraper.cache.get(cod_rh)
+        if cached is not None:
+            return FetchedPage(cod_rh, cached.status_code, cached.content, None)
+
+        try:
+            status_code, content = self.scraper.fetch_cvlac(cod_rh)
+        except Exception as ex:
+            return FetchedPage(cod_rh, None, None, str(ex))
+
+        self.scraper.cache.put(cod_rh, status_code, content)
+        return FetchedPage(cod_rh, status_code, content, None)
+
+    def _fetch_stage(self, id_iter, id_lock, fetched):
+        """Worker de descarga: toma IDs del iterador compartido."""
+        stage = self._stages["fetch"]
+        while True:
+            with id_lock:
+                cod_rh = next(id_iter, None)
+            # Al pedir la parada no se toman IDs nuevos; las etapas siguientes
+            # terminan los que ya se descargaron
+            if cod_rh is None or self.scraper.control.should_stop():
+                return
+
+            started = time.monotonic()
+            self.scraper._mark_tried(cod_rh)
+            page = self._fetch_one(cod_rh)
+            stage.add(time.monotonic() - started)
+            fetched.put(page)
+
+    def _async_fetch_stage(self, fetcher, ids, fetched):
+        """Descarga con el motor asíncrono; las páginas en caché no se descargan."""
+        stage = self._stages["fetch"]
+        control = self.scraper.control
+        to_fetch = []
+        for cod_rh in control.iter_until_stopped(ids):
+            cached = self.scraper.cache.get(cod_rh)
+            if cached is None:
+                to_fetch.append(cod_rh)
+                continue
+            self.scraper._mark_tried(cod_rh)
+            stage.add(0.0)
+            fetched.put(FetchedPage(cod_rh, cached.status_code, cached.content, None))
+
+        for result in fetcher.iter_results(control.iter_until_stopped(to_fetch)):
+            self.scraper._mark_tried(result.cod_rh)
+            self.scraper.cache.put(result.cod_rh, result.status_code, result.content)
+            stage.add(result.elapsed)
+            fetched.put(
+                FetchedPage(
+                    result.cod_rh, result.status_code, result.content, result.error
+                )
+            )
+
+    def _parse_stage(self, fetched, parsed, executor):
+        """
+        Envía al pool de procesos las páginas que contienen un CvLAC.
+
+        Los futures se encolan en orden de llegada, de modo que la cola de
+        escritura también acota el número de parseos en vuelo. Las páginas
+        rechazadas (errores, vacías o sin cambios) pasan directo a la
+        escritura, que registra el resultado.
+        """
+        connection = None
+        try:
+            connection = db.get_connection()
+        except Exception as ex:
+            module_logger.warning(
+                f"Pipeline sin conexión para consultar huellas: {str(ex)}"
+            )
+
+        try:
+            while True:
+                page = fetched.get()
+                if page is _DONE:
+                    break
+
+                try:
+                    needs_parse = self.scraper.should_parse(
+                        page.cod_rh,
+                        page.status_code,
+                        page.content,
+                        page.error,
+                        connection,
+                    )
+                except Exception as ex:
+                    module_logger.error(
+                        f"Error evaluando CvLAC {page.cod_rh}: {str(ex)}", exc_info=True
+                    )
+                    needs_parse = True
+
+                future = None
+                if needs_parse:
+                    future = executor.submit(
+                        _timed_parse, self.parse_func, page.cod_rh, page.content
+                    )
+                parsed.put((page, future))
+        finally:
+            for _ in range(self.write_workers):
+                parsed.put(_DONE)
+            if connection:
+                connection.close()
+
+    def _write_stage(self, parsed, reports, reports_lock):
+        """Worker de escritura: espera el parseo y escribe el CvLAC."""
+        parse_stage = self._stages["parse"]
+        stage = self._stages["write"]
+        while True:
+            item = parsed.get()
+            if item is _DONE:
+                return
+
+            page, future = item
+            result = None
+            if future is not None:
+                try:
+                    result, elapsed = future.result()
+                    parse_stage.add(elapsed)
+                except Exception as ex:
+                    module_logger.error(
+                        f"Error parseando CvLAC {page.cod_rh}: {str(ex)}", exc_info=True
+                    )
+
+            started = time.monotonic()
+            report_path = self.scraper.process_cvlac(
+                page.cod_rh, page.status_code, page.content, page.error, parsed=result
+            )
+            stage.add(time.monotonic() - started)
+            if report_path:
+                with reports_lock:
+                    reports.append(report_path)
+
+    def _monitor(self, finished):
+        """Muestrea las colas y reporta el estado del pipeline periódicamente."""
+        last_report = time.monotonic()
+        while not finished.wait(1.0):
+            for stage in self._stages.values():
+                stage.sample()
+            if (
+                self.report_interval
+                and time.monotonic() - last_report >= self.report_interval
+            ):
+                last_report = time.monotonic()
+                module_logger.info(self._format_progress())
+
+    def _format_progress(self):
+        """Línea de progreso con el throughput y la cola de cada etapa."""
+        stats = self.snapshot()
+        parts = []
+        for name in ("fetch", "parse", "write"):
+            stage = stats[name]
+            part = f"{name} {stage['items']} ({stage['throughput']}/s, {stage['utilization']:.0%})"
+            if "queue_depth" in stage:
+                part = f"cola {stage['queue_depth']}/{self.queue_size} → {part}"
+            parts.append(part)
+        return "Pipeline: " + " | ".join(parts)
+
+    def snapshot(self):
+        """
+        Retorna el estado de las etapas.
+
+        Returns:
+            dict: Estadísticas por etapa, segundos transcurridos y la etapa
+                  con mayor utilización (el cuello de botella).
+        """
+        elapsed = time.monotonic() - self._started
+        stats = {name: stage.snapshot(elapsed) for name, stage in self._stages.items()}
+        stats["elapsed"] = round(elapsed, 1)
+        stats["bottleneck"] = max(
+            self._stages, key=lambda name: stats[name]["utilization"]
+        )
+        return stats
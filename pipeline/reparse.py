@@ -0,0 +1,320 @@
+"""
+Extracción de páginas CvLAC ya guardadas (--reparse), sin descargarlas.
+
+Permite aplicar una corrección de un extractor a todo el corpus guardado
+(o a las secciones y cod_rh indicados) y medir el throughput del parseo.
+"""
+
+from collections import namedtuple
+from functools import partial
+from multiprocessing import Pool
+from config import ProjectLogger, db, project_settings
+from extractors.utils import batched_writes, delete_data
+from frontier import RunControl
+from validators import SchemaCatalog
+import os
+import time
+
+
+# Configuramos el logger para este módulo
+logger = ProjectLogger()
+module_logger = logger.get_logger(__name__)
+
+
+# Resultado del parseo y la escritura de una página en un worker
+ReparseResult = namedtuple(
+    "ReparseResult",
+    [
+        "cod_rh",
+        "error",
+        "section_errors",
+        "tables",
+        "write_errors",
+        "parse_seconds",
+        "write_seconds",
+    ],
+)
+
+
+class NullSink:
+    """Destino que descarta los registros (para medir solo el parseo)."""
+
+    def write(self, parsed, replace_tables=False):
+        """
+        Descarta los registros de un CvLAC.
+
+        Args:
+            parsed (ParsedCvlac): Resultado de parse_cvlac.
+            replace_tables (bool, optional): Ignorado.
+
+        Returns:
+            dict: Filas recibidas y errores (siempre 0).
+        """
+        return {
+            "rows": sum(len(rows) for rows in parsed.rows.values()),
+            "errors": 0,
+        }
+
+
+class DatabaseSink:
+    """
+    Destino que escribe los registros en la base de datos.
+
+    Sin filtro de secciones se reemplaza el CvLAC completo, como en la
+    extracción normal; con filtro se reemplazan solo las tablas que
+    produjeron las secciones. En ambos casos las filas del cvlac_id se
+    eliminan en la misma transacción en que se escriben las nuevas, de
+    modo que un error deja los datos anteriores.
+    """
+
+    def write(self, parsed, replace_tables=False):
+        """
+        Escribe los registros de un CvLAC.
+
+        Args:
+            parsed (ParsedCvlac): Resultado de parse_cvlac.
+            replace_tables (bool, optional): Reemplazar solo las tablas con
+                                             registros en lugar del CvLAC completo.
+
+        Returns:
+            dict: Resumen del flush (filas escritas, errores y sentencias).
+        """
+        delete = None
+        if replace_tables:
+            delete = partial(self._delete_tables, parsed.cod_rh, parsed.rows)
+        elif project_settings.scraper.get("remove_existing_data", True):
+            delete = partial(delete_data, parsed.cod_rh, commit=False)
+
+        connection = db.get_connection()
+        try:
+            # La eliminación se ejecuta en la transacción del flush
+            with batched_writes(connection, before=delete) as buffer:
+                buffer.extend(parsed.rows)
+            return buffer.last_summary
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _delete_tables(cod_rh, rows, connection):
+        """Elimina (sin confirmar) las filas del CvLAC en las tablas de rows."""
+        schema = SchemaCatalog(db)
+        cursor = connection.cursor()
+        for table in rows:
+            # Las tablas sin cvlac_id (p. ej. eventos_participantes) se
+            # eliminan en cascada desde su tabla padre
+            if schema.column_exists(table, "cvlac_id"):
+                cursor.execute(f"DELETE FROM {table} WHERE cvlac_id = %s", (cod_rh,))
+
+
+SINKS = {"db": DatabaseSink, "null": NullSink}
+
+# Destino del proceso (uno por worker del Pool)
+_sink = None
+
+
+def _init_worker(sink, shared=None):
+    """
+    Inicializador de los workers: crea el destino y, en el Pool, comparte
+    el control de la ejecución con el proceso principal.
+    """
+    global _sink
+    _sink = SINKS[sink]()
+    if shared is not None:
+        RunControl.attach(*shared)
+
+
+def _reparse_page(parse_func, sections, page):
+    """
+    Parsea una página guardada y escribe sus registros en el destino del proceso.
+
+    Args:
+        parse_func (callable): parse_func(cod_rh, content, sections) a nivel de módulo.
+        sections (set): Títulos de las secciones a extraer (None = todas).
+        page (StoredPage): Página guardada.
+
+    Returns:
+        ReparseResult: Resultado del CvLAC.
+    """
+    started = time.monotonic()
+    try:
+        parsed = parse_func(page.cod_rh, page.content, sections)
+    except Exception as ex:
+        module_logger.error(
+            f"Error parseando CvLAC {page.cod_rh}: {str(ex)}", exc_info=True
+        )
+        return ReparseResult(
+            page.cod_rh, str(ex), 0, {}, 0, time.monotonic() - started, 0.0
+        )
+    parse_seconds = time.monotonic() - started
+
+    if parsed.error:
+        return ReparseResult(page.cod_rh, parsed.error, 0, {}, 0, parse_seconds, 0.0)
+
+    tables = {table: len(rows) for table, rows in parsed.rows.items()}
+    started = time.monotonic()
+    write_errors = 0
+    try:
+        summary = _sink.write(parsed, replace_tables=sections is not None)
+        write_errors = (summary or {}).get("errors", 0)
+    except Exception as ex:
+        write_errors = sum(tables.values()) or 1
+        module_logger.error(
+            f"Error escribiendo CvLAC {page.cod_rh}: {str(ex)}", exc_info=True
+        )
+    return ReparseResult(
+        page.cod_rh,
+        None,
+        parsed.section_errors,
+        tables,
+        write_errors,
+        parse_seconds,
+        time.monotonic() - started,
+    )
+
+
+class Reparser:
+    """
+    Vuelve a extraer páginas CvLAC guardadas con un pool de procesos.
+
+    Cada worker parsea la página (parse_cvlac, con el filtro de secciones)
+    y escribe sus registros en el destino: la base de datos ("db") o
+    ninguno ("null", para medir el throughput del parseo). El proceso
+    principal solo lee las páginas y suma los resultados; la lectura se
+    detiene con la parada ordenada y los presupuestos de RunControl.
+    """
+
+    def __init__(self, parse_func, sink="db", sections=None, workers=None):
+        """
+        Inicializa el reparseo.
+
+        Args:
+            parse_func (callable): Función parse_func(cod_rh, content, sections)
+                                   a nivel de módulo (debe poder enviarse a otro proceso).
+            sink (str, optional): Destino de los registros ("db" o "null").
+            sections (set, optional): Títulos de las secciones a extraer.
+            workers (int, optional): Procesos de parseo. Por defecto parse_workers
+                                     de la configuración o el número de CPUs.
+        """
+        if sink not in SINKS:
+            raise ValueError(f"Destino desconocido: {sink}")
+        config = project_settings.scraper
+        self.parse_func = parse_func
+        self.sink = sink
+        self.sections = set(sections) if sections else None
+        self.workers = max(
+            1, workers or config.get("parse_workers") or os.cpu_count() or 1
+        )
+        self.report_interval = config.get("pipeline_report_interval", 30)
+        self.stats = None
+
+    def run(self, pages):
+        """
+        Procesa las páginas guardadas.
+
+        Args:
+            pages (iterable): Páginas StoredPage (p. ej. un StoredPages).
+
+        Returns:
+            dict: Estadísticas del reparseo.
+        """
+        control = RunControl()
+        task = partial(_reparse_page, self.parse_func, self.sections)
+        pages = control.iter_until_stopped(pages)
+        self._reset()
+
+        module_logger.info(
+            f"Reparseo con {self.workers} procesos, destino {self.sink}, "
+            f"secciones: {', '.join(sorted(self.sections)) if self.sections else 'todas'}"
+        )
+
+        if self.workers == 1:
+            _init_worker(self.sink)
+            for result in map(task, pages):
+                self._add(result, control)
+        else:
+            with Pool(
+                self.workers,
+                initializer=_init_worker,
+                initargs=(self.sink, control.shared()),
+            ) as pool:
+                for result in pool.imap_unordered(task, pages, chunksize=4):
+                    self._add(result, control)
+
+        self.stats = self.snapshot()
+        module_logger.info(f"Estadísticas del reparseo: {self.stats}")
+        return self.stats
+
+    def _reset(self):
+        self._started = time.monotonic()
+        self._last_report = self._started
+        self._counters = {
+            "pages": 0,
+            "parsed": 0,
+            "errors": 0,
+            "section_errors": 0,
+            "write_errors": 0,
+            "rows": 0,
+        }
+        self._tables = {}
+        self._parse_seconds = 0.0
+        self._write_seconds = 0.0
+
+    def _add(self, result, control):
+        """Suma el resultado de un CvLAC y reporta el progreso periódicamente."""
+        counters = self._counters
+        counters["pages"] += 1
+        if result.error:
+            counters["errors"] += 1
+        else:
+            counters["parsed"] += 1
+        counters["section_errors"] += result.section_errors
+        counters["write_errors"] += result.write_errors
+        for table, rows in result.tables.items():
+            counters["rows"] += rows
+            self._tables[table] = self._tables.get(table, 0) + rows
+        self._parse_seconds += result.parse_seconds
+        self._write_seconds += result.write_seconds
+        control.record_cv()
+
+        now = time.monotonic()
+        if self.report_interval and now - self._last_report >= self.report_interval:
+            self._last_report = now
+            elapsed = now - self._started
+            module_logger.info(
+                f"Reparseo: {counters['pages']} CvLAC, "
+                f"{counters['pages'] / elapsed:.1f} CvLAC/s, {counters['rows']} registros"
+            )
+
+    def snapshot(self):
+        """
+        Retorna las estadísticas acumuladas.
+
+        Returns:
+            dict: CvLAC procesados y con error, registros por tabla, throughput
+                  y tiempos medios de parseo y escritura por CvLAC.
+        """
+        elapsed = time.monotonic() - self._started
+        pages = self._counters["pages"]
+        stats = dict(self._counters)
+        stats.update(
+            {
+                "sink": self.sink,
+                "workers": self.workers,
+                "sections": sorted(self.sections) if self.sections else None,
+                "elapsed_seconds": round(elapsed, 2),
+                "pages_per_second": round(pages / elapsed, 2) if elapsed else 0.0,
+                "parse_ms_avg": (
+                    round(self._parse_seconds / pages * 1000, 2) if pages else 0.0
+                ),
+                "write_ms_avg": (
+                    round(self._write_seconds / pages * 1000, 2) if pages else 0.0
+                ),
+                "parse_utilization": (
+                    round(self._parse_seconds / (elapsed * self.workers), 3)
+                    if elapsed
+                    else 0.0
+                ),
+                "tables": dict(sorted(self._tables.items())),
+            }
+        )
+        return stats
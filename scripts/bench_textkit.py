@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Mide la limpieza de texto y los patrones de extractors.textkit.
+
+Toma los textos de páginas CvLAC guardadas (cada string del documento y el
+texto de cada blockquote) y compara, por llamada, la limpieza y los
+patrones de textkit con la forma anterior (cadena de replace y funciones
+de re con el patrón como texto). Antes de medir verifica que los
+resultados sean idénticos:
+
+    python scripts/bench_textkit.py
+    python scripts/bench_textkit.py paginas/ --number 20
+
+Termina con código 1 si algún resultado difiere.
+"""
+import argparse
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup  # noqa: E402
+from extractors import textkit  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures" / "cvlac"
+
+
+def legacy_clean_text(text):
+    """Limpieza anterior de los extractores (_clean_text)."""
+    if not text:
+        return ""
+
+    return (
+        text.strip()
+        .replace("'", '"')
+        .replace("\t'", '"')
+        .replace("  ", "")
+        .replace("\n", "")
+        .replace("\r", "")
+    )
+
+
+# Patrón compilado de textkit, patrón como texto usado antes y función de re
+PATTERNS = [
+    (textkit.AUTHORS, r"[A-Z]{2,}[ [A-Z]{2,}]*", "findall"),
+    (textkit.AUTHORS_END, "[A-Z]{2,},", "split"),
+    (textkit.NUMBERS, r"[0-9]+", "findall"),
+    (textkit.YEAR, r"[0-9]{4}", "findall"),
+    (textkit.LIST_SEPARATORS, ",| - ", "split"),
+]
+
+
+def iter_pages(paths):
+    """Recorre los archivos .html de las rutas (archivos o directorios)."""
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from sorted(path.glob("*.html"))
+        else:
+            yield path
+
+
+def load_texts(paths):
+    """Retorna los strings y los textos de los blockquote de las páginas."""
+    strings = []
+    blockquotes = []
+    for path in iter_pages(paths):
+        html = BeautifulSoup(path.read_bytes(), "lxml")
+        strings.extend(str(value) for value in html.strings)
+        blockquotes.extend(
+            blockquote.text for blockquote in html.find_all("blockquote")
+        )
+    return strings, blockquotes
+
+
+def per_call(func, items, number):
+    """Tiempo medio por elemento de func, en microsegundos."""
+    total = timeit.timeit(lambda: [func(item) for item in items], number=number)
+    return total / (number * len(items)) * 1e6
+
+
+def main_bench():
+    parser = argparse.ArgumentParser(
+        description="Mide la limpieza y los patrones de textkit"
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        default=[str(FIXTURES_DIR)],
+        help="Archivos .html o directorios con páginas CvLAC (por defecto, las fixtures)",
+    )
+    parser.add_argument(
+        "--number", type=int, default=10, help="Repeticiones de cada medición"
+    )
+    args = parser.parse_args()
+
+    strings, blockquotes = load_texts(args.paths)
+    if not strings:
+        print("No se encontraron páginas HTML")
+        return 1
+    texts = strings + blockquotes
+    number = max(1, args.number)
+
+    differences = 0
+    if [textkit.clean_text(text) for text in texts] != [
+        legacy_clean_text(text) for text in texts
+    ]:
+        differences += 1
+        print("DIFERENTE clean_text")
+    for pattern, source, method in PATTERNS:
+        for text in texts:
+            if getattr(pattern, method)(text) != getattr(re, method)(source, text):
+                differences += 1
+                print(f"DIFERENTE {source}")
+                break
+    if differences:
+        return 1
+
+    print(f"{len(strings)} strings y {len(blockquotes)} blockquote")
+    print("Limpieza (us por texto):")
+    for name, items in (("strings", strings), ("blockquote", blockquotes)):
+        if not items:
+            continue
+        before = per_call(legacy_clean_text, items, number)
+        after = per_call(textkit.clean_text, items, number)
+        print(f"  {name}: {before:.3f} -> {after:.3f} ({before / after:.2f}x)")
+
+    before = timeit.timeit(
+        lambda: [legacy_clean_text(text) for text in strings], number=number
+    )
+    after = timeit.timeit(lambda: textkit.clean_texts(strings), number=number)
+    scale = 1e6 / (number * len(strings))
+    print(
+        f"  clean_texts: {before * scale:.3f} -> {after * scale:.3f} ({before / after:.2f}x)"
+    )
+
+    print("Patrones (us por llamada):")
+    for pattern, source, method in PATTERNS:
+        inline = getattr(re, method)
+        compiled = getattr(pattern, method)
+        before = per_call(lambda text: inline(source, text), texts, number)
+        after = per_call(compiled, texts, number)
+        print(
+            f"  {method} {source!r}: {before:.3f} -> {after:.3f} ({before / after:.2f}x)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_bench())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Compara los registros extraídos con los backends de parseo bs4 y lxml.
+
+Ejecuta parse_cvlac sobre páginas HTML guardadas con cada backend y verifica
+que los registros por tabla sean idénticos; muestra también el tiempo medio
+de parseo de cada uno:
+
+    python scripts/compare_parsers.py
+    python scripts/compare_parsers.py paginas/ 0001468382.html --repeat 3
+
+Termina con código 1 si algún CvLAC difiere.
+"""
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import project_settings  # noqa: E402
+import main  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures" / "cvlac"
+
+
+def iter_pages(paths):
+    """Recorre los archivos .html de las rutas (archivos o directorios)."""
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from sorted(path.glob("*.html"))
+        else:
+            yield path
+
+
+def parse(cod_rh, content, parser):
+    """Parsea un CvLAC con un backend y retorna sus registros y la duración."""
+    project_settings.scraper["parser"] = parser
+    start = time.perf_counter()
+    parsed = main.parse_cvlac(cod_rh, content)
+    elapsed = time.perf_counter() - start
+    rows = {
+        table: [{key: str(value) for key, value in row.items()} for row in table_rows]
+        for table, table_rows in parsed.rows.items()
+    }
+    return (rows, parsed.section_errors, parsed.error), elapsed
+
+
+def first_difference(expected, actual):
+    """Describe la primera tabla cuyos registros difieren."""
+    for table in sorted(set(expected[0]) | set(actual[0])):
+        rows_a = expected[0].get(table, [])
+        rows_b = actual[0].get(table, [])
+        if len(rows_a) != len(rows_b):
+            return f"{table}: {len(rows_a)} registros con bs4, {len(rows_b)} con lxml"
+        for row_a, row_b in zip(rows_a, rows_b):
+            if row_a != row_b:
+                fields = sorted(
+                    key
+                    for key in set(row_a) | set(row_b)
+                    if row_a.get(key) != row_b.get(key)
+                )
+                return f"{table}: campos {', '.join(fields)}"
+    return f"errores: {expected[1:]} con bs4, {actual[1:]} con lxml"
+
+
+def main_compare():
+    parser = argparse.ArgumentParser(
+        description="Compara los backends de parseo bs4 y lxml"
+    )
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        default=[str(FIXTURES_DIR)],
+        help="Archivos .html o directorios con páginas CvLAC (por defecto, las fixtures)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="Repeticiones para medir el tiempo"
+    )
+    args = parser.parse_args()
+
+    # Los extractores registran cada sección; solo interesan los resultados
+    logging.disable(logging.CRITICAL)
+
+    totals = {"bs4": 0.0, "lxml": 0.0}
+    pages = differences = 0
+    for path in iter_pages(args.paths):
+        content = path.read_bytes()
+        cod_rh = path.stem
+        results = {}
+        for backend in totals:
+            for _ in range(max(1, args.repeat)):
+                results[backend], elapsed = parse(cod_rh, content, backend)
+                totals[backend] += elapsed
+        pages += 1
+        if results["bs4"] != results["lxml"]:
+            differences += 1
+            print(
+                f"DIFERENTE {path}: {first_difference(results['bs4'], results['lxml'])}"
+            )
+
+    if not pages:
+        print("No se encontraron páginas HTML")
+        return 1
+
+    runs = pages * max(1, args.repeat)
+    print(f"{pages} CvLAC comparados, {differences} con diferencias")
+    for backend, total in totals.items():
+        print(f"  {backend}: {total / runs * 1000:.1f} ms por CvLAC")
+    return 1 if differences else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_compare())
@@ -0,0 +1,327 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Servidor local que imita la página pública de CvLAC.
+
+Sirve páginas grabadas y anonimizadas desde scripts/fixtures/cvlac en la
+misma ruta que el sitio de Minciencias
+(/cvlac/visualizador/generarCurriculoCv.do?cod_rh=...) y páginas vacías
+para los IDs sin CvLAC, con perfiles configurables de latencia, tasa de
+errores y throughput. Permite ejecutar main.py de extremo a extremo, incluso
+con --multiprocess, sin conexión a internet:
+
+    python scripts/mock_cvlac_server.py --port 8800 --profile production
+    python main.py --base-url http://127.0.0.1:8800 --range_start 0 --range_end 1000
+
+También permite grabar nuevas páginas reales anonimizadas:
+
+    python scripts/mock_cvlac_server.py record 0001468382 0001655135
+"""
+import argparse
+import hashlib
+import logging
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+# Configurar logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+
+logger = logging.getLogger("mock_cvlac_server")
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures" / "cvlac"
+CVLAC_PATH = "/cvlac/visualizador/generarCurriculoCv.do"
+PRODUCTION_URL = "https://scienti.minciencias.gov.co" + CVLAC_PATH
+
+# Perfiles de servidor: latencia media y jitter en ms, fracción de respuestas
+# 503 y máximo de peticiones por segundo (0 = sin límite; el exceso recibe 429)
+PROFILES = {
+    "fast": {"latency_ms": 0, "jitter_ms": 0, "error_rate": 0.0, "max_rps": 0},
+    "production": {
+        "latency_ms": 350,
+        "jitter_ms": 250,
+        "error_rate": 0.01,
+        "max_rps": 50,
+    },
+    "flaky": {"latency_ms": 800, "jitter_ms": 1500, "error_rate": 0.1, "max_rps": 20},
+}
+
+
+class TokenBucket:
+    """Limitador de peticiones por segundo compartido por todos los hilos."""
+
+    def __init__(self, rate):
+        """
+        Inicializa el limitador.
+
+        Args:
+            rate (float): Peticiones por segundo permitidas (0 = sin límite).
+        """
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def allow(self):
+        """Consume un token. Retorna False si se superó el límite."""
+        if not self.rate:
+            return True
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class FixtureStore:
+    """Páginas servidas por el servidor simulado."""
+
+    def __init__(self, fixtures_dir, cv_ratio):
+        """
+        Carga las páginas en memoria.
+
+        Args:
+            fixtures_dir (Path): Directorio con <cod_rh>.html y vacio.html.
+            cv_ratio (float): Fracción de IDs sin página grabada que reciben un
+                              CvLAC sintético (copia de una página grabada).
+        """
+        self.pages = {}
+        for path in sorted(fixtures_dir.glob("*.html")):
+            self.pages[path.stem] = path.read_bytes()
+
+        self.empty_page = self.pages.pop("vacio", b"<html><body></body></html>")
+        self.templates = [self.pages[key] for key in sorted(self.pages)]
+        self.cv_ratio = cv_ratio
+        logger.info(f"{len(self.pages)} páginas grabadas cargadas desde {fixtures_dir}")
+
+    def get(self, cod_rh):
+        """
+        Obtiene la página de un cod_rh.
+
+        Args:
+            cod_rh (str): Código del investigador.
+
+        Returns:
+            bytes: Cuerpo HTML.
+        """
+        page = self.pages.get(cod_rh)
+        if page is not None:
+            return page
+
+        # Decisión determinista para que los reintentos vean la misma página
+        digest = int(hashlib.sha1(cod_rh.encode()).hexdigest()[:8], 16)
+        if self.templates and (digest % 10000) < self.cv_ratio * 10000:
+            return self.templates[digest % len(self.templates)]
+        return self.empty_page
+
+
+class MockCvlacHandler(BaseHTTPRequestHandler):
+    """Atiende las peticiones de generarCurriculoCv.do."""
+
+    protocol_version = "HTTP/1.1"
+    store = None
+    profile = None
+    bucket = None
+    stats = {"requests": 0, "cvs": 0, "errors": 0, "throttled": 0}
+    stats_lock = threading.Lock()
+
+    def _count(self, key):
+        with self.stats_lock:
+            self.stats[key] += 1
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=UTF-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        self._count("requests")
+
+        if url.path != CVLAC_PATH:
+            self._send(404, b"<html><body>Not Found</body></html>")
+            return
+
+        cod_rh = parse_qs(url.query).get("cod_rh", [""])[0]
+
+        if not self.bucket.allow():
+            self._count("throttled")
+            self._send(
+                429,
+                b"<html><body>Too Many Requests</body></html>",
+                {"Retry-After": "1"},
+            )
+            return
+
+        latency = self.profile["latency_ms"] + random.uniform(
+            0, self.profile["jitter_ms"]
+        )
+        if latency > 0:
+            time.sleep(latency / 1000)
+
+        if random.random() < self.profile["error_rate"]:
+            self._count("errors")
+            self._send(503, b"<html><body>Service Unavailable</body></html>")
+            return
+
+        page = self.store.get(cod_rh)
+        if page is not self.store.empty_page:
+            self._count("cvs")
+        self._send(200, page)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+def anonymize(html):
+    """
+    Anonimiza una página CvLAC grabada.
+
+    Reemplaza el nombre, el nombre en citaciones, los enlaces a ORCID/Scopus
+    y los correos electrónicos.
+
+    Args:
+        html (bytes): Página original.
+
+    Returns:
+        bytes: Página anonimizada.
+    """
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "lxml")
+    anchor = soup.find("a", {"name": "datos_generales"})
+    table = anchor and anchor.find_next_sibling("table")
+    if table:
+        for label, value in (
+            ("Nombre", "Investigador Anónimo"),
+            ("Nombre en citaciones", "ANONIMO, I."),
+        ):
+            cell = table.find(string=label)
+            target = cell and cell.find_next("td")
+            if target:
+                target.string = value
+        for link in table.find_all("a", href=True):
+            if "orcid" in link["href"] or "scopus" in link["href"]:
+                link["href"] = "https://example.org/anonimo"
+
+    text = str(soup)
+    text = re.sub(r"[\w.+-]+@[\w-]+\.[\w.-]+", "anonimo@example.org", text)
+    return text.encode("utf-8")
+
+
+def record(ids, fixtures_dir):
+    """
+    Descarga páginas reales de CvLAC, las anonimiza y las guarda como fixtures.
+
+    Args:
+        ids (list): Códigos a grabar.
+        fixtures_dir (Path): Directorio de destino.
+    """
+    import requests
+
+    fixtures_dir.mkdir(parents=True, exist_ok=True)
+    for cod_rh in ids:
+        response = requests.get(
+            PRODUCTION_URL, params={"cod_rh": cod_rh}, timeout=30, verify=False
+        )
+        if response.status_code != 200:
+            logger.warning(f"CvLAC {cod_rh}: HTTP {response.status_code}, omitido")
+            continue
+        path = fixtures_dir / f"{cod_rh}.html"
+        path.write_bytes(anonymize(response.content))
+        logger.info(f"CvLAC {cod_rh} grabado en {path}")
+
+
+def serve(args):
+    """Inicia el servidor simulado."""
+    profile = dict(PROFILES[args.profile])
+    for key in ("latency_ms", "jitter_ms", "error_rate", "max_rps"):
+        value = getattr(args, key)
+        if value is not None:
+            profile[key] = value
+
+    MockCvlacHandler.store = FixtureStore(Path(args.fixtures), args.cv_ratio)
+    MockCvlacHandler.profile = profile
+    MockCvlacHandler.bucket = TokenBucket(profile["max_rps"])
+
+    server = ThreadingHTTPServer((args.host, args.port), MockCvlacHandler)
+    server.daemon_threads = True
+    logger.info(
+        f"Servidor CvLAC simulado en http://{args.host}:{args.port} "
+        f"(perfil {args.profile}: {profile})"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        logger.info(f"Estadísticas del servidor simulado: {MockCvlacHandler.stats}")
+
+
+def main():
+    """Función principal."""
+    parser = argparse.ArgumentParser(description="Servidor CvLAC simulado")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        default="serve",
+        choices=["serve", "record"],
+        help="serve: iniciar el servidor; record: grabar páginas reales",
+    )
+    parser.add_argument("ids", nargs="*", help="Códigos a grabar (con record)")
+    parser.add_argument("--host", default="127.0.0.1", help="Dirección de escucha")
+    parser.add_argument("--port", type=int, default=8800, help="Puerto de escucha")
+    parser.add_argument(
+        "--fixtures", default=str(FIXTURES_DIR), help="Directorio de páginas grabadas"
+    )
+    parser.add_argument(
+        "--profile",
+        choices=sorted(PROFILES),
+        default="fast",
+        help="Perfil de latencia, errores y throughput",
+    )
+    parser.add_argument("--latency-ms", type=float, help="Latencia media en ms")
+    parser.add_argument(
+        "--jitter-ms", type=float, help="Variación máxima de latencia en ms"
+    )
+    parser.add_argument("--error-rate", type=float, help="Fracción de respuestas 503")
+    parser.add_argument(
+        "--max-rps",
+        type=float,
+        help="Máximo de peticiones por segundo (0 = sin límite)",
+    )
+    parser.add_argument(
+        "--cv-ratio",
+        type=float,
+        default=0.02,
+        help="Fracción de IDs sin página grabada que reciben un CvLAC sintético",
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "record":
+        if not args.ids:
+            parser.error("record requiere al menos un cod_rh")
+        record(args.ids, Path(args.fixtures))
+    else:
+        serve(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,7 +11,7 @@ SET session_replication_role = 'replica';
 DO $$ 
 DECLARE
     tables TEXT[] := ARRAY[
-        'investigador_grupo', 'articulos_publicados', 'eventos_productos', 'eventos_participantes', 
+        'crawl_chunk', 'cvlac_fingerprint', 'cvlac_refresh', 'investigador_grupo', 'articulos_publicados', 'eventos_productos', 'eventos_participantes', 
         'eventos_instituciones', 'eventos_cientificos', 'eventos_artisticos', 'redes_conocimiento',
         'reconocimientos', 'lineas_investigacion', 'idioma', 'areas_actuacion', 'experiencia',
         'formacion_complementaria', 'formacion_academica', 'software', 'libros', 'capitulos_libro',
@@ -1196,6 +1196,112 @@ CREATE TABLE "public"."investigador_grupo"
     CONSTRAINT "investigador_grupo_cvlac_id_fk" FOREIGN KEY ("cvlac_id") REFERENCES "public"."identificacion" ("cvlac_id") ON DELETE CASCADE
 );
 
+-- Crear tabla cvlac_fingerprint con la huella del HTML de cada CvLAC procesado
+CREATE TABLE "public"."cvlac_fingerprint"
+(
+ "cvlac_id"      varchar NOT NULL,
+ "content_hash"  varchar NOT NULL,
+ "updated_at"    timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
+ CONSTRAINT "PK_cvlac_fingerprint" PRIMARY KEY ("cvlac_id"),
+ CONSTRAINT "cvlac_fingerprint_cvlac_id_fk" FOREIGN KEY ("cvlac_id") REFERENCES "public"."identificacion" ("cvlac_id") ON DELETE CASCADE
+);
+
+-- Crear tabla crawl_chunk con los bloques de IDs del recorrido coordinado entre nodos
+CREATE TABLE "public"."crawl_chunk"
+(
+ "chunk_id"          serial NOT NULL,
+ "range_start"       integer NOT NULL,
+ "range_end"         integer NOT NULL,
+ "status"            varchar NOT NULL DEFAULT 'pending',
+ "lease_owner"       varchar,
+ "lease_expires_at"  timestamptz,
+ "attempts"          integer NOT NULL DEFAULT 0,
+ "completed_at"      timestamptz,
+ CONSTRAINT "PK_crawl_chunk" PRIMARY KEY ("chunk_id"),
+ CONSTRAINT "UQ_crawl_chunk_range" UNIQUE ("range_start", "range_end")
+);
+
+CREATE INDEX "crawl_chunk_claim_idx" ON "public"."crawl_chunk" ("status", "range_start");
+
+-- Crear tabla cvlac_refresh con el historial de revisiones de cada CvLAC conocido
+CREATE TABLE "public"."cvlac_refresh"
+(
+ "cvlac_id"          varchar NOT NULL,
+ "first_checked_at"  timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
+ "checked_at"        timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
+ "changed_at"        timestamp,
+ "checks"            integer NOT NULL DEFAULT 0,
+ "changes"           integer NOT NULL DEFAULT 0,
+ CONSTRAINT "PK_cvlac_refresh" PRIMARY KEY ("cvlac_id")
+);
+
+-- Claves naturales para el modo upsert (ver validators/natural_keys.py y
+-- sql/migrations/001_natural_keys.sql). Requiere PostgreSQL 15 o superior.
+ALTER TABLE "public"."formacion_academica" ADD CONSTRAINT "UQ_formacion_academica_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nivel_formacion", "institucion", "programa_academico", "fecha_inicio");
+ALTER TABLE "public"."formacion_complementaria" ADD CONSTRAINT "UQ_formacion_complementaria_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nivel_formacion", "institucion", "programa_academico", "fecha_inicio");
+ALTER TABLE "public"."experiencia" ADD CONSTRAINT "UQ_experiencia_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "institucion", "ano_inicio");
+ALTER TABLE "public"."areas_actuacion" ADD CONSTRAINT "UQ_areas_actuacion_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "gran_area", "area", "especialidad");
+ALTER TABLE "public"."idioma" ADD CONSTRAINT "UQ_idioma_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "idioma");
+ALTER TABLE "public"."lineas_investigacion" ADD CONSTRAINT "UQ_lineas_investigacion_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "linea_investigacion");
+ALTER TABLE "public"."reconocimientos" ADD CONSTRAINT "UQ_reconocimientos_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "fecha");
+ALTER TABLE "public"."cursos_corta_duracion" ADD CONSTRAINT "UQ_cursos_corta_duracion_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre_producto", "ano");
+ALTER TABLE "public"."trabajos_dirigidos" ADD CONSTRAINT "UQ_trabajos_dirigidos_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "persona_orientada", "fecha_inicio");
+ALTER TABLE "public"."asesorias" ADD CONSTRAINT "UQ_asesorias_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre_proyecto_ondas", "institucion");
+ALTER TABLE "public"."jurados" ADD CONSTRAINT "UQ_jurados_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "titulo", "nombre_orientado");
+ALTER TABLE "public"."par_evaluador" ADD CONSTRAINT "UQ_par_evaluador_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "par_evaluador_de", "entidad_convocadora", "ano", "mes");
+ALTER TABLE "public"."participacion_comites_evaluacion" ADD CONSTRAINT "UQ_participacion_comites_evaluacion_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre_producto", "institucion", "ano");
+ALTER TABLE "public"."consultorias" ADD CONSTRAINT "UQ_consultorias_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "numero_contrato", "ano");
+ALTER TABLE "public"."ediciones_revisiones" ADD CONSTRAINT "UQ_ediciones_revisiones_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "tipo_producto", "revista", "editorial", "ano");
+ALTER TABLE "public"."informes_investigacion" ADD CONSTRAINT "UQ_informes_investigacion_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "titulo", "ano");
+ALTER TABLE "public"."redes_conocimiento" ADD CONSTRAINT "UQ_redes_conocimiento_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "fecha_inicio");
+ALTER TABLE "public"."audio" ADD CONSTRAINT "UQ_audio_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "titulo", "fecha");
+ALTER TABLE "public"."impresa" ADD CONSTRAINT "UQ_impresa_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "fecha");
+ALTER TABLE "public"."multimedia" ADD CONSTRAINT "UQ_multimedia_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "ano");
+ALTER TABLE "public"."secuencias_geneticas" ADD CONSTRAINT "UQ_secuencias_geneticas_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "fecha");
+ALTER TABLE "public"."contenido_virtual" ADD CONSTRAINT "UQ_contenido_virtual_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "titulo", "fecha");
+ALTER TABLE "public"."estrategias_comunicacion" ADD CONSTRAINT "UQ_estrategias_comunicacion_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "fecha_inicio");
+ALTER TABLE "public"."estrategias_pedagogicas" ADD CONSTRAINT "UQ_estrategias_pedagogicas_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "fecha_inicio");
+ALTER TABLE "public"."espacios_participacion" ADD CONSTRAINT "UQ_espacios_participacion_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "fecha_inicio");
+ALTER TABLE "public"."participacion_proyectos" ADD CONSTRAINT "UQ_participacion_proyectos_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "fecha_inicio");
+ALTER TABLE "public"."obras_productos" ADD CONSTRAINT "UQ_obras_productos_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "fecha_creacion");
+ALTER TABLE "public"."registro_licencia" ADD CONSTRAINT "UQ_registro_licencia_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "numero_registro", "institucion");
+ALTER TABLE "public"."industrias_creativas_culturales" ADD CONSTRAINT "UQ_industrias_creativas_culturales_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "nit_registro");
+ALTER TABLE "public"."eventos_artisticos" ADD CONSTRAINT "UQ_eventos_artisticos_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "fecha_inicio");
+ALTER TABLE "public"."talleres_creativos" ADD CONSTRAINT "UQ_talleres_creativos_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "fecha_inicio");
+ALTER TABLE "public"."articulos" ADD CONSTRAINT "UQ_articulos_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "titulo", "revista", "ano");
+ALTER TABLE "public"."articulos_publicados" ADD CONSTRAINT "UQ_articulos_publicados_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "titulo", "issn", "ano");
+ALTER TABLE "public"."capitulos_libro" ADD CONSTRAINT "UQ_capitulos_libro_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "titulo_capitulo", "libro", "ano");
+ALTER TABLE "public"."libros" ADD CONSTRAINT "UQ_libros_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "titulo", "isbn", "ano");
+ALTER TABLE "public"."documentos_trabajo" ADD CONSTRAINT "UQ_documentos_trabajo_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "ano");
+ALTER TABLE "public"."otra_produccion" ADD CONSTRAINT "UQ_otra_produccion_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "titulo", "ano");
+ALTER TABLE "public"."textos_no_cientificas" ADD CONSTRAINT "UQ_textos_no_cientificas_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "titulo", "revista", "ano");
+ALTER TABLE "public"."traducciones" ADD CONSTRAINT "UQ_traducciones_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "ano");
+ALTER TABLE "public"."notas_cientificas" ADD CONSTRAINT "UQ_notas_cientificas_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "titulo_nota", "revista", "ano");
+ALTER TABLE "public"."cartas_mapas" ADD CONSTRAINT "UQ_cartas_mapas_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre_producto", "ano");
+ALTER TABLE "public"."conceptos_tecnicos" ADD CONSTRAINT "UQ_conceptos_tecnicos_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "titulo", "numero");
+ALTER TABLE "public"."diseno_industrial" ADD CONSTRAINT "UQ_diseno_industrial_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "ano");
+ALTER TABLE "public"."empresas_base_tecnologica" ADD CONSTRAINT "UQ_empresas_base_tecnologica_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "nit");
+ALTER TABLE "public"."esquemas_trazado" ADD CONSTRAINT "UQ_esquemas_trazado_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "ano");
+ALTER TABLE "public"."informes_tecnicos" ADD CONSTRAINT "UQ_informes_tecnicos_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "ano");
+ALTER TABLE "public"."innovacion_procesos" ADD CONSTRAINT "UQ_innovacion_procesos_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "ano");
+ALTER TABLE "public"."innovacion_gestion" ADD CONSTRAINT "UQ_innovacion_gestion_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "ano");
+ALTER TABLE "public"."variedad_animal" ADD CONSTRAINT "UQ_variedad_animal_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "ano");
+ALTER TABLE "public"."poblaciones_mejoradas" ADD CONSTRAINT "UQ_poblaciones_mejoradas_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "ano");
+ALTER TABLE "public"."variedad_vegetal" ADD CONSTRAINT "UQ_variedad_vegetal_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "ano");
+ALTER TABLE "public"."registro_cientifico" ADD CONSTRAINT "UQ_registro_cientifico_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "ano");
+ALTER TABLE "public"."plantas_piloto" ADD CONSTRAINT "UQ_plantas_piloto_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "ano");
+ALTER TABLE "public"."productos_nutraceuticos" ADD CONSTRAINT "UQ_productos_nutraceuticos_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "numero_registro");
+ALTER TABLE "public"."productos_tecnologicos" ADD CONSTRAINT "UQ_productos_tecnologicos_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "ano");
+ALTER TABLE "public"."prototipos" ADD CONSTRAINT "UQ_prototipos_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "ano");
+ALTER TABLE "public"."normas_regulaciones" ADD CONSTRAINT "UQ_normas_regulaciones_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "ano");
+ALTER TABLE "public"."protocolos_vigilancia" ADD CONSTRAINT "UQ_protocolos_vigilancia_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "fecha");
+ALTER TABLE "public"."reglamentos" ADD CONSTRAINT "UQ_reglamentos_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "ano");
+ALTER TABLE "public"."signos_distintivos" ADD CONSTRAINT "UQ_signos_distintivos_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "ano");
+ALTER TABLE "public"."software" ADD CONSTRAINT "UQ_software_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "ano");
+ALTER TABLE "public"."demas_trabajos" ADD CONSTRAINT "UQ_demas_trabajos_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "nombre", "ano");
+ALTER TABLE "public"."proyectos" ADD CONSTRAINT "UQ_proyectos_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "tipo", "nombre", "fecha_inicio");
+ALTER TABLE "public"."redes_sociales" ADD CONSTRAINT "UQ_redes_sociales_natural" UNIQUE NULLS NOT DISTINCT ("cvlac_id", "red", "link");
+
 -- Crear índices para mejorar el rendimiento
 CREATE INDEX idx_formacion_academica_cvlac ON formacion_academica(cvlac_id);
 CREATE INDEX idx_formacion_complementaria_cvlac ON formacion_complementaria(cvlac_id);
@@ -0,0 +1,19 @@
+-- Migración 002: huellas del contenido de cada CvLAC
+--
+-- Crea la tabla cvlac_fingerprint usada para omitir los CvLAC cuyo HTML no
+-- cambió desde la última extracción (ver validators/fingerprints.py).
+--
+-- Uso: psql -U postgres -d cvlac_db -f sql/migrations/002_cvlac_fingerprint.sql
+
+SET client_min_messages TO WARNING;
+
+CREATE TABLE IF NOT EXISTS "public"."cvlac_fingerprint"
+(
+ "cvlac_id"      varchar NOT NULL,
+ "content_hash"  varchar NOT NULL,
+ "updated_at"    timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
+ CONSTRAINT "PK_cvlac_fingerprint" PRIMARY KEY ("cvlac_id"),
+ CONSTRAINT "cvlac_fingerprint_cvlac_id_fk" FOREIGN KEY ("cvlac_id") REFERENCES "public"."identificacion" ("cvlac_id") ON DELETE CASCADE
+);
+
+SET client_min_messages TO DEFAULT;
@@ -0,0 +1,29 @@
+-- Migración 003: bloques de IDs para el recorrido coordinado entre nodos
+--
+-- Crea la tabla crawl_chunk usada por el modo --coordinator: cada fila es un
+-- bloque de IDs que un worker toma con un lease (SELECT ... FOR UPDATE SKIP
+-- LOCKED), renueva con heartbeats y marca como terminado (ver
+-- frontier/leases.py).
+--
+-- Uso: psql -U postgres -d cvlac_db -f sql/migrations/003_crawl_chunk.sql
+
+SET client_min_messages TO WARNING;
+
+CREATE TABLE IF NOT EXISTS "public"."crawl_chunk"
+(
+ "chunk_id"          serial NOT NULL,
+ "range_start"       integer NOT NULL,
+ "range_end"         integer NOT NULL,
+ "status"            varchar NOT NULL DEFAULT 'pending',
+ "lease_owner"       varchar,
+ "lease_expires_at"  timestamptz,
+ "attempts"          integer NOT NULL DEFAULT 0,
+ "retry_at"          timestamptz,
+ "completed_at"      timestamptz,
+ CONSTRAINT "PK_crawl_chunk" PRIMARY KEY ("chunk_id"),
+ CONSTRAINT "UQ_crawl_chunk_range" UNIQUE ("range_start", "range_end")
+);
+
+CREATE INDEX IF NOT EXISTS "crawl_chunk_claim_idx" ON "public"."crawl_chunk" ("status", "range_start");
+
+SET client_min_messages TO DEFAULT;
@@ -0,0 +1,23 @@
+-- Migración 004: historial de revisiones de los CvLAC conocidos
+--
+-- Crea la tabla cvlac_refresh usada por el modo --recrawl para ordenar los
+-- CvLAC según su antigüedad y la frecuencia con la que cambiaron (ver
+-- frontier/recrawl.py). No referencia a identificacion para conservar el
+-- historial cuando se eliminan y vuelven a insertar los datos de un CvLAC.
+--
+-- Uso: psql -U postgres -d cvlac_db -f sql/migrations/004_cvlac_refresh.sql
+
+SET client_min_messages TO WARNING;
+
+CREATE TABLE IF NOT EXISTS "public"."cvlac_refresh"
+(
+ "cvlac_id"          varchar NOT NULL,
+ "first_checked_at"  timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
+ "checked_at"        timestamp NOT NULL DEFAULT CURRENT_TIMESTAMP,
+ "changed_at"        timestamp,
+ "checks"            integer NOT NULL DEFAULT 0,
+ "changes"           integer NOT NULL DEFAULT 0,
+ CONSTRAINT "PK_cvlac_refresh" PRIMARY KEY ("cvlac_id")
+);
+
+SET client_min_messages TO DEFAULT;
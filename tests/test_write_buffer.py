@@ -0,0 +1,127 @@
+"""
+Pruebas de la escritura de un CvLAC en una sola transacción.
+
+Requieren la base de datos configurada (DB_HOST, DB_NAME, ...) con el
+esquema de sql/cvlac_db.sql; sin conexión se omiten.
+"""
+
+from functools import partial
+import pytest
+
+from config import db
+from extractors.utils import batched_writes, delete_data
+from frontier import FrontierStore
+from validators.write_buffer import WriteBuffer
+import main
+
+
+COD_RH = "9999999901"
+
+
+def _fail_on(table):
+    """Reemplazo de WriteBuffer._flush_table que falla al llegar a una tabla."""
+    flush_table = WriteBuffer._flush_table
+
+    def flush(self, cursor, connection, name, rows, update_if_exists, summary):
+        if name == table:
+            raise RuntimeError(f"fallo forzado en {table}")
+        return flush_table(
+            self, cursor, connection, name, rows, update_if_exists, summary
+        )
+
+    return flush
+
+
+def _rows(connection):
+    cursor = connection.cursor()
+    cursor.execute(
+        "SELECT nombre_completo FROM identificacion WHERE cvlac_id = %s", (COD_RH,)
+    )
+    nombres = [row[0] for row in cursor.fetchall()]
+    cursor.execute(
+        "SELECT idioma FROM idioma WHERE cvlac_id = %s ORDER BY idioma", (COD_RH,)
+    )
+    idiomas = [row[0] for row in cursor.fetchall()]
+    connection.commit()
+    return nombres, idiomas
+
+
+@pytest.fixture
+def connection():
+    if not db.test_connection():
+        pytest.skip("Base de datos no disponible")
+
+    connection = db.get_connection()
+    delete_data(COD_RH, connection)
+    cursor = connection.cursor()
+    cursor.execute(
+        "INSERT INTO identificacion (cvlac_id, nombre_completo) VALUES (%s, %s)",
+        (COD_RH, "Anterior"),
+    )
+    cursor.execute(
+        "INSERT INTO idioma (cvlac_id, idioma) VALUES (%s, %s)", (COD_RH, "Francés")
+    )
+    connection.commit()
+    try:
+        yield connection
+    finally:
+        connection.rollback()
+        delete_data(COD_RH, connection)
+        connection.close()
+
+
+def _new_rows():
+    return {
+        "identificacion": [{"cvlac_id": COD_RH, "nombre_completo": "Nuevo"}],
+        "idioma": [
+            {"cvlac_id": COD_RH, "idioma": "Español"},
+            {"cvlac_id": COD_RH, "idioma": "Inglés"},
+        ],
+    }
+
+
+def test_flush_replaces_rows_in_one_transaction(connection):
+    delete = partial(delete_data, COD_RH, commit=False)
+    with batched_writes(connection, before=delete) as buffer:
+        buffer.extend(_new_rows())
+
+    assert buffer.last_summary["errors"] == 0
+    assert _rows(connection) == (["Nuevo"], ["Español", "Inglés"])
+
+
+def test_flush_failure_keeps_previous_rows(connection, monkeypatch):
+    monkeypatch.setattr(WriteBuffer, "_flush_table", _fail_on("idioma"))
+
+    delete = partial(delete_data, COD_RH, commit=False)
+    with batched_writes(connection, before=delete) as buffer:
+        buffer.extend(_new_rows())
+
+    assert buffer.last_summary["errors"] == 3
+    assert _rows(connection) == (["Anterior"], ["Francés"])
+
+
+class _Frontier:
+    """Frontera que solo recuerda el último estado de cada ID."""
+
+    def __init__(self):
+        self.status = {}
+
+    def mark(self, cod_rh, status, error=None):
+        self.status[cod_rh] = status
+
+
+def test_process_cvlac_retries_when_flush_fails(connection, monkeypatch):
+    monkeypatch.setattr(WriteBuffer, "_flush_table", _fail_on("idioma"))
+
+    scraper = main.CvlacScraper.__new__(main.CvlacScraper)
+    scraper.scraper_config = {"remove_existing_data": True, "skip_unchanged": False}
+    scraper.frontier = _Frontier()
+    scraper.processed_ids = set()
+
+    content = b"<table></table>" * 10
+    parsed = main.ParsedCvlac(COD_RH, _new_rows(), 0, None)
+    scraper.process_cvlac(COD_RH, 200, content, parsed=parsed)
+
+    assert scraper.frontier.status[COD_RH] == FrontierStore.TRANSIENT_ERROR
+    assert COD_RH not in scraper.processed_ids
+    assert _rows(connection) == (["Anterior"], ["Francés"])
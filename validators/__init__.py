@@ -1,3 +1,6 @@
 from .data_validator import DataValidator
+from .fingerprints import FingerprintStore
+from .schema_catalog import SchemaCatalog
+from .write_buffer import WriteBuffer
 
-__all__ = ["DataValidator"]
+__all__ = ["DataValidator", "FingerprintStore", "SchemaCatalog", "WriteBuffer"]
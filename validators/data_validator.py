@@ -6,8 +6,11 @@ import json
 import logging
 from datetime import datetime
 import os
+import threading
 from pathlib import Path
 from reporting import EnhancedReporting
+from validators.schema_catalog import SchemaCatalog
+from validators.natural_keys import NATURAL_KEYS
 
 
 # Configuramos el logger para este módulo
@@ -20,6 +23,9 @@ class DataValidator:
     Clase para validar datos, evitar duplicados y generar reportes.
     """
 
+    # Serializa la lectura y escritura del archivo de sesión entre hilos
+    _session_lock = threading.Lock()
+
     def __init__(self, db_connection):
         """
         Inicializa el validador de datos.
@@ -28,6 +34,7 @@ class DataValidator:
             db_connection: Instancia de la clase DatabaseConnection.
         """
         self.db = db_connection
+        self.schema = SchemaCatalog(db_connection)
         self.temp_dir = Path("temp")
         self.report_dir = self.temp_dir / "reports"
         self._ensure_dirs_exist()
@@ -74,91 +81,57 @@ class DataValidator:
         }
 
         try:
-            with self.db.get_connection_context() as connection:
-                cursor = connection.cursor()
+            # Obtener lista de tablas a verificar desde el catálogo compartido
+            if not self.schema.load():
+                raise RuntimeError("No se pudo cargar el catálogo de esquema")
+
+            if tables_to_check is None:
+                tables_to_check = self.schema.get_tables()
+
+            for table in tables_to_check:
+                report["tables_checked"] += 1
+                report["details"][table] = {
+                    "exists": False,
+                    "columns": {},
+                    "issues": [],
+                }
 
-                # Obtener lista de tablas a verificar
-                if tables_to_check is None:
-                    cursor.execute(
-                        """
-                        SELECT table_name 
-                        FROM information_schema.tables 
-                        WHERE table_schema = 'public'
-                    """
-                    )
-                    tables_to_check = [row[0] for row in cursor.fetchall()]
-
-                for table in tables_to_check:
-                    report["tables_checked"] += 1
-                    report["details"][table] = {
-                        "exists": False,
-                        "columns": {},
-                        "issues": [],
-                    }
+                # Verificar si la tabla existe
+                table_exists = self.schema.table_exists(table)
+                report["details"][table]["exists"] = table_exists
 
-                    # Verificar si la tabla existe
-                    cursor.execute(
-                        """
-                        SELECT EXISTS (
-                            SELECT FROM information_schema.tables 
-                            WHERE table_schema = 'public' 
-                            AND table_name = %s
-                        )
-                    """,
-                        (table,),
-                    )
+                if not table_exists:
+                    report["tables_missing"] += 1
+                    report["details"][table]["issues"].append("Table does not exist")
+                    continue
 
-                    table_exists = cursor.fetchone()[0]
-                    report["details"][table]["exists"] = table_exists
+                # Verificar columnas
+                columns = dict(self.schema.get_columns(table))
+                report["details"][table]["columns"] = columns
 
-                    if not table_exists:
-                        report["tables_missing"] += 1
-                        report["details"][table]["issues"].append(
-                            "Table does not exist"
-                        )
-                        continue
-
-                    # Verificar columnas
-                    cursor.execute(
-                        """
-                        SELECT column_name, data_type 
-                        FROM information_schema.columns 
-                        WHERE table_schema = 'public' 
-                        AND table_name = %s
-                    """,
-                        (table,),
+                # Verificar si existe la columna cvlac_id
+                if "cvlac_id" not in columns:
+                    report["tables_with_issues"] += 1
+                    report["details"][table]["issues"].append(
+                        "Missing 'cvlac_id' column"
                     )
 
-                    columns = {row[0]: row[1] for row in cursor.fetchall()}
-                    report["details"][table]["columns"] = columns
-
-                    # Verificar si existe la columna cvlac_id
-                    if "cvlac_id" not in columns:
-                        report["tables_with_issues"] += 1
-                        report["details"][table]["issues"].append(
-                            "Missing 'cvlac_id' column"
+            # Mostrar informe en el log
+            for table, info in report["details"].items():
+                if info["exists"]:
+                    if len(info["issues"]) > 0:
+                        module_logger.warning(
+                            f"Tabla '{table}' existe pero tiene problemas: {', '.join(info['issues'])}"
                         )
-
-                # Mostrar informe en el log
-                for table, info in report["details"].items():
-                    if info["exists"]:
-                        if len(info["issues"]) > 0:
-                            module_logger.warning(
-                                f"Tabla '{table}' existe pero tiene problemas: {', '.join(info['issues'])}"
-                            )
-                            module_logger.debug(
-                                f"Columnas en '{table}': {list(info['columns'].keys())}"
-                            )
-                        else:
-                            module_logger.debug(
-                                f"Tabla '{table}' verificada correctamente"
-                            )
-                    else:
-                        module_logger.error(
-                            f"Tabla '{table}' no existe en la base de datos"
+                        module_logger.debug(
+                            f"Columnas en '{table}': {list(info['columns'].keys())}"
                         )
+                    else:
+                        module_logger.debug(f"Tabla '{table}' verificada correctamente")
+                else:
+                    module_logger.error(f"Tabla '{table}' no existe en la base de datos")
 
-                return report
+            return report
 
         except Exception as e:
             module_logger.error(
@@ -179,28 +152,14 @@ class DataValidator:
             bool: True si la columna existe, False en caso contrario.
         """
         try:
-            with self.db.get_connection_context() as connection:
-                cursor = connection.cursor()
-                cursor.execute(
-                    """
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.columns 
-                        WHERE table_schema = 'public' 
-                        AND table_name = %s 
-                        AND column_name = %s
-                    )
-                """,
-                    (table, column),
-                )
-
-                return cursor.fetchone()[0]
+            return self.schema.column_exists(table, column)
         except Exception as e:
             module_logger.error(
                 f"Error verificando columna {column} en {table}: {str(e)}"
             )
             return False
 
-    def check_duplicate(self, table, data, key_columns=None):
+    def check_duplicate(self, table, data, key_columns=None, connection=None):
         """
         Verifica si un registro ya existe en la base de datos.
 
@@ -209,6 +168,9 @@ class DataValidator:
             data (dict): Datos a verificar.
             key_columns (list, optional): Columnas que definen la unicidad.
                                           Si es None, se usa cvlac_id más las claves primarias.
+            connection (optional): Conexión del llamador. Si se indica, la consulta
+                                   se hace en su transacción en lugar de tomar
+                                   otra conexión del pool.
 
         Returns:
             tuple: (bool, dict) - (Es duplicado, Registro existente si lo hay)
@@ -261,23 +223,30 @@ class DataValidator:
             query = f"SELECT * FROM public.{table} WHERE {' AND '.join(conditions)}"
 
             # Ejecutar la consulta
+            if connection is not None:
+                return self._fetch_duplicate(connection, query, query_params)
             with self.db.get_connection_context() as connection:
-                cursor = connection.cursor()
-                cursor.execute(query, query_params)
-                result = cursor.fetchone()
-
-                if result:
-                    # Obtener los nombres de las columnas
-                    columns = [desc[0] for desc in cursor.description]
-                    existing_record = dict(zip(columns, result))
-                    return True, existing_record
-
-                return False, None
+                return self._fetch_duplicate(connection, query, query_params)
 
         except Exception as e:
             module_logger.error(f"Error verificando duplicados en {table}: {str(e)}")
             return False, None
 
+    @staticmethod
+    def _fetch_duplicate(connection, query, query_params):
+        """Ejecuta la consulta de duplicados y retorna (es duplicado, registro)."""
+        cursor = connection.cursor()
+        cursor.execute(query, query_params)
+        result = cursor.fetchone()
+
+        if result:
+            # Obtener los nombres de las columnas
+            columns = [desc[0] for desc in cursor.description]
+            existing_record = dict(zip(columns, result))
+            return True, existing_record
+
+        return False, None
+
     def _get_primary_key_columns(self, table):
         """
         Obtiene las columnas de clave primaria de una tabla.
@@ -289,22 +258,10 @@ class DataValidator:
             list: Lista de nombres de columnas de clave primaria.
         """
         try:
-            query = """
-            SELECT a.attname
-            FROM pg_constraint c
-            JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = ANY(c.conkey)
-            WHERE c.contype = 'p' AND c.conrelid = %s::regclass
-            """
-
-            with self.db.get_connection_context() as connection:
-                cursor = connection.cursor()
-                cursor.execute(query, (table,))
-                result = cursor.fetchall()
-
-                if result:
-                    return [row[0] for row in result]
-                else:
-                    return ["cvlac_id"]  # Default si no se encuentra clave primaria
+            primary_keys = self.schema.get_primary_keys(table)
+            if primary_keys:
+                return primary_keys
+            return ["cvlac_id"]  # Default si no se encuentra clave primaria
 
         except Exception as e:
             module_logger.error(
@@ -342,8 +299,7 @@ class DataValidator:
                 "processing_history": [],
                 "errors": [],
             }
-            with open(self.session_file, "w", encoding="utf-8") as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
+            self._write_session(session_data)
 
         # Reset extraction stats for this ID
         self.extraction_stats = {
@@ -354,6 +310,21 @@ class DataValidator:
 
         return self.extraction_stats
 
+    def _write_session(self, session_data):
+        """
+        Escribe el archivo de sesión de forma atómica (archivo temporal y
+        os.replace), para que una interrupción no lo deje a medio escribir.
+
+        Args:
+            session_data (dict): Contenido completo de la sesión.
+        """
+        tmp_file = self.session_file.with_name(
+            f".{self.session_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(session_data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, self.session_file)
+
     def record_operation(
         self, table, operation, data=None, existing_record=None, error=None
     ):
@@ -392,7 +363,9 @@ class DataValidator:
                 }
             )
 
-    def record_extraction_result(self, cod_rh, success=True, error=None):
+    def record_extraction_result(
+        self, cod_rh, success=True, error=None, unchanged=False
+    ):
         """
         Records the result of an extraction to the session file.
 
@@ -400,60 +373,122 @@ class DataValidator:
             cod_rh (str): CvLAC ID processed
             success (bool): Whether the extraction was successful
             error (str, optional): Error message if extraction failed
+            unchanged (bool, optional): The CvLAC was skipped because its content
+                                        did not change since the last extraction
         """
         if not hasattr(self, "current_session_id") or not self.session_file.exists():  # type: ignore
             self.start_new_extraction()
 
-        # Load current session data
-        with open(self.session_file, "r", encoding="utf-8") as f:  # type: ignore
-            session_data = json.load(f)
+        with self._session_lock:
+            # Load current session data
+            with open(self.session_file, "r", encoding="utf-8") as f:  # type: ignore
+                session_data = json.load(f)
 
-        # Update session stats
-        session_data["cvlacs_processed"] += 1
-        if success:
-            session_data["success_count"] += 1
-        else:
-            session_data["error_count"] += 1
-
-        # Update table stats
-        for table, stats in self.extraction_stats["tables"].items():
-            if table not in session_data["table_stats"]:
-                session_data["table_stats"][table] = {
-                    "inserts": 0,
-                    "updates": 0,
-                    "skips": 0,
-                    "errors": 0,
-                }
+            # Update session stats
+            session_data["cvlacs_processed"] += 1
+            if success:
+                session_data["success_count"] += 1
+            else:
+                session_data["error_count"] += 1
+            if unchanged:
+                session_data["unchanged_count"] = session_data.get("unchanged_count", 0) + 1
+
+            # Update table stats
+            for table, stats in self.extraction_stats["tables"].items():
+                if table not in session_data["table_stats"]:
+                    session_data["table_stats"][table] = {
+                        "inserts": 0,
+                        "updates": 0,
+                        "skips": 0,
+                        "errors": 0,
+                    }
 
-            for op in ["inserts", "updates", "skips", "errors"]:
-                session_data["table_stats"][table][op] += stats.get(op, 0)
-
-        # Add to processing history
-        extraction_summary = {
-            "cvlac_id": cod_rh,
-            "processed_at": datetime.now().isoformat(),
-            "success": success,
-            "processing_time": (
-                datetime.now()
-                - datetime.fromisoformat(self.extraction_stats["started_at"])
-            ).total_seconds(),
-        }
+                for op in ["inserts", "updates", "skips", "errors"]:
+                    session_data["table_stats"][table][op] += stats.get(op, 0)
+
+            # Add to processing history
+            extraction_summary = {
+                "cvlac_id": cod_rh,
+                "processed_at": datetime.now().isoformat(),
+                "success": success,
+                "processing_time": (
+                    datetime.now()
+                    - datetime.fromisoformat(self.extraction_stats["started_at"])
+                ).total_seconds(),
+            }
 
-        if not success and error:
-            extraction_summary["error"] = error
+            if not success and error:
+                extraction_summary["error"] = error
+            if unchanged:
+                extraction_summary["unchanged"] = True
 
-        session_data["processing_history"].append(extraction_summary)
+            session_data["processing_history"].append(extraction_summary)
 
-        # Add detailed errors if any
-        if self.extraction_stats["errors"]:
-            session_data["errors"].extend(self.extraction_stats["errors"])
+            # Add detailed errors if any
+            if self.extraction_stats["errors"]:
+                session_data["errors"].extend(self.extraction_stats["errors"])
 
-        # Write updated session data
-        with open(self.session_file, "w", encoding="utf-8") as f:  # type: ignore
-            json.dump(session_data, f, indent=2, ensure_ascii=False)
+            # Write updated session data
+            self._write_session(session_data)
+
+    def record_runtime_metrics(self, name, metrics):
+        """
+        Guarda métricas de ejecución (pool de conexiones, HTTP, etc.) en la sesión.
+
+        Args:
+            name (str): Nombre del grupo de métricas.
+            metrics (dict): Métricas a registrar. Reemplaza las anteriores del mismo grupo.
+        """
+        if not self.session_file or not self.session_file.exists():
+            return
+
+        with self._session_lock:
+            with open(self.session_file, "r", encoding="utf-8") as f:
+                session_data = json.load(f)
+
+            session_data.setdefault("runtime_metrics", {})[name] = metrics
+
+            self._write_session(session_data)
+
+    def filter_columns(self, table, data):
+        """
+        Elimina del registro las columnas que no existen en la tabla.
+
+        Si el catálogo del esquema no está disponible (la carga falló), el
+        registro se deja intacto: una columna inexistente hará fallar la
+        escritura con un error explícito en lugar de descartar todas las
+        columnas del registro.
+
+        Args:
+            table (str): Nombre de la tabla.
+            data (dict): Datos a verificar. Se modifica en el lugar.
+
+        Returns:
+            dict: El mismo diccionario sin las columnas inexistentes.
+        """
+        if not self.schema.is_loaded():
+            module_logger.warning(
+                f"Catálogo de esquema no disponible; no se filtran las columnas de {table}"
+            )
+            return data
+
+        table_columns = self.schema.get_columns(table)
+        for column in list(data.keys()):
+            if column not in table_columns:
+                module_logger.warning(
+                    f"La columna '{column}' no existe en la tabla {table}. Eliminando del conjunto de datos."
+                )
+                del data[column]
+        return data
 
     def insert_or_update(
-        self, table, data, connection, update_if_exists=True, key_columns=None
+        self,
+        table,
+        data,
+        connection,
+        update_if_exists=True,
+        key_columns=None,
+        commit=True,
     ):
         """
         Inserta o actualiza un registro evitando duplicados.
@@ -464,18 +499,15 @@ class DataValidator:
             connection: Conexión a la base de datos.
             update_if_exists (bool): Si es True, actualiza registros existentes.
             key_columns (list, optional): Columnas que definen la unicidad.
+            commit (bool, optional): Si es False, no hace commit ni rollback y deja
+                                     el control de la transacción al llamador.
 
         Returns:
             tuple: (operación realizada, error si ocurrió)
         """
         try:
             # Verificar primero que las columnas existan en la tabla
-            for column in list(data.keys()):
-                if not self.check_column_exists(table, column):
-                    module_logger.warning(
-                        f"La columna '{column}' no existe en la tabla {table}. Eliminando del conjunto de datos."
-                    )
-                    del data[column]
+            self.filter_columns(table, data)
 
             # Si no quedan datos después de la verificación, no podemos hacer nada
             if not data:
@@ -486,7 +518,7 @@ class DataValidator:
 
             # Verificar si el registro ya existe
             is_duplicate, existing_record = self.check_duplicate(
-                table, data, key_columns
+                table, data, key_columns, connection=connection
             )
 
             if is_duplicate:
@@ -515,7 +547,8 @@ class DataValidator:
                         update_query = f"UPDATE public.{table} SET {', '.join([f'{col} = %s' for col in update_columns])} WHERE {' AND '.join(where_conditions)}"
                         cursor = connection.cursor()
                         cursor.execute(update_query, update_values + where_values)
-                        connection.commit()
+                        if commit:
+                            connection.commit()
                         self.record_operation(table, "update", data, existing_record)
                         return "update", None
                     else:
@@ -535,17 +568,150 @@ class DataValidator:
 
                 cursor = connection.cursor()
                 cursor.execute(insert_query, values)
-                connection.commit()
+                if commit:
+                    connection.commit()
                 self.record_operation(table, "insert", data)
                 return "insert", None
 
         except Exception as e:
-            connection.rollback()
+            if commit:
+                connection.rollback()
             error_msg = f"Error en insert_or_update para {table}: {str(e)}"
             module_logger.error(error_msg, exc_info=True)
             self.record_operation(table, "error", data, error=str(e))
             return "error", error_msg
 
+    def get_conflict_columns(self, table, data=None):
+        """
+        Obtiene las columnas a usar como destino de ON CONFLICT.
+
+        Usa la clave natural declarada si la restricción UNIQUE existe en la base
+        de datos; si no, la clave primaria cuando el registro la trae completa.
+
+        Args:
+            table (str): Nombre de la tabla.
+            data (dict, optional): Registro a escribir.
+
+        Returns:
+            list: Columnas del conflicto, o None si la tabla no tiene una clave utilizable.
+        """
+        natural_key = NATURAL_KEYS.get(table)
+        if natural_key and self.schema.has_unique_key(table, natural_key):
+            return list(natural_key)
+
+        primary_keys = self.schema.get_primary_keys(table)
+        if (
+            primary_keys
+            and data is not None
+            and all(data.get(key) is not None for key in primary_keys)
+        ):
+            return primary_keys
+
+        return None
+
+    def build_upsert_query(self, table, columns, conflict_columns, update_if_exists=True):
+        """
+        Construye una sentencia INSERT ... ON CONFLICT con RETURNING (xmax = 0).
+
+        La sentencia usa un único marcador 'VALUES %s', válido tanto para una fila
+        (pasando una tupla) como para execute_values.
+
+        Args:
+            table (str): Nombre de la tabla.
+            columns (list): Columnas a insertar.
+            conflict_columns (list): Columnas del conflicto, o None para INSERT simple.
+            update_if_exists (bool): DO UPDATE si es True, DO NOTHING si es False.
+
+        Returns:
+            str: Sentencia SQL.
+        """
+        query = f"INSERT INTO public.{table} AS t ({', '.join(columns)}) VALUES %s"
+
+        if conflict_columns:
+            update_columns = [col for col in columns if col not in conflict_columns]
+            query += f" ON CONFLICT ({', '.join(conflict_columns)})"
+            if update_if_exists and update_columns:
+                # Igual que insert_or_update: los valores nulos no sobrescriben
+                assignments = ", ".join(
+                    f"{col} = COALESCE(EXCLUDED.{col}, t.{col})"
+                    for col in update_columns
+                )
+                query += f" DO UPDATE SET {assignments}"
+            else:
+                query += " DO NOTHING"
+
+        return query + " RETURNING (xmax = 0) AS inserted"
+
+    def record_upsert_results(self, table, results, total, data=None):
+        """
+        Registra las operaciones de un upsert a partir de las filas RETURNING.
+
+        Args:
+            table (str): Nombre de la tabla.
+            results (list): Filas devueltas por RETURNING (xmax = 0).
+            total (int): Número de registros enviados.
+            data (dict, optional): Registro, si se escribió uno solo.
+
+        Returns:
+            dict: Conteo de 'insert', 'update' y 'skip'.
+        """
+        counts = {"insert": 0, "update": 0, "skip": 0}
+        for row in results:
+            counts["insert" if row[0] else "update"] += 1
+        # Las filas que chocaron con DO NOTHING no aparecen en RETURNING
+        counts["skip"] = max(0, total - len(results))
+
+        for operation, count in counts.items():
+            for _ in range(count):
+                self.record_operation(table, operation, data)
+
+        return counts
+
+    def upsert(self, table, data, connection, update_if_exists=True, commit=True):
+        """
+        Inserta o actualiza un registro en una sola sentencia INSERT ... ON CONFLICT.
+
+        Args:
+            table (str): Nombre de la tabla.
+            data (dict): Datos a insertar o actualizar.
+            connection: Conexión a la base de datos.
+            update_if_exists (bool): Si es True, actualiza registros existentes.
+            commit (bool, optional): Si es False, deja el control de la transacción al llamador.
+
+        Returns:
+            tuple: (operación realizada, error si ocurrió)
+        """
+        try:
+            self.filter_columns(table, data)
+            if not data:
+                error_msg = f"No hay columnas válidas para insertar en {table}"
+                module_logger.error(error_msg)
+                self.record_operation(table, "error", data=None, error=error_msg)
+                return "error", error_msg
+
+            columns = list(data.keys())
+            query = self.build_upsert_query(
+                table, columns, self.get_conflict_columns(table, data), update_if_exists
+            )
+
+            cursor = connection.cursor()
+            cursor.execute(query, (tuple(data[col] for col in columns),))
+            results = cursor.fetchall()
+            if commit:
+                connection.commit()
+
+            counts = self.record_upsert_results(table, results, 1, data)
+            operation = next(op for op, count in counts.items() if count)
+            return operation, None
+
+        except Exception as e:
+            if commit:
+                connection.rollback()
+            error_msg = f"Error en upsert para {table}: {str(e)}"
+            module_logger.error(error_msg, exc_info=True)
+            self.record_operation(table, "error", data, error=str(e))
+            return "error", error_msg
+
     def generate_enhanced_reports(self, cod_rh=None, formats=None):
         """
         Generates enhanced reports for the extraction.
@@ -682,8 +848,7 @@ class DataValidator:
             session_data["success_rate"] = (session_data["success_count"] / total) * 100
 
         # Write final session data
-        with open(self.session_file, "w", encoding="utf-8") as f:  # type: ignore
-            json.dump(session_data, f, indent=2, ensure_ascii=False)
+        self._write_session(session_data)
 
         # Create enhanced reports
         report_paths = {"session_json": str(self.session_file)}
@@ -0,0 +1,181 @@
+"""
+Módulo con el registro de huellas del contenido de cada CvLAC.
+"""
+
+import hashlib
+import logging
+import re
+
+from validators.schema_catalog import SchemaCatalog
+
+
+# Configuramos el logger para este módulo
+logging.basicConfig(level=logging.INFO)
+module_logger = logging.getLogger(__name__)
+
+
+# Bloques que pueden cambiar entre descargas sin que cambie el CvLAC
+_VOLATILE_BLOCKS = re.compile(
+    rb"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL
+)
+_WHITESPACE = re.compile(rb"\s+")
+
+
+class FingerprintStore:
+    """
+    Guarda en la tabla cvlac_fingerprint el hash del HTML normalizado de cada
+    CvLAC procesado, para omitir la eliminación, el parseo y la inserción de
+    los CvLAC que no cambiaron desde la última extracción.
+
+    La tabla referencia a identificacion con ON DELETE CASCADE, de modo que
+    al eliminar los datos de un investigador también se elimina su huella.
+    """
+
+    TABLE = "cvlac_fingerprint"
+
+    SELECT_QUERY = (
+        "SELECT content_hash FROM public.cvlac_fingerprint WHERE cvlac_id = %s"
+    )
+
+    SELECT_RANGE_QUERY = """
+        SELECT cvlac_id, content_hash
+        FROM public.cvlac_fingerprint
+        WHERE cvlac_id BETWEEN %s AND %s
+    """
+
+    UPSERT_QUERY = """
+        INSERT INTO public.cvlac_fingerprint (cvlac_id, content_hash, updated_at)
+        VALUES (%s, %s, now())
+        ON CONFLICT (cvlac_id) DO UPDATE
+        SET content_hash = EXCLUDED.content_hash, updated_at = EXCLUDED.updated_at
+    """
+
+    def __init__(self, db_connection):
+        """
+        Inicializa el registro de huellas.
+
+        Args:
+            db_connection: Instancia de la clase DatabaseConnection.
+        """
+        self.schema = SchemaCatalog(db_connection)
+        self._preloaded = None
+        self._preloaded_range = None
+
+    @property
+    def available(self):
+        """Indica si la tabla de huellas existe en la base de datos."""
+        return self.schema.table_exists(self.TABLE)
+
+    @staticmethod
+    def fingerprint(content):
+        """
+        Calcula la huella del HTML de un CvLAC.
+
+        Se descartan los bloques <script> y <style> y se colapsan los espacios
+        para que diferencias de formato no cuenten como cambios.
+
+        Args:
+            content (bytes): Cuerpo de la respuesta.
+
+        Returns:
+            str: Hash SHA-256 del contenido normalizado.
+        """
+        normalized = _VOLATILE_BLOCKS.sub(b"", content or b"")
+        normalized = _WHITESPACE.sub(b" ", normalized).strip()
+        return hashlib.sha256(normalized).hexdigest()
+
+    def preload(self, first_id, last_id, connection):
+        """
+        Carga en memoria las huellas de un rango de IDs con una sola consulta.
+
+        Args:
+            first_id (str): Primer cod_rh del rango (con ceros a la izquierda).
+            last_id (str): Último cod_rh del rango.
+            connection: Conexión a la base de datos.
+        """
+        if not self.available:
+            return
+
+        try:
+            cursor = connection.cursor()
+            cursor.execute(self.SELECT_RANGE_QUERY, (first_id, last_id))
+            self._preloaded = dict(cursor.fetchall())
+            self._preloaded_range = (first_id, last_id)
+            connection.commit()
+        except Exception as e:
+            connection.rollback()
+            self._preloaded = None
+            self._preloaded_range = None
+            module_logger.warning(f"No se pudieron precargar las huellas: {str(e)}")
+
+    def get(self, cod_rh, connection):
+        """
+        Obtiene la huella registrada de un CvLAC.
+
+        Args:
+            cod_rh (str): Código del investigador.
+            connection: Conexión a la base de datos.
+
+        Returns:
+            str: Hash registrado, o None si no existe.
+        """
+        if self._preloaded_range is not None:
+            first_id, last_id = self._preloaded_range
+            if first_id <= cod_rh <= last_id:
+                return self._preloaded.get(cod_rh)
+
+        try:
+            cursor = connection.cursor()
+            cursor.execute(self.SELECT_QUERY, (cod_rh,))
+            row = cursor.fetchone()
+            connection.commit()
+            return row[0] if row else None
+        except Exception as e:
+            connection.rollback()
+            module_logger.warning(
+                f"No se pudo consultar la huella de {cod_rh}: {str(e)}"
+            )
+            return None
+
+    def is_unchanged(self, cod_rh, content_hash, connection):
+        """
+        Verifica si el contenido de un CvLAC es igual al último procesado.
+
+        Args:
+            cod_rh (str): Código del investigador.
+            content_hash (str): Huella del contenido descargado.
+            connection: Conexión a la base de datos.
+
+        Returns:
+            bool: True si la huella registrada coincide.
+        """
+        if not self.available:
+            return False
+        return self.get(cod_rh, connection) == content_hash
+
+    def record(self, cod_rh, content_hash, connection):
+        """
+        Registra la huella de un CvLAC procesado correctamente.
+
+        Args:
+            cod_rh (str): Código del investigador.
+            content_hash (str): Huella del contenido procesado.
+            connection: Conexión a la base de datos.
+
+        Returns:
+            bool: True si se registró, False en caso contrario.
+        """
+        if not self.available:
+            return False
+
+        try:
+            cursor = connection.cursor()
+            cursor.execute(self.UPSERT_QUERY, (cod_rh, content_hash))
+            connection.commit()
+            if self._preloaded is not None:
+                self._preloaded[cod_rh] = content_hash
+            return True
+        except Exception as e:
+            connection.rollback()
+            module_logger.error(f"Error registrando la huella de {cod_rh}: {str(e)}")
+            return False
@@ -0,0 +1,107 @@
+"""
+Claves naturales por tabla usadas por el modo upsert (INSERT ... ON CONFLICT).
+
+Cada clave debe tener una restricción UNIQUE NULLS NOT DISTINCT equivalente en
+la base de datos (ver sql/migrations/001_natural_keys.sql). Si la restricción
+no existe, DataValidator no la usa como destino de ON CONFLICT.
+
+Las tablas eventos_cientificos y sus tablas hijas (eventos_participantes,
+eventos_productos, eventos_instituciones) no tienen clave natural: el id del
+evento es un UUID generado en cada extracción y lo referencian las hijas.
+"""
+
+NATURAL_KEYS = {
+    "formacion_academica": (
+        "cvlac_id",
+        "nivel_formacion",
+        "institucion",
+        "programa_academico",
+        "fecha_inicio",
+    ),
+    "formacion_complementaria": (
+        "cvlac_id",
+        "nivel_formacion",
+        "institucion",
+        "programa_academico",
+        "fecha_inicio",
+    ),
+    "experiencia": ("cvlac_id", "institucion", "ano_inicio"),
+    "areas_actuacion": ("cvlac_id", "gran_area", "area", "especialidad"),
+    "idioma": ("cvlac_id", "idioma"),
+    "lineas_investigacion": ("cvlac_id", "linea_investigacion"),
+    "reconocimientos": ("cvlac_id", "nombre", "fecha"),
+    "cursos_corta_duracion": ("cvlac_id", "nombre_producto", "ano"),
+    "trabajos_dirigidos": ("cvlac_id", "nombre", "persona_orientada", "fecha_inicio"),
+    "asesorias": ("cvlac_id", "nombre_proyecto_ondas", "institucion"),
+    "jurados": ("cvlac_id", "titulo", "nombre_orientado"),
+    "par_evaluador": (
+        "cvlac_id",
+        "par_evaluador_de",
+        "entidad_convocadora",
+        "ano",
+        "mes",
+    ),
+    "participacion_comites_evaluacion": (
+        "cvlac_id",
+        "nombre_producto",
+        "institucion",
+        "ano",
+    ),
+    "consultorias": ("cvlac_id", "nombre", "numero_contrato", "ano"),
+    "ediciones_revisiones": (
+        "cvlac_id",
+        "tipo_producto",
+        "revista",
+        "editorial",
+        "ano",
+    ),
+    "informes_investigacion": ("cvlac_id", "titulo", "ano"),
+    "redes_conocimiento": ("cvlac_id", "nombre", "fecha_inicio"),
+    "audio": ("cvlac_id", "titulo", "fecha"),
+    "impresa": ("cvlac_id", "nombre", "fecha"),
+    "multimedia": ("cvlac_id", "nombre", "ano"),
+    "secuencias_geneticas": ("cvlac_id", "nombre", "fecha"),
+    "contenido_virtual": ("cvlac_id", "titulo", "fecha"),
+    "estrategias_comunicacion": ("cvlac_id", "nombre", "fecha_inicio"),
+    "estrategias_pedagogicas": ("cvlac_id", "nombre", "fecha_inicio"),
+    "espacios_participacion": ("cvlac_id", "nombre", "fecha_inicio"),
+    "participacion_proyectos": ("cvlac_id", "nombre", "fecha_inicio"),
+    "obras_productos": ("cvlac_id", "nombre", "fecha_creacion"),
+    "registro_licencia": ("cvlac_id", "numero_registro", "institucion"),
+    "industrias_creativas_culturales": ("cvlac_id", "nombre", "nit_registro"),
+    "eventos_artisticos": ("cvlac_id", "nombre", "fecha_inicio"),
+    "talleres_creativos": ("cvlac_id", "nombre", "fecha_inicio"),
+    "articulos": ("cvlac_id", "titulo", "revista", "ano"),
+    "articulos_publicados": ("cvlac_id", "titulo", "issn", "ano"),
+    "capitulos_libro": ("cvlac_id", "titulo_capitulo", "libro", "ano"),
+    "libros": ("cvlac_id", "titulo", "isbn", "ano"),
+    "documentos_trabajo": ("cvlac_id", "nombre", "ano"),
+    "otra_produccion": ("cvlac_id", "titulo", "ano"),
+    "textos_no_cientificas": ("cvlac_id", "titulo", "revista", "ano"),
+    "traducciones": ("cvlac_id", "nombre", "ano"),
+    "notas_cientificas": ("cvlac_id", "titulo_nota", "revista", "ano"),
+    "cartas_mapas": ("cvlac_id", "nombre_producto", "ano"),
+    "conceptos_tecnicos": ("cvlac_id", "titulo", "numero"),
+    "diseno_industrial": ("cvlac_id", "nombre", "ano"),
+    "empresas_base_tecnologica": ("cvlac_id", "nombre", "nit"),
+    "esquemas_trazado": ("cvlac_id", "nombre", "ano"),
+    "informes_tecnicos": ("cvlac_id", "nombre", "ano"),
+    "innovacion_procesos": ("cvlac_id", "nombre", "ano"),
+    "innovacion_gestion": ("cvlac_id", "nombre", "ano"),
+    "variedad_animal": ("cvlac_id", "nombre", "ano"),
+    "poblaciones_mejoradas": ("cvlac_id", "nombre", "ano"),
+    "variedad_vegetal": ("cvlac_id", "nombre", "ano"),
+    "registro_cientifico": ("cvlac_id", "nombre", "ano"),
+    "plantas_piloto": ("cvlac_id", "nombre", "ano"),
+    "productos_nutraceuticos": ("cvlac_id", "nombre", "numero_registro"),
+    "productos_tecnologicos": ("cvlac_id", "nombre", "ano"),
+    "prototipos": ("cvlac_id", "nombre", "ano"),
+    "normas_regulaciones": ("cvlac_id", "nombre", "ano"),
+    "protocolos_vigilancia": ("cvlac_id", "nombre", "fecha"),
+    "reglamentos": ("cvlac_id", "nombre", "ano"),
+    "signos_distintivos": ("cvlac_id", "nombre", "ano"),
+    "software": ("cvlac_id", "nombre", "ano"),
+    "demas_trabajos": ("cvlac_id", "nombre", "ano"),
+    "proyectos": ("cvlac_id", "tipo", "nombre", "fecha_inicio"),
+    "redes_sociales": ("cvlac_id", "red", "link"),
+}
@@ -0,0 +1,286 @@
+"""
+Módulo con el catálogo en memoria del esquema de la base de datos.
+"""
+
+import logging
+import threading
+import time
+
+
+# Configuramos el logger para este módulo
+logging.basicConfig(level=logging.INFO)
+module_logger = logging.getLogger(__name__)
+
+
+class SchemaCatalog:
+    """
+    Catálogo del esquema 'public' compartido por todo el proceso.
+
+    Carga una sola vez las columnas, tipos, claves primarias y restricciones
+    UNIQUE de todas las tablas para que las validaciones por registro no
+    tengan que consultar information_schema. Se debe invalidar explícitamente con invalidate()
+    cuando el esquema cambie (migraciones, creación de tablas, etc.).
+
+    Si la carga falla (p. ej. un error transitorio de la base de datos), los
+    reintentos perezosos esperan un tiempo creciente (RETRY_BACKOFF, duplicado
+    en cada fallo hasta RETRY_BACKOFF_MAX) para no consultar el esquema en
+    cada registro.
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    RETRY_BACKOFF = 1.0
+    RETRY_BACKOFF_MAX = 60.0
+
+    COLUMNS_QUERY = """
+        SELECT table_name, column_name, data_type
+        FROM information_schema.columns
+        WHERE table_schema = 'public'
+        ORDER BY table_name, ordinal_position
+    """
+
+    PRIMARY_KEYS_QUERY = """
+        SELECT c.relname, a.attname
+        FROM pg_constraint con
+        JOIN pg_class c ON c.oid = con.conrelid
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        JOIN pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = ANY(con.conkey)
+        WHERE con.contype = 'p' AND n.nspname = 'public'
+        ORDER BY c.relname, array_position(con.conkey, a.attnum)
+    """
+
+    UNIQUE_KEYS_QUERY = """
+        SELECT c.relname, array_agg(a.attname ORDER BY array_position(con.conkey, a.attnum))
+        FROM pg_constraint con
+        JOIN pg_class c ON c.oid = con.conrelid
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        JOIN pg_attribute a ON a.attrelid = con.conrelid AND a.attnum = ANY(con.conkey)
+        WHERE con.contype = 'u' AND n.nspname = 'public'
+        GROUP BY c.relname, con.conname
+    """
+
+    def __new__(cls, db_connection=None):
+        """Implementa el patrón Singleton para compartir el catálogo en el proceso."""
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(SchemaCatalog, cls).__new__(cls)
+                cls._instance._initialized = False
+            return cls._instance
+
+    def __init__(self, db_connection=None):
+        """
+        Inicializa el catálogo.
+
+        Args:
+            db_connection: Instancia de la clase DatabaseConnection.
+        """
+        if self._initialized:
+            if db_connection is not None and self.db is None:
+                self.db = db_connection
+            return
+
+        self.db = db_connection
+        self._loaded = False
+        self._columns = {}
+        self._primary_keys = {}
+        self._unique_keys = {}
+        self._load_count = 0
+        self._failures = 0
+        self._retry_at = 0.0
+        self._initialized = True
+
+    def load(self, force=False):
+        """
+        Carga el esquema completo de la base de datos.
+
+        Args:
+            force (bool, optional): Recargar aunque el catálogo ya esté cargado
+                                    o esté esperando para reintentar.
+
+        Returns:
+            bool: True si el catálogo quedó cargado, False en caso contrario.
+        """
+        with self._lock:
+            if self._loaded and not force:
+                return True
+            if not force and time.monotonic() < self._retry_at:
+                return False
+
+            if self.db is None:
+                module_logger.error("SchemaCatalog no tiene conexión configurada")
+                return False
+
+            try:
+                with self.db.get_connection_context() as connection:
+                    cursor = connection.cursor()
+
+                    columns = {}
+                    cursor.execute(self.COLUMNS_QUERY)
+                    for table, column, data_type in cursor.fetchall():
+                        columns.setdefault(table, {})[column] = data_type
+
+                    primary_keys = {}
+                    cursor.execute(self.PRIMARY_KEYS_QUERY)
+                    for table, column in cursor.fetchall():
+                        primary_keys.setdefault(table, []).append(column)
+
+                    unique_keys = {}
+                    cursor.execute(self.UNIQUE_KEYS_QUERY)
+                    for table, key_columns in cursor.fetchall():
+                        unique_keys.setdefault(table, []).append(tuple(key_columns))
+
+                self._columns = columns
+                self._primary_keys = primary_keys
+                self._unique_keys = unique_keys
+                self._loaded = True
+                self._load_count += 1
+                self._failures = 0
+                self._retry_at = 0.0
+                module_logger.debug(
+                    f"Catálogo de esquema cargado: {len(columns)} tablas"
+                )
+                return True
+            except Exception as e:
+                self._failures += 1
+                backoff = min(
+                    self.RETRY_BACKOFF * 2 ** (self._failures - 1),
+                    self.RETRY_BACKOFF_MAX,
+                )
+                self._retry_at = time.monotonic() + backoff
+                module_logger.error(
+                    f"Error cargando catálogo de esquema: {str(e)}. "
+                    f"Reintento en {backoff:.0f} s"
+                )
+                return False
+
+    def invalidate(self, table=None):
+        """
+        Invalida el catálogo para forzar una recarga en el próximo acceso.
+
+        Args:
+            table (str, optional): Tabla a invalidar. Si es None, invalida todo.
+        """
+        with self._lock:
+            if table is None:
+                self._loaded = False
+                self._columns = {}
+                self._primary_keys = {}
+                self._unique_keys = {}
+            else:
+                self._columns.pop(table, None)
+                self._primary_keys.pop(table, None)
+                self._unique_keys.pop(table, None)
+                # Forzar recarga completa para que la tabla vuelva a leerse
+                self._loaded = False
+
+    def _ensure_loaded(self):
+        """Carga el catálogo de forma perezosa si aún no está disponible."""
+        return self._loaded or self.load()
+
+    def is_loaded(self):
+        """
+        Indica si el catálogo está cargado, intentando cargarlo si no lo está.
+
+        Returns:
+            bool: True si el catálogo está disponible, False si la carga falló
+                  (o se está esperando para reintentarla).
+        """
+        return self._ensure_loaded()
+
+    def get_tables(self):
+        """
+        Obtiene la lista de tablas del esquema.
+
+        Returns:
+            list: Nombres de las tablas del esquema 'public'.
+        """
+        if not self._ensure_loaded():
+            return []
+        return list(self._columns.keys())
+
+    def table_exists(self, table):
+        """
+        Verifica si una tabla existe en el esquema.
+
+        Args:
+            table (str): Nombre de la tabla.
+
+        Returns:
+            bool: True si la tabla existe, False en caso contrario.
+        """
+        if not self._ensure_loaded():
+            return False
+        return table in self._columns
+
+    def get_columns(self, table):
+        """
+        Obtiene las columnas de una tabla con su tipo de dato.
+
+        Args:
+            table (str): Nombre de la tabla.
+
+        Returns:
+            dict: Diccionario {columna: tipo}. Vacío si la tabla no existe.
+        """
+        if not self._ensure_loaded():
+            return {}
+        return self._columns.get(table, {})
+
+    def column_exists(self, table, column):
+        """
+        Verifica si una columna existe en una tabla.
+
+        Args:
+            table (str): Nombre de la tabla.
+            column (str): Nombre de la columna.
+
+        Returns:
+            bool: True si la columna existe, False en caso contrario.
+        """
+        return column in self.get_columns(table)
+
+    def get_primary_keys(self, table):
+        """
+        Obtiene las columnas de clave primaria de una tabla.
+
+        Args:
+            table (str): Nombre de la tabla.
+
+        Returns:
+            list: Copia de la lista de columnas de clave primaria (puede estar vacía).
+        """
+        if not self._ensure_loaded():
+            return []
+        return list(self._primary_keys.get(table, []))
+
+    def has_unique_key(self, table, columns):
+        """
+        Verifica si existe una restricción UNIQUE sobre exactamente esas columnas.
+
+        Args:
+            table (str): Nombre de la tabla.
+            columns (iterable): Columnas de la clave.
+
+        Returns:
+            bool: True si la restricción existe, False en caso contrario.
+        """
+        if not self._ensure_loaded():
+            return False
+        wanted = set(columns)
+        return any(set(key) == wanted for key in self._unique_keys.get(table, []))
+
+    def stats(self):
+        """
+        Retorna información del estado del catálogo.
+
+        Returns:
+            dict: Estado de carga, número de tablas, número de cargas realizadas
+                  y fallos consecutivos de carga.
+        """
+        return {
+            "loaded": self._loaded,
+            "tables": len(self._columns),
+            "load_count": self._load_count,
+            "failures": self._failures,
+        }
@@ -0,0 +1,261 @@
+"""
+Módulo con el buffer de escritura por CvLAC.
+"""
+
+import logging
+from psycopg2.extras import execute_values
+
+
+# Configuramos el logger para este módulo
+logging.basicConfig(level=logging.INFO)
+module_logger = logging.getLogger(__name__)
+
+
+class WriteBuffer:
+    """
+    Acumula los registros producidos para un CvLAC agrupados por tabla y los
+    escribe en una sola transacción con inserciones de múltiples filas.
+
+    Las tablas se vacían en el orden en que recibieron su primer registro, de
+    modo que 'identificacion' se escribe antes que las tablas que la referencian.
+    Los registros que traen su clave primaria completa (p. ej. identificacion)
+    siguen pasando por DataValidator.insert_or_update para conservar la
+    detección de duplicados; el resto se inserta con execute_values.
+
+    En modo upsert todas las filas se escriben con INSERT ... ON CONFLICT de
+    múltiples filas sobre la clave natural de cada tabla.
+    """
+
+    def __init__(self, validator, page_size=500, upsert=False):
+        """
+        Inicializa el buffer.
+
+        Args:
+            validator (DataValidator): Validador usado para el esquema y las estadísticas.
+            page_size (int, optional): Filas por sentencia INSERT. Por defecto 500.
+            upsert (bool, optional): Escribir con INSERT ... ON CONFLICT. Por defecto False.
+        """
+        self.validator = validator
+        self.page_size = page_size
+        self.upsert = upsert
+        self.rows = {}
+        # Resumen del último flush (None si aún no se ha escrito)
+        self.last_summary = None
+
+    def __len__(self):
+        return sum(len(rows) for rows in self.rows.values())
+
+    def add(self, table, data):
+        """
+        Agrega un registro al buffer.
+
+        Args:
+            table (str): Nombre de la tabla.
+            data (dict): Datos del registro. Se guarda una copia.
+
+        Returns:
+            str: 'buffered'
+        """
+        self.rows.setdefault(table, []).append(dict(data))
+        return "buffered"
+
+    def extend(self, rows):
+        """
+        Agrega los registros de otro buffer (p. ej. producido en otro proceso).
+
+        Args:
+            rows (dict): Diccionario {tabla: [registros]}.
+        """
+        for table, table_rows in rows.items():
+            self.rows.setdefault(table, []).extend(table_rows)
+
+    def clear(self):
+        """Descarta los registros pendientes."""
+        self.rows = {}
+
+    def flush(self, connection, update_if_exists=True, before=None):
+        """
+        Escribe todos los registros pendientes en una sola transacción.
+
+        Args:
+            connection: Conexión a la base de datos.
+            update_if_exists (bool, optional): Se pasa a insert_or_update para los
+                                               registros con clave primaria completa.
+            before (callable, optional): Recibe la conexión y se ejecuta en la misma
+                                         transacción antes de los registros, sin
+                                         confirmar (p. ej. eliminar los datos previos
+                                         del CvLAC). Si falla, nada se confirma.
+
+        Returns:
+            dict: Resumen con filas escritas, errores y sentencias ejecutadas.
+        """
+        summary = {"rows": 0, "errors": 0, "statements": 0}
+        self.last_summary = summary
+        if not self.rows and before is None:
+            return summary
+
+        try:
+            if before is not None:
+                before(connection)
+            cursor = connection.cursor()
+            for table, rows in self.rows.items():
+                self._flush_table(
+                    cursor, connection, table, rows, update_if_exists, summary
+                )
+            connection.commit()
+        except Exception as e:
+            connection.rollback()
+            module_logger.error(
+                f"Error escribiendo el buffer de registros: {str(e)}", exc_info=True
+            )
+            for table, rows in self.rows.items():
+                for data in rows:
+                    self.validator.record_operation(table, "error", data, error=str(e))
+            summary["errors"] += max(len(self), 1)
+        finally:
+            self.clear()
+
+        module_logger.debug(f"Buffer de escritura vaciado: {summary}")
+        return summary
+
+    def _flush_table(self, cursor, connection, table, rows, update_if_exists, summary):
+        """Escribe los registros de una tabla dentro de la transacción abierta."""
+        primary_keys = self.validator.schema.get_primary_keys(table)
+        groups = {}
+
+        for data in rows:
+            self.validator.filter_columns(table, data)
+            if not data:
+                error_msg = f"No hay columnas válidas para insertar en {table}"
+                module_logger.error(error_msg)
+                self.validator.record_operation(table, "error", error=error_msg)
+                summary["errors"] += 1
+                continue
+
+            if self.upsert:
+                conflict_columns = self.validator.get_conflict_columns(table, data)
+                key = (tuple(data.keys()), tuple(conflict_columns or ()))
+                groups.setdefault(key, []).append(data)
+            elif primary_keys and all(
+                data.get(key) is not None for key in primary_keys
+            ):
+                self._write_keyed(
+                    cursor, connection, table, data, update_if_exists, summary
+                )
+            else:
+                groups.setdefault(tuple(data.keys()), []).append(data)
+
+        for key, group in groups.items():
+            if self.upsert:
+                columns, conflict_columns = key
+                self._write_upsert_group(
+                    cursor,
+                    table,
+                    columns,
+                    list(conflict_columns),
+                    group,
+                    update_if_exists,
+                    summary,
+                )
+            else:
+                self._write_group(cursor, table, key, group, summary)
+
+    def _write_upsert_group(
+        self, cursor, table, columns, conflict_columns, group, update_if_exists, summary
+    ):
+        """Escribe un grupo de registros con INSERT ... ON CONFLICT de múltiples filas."""
+        # Una sentencia ON CONFLICT DO UPDATE no puede tocar la misma fila dos
+        # veces: se conserva el último registro de cada clave y el resto se omite.
+        if conflict_columns:
+            unique = {}
+            for data in group:
+                unique[tuple(data.get(col) for col in conflict_columns)] = data
+            duplicates = len(group) - len(unique)
+            for _ in range(duplicates):
+                self.validator.record_operation(table, "skip")
+            group = list(unique.values())
+
+        query = self.validator.build_upsert_query(
+            table, list(columns), conflict_columns or None, update_if_exists
+        )
+        values = [tuple(data[column] for column in columns) for data in group]
+
+        cursor.execute("SAVEPOINT write_buffer_group")
+        try:
+            results = execute_values(
+                cursor, query, values, page_size=self.page_size, fetch=True
+            )
+            cursor.execute("RELEASE SAVEPOINT write_buffer_group")
+            summary["statements"] += -(-len(values) // self.page_size)
+            summary["rows"] += len(results)
+            self.validator.record_upsert_results(table, results, len(values))
+            return
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT write_buffer_group")
+            module_logger.warning(
+                f"Error en upsert múltiple para {table}, reintentando fila a fila: {str(e)}"
+            )
+
+        # Reintentar fila a fila para aislar los registros inválidos
+        for data in group:
+            cursor.execute("SAVEPOINT write_buffer_row")
+            operation, error = self.validator.upsert(
+                table, data, cursor.connection, update_if_exists, commit=False
+            )
+            summary["statements"] += 1
+            if operation == "error":
+                cursor.execute("ROLLBACK TO SAVEPOINT write_buffer_row")
+                summary["errors"] += 1
+            else:
+                cursor.execute("RELEASE SAVEPOINT write_buffer_row")
+                summary["rows"] += 1
+
+    def _write_keyed(self, cursor, connection, table, data, update_if_exists, summary):
+        """Escribe un registro con clave primaria completa usando insert_or_update."""
+        cursor.execute("SAVEPOINT write_buffer_row")
+        operation, error = self.validator.insert_or_update(
+            table, data, connection, update_if_exists, commit=False
+        )
+        summary["statements"] += 1
+        if operation == "error":
+            cursor.execute("ROLLBACK TO SAVEPOINT write_buffer_row")
+            summary["errors"] += 1
+        else:
+            cursor.execute("RELEASE SAVEPOINT write_buffer_row")
+            summary["rows"] += 1
+
+    def _write_group(self, cursor, table, columns, group, summary):
+        """Inserta un grupo de registros con las mismas columnas en una sentencia."""
+        query = f"INSERT INTO public.{table} ({', '.join(columns)}) VALUES %s"
+        values = [tuple(data[column] for column in columns) for data in group]
+
+        cursor.execute("SAVEPOINT write_buffer_group")
+        try:
+            execute_values(cursor, query, values, page_size=self.page_size)
+            cursor.execute("RELEASE SAVEPOINT write_buffer_group")
+            summary["statements"] += -(-len(values) // self.page_size)
+            summary["rows"] += len(group)
+            for data in group:
+                self.validator.record_operation(table, "insert", data)
+            return
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT write_buffer_group")
+            module_logger.warning(
+                f"Error en inserción múltiple para {table}, reintentando fila a fila: {str(e)}"
+            )
+
+        # Reintentar fila a fila para aislar los registros inválidos
+        single_query = f"INSERT INTO public.{table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+        for data, row in zip(group, values):
+            cursor.execute("SAVEPOINT write_buffer_row")
+            try:
+                cursor.execute(single_query, row)
+                cursor.execute("RELEASE SAVEPOINT write_buffer_row")
+                summary["rows"] += 1
+                self.validator.record_operation(table, "insert", data)
+            except Exception as e:
+                cursor.execute("ROLLBACK TO SAVEPOINT write_buffer_row")
+                module_logger.error(f"Error insertando registro en {table}: {str(e)}")
+                self.validator.record_operation(table, "error", data, error=str(e))
+                summary["errors"] += 1
+            summary["statements"] += 1